@@ -0,0 +1,148 @@
+"""
+============================================================
+File Name: database.py
+Brief Description:
+Builds settings.DATABASES for the SQLite database in one of
+two modes (EVENT_DB_MODE):
+
+  simple  Django's stock SQLite setup: rollback journal, a new
+          connection per request. Readers wait behind writes.
+  wal     WAL journaling, so readers never block on a writer
+          (or it on them), with tuned pragmas, persistent
+          connections (CONN_MAX_AGE; one per worker thread and
+          alias) and IMMEDIATE write transactions, so a writer
+          takes its lock up front rather than failing with
+          "database is locked" on upgrade. Adds a "read" alias
+          on the same file, opened query-only, which
+          main/db_routers.py uses for public read-only views.
+
+replica_databases() adds read-only replica aliases (replica_1,
+replica_2, ...) for copies of the database file, e.g. kept in
+sync by `manage.py replicate_sqlite`; db_routers.py spreads
+public reads across them.
+
+Pragmas apply to every new connection; EVENT_SQLITE_PRAGMAS
+(e.g. "synchronous=FULL,cache_size=-16000") overrides the
+defaults below.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | simple / wal SQLite database modes          | user-022
+v1.1    | 2026-10-17 | Read-only replica aliases                   | user-023
+============================================================
+"""
+
+import sqlite3
+
+from django.core.exceptions import ImproperlyConfigured
+
+ENGINE = "django.db.backends.sqlite3"
+READ_ALIAS = "read"
+REPLICA_PREFIX = "replica_"
+REPLICA_URI = "file:{path}?mode=ro"
+MODES = ("simple", "wal")
+
+# Pragmas for wal mode, applied to each new connection
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    # Durable at checkpoints rather than every commit; safe with WAL
+    "synchronous": "NORMAL",
+    # Page cache per connection, in KiB when negative (64 MiB)
+    "cache_size": "-65536",
+    # Read through a 256 MiB memory map instead of read() calls
+    "mmap_size": "268435456",
+    "temp_store": "MEMORY",
+}
+
+
+# {"name": "value"} from "name=value,name=value"
+def parse_pragmas(text):
+    pragmas = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, separator, value = item.partition("=")
+        if not separator or not name.strip().isidentifier():
+            raise ImproperlyConfigured(f"EVENT_SQLITE_PRAGMAS: expected name=value, got {item!r}.")
+        pragmas[name.strip()] = value.strip()
+    return pragmas
+
+
+def _init_command(pragmas):
+    return ";".join(f"PRAGMA {name}={value}" for name, value in pragmas.items())
+
+
+# DATABASES for the SQLite file at path
+def sqlite_databases(path, mode="simple", conn_max_age=60, pragmas=None, timeout=20):
+    if mode not in MODES:
+        raise ImproperlyConfigured(f"EVENT_DB_MODE must be one of {', '.join(MODES)}, not {mode!r}.")
+    if mode == "simple":
+        return {"default": {"ENGINE": ENGINE, "NAME": path}}
+
+    pragmas = {**SQLITE_PRAGMAS, **(pragmas or {})}
+    default = {
+        "ENGINE": ENGINE,
+        "NAME": path,
+        "CONN_MAX_AGE": conn_max_age,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "init_command": _init_command(pragmas),
+            "transaction_mode": "IMMEDIATE",
+            "timeout": timeout,
+        },
+    }
+    read = {
+        **default,
+        "OPTIONS": {
+            "init_command": _init_command({**pragmas, "query_only": "ON"}),
+            "timeout": timeout,
+        },
+        # Tests run against one database; the read alias shares it
+        "TEST": {"MIRROR": "default"},
+    }
+    return {"default": default, READ_ALIAS: read}
+
+
+# Replica aliases for the SQLite files at paths, opened read-only. The
+# journal mode is the replica file's own; the replication job sets it.
+def replica_databases(paths, conn_max_age=60, pragmas=None, timeout=20):
+    pragmas = {**SQLITE_PRAGMAS, **(pragmas or {}), "query_only": "ON"}
+    pragmas.pop("journal_mode")
+    return {
+        f"{REPLICA_PREFIX}{number}": {
+            "ENGINE": ENGINE,
+            "NAME": REPLICA_URI.format(path=path),
+            "CONN_MAX_AGE": conn_max_age,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {"init_command": _init_command(pragmas), "timeout": timeout},
+            # Tests run against one database; replicas share it
+            "TEST": {"MIRROR": "default"},
+        }
+        for number, path in enumerate(paths, start=1)
+    }
+
+
+# File path of a replica alias's settings (NAME without the URI wrapping)
+def replica_path(settings_dict):
+    name = str(settings_dict["NAME"])
+    if name.startswith("file:"):
+        return name[len("file:"):].partition("?")[0]
+    return name
+
+
+# Copy the database at source onto target with SQLite's online backup, which
+# sees one consistent snapshot of source. The copy uses the rollback journal:
+# read-only (mode=ro) connections cannot open a WAL file without its -shm.
+def copy_database(source, target, timeout=20):
+    source_db = sqlite3.connect(f"file:{source}?mode=ro", uri=True, timeout=timeout)
+    target_db = sqlite3.connect(target, timeout=timeout)
+    try:
+        source_db.backup(target_db)
+        target_db.execute("PRAGMA journal_mode=DELETE")
+    finally:
+        target_db.close()
+        source_db.close()
@@ -12,6 +12,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 # I wrote all this code appart from the standard django.
 from pathlib import Path
 import os
+
+from config.database import READ_ALIAS, parse_pragmas, replica_databases, sqlite_databases
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -50,7 +52,91 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny'
     ]
 }
+
+# Event list pagination (keyset cursors, see main/pagination.py)
+EVENT_PAGE_SIZE = int(os.environ.get("EVENT_PAGE_SIZE", 20))
+EVENT_MAX_PAGE_SIZE = int(os.environ.get("EVENT_MAX_PAGE_SIZE", 100))
+
+# Proximity search (main/geo.py): nearest-N searches stop at the max radius
+EVENT_NEARBY_MAX_RADIUS_KM = float(os.environ.get("EVENT_NEARBY_MAX_RADIUS_KM", 100))
+# CSV of UK outcode centroids (outcode, latitude, longitude) used to geocode
+# postcodes. The bundled file is a small sample; use a full extract in production.
+EVENT_OUTCODE_CENTROIDS = os.environ.get(
+    "EVENT_OUTCODE_CENTROIDS", os.path.join(BASE_DIR, "main", "data", "outcode_centroids.csv")
+)
+
+# Serve the events API through the compiled serializer (main/fast_serializers.py)
+EVENT_API_FAST_SERIALIZER = os.environ.get("EVENT_API_FAST_SERIALIZER", "0") == "1"
+
+# Serve /api/events/ from an in-memory snapshot of the published catalogue
+# (main/snapshot.py); each process holds its own copy
+EVENT_SNAPSHOT = os.environ.get("EVENT_SNAPSHOT", "0") == "1"
+
+# Events read and serialized per chunk by the streaming export (main/exporters.py)
+EVENT_EXPORT_CHUNK_SIZE = int(os.environ.get("EVENT_EXPORT_CHUNK_SIZE", 2000))
+
+# Days of history kept by `prune_event_changes` for the change feed (main/changes.py)
+EVENT_CHANGE_RETENTION_DAYS = int(os.environ.get("EVENT_CHANGE_RETENTION_DAYS", 30))
+
+# Days ahead that recurring events are expanded into occurrences (main/occurrences.py)
+EVENT_OCCURRENCE_HORIZON_DAYS = int(os.environ.get("EVENT_OCCURRENCE_HORIZON_DAYS", 180))
+
+# Request metrics (main/metrics.py): Server-Timing / X-Query-Count response
+# headers and a JSON log line per request. /internal/metrics is open to
+# staff and to the addresses in EVENT_METRICS_ALLOWED_IPS (e.g. a Prometheus
+# scraper), none by default. The check reads REMOTE_ADDR: behind a reverse
+# proxy on the same host every request comes from 127.0.0.1, so never list
+# the proxy's address here; list the scraper's address as the app sees it.
+EVENT_METRICS_HEADER = os.environ.get("EVENT_METRICS_HEADER", "0") == "1"
+EVENT_METRICS_LOG = os.environ.get("EVENT_METRICS_LOG", "0") == "1"
+EVENT_METRICS_ALLOWED_IPS = [ip for ip in os.environ.get("EVENT_METRICS_ALLOWED_IPS", "").split(",") if ip]
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {"main.metrics": {"handlers": ["console"], "level": "INFO", "propagate": False}},
+}
+
+# Cache holding the version tokens that tell processes to reload reference data,
+# the match matrix and the snapshot (main/lookup_cache.py). Running more than one
+# process, set REFERENCE_DATA_CACHE_BACKEND=file (and optionally
+# REFERENCE_DATA_CACHE_DIR) so every process sees a change. Tokens expire after
+# REFERENCE_DATA_VERSION_TIMEOUT seconds, bounding how long a missed change lasts.
+REFERENCE_DATA_CACHE = "reference"
+REFERENCE_DATA_CACHE_BACKEND = os.environ.get("REFERENCE_DATA_CACHE_BACKEND", "locmem")
+REFERENCE_DATA_VERSION_TIMEOUT = int(os.environ.get("REFERENCE_DATA_VERSION_TIMEOUT", 300))
+REFERENCE_DATA_CACHE_BACKENDS = {
+    "locmem": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "reference-data"},
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("REFERENCE_DATA_CACHE_DIR", os.path.join(BASE_DIR, "var", "reference_cache")),
+    },
+}
+
+# Rendered event page cache (main/page_cache.py). Set EVENT_PAGE_CACHE_BACKEND=file
+# to keep pages on disk in EVENT_PAGE_CACHE_DIR, shared by every process.
+EVENT_PAGE_CACHE = "pages"
+EVENT_PAGE_CACHE_TIMEOUT = int(os.environ.get("EVENT_PAGE_CACHE_TIMEOUT", 600))
+PAGE_CACHE_BACKENDS = {
+    "locmem": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "event-pages"},
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("EVENT_PAGE_CACHE_DIR", os.path.join(BASE_DIR, "var", "page_cache")),
+    },
+}
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    REFERENCE_DATA_CACHE: REFERENCE_DATA_CACHE_BACKENDS[REFERENCE_DATA_CACHE_BACKEND],
+    EVENT_PAGE_CACHE: PAGE_CACHE_BACKENDS[os.environ.get("EVENT_PAGE_CACHE_BACKEND", "locmem")],
+}
+
 MIDDLEWARE = [
+    # First, so its query counts and timings cover the rest of the stack
+    "main.metrics.RequestMetricsMiddleware",
+    # Pins a client's reads to the primary for a while after it writes
+    "main.db_routers.ReplicaPinMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -84,12 +170,31 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": os.path.join(BASE_DIR, 'db.sqlite3'),
-    }
-}
+# EVENT_DB_MODE=simple is the stock SQLite setup; wal enables WAL, tuned
+# pragmas, persistent connections and a query-only "read" alias that the
+# public views read through (config/database.py, main/db_routers.py)
+EVENT_DB_MODE = os.environ.get("EVENT_DB_MODE", "simple")
+DATABASES = sqlite_databases(
+    os.environ.get("EVENT_DB_PATH", os.path.join(BASE_DIR, 'db.sqlite3')),
+    mode=EVENT_DB_MODE,
+    conn_max_age=int(os.environ.get("EVENT_DB_CONN_MAX_AGE", 60)),
+    pragmas=parse_pragmas(os.environ.get("EVENT_SQLITE_PRAGMAS", "")),
+)
+# EVENT_DB_REPLICAS: comma-separated paths of read-only copies of the database
+# (e.g. kept in sync by `manage.py replicate_sqlite`). Public read-only views
+# read from one of them; a client that writes reads from the primary for
+# EVENT_REPLICA_PIN_SECONDS, and a replica that fails to connect is skipped
+# for EVENT_REPLICA_RETRY_SECONDS.
+DATABASES.update(replica_databases(
+    [path.strip() for path in os.environ.get("EVENT_DB_REPLICAS", "").split(",") if path.strip()],
+    conn_max_age=int(os.environ.get("EVENT_DB_CONN_MAX_AGE", 60)),
+    pragmas=parse_pragmas(os.environ.get("EVENT_SQLITE_PRAGMAS", "")),
+))
+DATABASE_ROUTERS = ["main.db_routers.ReadDatabaseRouter"]
+EVENT_READ_DATABASE = READ_ALIAS
+EVENT_REPLICA_DATABASES = [alias for alias in DATABASES if alias.startswith("replica_")]
+EVENT_REPLICA_PIN_SECONDS = 10
+EVENT_REPLICA_RETRY_SECONDS = 30
 
 
 # Password validation
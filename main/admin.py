@@ -7,19 +7,37 @@ with the Django admin for rapid prototyping.
 
 Author: Gavin Plucknett
 Created: 2026-01-06
-Current Version: v1.0
+Current Version: v1.2
 
 Change Log:
 ------------------------------------------------------------
 Version | Date       | Change Description                       | Reference
 ------------------------------------------------------------
 v1.0    | 2026-01-06 | Admin registration for prototype models  | DEV-118
+v1.1    | 2026-10-17 | Full-text search for events / profiles   | user-007
+v1.2    | 2026-10-17 | Warn on capped / unavailable search      | user-007
 ============================================================
 """
 
-from django.contrib import admin
+from django.contrib import admin, messages
 from .models import *
 from .forms import LookupOptionAdminForm
+from .search import available as search_available, search_events
+
+# Maximum full-text matches shown in an admin changelist search
+ADMIN_SEARCH_LIMIT = 1000
+
+
+# Event ids matching an admin search term, using the full-text index; warns
+# when the best ADMIN_SEARCH_LIMIT matches are not all of them
+def admin_search_ids(request, search_term):
+    hits = search_events(search_term, limit=ADMIN_SEARCH_LIMIT + 1, published_only=False)
+    if len(hits) > ADMIN_SEARCH_LIMIT:
+        messages.warning(
+            request,
+            f"Showing the best {ADMIN_SEARCH_LIMIT} matches for \"{search_term}\"; refine the search to see others.",
+        )
+    return [event_id for event_id, _ in hits[:ADMIN_SEARCH_LIMIT]]
 
 
 # ---------------------------
@@ -80,6 +98,12 @@ class AccessibilityProfileAdmin(admin.ModelAdmin):
     search_fields = ("additional_notes",)
     ordering = ("-updated_at",)
 
+    # Notes are searched through the events' full-text index when there is one
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip() or not search_available():
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(event__pk__in=admin_search_ids(request, search_term)), False
+
     autocomplete_fields = (
         "noise_level",
         "lighting_conditions",
@@ -95,4 +119,10 @@ class EventAdmin(admin.ModelAdmin):
     search_fields = ("title", "description", "location_text", "postcode")
     ordering = ("start_datetime",)
 
+    # Use the full-text index instead of icontains table scans when there is one
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip() or not search_available():
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(pk__in=admin_search_ids(request, search_term)), False
+
     autocomplete_fields = ("category", "accessibility_profile", "created_by_user")
\ No newline at end of file
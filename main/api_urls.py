@@ -6,22 +6,43 @@ URL routing for the prototype REST API.
 
 Author: Gavin Plucknett
 Created: 2026-01-04
-Current Version: v1.0
+Current Version: v1.7
 
 Change Log:
 ------------------------------------------------------------
 Version | Date       | Change Description                    | Reference
 ------------------------------------------------------------
 v1.0    | 2026-01-04 | Added /api/events endpoints           | DEV-123
+v1.1    | 2026-10-17 | Added /api/events/search              | user-007
+v1.2    | 2026-10-17 | Added /api/events/nearby              | user-008
+v1.3    | 2026-10-17 | Added /api/events/export.<format>     | user-013
+v1.4    | 2026-10-17 | Added /api/events/changes             | user-014
+v1.5    | 2026-10-17 | Added /api/events/occurrences         | user-015
+v1.6    | 2026-10-17 | Added /api/events/match               | user-017
+v1.7    | 2026-10-17 | Added async /api/async/events routes  | user-021
 ============================================================
 """
 
 from django.urls import path
-from .api_views import EventListAPIView, EventDetailAPIView
+from .api_views import (
+    EventListAPIView, EventDetailAPIView, EventSearchAPIView, EventNearbyAPIView, EventExportView,
+    EventChangesAPIView, EventOccurrencesAPIView, EventMatchAPIView,
+)
+from .async_views import AsyncEventListView, AsyncEventDetailView, AsyncEventSearchView
 
 app_name = "main_api"
 
 urlpatterns = [
     path("events/", EventListAPIView.as_view(), name="events_list"),
     path("events/<int:pk>/", EventDetailAPIView.as_view(), name="events_detail"),
+    path("events/search/", EventSearchAPIView.as_view(), name="events_search"),
+    path("events/nearby/", EventNearbyAPIView.as_view(), name="events_nearby"),
+    path("events/export.<str:fmt>", EventExportView.as_view(), name="events_export"),
+    path("events/changes/", EventChangesAPIView.as_view(), name="events_changes"),
+    path("events/occurrences/", EventOccurrencesAPIView.as_view(), name="events_occurrences"),
+    path("events/match/", EventMatchAPIView.as_view(), name="events_match"),
+    # Async variants for ASGI deployments (async_views.py)
+    path("async/events/", AsyncEventListView.as_view(), name="events_list_async"),
+    path("async/events/<int:pk>/", AsyncEventDetailView.as_view(), name="events_detail_async"),
+    path("async/events/search/", AsyncEventSearchView.as_view(), name="events_search_async"),
 ]
@@ -8,35 +8,412 @@ accessibility information.
 
 Author: Gavin Plucknett
 Created: 2026-01-04
-Current Version: v1.0
+Current Version: v1.21
 
 Change Log:
 ------------------------------------------------------------
 Version | Date       | Change Description                     | Reference
 ------------------------------------------------------------
 v1.0    | 2026-01-04 | Initial read-only API views            | DEV-123
+v1.1    | 2026-10-17 | Eager-load relations via query plan    | user-001
+v1.2    | 2026-10-17 | Cursor pagination on event list        | user-002
+v1.3    | 2026-10-17 | Opt-in compiled serializer fast path   | user-004
+v1.4    | 2026-10-17 | Accessibility filters + facet counts   | user-005
+v1.5    | 2026-10-17 | List pages via EventSearchDocument     | user-006
+v1.6    | 2026-10-17 | Ranked full-text search endpoint       | user-007
+v1.7    | 2026-10-17 | Postcode proximity search endpoint     | user-008
+v1.8    | 2026-10-17 | ETag / Last-Modified on list + detail  | user-009
+v1.9    | 2026-10-17 | Streaming catalogue export             | user-013
+v1.10   | 2026-10-17 | Incremental change feed                | user-014
+v1.11   | 2026-10-17 | Occurrence calendar endpoint           | user-015
+v1.12   | 2026-10-17 | Accessibility match ranking endpoint   | user-017
+v1.13   | 2026-10-17 | Serve the list from the snapshot       | user-018
+v1.14   | 2026-10-17 | Time serialization for request metrics | user-019
+v1.15   | 2026-10-17 | Public reads via the read database     | user-022
+v1.16   | 2026-10-17 | Upcoming list from UpcomingEvent       | user-024
+v1.17   | 2026-10-17 | Change feed 501 off SQLite             | user-014
+v1.18   | 2026-10-17 | Occurrence window via _parse_moment    | user-015
+v1.19   | 2026-10-17 | No validators for happening=now        | user-016
+v1.20   | 2026-10-17 | Bounded ?offset= via get_offset        | user-007
+v1.21   | 2026-10-17 | Nearby / search skip ended events      | user-024
 ============================================================
 """
 
-from rest_framework import generics
-from .models import Event
+from datetime import timedelta
+
+from django.conf import settings
+from django.http import Http404, StreamingHttpResponse
+from django.utils import timezone
+from django.views import View
+from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from . import changes, geo, matching, occurrences, snapshot
+from .conditional import event_validators, filtered_list_validators, list_stamp
+from .db_routers import ReadDatabaseMixin
+from .exporters import FORMATS as EXPORT_FORMATS, stream_export
+from .models import Event, EventSearchDocument
 from .serializers import EventSerializer
+from .fast_serializers import compile_serializer
+from .query_plans import with_query_plan
+from .pagination import EventCursorPagination, PAGE_SIZE_QUERY_PARAM, get_offset, get_page_size
+from .search import search_events
+from .search_documents import live_q
+from .filters import AccessibilityFilterBackend, _parse_moment, facet_counts, list_documents, parse_event_filters
+from .metrics import timer
+
+# Serve list / retrieve from values() rows through the compiled serializer
+# when settings.EVENT_API_FAST_SERIALIZER is on; output is identical.
+class CompiledSerializerMixin:
+
+    def use_compiled_serializer(self):
+        return getattr(settings, "EVENT_API_FAST_SERIALIZER", False)
+
+    def get_compiled_serializer(self):
+        return compile_serializer(self.get_serializer_class())
+
+    # Serialize the events with the given ids, in that order
+    def serialize_events(self, event_ids):
+        queryset = Event.objects.filter(pk__in=event_ids)
+
+        if self.use_compiled_serializer():
+            compiled = self.get_compiled_serializer()
+            rows = {row["id"]: row for row in compiled.values(queryset)}
+            with timer("serializer"):
+                return compiled.serialize_many(rows[pk] for pk in event_ids if pk in rows)
+
+        events = {event.pk: event for event in with_query_plan(queryset, self.get_serializer_class())}
+        with timer("serializer"):
+            return self.get_serializer([events[pk] for pk in event_ids if pk in events], many=True).data
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_compiled_serializer():
+            return super().list(request, *args, **kwargs)
+
+        compiled = self.get_compiled_serializer()
+        rows = compiled.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        with timer("serializer"):
+            data = compiled.serialize_many(rows if page is None else page)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    # values() row for the object named in the URL
+    def get_compiled_row(self, compiled):
+        lookup = {self.lookup_field: self.kwargs[self.lookup_url_kwarg or self.lookup_field]}
+        row = compiled.values(self.filter_queryset(self.get_queryset()).filter(**lookup)).first()
+        if row is None:
+            raise Http404
+        return row
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.use_compiled_serializer():
+            return super().retrieve(request, *args, **kwargs)
+
+        compiled = self.get_compiled_serializer()
+        return Response(compiled.serialize(self.get_compiled_row(compiled)))
+
 
 # Read only endpoint return published Event List
-class EventListAPIView(generics.ListAPIView):
+class EventListAPIView(ReadDatabaseMixin, CompiledSerializerMixin, generics.ListAPIView):
 
     # Set serializer
     serializer_class = EventSerializer
+    pagination_class = EventCursorPagination
 
-    # return query events
+    # Published events are found, filtered and paged through their flat
+    # search documents, the upcoming ones only unless a time range is asked
+    # for; only the page of events is then loaded
     def get_queryset(self):
-        return Event.objects.filter(status="PUBLISHED").order_by("start_datetime")
+        return list_documents(parse_event_filters(self.request.query_params))
+
+    # Answer unchanged polls with 304 before filtering or serializing anything
+    def list(self, request, *args, **kwargs):
+        filters = parse_event_filters(request.query_params)
+        if snapshot.enabled():
+            return self.list_from_snapshot(request, snapshot.get_snapshot(), filters)
+
+        validators = filtered_list_validators(request, filters, list_stamp)
+        not_modified = validators.conditional_response(request)
+        if not_modified is not None:
+            return not_modified
+
+        # Kept so facets count the same result set
+        self.filtered_queryset = list_documents(filters)
+        page = self.paginate_queryset(self.filtered_queryset)
+        response = self.get_paginated_response(self.serialize_events([document.pk for document in page]))
+        return validators.apply(response)
+
+    # Same response from the in-memory snapshot, without database queries
+    def list_from_snapshot(self, request, current, filters):
+        validators = filtered_list_validators(request, filters, current.stamp)
+        not_modified = validators.conditional_response(request)
+        if not_modified is not None:
+            return not_modified
+
+        self.filtered_queryset = current.select(filters)
+        page = self.paginate_queryset(self.filtered_queryset)
+        with timer("serializer"):
+            data = self.get_compiled_serializer().serialize_many(page)
+        response = self.get_paginated_response(data)
+        return validators.apply(response)
+
+    # Add facet counts alongside the page of results (skip with ?facets=false)
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.request.query_params.get("facets", "true").lower() not in ("false", "0", "no"):
+            response.data["facets"] = facet_counts(self.filtered_queryset)
+        return response
 
 # Read only endpoint return event details
-class EventDetailAPIView(generics.RetrieveAPIView):
+class EventDetailAPIView(ReadDatabaseMixin, CompiledSerializerMixin, generics.RetrieveAPIView):
     
     #Set serializer
     serializer_class = EventSerializer
 
     # Return Event details
-    queryset = Event.objects.all()
+    def get_queryset(self):
+        return with_query_plan(Event.objects.all(), self.get_serializer_class())
+
+    # Validators come from the row being loaded anyway, so a 304 costs the
+    # same single query and skips serialization
+    def retrieve(self, request, *args, **kwargs):
+        if self.use_compiled_serializer():
+            compiled = self.get_compiled_serializer()
+            row = self.get_compiled_row(compiled)
+            validators = event_validators(
+                request, row["id"], row["updated_at"], row["accessibility_profile__updated_at"]
+            )
+            render = lambda: compiled.serialize(row)
+        else:
+            instance = self.get_object()
+            validators = event_validators(
+                request, instance.pk, instance.updated_at, instance.accessibility_profile.updated_at
+            )
+            render = lambda: self.get_serializer(instance).data
+
+        not_modified = validators.conditional_response(request)
+        if not_modified is not None:
+            return not_modified
+        with timer("serializer"):
+            data = render()
+        return validators.apply(Response(data))
+
+# Read only endpoint return published events matching ?q=, best match first
+class EventSearchAPIView(ReadDatabaseMixin, CompiledSerializerMixin, generics.GenericAPIView):
+
+    serializer_class = EventSerializer
+
+    def get(self, request, *args, **kwargs):
+        text = request.query_params.get("q", "").strip()
+        if not text:
+            raise ValidationError({"q": "A search term is required."})
+
+        offset = get_offset(request.query_params.get("offset"))
+        page_size = get_page_size(request.query_params.get(PAGE_SIZE_QUERY_PARAM))
+
+        hits = search_events(text, limit=page_size + 1, offset=offset, live_at=timezone.now())
+        has_next = len(hits) > page_size
+        hits = hits[:page_size]
+
+        results = self.serialize_events([event_id for event_id, _ in hits])
+        url = request.build_absolute_uri()
+        return Response({
+            "next": replace_query_param(url, "offset", offset + page_size) if has_next else None,
+            "previous": replace_query_param(url, "offset", max(0, offset - page_size)) if offset else None,
+            "results": results,
+        })
+
+# Read only endpoint return published events nearest a postcode (or lat / lon),
+# optionally within radius_km; accepts the same filters as the event list
+class EventNearbyAPIView(ReadDatabaseMixin, CompiledSerializerMixin, generics.GenericAPIView):
+
+    serializer_class = EventSerializer
+    filter_backends = [AccessibilityFilterBackend]
+
+    # As on the event list: only events that have not ended, unless a time
+    # range is given (the filter backend applies the rest of the filters)
+    def get_queryset(self):
+        filters = parse_event_filters(self.request.query_params)
+        if filters.upcoming:
+            return EventSearchDocument.objects.filter(live_q(filters.now))
+        return EventSearchDocument.objects.all()
+
+    @staticmethod
+    def _number(params, name):
+        try:
+            return float(params[name])
+        except (KeyError, ValueError):
+            raise ValidationError({name: "Expected a number."})
+
+    # (postcode, latitude, longitude) of the search origin
+    def get_origin(self, params):
+        if params.get("postcode"):
+            postcode = geo.normalise_postcode(params["postcode"])
+            point = geo.locate(postcode)
+            if point is None:
+                raise ValidationError({"postcode": "Unknown or invalid postcode."})
+            return postcode, point[0], point[1]
+        if "lat" in params or "lon" in params:
+            latitude, longitude = self._number(params, "lat"), self._number(params, "lon")
+            if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+                raise ValidationError({"lat": "Coordinates out of range."})
+            return None, latitude, longitude
+        raise ValidationError({"postcode": "A postcode or lat / lon is required."})
+
+    def get(self, request, *args, **kwargs):
+        params = request.query_params
+        postcode, latitude, longitude = self.get_origin(params)
+
+        max_radius = settings.EVENT_NEARBY_MAX_RADIUS_KM
+        radius = max_radius
+        if params.get("radius_km"):
+            radius = self._number(params, "radius_km")
+            if not 0 < radius <= max_radius:
+                raise ValidationError({"radius_km": f"Expected a radius between 0 and {max_radius:g} km."})
+        limit = get_page_size(params.get("limit"))
+
+        queryset = self.filter_queryset(self.get_queryset())
+        hits = geo.nearest(queryset, latitude, longitude, limit, radius)
+
+        results = self.serialize_events([pk for pk, _ in hits])
+        for item, (_, distance) in zip(results, hits):
+            item["distance_km"] = round(distance, 2)
+        return Response({
+            "origin": {"postcode": postcode, "latitude": latitude, "longitude": longitude},
+            "radius_km": radius,
+            "results": results,
+        })
+
+# Read only endpoint return upcoming published events ranked by how well they
+# match a sensory preference vector: <field>=<code> with an optional
+# <field>_weight=<number> for each of matching.SENSORY_FIELDS, plus optional
+# access requirements (wheelchair_access, accessible_toilets,
+# quiet_space_available). Best match first, each with its match_score.
+class EventMatchAPIView(ReadDatabaseMixin, CompiledSerializerMixin, generics.GenericAPIView):
+
+    serializer_class = EventSerializer
+
+    def get(self, request, *args, **kwargs):
+        params = request.query_params
+        preferences = matching.parse_preferences(params)
+        requirements = matching.parse_requirements(params)
+        offset = get_offset(params.get("offset"))
+        page_size = get_page_size(params.get(PAGE_SIZE_QUERY_PARAM))
+
+        count, hits = matching.rank(preferences, requirements, offset=offset, limit=page_size)
+
+        results = self.serialize_events([pk for pk, _ in hits])
+        scores = dict(hits)
+        for item in results:
+            item["match_score"] = round(scores[item["id"]], 4)
+        url = request.build_absolute_uri()
+        return Response({
+            "count": count,
+            "next": replace_query_param(url, "offset", offset + page_size) if offset + page_size < count else None,
+            "previous": replace_query_param(url, "offset", max(0, offset - page_size)) if offset else None,
+            "results": results,
+        })
+
+# Read only endpoint return occurrences of published events starting between
+# ?from= and ?to= (ISO dates or datetimes, a to date covering its whole day;
+# default the next 7 days), in start order, each with its event
+class EventOccurrencesAPIView(ReadDatabaseMixin, CompiledSerializerMixin, generics.GenericAPIView):
+
+    serializer_class = EventSerializer
+    default_days = 7
+
+    def get(self, request, *args, **kwargs):
+        params = request.query_params
+        start = _parse_moment("from", params["from"]) if params.get("from") else timezone.now()
+        if params.get("to"):
+            end = _parse_moment("to", params["to"], end_of_day=True)
+        else:
+            end = start + timedelta(days=self.default_days)
+        if end <= start:
+            raise ValidationError({"to": "Must be after from."})
+        offset = get_offset(params.get("offset"))
+        page_size = get_page_size(params.get(PAGE_SIZE_QUERY_PARAM))
+
+        page = list(occurrences.between(start, end)[offset:offset + page_size + 1])
+        has_next = len(page) > page_size
+        page = page[:page_size]
+
+        event_ids = list(dict.fromkeys(occurrence.event_id for occurrence in page))
+        events = {item["id"]: item for item in self.serialize_events(event_ids)}
+        url = request.build_absolute_uri()
+        return Response({
+            "from": start,
+            "to": end,
+            "next": replace_query_param(url, "offset", offset + page_size) if has_next else None,
+            "previous": replace_query_param(url, "offset", max(0, offset - page_size)) if offset else None,
+            "results": [
+                {
+                    "start_datetime": occurrence.start_datetime,
+                    "end_datetime": occurrence.end_datetime,
+                    "event": events[occurrence.event_id],
+                }
+                for occurrence in page
+                if occurrence.event_id in events
+            ],
+        })
+
+# Read only endpoint return event changes after ?since=<token>, oldest first.
+# Without since, returns only the current token to start syncing from.
+# Each change carries the event's current representation, or null when the
+# event is deleted or no longer published (mirrors drop it).
+class EventChangesAPIView(CompiledSerializerMixin, generics.GenericAPIView):
+
+    serializer_class = EventSerializer
+
+    def get(self, request, *args, **kwargs):
+        if not changes.available():
+            raise changes.ChangeFeedUnavailable()
+        since = request.query_params.get("since")
+        if since is None:
+            return Response({"next": str(changes.head()), "has_more": False, "results": []})
+        if not since.isdigit():
+            raise ValidationError({"since": "Expected a change token."})
+
+        page_size = get_page_size(request.query_params.get(PAGE_SIZE_QUERY_PARAM))
+        try:
+            page, next_token, has_more = changes.changes_since(int(since), page_size)
+        except changes.StaleToken as exc:
+            return Response(
+                {"detail": f"{exc} Re-export the catalogue and sync from a new token."},
+                status=status.HTTP_410_GONE,
+            )
+
+        published = Event.objects.filter(
+            pk__in=[change.event_id for change in page], status=Event.Status.PUBLISHED
+        ).values_list("pk", flat=True)
+        events = {item["id"]: item for item in self.serialize_events(list(published))}
+        return Response({
+            "next": str(next_token),
+            "has_more": has_more,
+            "results": [
+                {
+                    "token": str(change.id),
+                    "event_id": change.event_id,
+                    "kind": change.kind,
+                    "changed_at": change.changed_at,
+                    "event": events.get(change.event_id),
+                }
+                for change in page
+            ],
+        })
+
+# Streamed download of every published event as JSONL / NDJSON / CSV. A plain
+# Django view: the body is produced chunk by chunk, so DRF content
+# negotiation and Response rendering do not apply.
+class EventExportView(View):
+
+    def get(self, request, fmt):
+        if fmt not in EXPORT_FORMATS:
+            raise Http404
+        response = StreamingHttpResponse(stream_export(fmt), content_type=EXPORT_FORMATS[fmt])
+        filename = f"events-{timezone.now():%Y%m%d}.{fmt}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class MainConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "main"
+
+    def ready(self):
+        # Connect signal receivers
+        from . import signals  # noqa: F401
+
+        # Fail loudly when the postcode geocoding data is missing
+        from django.core import checks
+        from .geo import check_outcode_data, check_outcode_data_deploy
+        checks.register(check_outcode_data)
+        checks.register(check_outcode_data_deploy, deploy=True)
+
+        # Refuse to share cached pages keyed on a per-process version
+        from .page_cache import check_shared_version
+        check_shared_version()
@@ -0,0 +1,188 @@
+"""
+============================================================
+File Name: async_views.py
+Brief Description:
+Async variants of the read-only event list, detail and search
+API endpoints (served under /api/async/) for ASGI deployments.
+While a request waits on the database or on a slow client the
+worker's event loop serves other requests, rather than each
+connection holding a thread.
+
+Database reads use Django's async ORM (aiterator, aget,
+aaggregate); raw-SQL full-text search and reference-data
+refreshes, which have no async API, run in worker threads via
+sync_to_async. Events are always serialized through the
+compiled serializer (fast_serializers.py), so bodies match the
+DRF endpoints. Output is JSON only (no browsable API); errors
+use DRF's {"field": [...]} / {"detail": ...} shapes.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.6
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Async list / detail / search endpoints      | user-021
+v1.1    | 2026-10-17 | Reads via the read database                 | user-022
+v1.2    | 2026-10-17 | Upcoming list from UpcomingEvent            | user-024
+v1.3    | 2026-10-17 | No validators for happening=now             | user-016
+v1.4    | 2026-10-17 | Retry failed replica reads on the primary   | user-023
+v1.5    | 2026-10-17 | Bounded ?offset= via get_offset             | user-007
+v1.6    | 2026-10-17 | Search skips ended events                   | user-024
+============================================================
+"""
+
+from asgiref.sync import sync_to_async
+from django.db import DatabaseError
+from django.http import HttpResponse
+from django.utils import timezone
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.urls import replace_query_param
+from . import snapshot
+from .conditional import afiltered_list_validators, alist_stamp, event_validators, filtered_list_validators
+from .db_routers import fail_over, read_database
+from .fast_serializers import compile_serializer
+from .filters import afacet_counts, list_documents, parse_event_filters
+from .lookup_cache import aget_reference_data
+from .metrics import timer
+from .models import Event
+from .pagination import (
+    CURSOR_QUERY_PARAM, PAGE_SIZE_QUERY_PARAM, InvalidCursor, apaginate_keyset, cursor_link, get_offset,
+    get_page_size,
+)
+from .search import search_events
+from .serializers import EventSerializer
+
+
+# Same bytes as DRF's JSON renderer
+def json_response(data, status=200):
+    with timer("render"):
+        content = JSONRenderer().render(data)
+    return HttpResponse(content, status=status, content_type="application/json")
+
+
+# Serialize the events with the given ids, in that order
+async def aserialize_events(event_ids):
+    compiled = compile_serializer(EventSerializer)
+    rows = {row["id"]: row for row in await compiled.avalues(Event.objects.filter(pk__in=event_ids))}
+    reference_data = await aget_reference_data()
+    with timer("serializer"):
+        return compiled.serialize_many((rows[pk] for pk in event_ids if pk in rows), reference_data)
+
+
+# Base for the async endpoints: reads use the read database, and DRF
+# exceptions become JSON error responses
+class AsyncAPIView(View):
+
+    http_method_names = ["get", "head", "options"]
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            with read_database() as state:
+                try:
+                    return await super().dispatch(request, *args, **kwargs)
+                except DatabaseError:
+                    # Closes the replica connection in the ORM's thread
+                    if not await sync_to_async(fail_over)(state):
+                        raise
+                    return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            detail = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+            return json_response(detail, status=exc.status_code)
+
+
+# Async /api/events/: same filters, cursor pages, facets and validators
+class AsyncEventListView(AsyncAPIView):
+
+    async def get(self, request):
+        params = request.GET
+        # Parsing validates codes against reference data, which may need a refresh
+        filters = await sync_to_async(parse_event_filters)(params)
+        if snapshot.enabled():
+            current = await sync_to_async(snapshot.get_snapshot)()
+            validators = filtered_list_validators(request, filters, current.stamp)
+        else:
+            current = None
+            validators = await afiltered_list_validators(request, filters, alist_stamp)
+        not_modified = validators.conditional_response(request)
+        if not_modified is not None:
+            return not_modified
+
+        if current is not None:
+            documents = await sync_to_async(current.select)(filters)
+        else:
+            documents = list_documents(filters)
+        try:
+            page = await apaginate_keyset(
+                documents if current is not None else documents.only("start_datetime"),
+                cursor=params.get(CURSOR_QUERY_PARAM),
+                page_size=params.get(PAGE_SIZE_QUERY_PARAM),
+            )
+        except InvalidCursor:
+            raise NotFound("Invalid cursor")
+
+        if current is not None:
+            reference_data = await aget_reference_data()
+            with timer("serializer"):
+                results = compile_serializer(EventSerializer).serialize_many(page.items, reference_data)
+        else:
+            results = await aserialize_events([document.pk for document in page.items])
+
+        data = {
+            "next": cursor_link(request, page.next_cursor),
+            "previous": cursor_link(request, page.previous_cursor),
+            "results": results,
+        }
+        if params.get("facets", "true").lower() not in ("false", "0", "no"):
+            data["facets"] = await afacet_counts(documents)
+        return validators.apply(json_response(data))
+
+
+# Async /api/events/<pk>/
+class AsyncEventDetailView(AsyncAPIView):
+
+    async def get(self, request, pk):
+        compiled = compile_serializer(EventSerializer)
+        try:
+            row = await compiled.values(Event.objects.all()).aget(pk=pk)
+        except Event.DoesNotExist:
+            raise NotFound()
+
+        validators = event_validators(request, row["id"], row["updated_at"], row["accessibility_profile__updated_at"])
+        not_modified = validators.conditional_response(request)
+        if not_modified is not None:
+            return not_modified
+        reference_data = await aget_reference_data()
+        with timer("serializer"):
+            data = compiled.serialize(row, reference_data)
+        return validators.apply(json_response(data))
+
+
+# Async /api/events/search/?q=
+class AsyncEventSearchView(AsyncAPIView):
+
+    async def get(self, request):
+        params = request.GET
+        text = params.get("q", "").strip()
+        if not text:
+            raise ValidationError({"q": "A search term is required."})
+
+        offset = get_offset(params.get("offset"))
+        page_size = get_page_size(params.get(PAGE_SIZE_QUERY_PARAM))
+
+        # Full-text search is raw SQL, which the async ORM does not cover
+        hits = await sync_to_async(search_events)(text, limit=page_size + 1, offset=offset, live_at=timezone.now())
+        has_next = len(hits) > page_size
+        hits = hits[:page_size]
+
+        results = await aserialize_events([event_id for event_id, _ in hits])
+        url = request.build_absolute_uri()
+        return json_response({
+            "next": replace_query_param(url, "offset", offset + page_size) if has_next else None,
+            "previous": replace_query_param(url, "offset", max(0, offset - page_size)) if offset else None,
+            "results": results,
+        })
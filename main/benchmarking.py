@@ -0,0 +1,326 @@
+"""
+============================================================
+File Name: benchmarking.py
+Brief Description:
+Small helpers shared by the bench_* management commands:
+timing with repeats, building a throwaway synthetic
+catalogue inside a transaction that is rolled back, latency
+percentiles, and JSON result files compared between commits.
+
+The synthetic catalogue builders (build_catalogue,
+feed_records, ...) live here too. They use bulk_create rather
+than Factory Boy so benchmarks and tests can create thousands
+of events quickly; the test suite imports them from here.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.4
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Timing + temporary catalogue helpers        | user-004
+v1.1    | 2026-10-17 | Latency percentiles + JSON result files     | user-020
+v1.2    | 2026-10-17 | Shared WSGI environ for in-process requests | user-022
+v1.3    | 2026-10-17 | Shared chunked catalogue builder            | user-020
+v1.4    | 2026-10-17 | Catalogue builders moved from test_suite    | user-020
+============================================================
+"""
+
+import io
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import django
+
+from django.db import transaction
+from django.utils import timezone
+
+from main import geo
+from main.models import Event, AccessibilityProfile, LookupOption, SensoryCategory
+from main.signals import events_changed
+
+# Reference data mirrors main/fixtures: sensory category -> option codes in display_order
+SENSORY_OPTIONS = {
+    "NOISE": ("LOW", "MEDIUM", "HIGH"),
+    "LIGHTING": ("DIM", "STANDARD", "FLASHING"),
+    "CROWD": ("SMALL", "MEDIUM", "LARGE"),
+    "SENSORY": ("LOW", "MEDIUM", "HIGH"),
+}
+EVENT_CATEGORIES = ("SOCIAL", "SPORTS", "ARTS", "EDUCATION")
+
+# Word lists combined deterministically into event text
+ADJECTIVES = ("Relaxed", "Quiet", "Family", "Evening", "Weekend", "Beginners", "Community", "Outdoor")
+ACTIVITIES = (
+    "Pottery", "Yoga", "Choir", "Cinema", "Swimming", "Gardening", "Chess",
+    "Football", "Coding", "Poetry", "Dance", "Baking", "Theatre", "Walking",
+)
+FORMATS = ("Workshop", "Session", "Club", "Screening", "Meetup", "Class")
+VENUES = ("Community Hall", "Central Library", "Riverside Park", "Town Museum", "Leisure Centre", "Arts Centre")
+NOTES = (
+    "", "Ear defenders available on request.", "Step-free access via the side entrance.",
+    "Hearing loop installed.", "British Sign Language interpreter present.", "Chill-out room next to the main hall.",
+)
+
+
+# Deterministic postcode in one of the bundled outcodes for catalogue event i
+def event_postcode(i):
+    outcodes = sorted(geo.outcode_centroids())
+    return f"{outcodes[i % len(outcodes)]} {i % 10}{'ABDEFGHJ'[i % 8]}{'LNPQRSTU'[(i // 8) % 8]}"
+
+
+# Scatter events up to ~2 km around their outcode centroid so the grid index
+# sees a realistic spread of points
+def place_event(event, i):
+    geo.geocode_event(event)
+    event.latitude += ((i * 7919) % 401 - 200) / 10000
+    event.longitude += ((i * 6007) % 401 - 200) / 10000
+    event.geo_cell_x, event.geo_cell_y = geo.grid_cell(event.latitude, event.longitude)
+    return event
+
+
+# Deterministic (title, description, location, postcode, notes) for catalogue event i
+def event_text(i):
+    adjective = ADJECTIVES[i % len(ADJECTIVES)]
+    activity = ACTIVITIES[(i // len(ADJECTIVES)) % len(ACTIVITIES)]
+    event_format = FORMATS[(i // 3) % len(FORMATS)]
+    venue = VENUES[(i // 5) % len(VENUES)]
+    title = f"{adjective} {activity} {event_format} {i}"
+    description = (
+        f"A {adjective.lower()} {activity.lower()} {event_format.lower()} at the {venue}. "
+        f"Suitable for {('all ages', 'adults', 'young people', 'families')[i % 4]}."
+    )
+    return title, description, venue, event_postcode(i), NOTES[(i // 2) % len(NOTES)]
+
+
+# Create (or reuse) the reference data used by built catalogues.
+# Returns {"EVENT_CATEGORY": [options], "NOISE": [options], ...}
+def build_reference_data():
+    options = {"EVENT_CATEGORY": []}
+    for code in EVENT_CATEGORIES:
+        option, _ = LookupOption.objects.get_or_create(
+            option_type=LookupOption.OptionType.EVENT_CATEGORY,
+            category=None,
+            code=code,
+            defaults={"label": code.title()},
+        )
+        options["EVENT_CATEGORY"].append(option)
+
+    for order, (category_code, codes) in enumerate(SENSORY_OPTIONS.items(), start=1):
+        category, _ = SensoryCategory.objects.get_or_create(
+            code=category_code,
+            defaults={"label": category_code.title(), "display_order": order},
+        )
+        options[category_code] = []
+        for rank, code in enumerate(codes, start=1):
+            option, _ = LookupOption.objects.get_or_create(
+                option_type=LookupOption.OptionType.ACCESSIBILITY_LEVEL,
+                category=category,
+                code=code,
+                defaults={"label": code.title(), "display_order": rank},
+            )
+            options[category_code].append(option)
+    return options
+
+
+# Bulk create event_count events, each with its own AccessibilityProfile.
+# offset numbers the events so large catalogues can be built in several calls
+def build_catalogue(event_count, status=Event.Status.PUBLISHED, batch_size=2000, offset=0):
+    options = build_reference_data()
+    start = timezone.now()
+
+    profiles = [
+        AccessibilityProfile(
+            wheelchair_access=i % 2 == 0,
+            accessible_toilets=(True, False, None)[i % 3],
+            quiet_space_available=(True, False, None)[(i // 3) % 3],
+            noise_level=options["NOISE"][i % 3],
+            lighting_conditions=options["LIGHTING"][(i // 2) % 3],
+            crowd_level=options["CROWD"][(i // 5) % 3],
+            sensory_level=options["SENSORY"][(i // 7) % 3],
+            additional_notes=event_text(i)[4],
+        )
+        for i in range(offset, offset + event_count)
+    ]
+    profiles = AccessibilityProfile.objects.bulk_create(profiles, batch_size=batch_size)
+
+    categories = options["EVENT_CATEGORY"]
+    events = []
+    for i, profile in enumerate(profiles, start=offset):
+        title, description, venue, postcode, _ = event_text(i)
+        events.append(place_event(Event(
+            title=title,
+            description=description,
+            category=categories[i % len(categories)],
+            status=status,
+            start_datetime=start + timedelta(hours=i),
+            end_datetime=start + timedelta(hours=i + 2),
+            location_text=venue,
+            postcode=postcode,
+            accessibility_profile=profile,
+        ), i))
+    events = Event.objects.bulk_create(events, batch_size=batch_size)
+
+    # bulk_create skips model signals; refresh derived data explicitly
+    events_changed.send(sender=Event, event_ids=[event.pk for event in events], created=True, events=events)
+    return events
+
+
+# Partner feed records (string values, as read from CSV) for event_count events
+def feed_records(event_count, offset=0):
+    start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    for i in range(offset, offset + event_count):
+        title, description, venue, postcode, notes = event_text(i)
+        yield {
+            "external_id": f"EXT-{i}",
+            "title": title,
+            "description": description,
+            "category": EVENT_CATEGORIES[i % len(EVENT_CATEGORIES)],
+            "status": "PUBLISHED",
+            "start_datetime": (start + timedelta(hours=i)).isoformat(),
+            "end_datetime": (start + timedelta(hours=i + 2)).isoformat(),
+            "location_text": venue,
+            "postcode": postcode,
+            "age_min": "" if i % 3 else "5",
+            "age_max": "",
+            "price": f"{i % 20}.50" if i % 4 else "",
+            "booking_required": "yes" if i % 5 == 0 else "no",
+            "booking_url": "",
+            "wheelchair_access": "true" if i % 2 == 0 else "false",
+            "accessible_toilets": ("true", "false", "")[i % 3],
+            "quiet_space_available": ("true", "false", "unknown")[(i // 3) % 3],
+            "noise_level": SENSORY_OPTIONS["NOISE"][i % 3],
+            "lighting_conditions": SENSORY_OPTIONS["LIGHTING"][(i // 2) % 3],
+            "crowd_level": SENSORY_OPTIONS["CROWD"][(i // 5) % 3],
+            "sensory_level": SENSORY_OPTIONS["SENSORY"][(i // 7) % 3],
+            "additional_notes": notes,
+        }
+
+
+# Best wall-clock time in seconds of fn() over repeat runs
+def best_of(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+# Build the synthetic events numbered start to target - 1, chunk at a time
+# to bound memory use; returns their ids
+def grow_catalogue(target, chunk=20000, start=0):
+    created = []
+    for offset in range(start, target, chunk):
+        created += [event.pk for event in build_catalogue(min(chunk, target - offset), offset=offset)]
+    return created
+
+
+# Build event_count synthetic events, yield them, then roll everything back
+@contextmanager
+def temporary_catalogue(event_count, **kwargs):
+    with transaction.atomic():
+        yield build_catalogue(event_count, **kwargs)
+        transaction.set_rollback(True)
+
+
+# Nearest-rank percentile (0-100) of already sorted samples
+def percentile(samples, p):
+    return samples[max(0, math.ceil(p / 100 * len(samples)) - 1)]
+
+
+# Call fn() count times; throughput and latency percentiles in milliseconds
+def latency_stats(fn, count):
+    samples = []
+    started = time.perf_counter()
+    for _ in range(count):
+        begun = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - begun)
+    elapsed = time.perf_counter() - started
+    samples.sort()
+    return {
+        "requests": count,
+        "throughput_rps": round(count / elapsed, 1),
+        "mean_ms": round(sum(samples) / count * 1000, 3),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "max_ms": round(samples[-1] * 1000, 3),
+    }
+
+
+# Current git commit (None outside a checkout) and whether the tree is dirty
+def git_revision():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, dirty
+
+
+# Result document with the environment it was measured in
+def result_document(results, **context):
+    commit, dirty = git_revision()
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "recorded_at": datetime.now(dt_timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        **context,
+        "results": results,
+    }
+
+
+def write_results(path, document):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+# (key, metric, baseline, current, change) for each p50 / p99 that got
+# slower than the baseline by more than threshold (a fraction); results
+# are matched on key(result)
+def regressions(baseline, current, key, threshold=0.1, metrics=("p50_ms", "p99_ms")):
+    previous = {key(result): result for result in baseline["results"]}
+    found = []
+    for result in current["results"]:
+        before = previous.get(key(result))
+        if before is None:
+            continue
+        for metric in metrics:
+            if before[metric] and result[metric] > before[metric] * (1 + threshold):
+                found.append((key(result), metric, before[metric], result[metric], result[metric] / before[metric] - 1))
+    return found
+
+
+# Minimal WSGI environ for a GET, to drive WSGIHandler() without a server
+def wsgi_environ(path, query=""):
+    return {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "SERVER_NAME": "testserver",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": "127.0.0.1",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
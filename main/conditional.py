@@ -0,0 +1,194 @@
+"""
+============================================================
+File Name: conditional.py
+Brief Description:
+ETag / Last-Modified validators for the events API so polling
+clients receive 304 Not Modified without anything being
+serialized.
+
+  * Detail: the event's and its AccessibilityProfile's
+    updated_at, read from the row the view loads anyway.
+  * List: one aggregate (Max updated_at, Count) over the
+    EventSearchDocument table. Documents are rewritten whenever
+    an event, its profile or its lookup options change, and
+    deletions lower the count. A removed document takes its
+    updated_at with it, so Last-Modified is also at least
+    CatalogueState.removed_at. With the in-memory snapshot on
+    (snapshot.py) the same stamp comes from the snapshot.
+  * Upcoming list (no time-range filter): the same aggregate
+    over the UpcomingEvent rows not yet ended (live_until, the
+    end of a recurring event's last occurrence), plus the next
+    such end, since the list also changes when an event ends.
+    Last-Modified counts the latest end already passed.
+  * happening=now: the list changes whenever any event starts
+    or ends, which no stamp above tracks, so it is sent with
+    Cache-Control: no-cache and no validators (UNVALIDATED).
+
+ETags also cover the reference-data version (lookup labels),
+the request path / query string and the response format, and
+are strong: equal tags mean byte-identical bodies.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.8
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | ETag / Last-Modified for events API         | user-009
+v1.1    | 2026-10-17 | Shared catalogue_stamp() for page cache     | user-010
+v1.2    | 2026-10-17 | List stamp from the in-memory snapshot      | user-018
+v1.3    | 2026-10-17 | acatalogue_stamp() for async views          | user-021
+v1.4    | 2026-10-17 | Upcoming list stamp                         | user-024
+v1.5    | 2026-10-17 | Stamps read from covering indexes           | user-025
+v1.6    | 2026-10-17 | Last-Modified covers removed events         | user-009
+v1.7    | 2026-10-17 | No validators for happening=now lists       | user-016
+v1.8    | 2026-10-17 | Upcoming stamp follows live_until           | user-024
+============================================================
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Count, Max, Min, Subquery
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+from .lookup_cache import current_version
+from .models import CatalogueState, EventSearchDocument, UpcomingEvent
+from .search_documents import live_q
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    last_modified: datetime = None
+
+    # 304 / 412 response when the request's conditions say so, else None
+    def conditional_response(self, request):
+        if self.etag is None:
+            return None
+        timestamp = int(self.last_modified.timestamp()) if self.last_modified else None
+        return get_conditional_response(request, etag=self.etag, last_modified=timestamp)
+
+    def apply(self, response):
+        if self.etag is None:
+            patch_cache_control(response, no_cache=True)
+            return response
+        response["ETag"] = self.etag
+        if self.last_modified:
+            response["Last-Modified"] = http_date(self.last_modified.timestamp())
+        patch_vary_headers(response, ["Accept"])
+        return response
+
+
+# For responses that must be fetched afresh every time
+UNVALIDATED = Validators(etag=None)
+
+
+def make_etag(request, *parts):
+    renderer = getattr(getattr(request, "accepted_renderer", None), "format", "")
+    key = "|".join(str(part) for part in (*parts, current_version(), renderer, request.get_full_path()))
+    return f'"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+
+# Validators for one event from its own and its profile's updated_at
+def event_validators(request, pk, updated_at, profile_updated_at):
+    last_modified = max(updated_at, profile_updated_at)
+    return Validators(make_etag(request, "event", pk, updated_at, profile_updated_at), last_modified)
+
+
+# Latest of the given datetimes, ignoring None
+def _latest(*moments):
+    return max(filter(None, moments), default=None)
+
+
+# When a published event last left the catalogue (None if never)
+def removed_at():
+    return CatalogueState.objects.filter(pk=1).values_list("removed_at", flat=True).first()
+
+
+# Read in the stamp's own aggregate query, as a constant subquery
+def _removed_at_subquery():
+    return Max(Subquery(CatalogueState.objects.filter(pk=1).values("removed_at")))
+
+
+def _catalogue_aggregates():
+    return {"count": Count("pk"), "last_modified": Max("updated_at"), "removed_at": _removed_at_subquery()}
+
+
+# (count, last_modified) of published events: one aggregate query
+def catalogue_stamp():
+    stamp = EventSearchDocument.objects.order_by().aggregate(**_catalogue_aggregates())
+    return stamp["count"], _latest(stamp["last_modified"], stamp["removed_at"])
+
+
+async def acatalogue_stamp():
+    stamp = await EventSearchDocument.objects.order_by().aaggregate(**_catalogue_aggregates())
+    return stamp["count"], _latest(stamp["last_modified"], stamp["removed_at"])
+
+
+def _upcoming_aggregates(now):
+    last_ended = (
+        EventSearchDocument.objects.filter(live_until__lte=now)
+        .order_by("-live_until").values("live_until")[:1]
+    )
+    return {
+        "count": Count("pk"),
+        "last_modified": Max("updated_at"),
+        "next_end": Min("live_until"),
+        # Constant across rows; only read when there are live rows
+        "last_ended": Max(Subquery(last_ended)),
+        "removed_at": _removed_at_subquery(),
+    }
+
+
+def _upcoming_result(stamp):
+    if not stamp["count"]:
+        return 0, None, None
+    last_modified = _latest(stamp["last_modified"], stamp["last_ended"], stamp["removed_at"])
+    return stamp["count"], last_modified, stamp["next_end"]
+
+
+# (count, last_modified, next end) of the events not ended at now: one
+# aggregate over the UpcomingEvent rows, read from a covering index
+def upcoming_stamp(now):
+    live = UpcomingEvent.objects.filter(live_q(now)).order_by()
+    return _upcoming_result(live.aggregate(**_upcoming_aggregates(now)))
+
+
+async def aupcoming_stamp(now):
+    live = UpcomingEvent.objects.filter(live_q(now)).order_by()
+    return _upcoming_result(await live.aaggregate(**_upcoming_aggregates(now)))
+
+
+# Stamp of the event list for filters (filters.py)
+def list_stamp(filters):
+    return upcoming_stamp(filters.now) if filters.upcoming else catalogue_stamp()
+
+
+async def alist_stamp(filters):
+    return await aupcoming_stamp(filters.now) if filters.upcoming else await acatalogue_stamp()
+
+
+# Validators for the published event list; stamp, when given, replaces
+# catalogue_stamp() (e.g. list_stamp(), or one from the in-memory snapshot)
+def event_list_validators(request, stamp=None):
+    stamp = stamp or catalogue_stamp()
+    return Validators(make_etag(request, "events", *stamp), stamp[1])
+
+
+# Validators for the list under filters; get_stamp is only called for lists
+# that do not move with the clock
+def filtered_list_validators(request, filters, get_stamp):
+    if filters.relative:
+        return UNVALIDATED
+    return event_list_validators(request, get_stamp(filters))
+
+
+async def afiltered_list_validators(request, filters, get_stamp):
+    if filters.relative:
+        return UNVALIDATED
+    return event_list_validators(request, await get_stamp(filters))
@@ -0,0 +1,262 @@
+"""
+============================================================
+File Name: db_routers.py
+Brief Description:
+Database routing for public read traffic. Views that only read
+(ReadDatabaseMixin, or code inside read_database()) send their
+ORM reads to, in order of preference:
+
+  1. a replica from settings.EVENT_REPLICA_DATABASES, chosen
+     at random once per request so its reads see one
+     consistent copy; replicas that fail to connect are skipped
+     for EVENT_REPLICA_RETRY_SECONDS. A replica that fails a
+     read mid-request is skipped the same way and the request
+     is run once more against the primary;
+  2. settings.EVENT_READ_DATABASE (the query-only "read"
+     connection in wal mode, see config/database.py);
+  3. "default".
+
+Every write goes to "default". Once a request writes, its
+remaining reads use "default" too, and ReplicaPinMiddleware
+sets a short-lived cookie (EVENT_REPLICA_PIN_SECONDS) so the
+client's next requests also read from "default" until replicas
+have caught up with its write.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Read-only alias router for public views     | user-022
+v1.1    | 2026-10-17 | Replica routing, pin-after-write, fallback  | user-023
+v1.2    | 2026-10-17 | Retry failed replica reads on the primary   | user-023
+============================================================
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from .metrics import timer
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+PIN_COOKIE = "db_pin"
+
+
+class RoutingState:
+    """Routing for one request (or one read_database() block outside a request)."""
+
+    def __init__(self, pinned=False):
+        # Reads go to the primary (the request or a recent one wrote)
+        self.pinned = pinned
+        self.wrote = False
+        # Inside read_database()
+        self.reading = False
+        # Read alias chosen for this request (None: default routing)
+        self.alias = None
+        self.chosen = False
+
+
+_state = ContextVar("database_routing", default=None)
+
+
+class ReplicaHealth:
+    """Process-local record of replicas that recently failed to connect."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._down_until = {}
+
+    def mark_down(self, alias):
+        with self._lock:
+            self._down_until[alias] = time.monotonic() + getattr(settings, "EVENT_REPLICA_RETRY_SECONDS", 30)
+
+    def reset(self):
+        with self._lock:
+            self._down_until.clear()
+
+    # Connect (and, for a new connection, probe) the replica in this thread
+    def available(self, alias):
+        if time.monotonic() < self._down_until.get(alias, 0):
+            return False
+        connection = connections[alias]
+        try:
+            if connection.connection is None:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1 FROM django_migrations LIMIT 1")
+            else:
+                connection.ensure_connection()
+        except DatabaseError:
+            connection.close()
+            self.mark_down(alias)
+            return False
+        return True
+
+
+replica_health = ReplicaHealth()
+
+
+def read_alias():
+    alias = getattr(settings, "EVENT_READ_DATABASE", None)
+    return alias if alias in settings.DATABASES else None
+
+
+def replica_aliases():
+    return [alias for alias in getattr(settings, "EVENT_REPLICA_DATABASES", ()) if alias in settings.DATABASES]
+
+
+# Alias for this request's routed reads: a live replica, else the read alias
+def choose_read_alias():
+    replicas = [alias for alias in replica_aliases() if replica_health.available(alias)]
+    if replicas:
+        return random.choice(replicas)
+    return read_alias()
+
+
+# After a read raised DatabaseError: when it ran on a replica, mark the replica
+# down and pin the rest of the request to the primary. Returns whether the
+# read is worth retrying.
+def fail_over(state):
+    alias = state.alias
+    if state.pinned or alias not in replica_aliases():
+        return False
+    connections[alias].close()
+    replica_health.mark_down(alias)
+    state.pinned = True
+    return True
+
+
+# Route ORM reads in the block to a replica or the read alias, when configured
+@contextmanager
+def read_database():
+    state = _state.get()
+    token = None
+    if state is None:
+        state = RoutingState()
+        token = _state.set(state)
+    reading, state.reading = state.reading, True
+    try:
+        yield state
+    finally:
+        state.reading = reading
+        if token is not None:
+            _state.reset(token)
+
+
+# Read from the primary in the block, e.g. to build process-wide caches that
+# must not capture a lagging replica's rows
+@contextmanager
+def primary_database():
+    state = _state.get()
+    if state is None:
+        yield
+        return
+    reading, state.reading = state.reading, False
+    try:
+        yield
+    finally:
+        state.reading = reading
+
+
+class ReadDatabaseRouter:
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.reading or state.pinned:
+            return None
+        if not state.chosen:
+            state.alias, state.chosen = choose_read_alias(), True
+        return state.alias
+
+    # Writes go to the primary and pin the rest of the request to it
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = state.pinned = True
+        return None
+
+    # Replicas and the read alias hold the default database's rows, so objects may mix
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, read_alias(), *replica_aliases()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    # Never migrate through the read alias or a replica
+    def allow_migrate(self, db, app_label, **hints):
+        if db == read_alias() or db in replica_aliases():
+            return False
+        return None
+
+
+# Tracks writes per request: requests carrying the pin cookie read from the
+# primary, and a request that writes sets it
+class ReplicaPinMiddleware:
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        state = RoutingState(pinned=PIN_COOKIE in request.COOKIES)
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self.pin(state, response)
+
+    async def __acall__(self, request):
+        state = RoutingState(pinned=PIN_COOKIE in request.COOKIES)
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self.pin(state, response)
+
+    @staticmethod
+    def pin(state, response):
+        if state.wrote and replica_aliases():
+            seconds = getattr(settings, "EVENT_REPLICA_PIN_SECONDS", 10)
+            response.set_cookie(PIN_COOKIE, "1", max_age=seconds, httponly=True, samesite="Lax")
+        return response
+
+
+# Serve safe requests from a replica or the read alias, once more from the
+# primary if the replica fails. Template responses are rendered inside the
+# block, since templates may still run queries.
+class ReadDatabaseMixin:
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+        with read_database() as state:
+            try:
+                return self.read_response(request, *args, **kwargs)
+            except DatabaseError:
+                if not fail_over(state):
+                    raise
+                return self.read_response(request, *args, **kwargs)
+
+    def read_response(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+        if hasattr(response, "render") and not getattr(response, "is_rendered", True):
+            with timer("render"):
+                response.render()
+        return response
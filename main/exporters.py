@@ -0,0 +1,129 @@
+"""
+============================================================
+File Name: exporters.py
+Brief Description:
+Streaming bulk export of the published catalogue, used by the
+/api/events/export.<format> endpoint and
+`python manage.py export_events`.
+
+Events are read with a single values() query iterated in
+chunks (queryset.iterator(chunk_size=...), a server-side
+cursor on PostgreSQL), serialized a chunk at a time through the
+compiled EventSerializer (fast_serializers.py) and yielded as
+encoded text. Nothing larger than one chunk is held in memory,
+so peak memory does not grow with the catalogue.
+
+Formats:
+  * jsonl / ndjson: one EventSerializer object per line, the
+    same shape as /api/events/<id>/.
+  * csv: one flat row per event, with lookup fields as codes
+    and profile fields inlined. Column names match the import
+    feed (see importers.py), so an export can be re-imported.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Streaming JSONL / CSV catalogue export      | user-013
+============================================================
+"""
+
+import csv
+import io
+from itertools import islice
+
+from django.conf import settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from .fast_serializers import compile_serializer
+from .models import Event
+from .serializers import EventSerializer
+
+# Export format -> response content type
+FORMATS = {
+    "jsonl": "application/x-ndjson",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# CSV columns: event fields, then the accessibility profile fields inlined
+EVENT_COLUMNS = (
+    "id", "title", "description", "category", "age_min", "age_max", "start_datetime", "end_datetime",
+    "location_text", "postcode", "price", "booking_required", "booking_url", "status",
+    "created_at", "updated_at",
+)
+PROFILE_COLUMNS = (
+    "wheelchair_access", "accessible_toilets", "quiet_space_available",
+    "noise_level", "lighting_conditions", "crowd_level", "sensory_level", "additional_notes",
+)
+CSV_COLUMNS = EVENT_COLUMNS + PROFILE_COLUMNS
+
+
+def default_chunk_size():
+    return getattr(settings, "EVENT_EXPORT_CHUNK_SIZE", 2000)
+
+
+def published_events():
+    return Event.objects.filter(status=Event.Status.PUBLISHED).order_by("pk")
+
+
+# Yield lists of serialized events, at most chunk_size at a time
+def serialized_chunks(queryset=None, chunk_size=None):
+    chunk_size = chunk_size or default_chunk_size()
+    compiled = compile_serializer(EventSerializer)
+    queryset = published_events() if queryset is None else queryset
+    rows = compiled.values(queryset).iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield compiled.serialize_many(chunk)
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, dict):
+        return value["code"]
+    return value
+
+
+# Flat CSV row for one serialized event
+def flatten(item):
+    profile = item["accessibility_profile"]
+    row = {name: _cell(item[name]) for name in EVENT_COLUMNS}
+    row.update((name, _cell(profile[name])) for name in PROFILE_COLUMNS)
+    return row
+
+
+def _jsonl(chunks):
+    encoder = JSONEncoder(ensure_ascii=False)
+    for items in chunks:
+        yield "".join(encoder.encode(item) + "\n" for item in items)
+
+
+def _csv(chunks):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    for items in chunks:
+        writer.writerows(flatten(item) for item in items)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+# Yield the export as text pieces (one per chunk of events)
+def stream_export(fmt, queryset=None, chunk_size=None):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {', '.join(FORMATS)}.")
+    chunks = serialized_chunks(queryset, chunk_size)
+    return _csv(chunks) if fmt == "csv" else _jsonl(chunks)
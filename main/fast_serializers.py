@@ -0,0 +1,162 @@
+"""
+============================================================
+File Name: fast_serializers.py
+Brief Description:
+Opt-in compiled fast path for read-only ModelSerializers.
+A serializer declaration (e.g. EventSerializer) is compiled
+once into a plain Python function that builds the same JSON
+shape straight from queryset.values() rows, with LookupOption
+fields resolved from the reference-data cache. This skips the
+per-row, per-field DRF machinery (field binding, get_attribute,
+nested serializer instances) that dominates large list renders.
+
+Enabled for the events API with settings.EVENT_API_FAST_SERIALIZER.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Compiled values()-based serializer          | user-004
+v1.1    | 2026-10-17 | Async row loading for async views           | user-021
+============================================================
+"""
+
+import datetime
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from .lookup_cache import get_reference_data
+from .serializers import CachedLookupOptionField
+
+# Fields whose DRF representation of a non-null database value is the value itself
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+)
+
+
+class CompiledSerializer:
+    """values()-row serializer compiled from a ModelSerializer class."""
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self.value_fields = []
+        self.converters = []
+
+        serializer = serializer_class()
+        body = self._compile(serializer, serializer_class.Meta.model, "", indent=1)
+        source = f"def build(row, represent, convert, as_datetime):\n    return {body}\n"
+        namespace = {}
+        exec(compile(source, f"<compiled {serializer_class.__name__}>", "exec"), namespace)
+        self.source = source
+        self._build = namespace["build"]
+
+    # Emit a dict literal for serializer, reading row keys prefixed with prefix
+    def _compile(self, serializer, model, prefix, indent):
+        pad = "    " * (indent + 1)
+        lines = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            lines.append(f"{pad}{name!r}: {self._compile_field(field, model, prefix, indent)},")
+        return "{\n" + "\n".join(lines) + "\n" + "    " * indent + "}"
+
+    def _compile_field(self, field, model, prefix, indent):
+        if field.source == "*" or "." in field.source:
+            raise ImproperlyConfigured(
+                f"Cannot compile field {field.field_name!r}: only plain attribute sources are supported."
+            )
+        if isinstance(field, serializers.ListSerializer):
+            raise ImproperlyConfigured(f"Cannot compile many=True field {field.field_name!r}.")
+
+        if isinstance(field, serializers.BaseSerializer):
+            model_field = model._meta.get_field(field.source)
+            related = model_field.related_model
+            nested = self._compile(field, related, f"{prefix}{field.source}__", indent + 1)
+            if model_field.null:
+                pk = self._value(f"{prefix}{field.source}__{related._meta.pk.name}")
+                return f"(None if {pk} is None else {nested})"
+            return nested
+
+        key = self._value(f"{prefix}{field.source}")
+
+        if isinstance(field, CachedLookupOptionField):
+            return f"represent({key})"
+
+        if isinstance(field, PASSTHROUGH_FIELDS):
+            return key
+
+        if isinstance(field, serializers.DateTimeField) and self._is_iso_datetime(field):
+            return f"as_datetime({key})"
+
+        # Anything else goes through the bound DRF field's own to_representation
+        self.converters.append(field.to_representation)
+        index = len(self.converters) - 1
+        return f"(None if {key} is None else convert[{index}]({key}))"
+
+    @staticmethod
+    def _is_iso_datetime(field):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        return isinstance(output_format, str) and output_format.lower() == ISO_8601
+
+    def _value(self, path):
+        if path not in self.value_fields:
+            self.value_fields.append(path)
+        return f"row[{path!r}]"
+
+    # Restrict a queryset to the columns this serializer reads
+    def values(self, queryset):
+        return queryset.values(*self.value_fields)
+
+    # values() rows of queryset, read with aiterator() for async views
+    async def avalues(self, queryset):
+        return [row async for row in self.values(queryset).aiterator()]
+
+    # Serialize an iterable of values() rows; async callers pass the
+    # reference data (lookup_cache.aget_reference_data()) so nothing here
+    # can touch the database
+    def serialize_many(self, rows, reference_data=None):
+        represent = (reference_data or get_reference_data()).represent
+        as_datetime = _datetime_converter()
+        build, convert = self._build, self.converters
+        return [build(row, represent, convert, as_datetime) for row in rows]
+
+    def serialize(self, row, reference_data=None):
+        return self.serialize_many([row], reference_data)[0]
+
+
+# Same output as DRF DateTimeField with the ISO 8601 format, in the active timezone
+def _datetime_converter():
+    current = timezone.get_current_timezone() if settings.USE_TZ else None
+
+    def as_datetime(value):
+        if not value:
+            return None
+        if isinstance(value, str):
+            return value
+        if current is not None:
+            value = value.astimezone(current) if timezone.is_aware(value) else timezone.make_aware(value, current)
+        elif timezone.is_aware(value):
+            value = timezone.make_naive(value, datetime.timezone.utc)
+        value = value.isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return as_datetime
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(serializer_class) -> CompiledSerializer:
+    return CompiledSerializer(serializer_class)
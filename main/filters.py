@@ -0,0 +1,351 @@
+"""
+============================================================
+File Name: filters.py
+Brief Description:
+Accessibility-aware filtering and facet counts for the events
+API, run against the flat EventSearchDocument table so each
+discovery query is a single-table scan. Sensory "max level"
+filters compare LookupOption display_order ranks within the
+field's sensory category, with codes validated against the
+reference-data cache. Parameters are parsed once into
+EventFilters, which compiles to a Q object here or to a NumPy
+mask over the in-memory snapshot (snapshot.py).
+
+Supported query parameters on /api/events/:
+  wheelchair_access=true|false
+  accessible_toilets=true|false|unknown
+  quiet_space_available=true|false|unknown
+  max_noise_level=<code>, max_crowd_level=<code>, max_sensory_level=<code>
+  lighting_conditions=<code>[,<code>...]
+  category=<code>[,<code>...]
+  starts_after=<date/datetime>, starts_before=<date/datetime>
+  from=<date/datetime>, to=<date/datetime>  (events overlapping the window)
+  happening=now
+  age=<years>
+  max_price=<amount>
+
+Without a time-range parameter (starts_after, starts_before,
+from, to, happening) the list shows events that have not ended,
+read from the UpcomingEvent working set (list_documents());
+with one it searches every published event.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.10
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Accessibility filters + facet counts        | user-005
+v1.1    | 2026-10-17 | Filter / facet on EventSearchDocument       | user-006
+v1.2    | 2026-10-17 | from / to overlap + happening=now filters   | user-016
+v1.3    | 2026-10-17 | Parse filters once for the Q / snapshot paths | user-018
+v1.4    | 2026-10-17 | Async facet counts (aaggregate)             | user-021
+v1.5    | 2026-10-17 | Upcoming-only list via UpcomingEvent        | user-024
+v1.6    | 2026-10-17 | 400 for impossible dates                    | user-005
+v1.7    | 2026-10-17 | happening=now lists are marked relative     | user-016
+v1.8    | 2026-10-17 | Upcoming list keeps live recurring events   | user-024
+v1.9    | 2026-10-17 | 400 for NaN / Infinity max_price            | user-005
+v1.10   | 2026-10-17 | Windows match any occurrence of an event    | user-016
+============================================================
+"""
+
+from dataclasses import dataclass, field as dataclass_field
+from datetime import datetime, time
+from decimal import Decimal, InvalidOperation
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .lookup_cache import get_reference_data
+from .search_documents import live_q
+from .time_windows import overlapping
+from .models import AccessibilityProfile, EventSearchDocument, LookupOption, UpcomingEvent
+
+TRUE_VALUES = {"true", "1", "yes"}
+FALSE_VALUES = {"false", "0", "no"}
+UNKNOWN_VALUES = {"unknown", "null"}
+
+# Query parameter -> AccessibilityProfile sensory field filtered by maximum rank
+MAX_LEVEL_PARAMS = {
+    "max_noise_level": "noise_level",
+    "max_crowd_level": "crowd_level",
+    "max_sensory_level": "sensory_level",
+}
+BOOLEAN_FIELDS = ("wheelchair_access",)
+TRI_STATE_FIELDS = ("accessible_toilets", "quiet_space_available")
+
+
+def _parse_bool(name, value, allow_unknown=False):
+    value = value.strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    if allow_unknown and value in UNKNOWN_VALUES:
+        return None
+    choices = "true, false or unknown" if allow_unknown else "true or false"
+    raise ValidationError({name: f"Expected {choices}."})
+
+
+# Dates are tried first: parse_datetime() also accepts a bare date, as midnight.
+# Both parsers raise ValueError for well-formed but impossible values (2026-02-30).
+def _parse_moment(name, value, end_of_day=False):
+    try:
+        day = parse_date(value)
+        moment = None if day is not None else parse_datetime(value)
+    except ValueError:
+        raise ValidationError({name: "Not a valid date or datetime."})
+    if day is not None:
+        moment = datetime.combine(day, time.max if end_of_day else time.min)
+    elif moment is None:
+        raise ValidationError({name: "Expected an ISO 8601 date or datetime."})
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def _parse_codes(value):
+    return [code.strip().upper() for code in value.split(",") if code.strip()]
+
+
+# Active options of a sensory field, in display order
+def sensory_options(field):
+    data = get_reference_data()
+    category = data.get_category_by_code(AccessibilityProfile.SENSORY_CATEGORY_CODES[field])
+    if category is None:
+        return []
+    return [option for option in data.options_in_category(category.pk) if option.is_active]
+
+
+def _known_codes(param, codes, options):
+    known = {option.code for option in options}
+    unknown = [code for code in codes if code not in known]
+    if unknown:
+        raise ValidationError({param: f"Unknown code(s): {', '.join(unknown)}."})
+    return codes
+
+
+# Parsed, validated filter parameters. Compiled to a Q object over
+# EventSearchDocument by as_q(), or to a NumPy mask by snapshot.py.
+@dataclass
+class EventFilters:
+    # Access flag -> True / False / None (unknown)
+    flags: dict = dataclass_field(default_factory=dict)
+    # Sensory field -> the LookupOption whose display_order is the maximum
+    max_levels: dict = dataclass_field(default_factory=dict)
+    lighting_codes: list = None
+    category_codes: list = None
+    starts_after: datetime = None
+    starts_before: datetime = None
+    # (start, end) windows events must overlap; start == end is an instant and
+    # None leaves that side open
+    windows: list = dataclass_field(default_factory=list)
+    age: int = None
+    max_price: Decimal = None
+    # When the filters were parsed; upcoming lists hide events ended by then
+    now: datetime = dataclass_field(default_factory=timezone.now)
+
+    # No time-range parameter: list only the events that have not ended
+    @property
+    def upcoming(self):
+        return not (self.starts_after or self.starts_before or self.windows)
+
+    # ?happening=now: the result set moves whenever an event starts or ends,
+    # so it has no stable validators (conditional.py)
+    @property
+    def relative(self):
+        return (self.now, self.now) in self.windows
+
+    def as_q(self) -> Q:
+        query = Q()
+        for name, value in self.flags.items():
+            query &= Q(**{f"{name}__isnull": True}) if value is None else Q(**{name: value})
+        for name, limit in self.max_levels.items():
+            query &= Q(**{f"{name}_rank__lte": limit.display_order})
+        if self.lighting_codes is not None:
+            query &= Q(lighting_conditions_code__in=self.lighting_codes)
+        if self.category_codes is not None:
+            query &= Q(category_code__in=self.category_codes)
+        if self.starts_after:
+            query &= Q(start_datetime__gte=self.starts_after)
+        if self.starts_before:
+            query &= Q(start_datetime__lte=self.starts_before)
+        for start, end in self.windows:
+            query &= _window_q(start, end)
+        if self.age is not None:
+            age = self.age
+            query &= (Q(age_min__isnull=True) | Q(age_min__lte=age)) & (Q(age_max__isnull=True) | Q(age_max__gte=age))
+        if self.max_price is not None:
+            query &= Q(price__lte=self.max_price)
+        return query
+
+
+# Parse and validate the filters present in params
+def parse_event_filters(params) -> EventFilters:
+    filters = EventFilters(now=timezone.now())
+
+    for name in BOOLEAN_FIELDS:
+        if params.get(name):
+            filters.flags[name] = _parse_bool(name, params[name])
+
+    for name in TRI_STATE_FIELDS:
+        if params.get(name):
+            filters.flags[name] = _parse_bool(name, params[name], allow_unknown=True)
+
+    for param, name in MAX_LEVEL_PARAMS.items():
+        if params.get(param):
+            code = params[param].strip().upper()
+            limit = {option.code: option for option in sensory_options(name)}.get(code)
+            if limit is None:
+                raise ValidationError({param: f"Unknown level {code!r}."})
+            filters.max_levels[name] = limit
+
+    if params.get("lighting_conditions"):
+        filters.lighting_codes = _known_codes(
+            "lighting_conditions", _parse_codes(params["lighting_conditions"]), sensory_options("lighting_conditions")
+        )
+
+    if params.get("category"):
+        categories = get_reference_data().active_options(LookupOption.OptionType.EVENT_CATEGORY)
+        filters.category_codes = _known_codes("category", _parse_codes(params["category"]), categories)
+
+    if params.get("starts_after"):
+        filters.starts_after = _parse_moment("starts_after", params["starts_after"])
+    if params.get("starts_before"):
+        filters.starts_before = _parse_moment("starts_before", params["starts_before"], end_of_day=True)
+
+    filters.windows = _parse_windows(params, filters.now)
+
+    if params.get("age"):
+        try:
+            filters.age = int(params["age"])
+        except ValueError:
+            raise ValidationError({"age": "Expected a whole number of years."})
+
+    if params.get("max_price"):
+        try:
+            filters.max_price = Decimal(params["max_price"])
+        except InvalidOperation:
+            raise ValidationError({"max_price": "Expected a decimal amount."})
+        # NaN / Infinity parse as decimals but the database refuses them
+        if not filters.max_price.is_finite():
+            raise ValidationError({"max_price": "Expected a decimal amount."})
+
+    return filters
+
+
+# Build the Q object (over EventSearchDocument) for the filters present in params
+def build_event_filter(params) -> Q:
+    return parse_event_filters(params).as_q()
+
+
+# Documents the event list pages through: the UpcomingEvent working set for
+# upcoming lists (rows ended since the last refresh are filtered out), else
+# every published event's search document
+def list_documents(filters):
+    if filters.upcoming:
+        documents = UpcomingEvent.objects.filter(live_q(filters.now))
+    else:
+        documents = EventSearchDocument.objects.all()
+    query = filters.as_q()
+    return (documents.filter(query) if query else documents).order_by("start_datetime")
+
+
+# Windows from ?from= / ?to= and ?happening=now
+def _parse_windows(params, now):
+    windows = []
+    if params.get("happening"):
+        if params["happening"].strip().lower() != "now":
+            raise ValidationError({"happening": "Expected now."})
+        windows.append((now, now))
+
+    start = _parse_moment("from", params["from"]) if params.get("from") else None
+    end = _parse_moment("to", params["to"], end_of_day=True) if params.get("to") else None
+    if start and end and end <= start:
+        raise ValidationError({"to": "Must be after from."})
+    if start or end:
+        windows.append((start, end))
+    return windows
+
+
+# A closed window reads the per-occurrence day buckets (time_windows.py).
+# An open-ended one needs no buckets: the first occurrence starts earliest
+# and live_until is when the last one ends.
+def _window_q(start, end) -> Q:
+    if start is None:
+        return Q(start_datetime__lt=end)
+    if end is None:
+        return live_q(start)
+    return overlapping(start, end)
+
+
+# DRF filter backend applying build_event_filter to EventSearchDocument querysets
+class AccessibilityFilterBackend(BaseFilterBackend):
+
+    def filter_queryset(self, request, queryset, view):
+        query = build_event_filter(request.query_params)
+        return queryset.filter(query) if query else queryset
+
+
+# Count matching documents per option / boolean value in a single aggregate query
+def facet_counts(queryset):
+    # In-memory selections (snapshot.py) count themselves
+    if hasattr(queryset, "facet_counts"):
+        return queryset.facet_counts()
+
+    aggregates, facets = _facet_aggregates()
+    return _facet_result(queryset.order_by().aggregate(**aggregates), facets)
+
+
+# facet_counts() for async views. Building the aggregates reads reference
+# data, which may need a database refresh, so it runs in a worker thread.
+async def afacet_counts(queryset):
+    if hasattr(queryset, "facet_counts"):
+        return await sync_to_async(queryset.facet_counts)()
+
+    aggregates, facets = await sync_to_async(_facet_aggregates)()
+    return _facet_result(await queryset.order_by().aaggregate(**aggregates), facets)
+
+
+# ({key: Count}, {facet: [(key, option)]}) for one aggregate query
+def _facet_aggregates():
+    aggregates = {}
+    facets = {}
+
+    def option_facet(name, column, options):
+        facets[name] = []
+        for option in options:
+            key = f"{name}__{option.pk}"
+            aggregates[key] = Count("pk", filter=Q(**{column: option.code}))
+            facets[name].append((key, option))
+
+    option_facet(
+        "category", "category_code",
+        get_reference_data().active_options(LookupOption.OptionType.EVENT_CATEGORY),
+    )
+    for field in AccessibilityProfile.SENSORY_CATEGORY_CODES:
+        option_facet(field, f"{field}_code", sensory_options(field))
+
+    for field in BOOLEAN_FIELDS + TRI_STATE_FIELDS:
+        aggregates[f"{field}__true"] = Count("pk", filter=Q(**{field: True}))
+        aggregates[f"{field}__false"] = Count("pk", filter=Q(**{field: False}))
+        if field in TRI_STATE_FIELDS:
+            aggregates[f"{field}__unknown"] = Count("pk", filter=Q(**{f"{field}__isnull": True}))
+    return aggregates, facets
+
+
+def _facet_result(counts, facets):
+    result = {
+        name: [{"code": option.code, "label": option.label, "count": counts[key]} for key, option in entries]
+        for name, entries in facets.items()
+    }
+    for field in BOOLEAN_FIELDS + TRI_STATE_FIELDS:
+        values = ("true", "false", "unknown") if field in TRI_STATE_FIELDS else ("true", "false")
+        result[field] = {value: counts[f"{field}__{value}"] for value in values}
+    return result
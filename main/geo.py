@@ -0,0 +1,229 @@
+"""
+============================================================
+File Name: geo.py
+Brief Description:
+Offline postcode geocoding and grid-indexed proximity search.
+
+Postcodes are normalised and resolved to the centroid of their
+outcode (the part before the space), read from the CSV file at
+settings.EVENT_OUTCODE_CENTROIDS (columns outcode, latitude,
+longitude). The bundled main/data/outcode_centroids.csv is a
+small sample of major towns for development and tests; point
+the setting at a full extract (e.g. derived from the ONS
+Postcode Directory, Open Government Licence) in production. A
+missing or unreadable file is a system check error and raises
+ImproperlyConfigured; the bundled sample is a deployment check
+warning. `python manage.py geocode_events` re-geocodes stored
+events after the file changes.
+
+Located events are placed in a fixed latitude / longitude grid
+(GRID_CELL_DEGREES). A radius query reads only the cells that
+overlap the radius through the (geo_cell_y, geo_cell_x) index,
+then measures exact great-circle distances for those
+candidates, so cost follows local density rather than the size
+of the catalogue. Changing GRID_CELL_DEGREES requires the cells
+to be recomputed (see migration 0008).
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.3
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Postcode geocoding + grid proximity search  | user-008
+v1.1    | 2026-10-17 | Memoise locate() for bulk imports           | user-011
+v1.2    | 2026-10-17 | Configurable outcode file + checks          | user-008
+v1.3    | 2026-10-17 | Drop stale centroids for unresolved postcodes | user-008
+============================================================
+"""
+
+import csv
+import math
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# Bundled sample; settings.EVENT_OUTCODE_CENTROIDS names the file in use
+OUTCODE_DATA = Path(__file__).resolve().parent / "data" / "outcode_centroids.csv"
+
+# Grid cell size in degrees (about 5.5 km north-south)
+GRID_CELL_DEGREES = 0.05
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LATITUDE = 111.2
+
+# Nearest-N searches start at this radius and double until enough are found
+INITIAL_RADIUS_KM = 2.0
+
+_POSTCODE = re.compile(r"^([A-Z]{1,2}[0-9][A-Z0-9]?)\s*([0-9][A-Z]{2})?$")
+_POSTCODE_IN_TEXT = re.compile(r"\b([A-Z]{1,2}[0-9][A-Z0-9]?)\s*([0-9][A-Z]{2})\b")
+
+
+# "eh11yz" -> "EH1 1YZ", "eh1" -> "EH1"; None when not a UK postcode / outcode
+def normalise_postcode(text):
+    match = _POSTCODE.match((text or "").strip().upper())
+    if match is None:
+        return None
+    outward, inward = match.groups()
+    return f"{outward} {inward}" if inward else outward
+
+
+def outcode(postcode):
+    normalised = normalise_postcode(postcode)
+    return normalised.split(" ")[0] if normalised else None
+
+
+# First full postcode mentioned in free text, e.g. a location line
+def find_postcode(text):
+    match = _POSTCODE_IN_TEXT.search((text or "").upper())
+    return f"{match.group(1)} {match.group(2)}" if match else None
+
+
+def outcode_data_path():
+    return Path(getattr(settings, "EVENT_OUTCODE_CENTROIDS", OUTCODE_DATA))
+
+
+@lru_cache(maxsize=1)
+def _load_centroids(path):
+    try:
+        with open(path, newline="", encoding="utf-8") as handle:
+            centroids = {
+                row["outcode"].strip().upper(): (float(row["latitude"]), float(row["longitude"]))
+                for row in csv.DictReader(handle)
+            }
+    except (OSError, KeyError, ValueError) as exc:
+        raise ImproperlyConfigured(
+            f"Cannot read outcode centroids from {path} ({exc}); set EVENT_OUTCODE_CENTROIDS to a CSV "
+            "file with outcode, latitude and longitude columns."
+        )
+    if not centroids:
+        raise ImproperlyConfigured(f"No outcode centroids in {path}.")
+    return centroids
+
+
+# {outcode: (latitude, longitude)} from settings.EVENT_OUTCODE_CENTROIDS
+def outcode_centroids():
+    return _load_centroids(outcode_data_path())
+
+
+@lru_cache(maxsize=1)
+def _centroid_points(path):
+    return frozenset(_load_centroids(path).values())
+
+
+# True when a point is an outcode centroid, i.e. was set by geocoding
+def is_centroid(latitude, longitude):
+    return (latitude, longitude) in _centroid_points(outcode_data_path())
+
+
+# Forget memoised lookups when the outcode file setting changes (tests)
+@receiver(setting_changed)
+def _outcode_data_changed(setting, **kwargs):
+    if setting == "EVENT_OUTCODE_CENTROIDS":
+        locate.cache_clear()
+
+
+# System checks: the outcode file must load; the bundled sample only
+# covers major towns, so deploying with it is flagged
+def check_outcode_data(app_configs=None, **kwargs):
+    try:
+        outcode_centroids()
+    except ImproperlyConfigured as exc:
+        return [checks.Error(str(exc), id="main.E001")]
+    return []
+
+
+def check_outcode_data_deploy(app_configs=None, **kwargs):
+    if outcode_data_path().resolve() == OUTCODE_DATA:
+        return [checks.Warning(
+            f"Geocoding uses the bundled sample of {len(outcode_centroids())} outcodes, so most postcodes "
+            "will not resolve.",
+            hint="Set EVENT_OUTCODE_CENTROIDS to a full UK outcode centroid file, then run geocode_events.",
+            id="main.W001",
+        )]
+    return []
+
+
+# (latitude, longitude) of a postcode's outcode centroid, or None
+@lru_cache(maxsize=4096)
+def locate(postcode):
+    return outcode_centroids().get(outcode(postcode))
+
+
+# (x, y) grid cell containing a point
+def grid_cell(latitude, longitude):
+    return math.floor(longitude / GRID_CELL_DEGREES), math.floor(latitude / GRID_CELL_DEGREES)
+
+
+# Set latitude / longitude from the event's postcode (or a postcode in its
+# location text) and recompute its grid cell. When no postcode resolves,
+# hand-entered coordinates are kept but a centroid left by an earlier
+# postcode is cleared, so the event leaves nearby results.
+def geocode_event(event):
+    point = locate(event.postcode) or locate(find_postcode(event.location_text))
+    if point is not None:
+        event.latitude, event.longitude = point
+    elif is_centroid(event.latitude, event.longitude):
+        event.latitude = event.longitude = None
+
+    if event.latitude is None or event.longitude is None:
+        event.geo_cell_x = event.geo_cell_y = None
+    else:
+        event.geo_cell_x, event.geo_cell_y = grid_cell(event.latitude, event.longitude)
+    return event
+
+
+# Great-circle distance in km
+def distance_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+# Bounding box (min_lat, max_lat, min_lon, max_lon) enclosing a radius
+def bounding_box(latitude, longitude, radius_km):
+    delta_lat = radius_km / KM_PER_DEGREE_LATITUDE
+    widest = math.cos(math.radians(min(89.0, abs(latitude) + delta_lat)))
+    delta_lon = min(180.0, radius_km / (KM_PER_DEGREE_LATITUDE * widest))
+    return latitude - delta_lat, latitude + delta_lat, longitude - delta_lon, longitude + delta_lon
+
+
+# [(pk, distance_km)] for rows of queryset within radius_km, nearest first.
+# queryset must have latitude, longitude, geo_cell_x and geo_cell_y fields.
+def within_radius(queryset, latitude, longitude, radius_km):
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    min_x, min_y = grid_cell(min_lat, min_lon)
+    max_x, max_y = grid_cell(max_lat, max_lon)
+
+    candidates = queryset.filter(
+        geo_cell_y__range=(min_y, max_y),
+        geo_cell_x__range=(min_x, max_x),
+        latitude__range=(min_lat, max_lat),
+        longitude__range=(min_lon, max_lon),
+    ).order_by().values_list("pk", "latitude", "longitude")
+
+    hits = []
+    for pk, lat, lon in candidates:
+        distance = distance_km(latitude, longitude, lat, lon)
+        if distance <= radius_km:
+            hits.append((pk, distance))
+    hits.sort(key=lambda hit: (hit[1], hit[0]))
+    return hits
+
+
+# The limit nearest rows within max_radius_km, searching outwards in
+# doubling radii so dense areas only read nearby cells
+def nearest(queryset, latitude, longitude, limit, max_radius_km):
+    radius = min(INITIAL_RADIUS_KM, max_radius_km)
+    while True:
+        hits = within_radius(queryset, latitude, longitude, radius)
+        if len(hits) >= limit or radius >= max_radius_km:
+            return hits[:limit]
+        radius = min(radius * 2, max_radius_km)
@@ -0,0 +1,521 @@
+"""
+============================================================
+File Name: importers.py
+Brief Description:
+Bulk event import from partner CSV / JSONL feeds, used by
+`python manage.py import_events`.
+
+Records are streamed one at a time, lookup codes are resolved
+against the in-memory reference-data cache, and each chunk of
+rows is written in its own transaction: profiles and events
+are inserted with bulk_create in batches, then events_changed
+is sent once for the chunk so search documents and the
+full-text index are brought up to date (see signals.py).
+
+Feed columns / keys (codes as in LookupOption.code):
+  title, description, category, status, start_datetime,
+  end_datetime, location_text, postcode, age_min, age_max,
+  price, booking_required, booking_url, latitude, longitude,
+  wheelchair_access, accessible_toilets, quiet_space_available,
+  noise_level, lighting_conditions, crowd_level, sensory_level,
+  additional_notes, external_id
+
+Rows that fail validation are skipped and reported with their
+line number. Validation covers everything the database would
+reject (impossible dates, non-finite or out-of-range numbers,
+text longer than its column), so one bad row cannot fail the
+INSERT of its whole chunk. A failed chunk rolls back on its
+own; chunks already written stay committed.
+
+EventSync re-applies a recurring feed from one source, keyed on
+(source, external_id): each record is hashed and unchanged rows
+are skipped without parsing, changed rows update only the
+Event / AccessibilityProfile fields that differ (bulk_update),
+new rows are created, and events of the source missing from the
+feed are soft-cancelled. A feed without a status column leaves
+the stored status alone (an editor may have published or held
+an event back) and only reactivates events it had cancelled.
+An event deleted while the sync runs is reported as a row error
+and re-created by the next sync.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.4
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Streaming CSV / JSONL event importer        | user-011
+v1.1    | 2026-10-17 | Idempotent upsert sync (EventSync)          | user-012
+v1.2    | 2026-10-17 | Reject values the database would refuse     | user-011
+v1.3    | 2026-10-17 | Keep stored status for status-less feeds    | user-012
+v1.4    | 2026-10-17 | Events deleted mid-sync are row errors      | user-012
+============================================================
+"""
+
+import csv
+import hashlib
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from . import geo
+from .lookup_cache import get_reference_data
+from .models import Event, AccessibilityProfile, LookupOption
+from .signals import events_changed
+
+FORMATS = ("csv", "jsonl")
+
+TRUE_VALUES = {"true", "1", "yes", "y"}
+FALSE_VALUES = {"false", "0", "no", "n"}
+UNKNOWN_VALUES = {"", "unknown", "null", "none"}
+
+
+class ImportRowError(ValueError):
+    """A feed row that cannot be imported."""
+
+
+# Fields compared and updated by EventSync
+EVENT_SYNC_FIELDS = (
+    "title", "description", "category", "status", "start_datetime", "end_datetime", "location_text",
+    "postcode", "age_min", "age_max", "price", "booking_required", "booking_url",
+    "latitude", "longitude", "geo_cell_x", "geo_cell_y",
+)
+PROFILE_SYNC_FIELDS = (
+    "wheelchair_access", "accessible_toilets", "quiet_space_available",
+    "noise_level", "lighting_conditions", "crowd_level", "sensory_level", "additional_notes",
+)
+
+
+@dataclass
+class ImportResult:
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    cancelled: int = 0
+    errors: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def skipped(self) -> int:
+        return len(self.errors)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+# "feed.csv" -> "csv", "feed.jsonl" / "feed.ndjson" -> "jsonl"
+def detect_format(path):
+    suffix = str(path).rsplit(".", 1)[-1].lower()
+    if suffix in ("jsonl", "ndjson", "json"):
+        return "jsonl"
+    if suffix == "csv":
+        return "csv"
+    raise ValueError(f"Cannot tell the format of {path}; pass --format.")
+
+
+# Yield (line number, record dict) from an open text stream
+def read_records(stream, fmt):
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+    elif fmt == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield line_number, ImportRowError(f"Invalid JSON: {exc.msg}")
+                continue
+            yield line_number, record if isinstance(record, dict) else ImportRowError("Expected a JSON object.")
+    else:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {', '.join(FORMATS)}.")
+
+
+# Stable hash of a record's non-empty values, independent of key order
+def record_hash(record):
+    values = {key: _text(record, key) for key in record}
+    canonical = json.dumps({key: value for key, value in values.items() if value}, sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _text(record, name):
+    value = record.get(name)
+    return "" if value is None else str(value).strip()
+
+
+def _required(record, name):
+    value = _text(record, name)
+    if not value:
+        raise ImportRowError(f"{name} is required.")
+    return value
+
+
+def _bool(record, name, allow_unknown=False):
+    value = record.get(name)
+    if isinstance(value, bool) or (value is None and allow_unknown):
+        return value
+    text = _text(record, name).lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES or (text == "" and not allow_unknown):
+        return False
+    if allow_unknown and text in UNKNOWN_VALUES:
+        return None
+    raise ImportRowError(f"{name}: expected true, false{' or unknown' if allow_unknown else ''}.")
+
+
+# float("nan") / Decimal("inf") parse, but are not numbers a column can hold
+def _number(record, name, convert):
+    text = _text(record, name)
+    if not text:
+        return None
+    try:
+        value = convert(text)
+    except (ValueError, InvalidOperation):
+        raise ImportRowError(f"{name}: {text!r} is not a valid number.")
+    if isinstance(value, (float, Decimal)) and not math.isfinite(value):
+        raise ImportRowError(f"{name}: {text!r} is not a valid number.")
+    return value
+
+
+def _coordinate(record, name, limit):
+    value = _number(record, name, float)
+    if value is not None and abs(value) > limit:
+        raise ImportRowError(f"{name}: {value} is outside -{limit} to {limit}.")
+    return value
+
+
+# parse_datetime() raises ValueError for well-formed but impossible values
+def _datetime(record, name):
+    text = _required(record, name)
+    try:
+        moment = parse_datetime(text)
+    except ValueError:
+        raise ImportRowError(f"{name}: {text!r} is not a valid datetime.")
+    if moment is None:
+        raise ImportRowError(f"{name}: expected an ISO 8601 datetime.")
+    return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+
+
+# Check an instance's values fit their columns: text within max_length,
+# decimals within their digits, integers within the backend's range. On
+# PostgreSQL a value that does not fit fails the whole chunk's INSERT.
+def _check_columns(instance):
+    for model_field in instance._meta.concrete_fields:
+        value = getattr(instance, model_field.attname)
+        if value is None or model_field.primary_key or model_field.is_relation:
+            continue
+        if isinstance(model_field, models.CharField) and model_field.max_length and len(value) > model_field.max_length:
+            raise ImportRowError(f"{model_field.name} is too long (at most {model_field.max_length} characters).")
+        if isinstance(model_field, models.DecimalField):
+            whole_digits = model_field.max_digits - model_field.decimal_places
+            if abs(value) >= Decimal(10) ** whole_digits:
+                raise ImportRowError(f"{model_field.name}: {value} has more than {whole_digits} whole digits.")
+        if isinstance(model_field, models.IntegerField):
+            low, high = connection.ops.integer_field_range(model_field.get_internal_type())
+            if (low is not None and value < low) or (high is not None and value > high):
+                raise ImportRowError(f"{model_field.name}: {value} is out of range.")
+
+
+class CodeResolver:
+    """Lookup code -> LookupOption id maps built once from the reference-data cache."""
+
+    def __init__(self, reference=None):
+        reference = reference or get_reference_data()
+        self.categories = {
+            option.code: option.pk
+            for option in reference.active_options(LookupOption.OptionType.EVENT_CATEGORY)
+        }
+        self.sensory = {}
+        for name, category_code in AccessibilityProfile.SENSORY_CATEGORY_CODES.items():
+            category = reference.get_category_by_code(category_code)
+            options = reference.active_options(LookupOption.OptionType.ACCESSIBILITY_LEVEL, category.pk) if category else []
+            self.sensory[name] = {option.code: option.pk for option in options}
+
+    @staticmethod
+    def _resolve(name, codes, code):
+        option_id = codes.get(code.upper())
+        if option_id is None:
+            raise ImportRowError(f"{name}: unknown code {code!r}.")
+        return option_id
+
+    def category(self, code):
+        return self._resolve("category", self.categories, code)
+
+    def sensory_option(self, name, code):
+        return self._resolve(name, self.sensory[name], code)
+
+
+class EventImporter:
+    """Parse feed records into events and write them chunk by chunk."""
+
+    def __init__(self, batch_size=1000, chunk_size=10000, status=Event.Status.DRAFT, created_by=None, source=""):
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.status = status
+        self.created_by = created_by
+        self.source = source
+        self.resolver = CodeResolver()
+
+    # Status a record will be given
+    def record_status(self, record):
+        return _text(record, "status").upper() or self.status
+
+    # Unsaved (profile, event) for one record; raises ImportRowError
+    def parse(self, record):
+        profile = AccessibilityProfile(
+            wheelchair_access=_bool(record, "wheelchair_access"),
+            accessible_toilets=_bool(record, "accessible_toilets", allow_unknown=True),
+            quiet_space_available=_bool(record, "quiet_space_available", allow_unknown=True),
+            additional_notes=_text(record, "additional_notes"),
+        )
+        for name in AccessibilityProfile.SENSORY_CATEGORY_CODES:
+            setattr(profile, f"{name}_id", self.resolver.sensory_option(name, _required(record, name)))
+
+        status = self.record_status(record)
+        if status not in Event.Status.values:
+            raise ImportRowError(f"status: unknown status {status!r}.")
+
+        event = Event(
+            title=_required(record, "title"),
+            description=_text(record, "description"),
+            category_id=self.resolver.category(_required(record, "category")),
+            status=status,
+            start_datetime=_datetime(record, "start_datetime"),
+            end_datetime=_datetime(record, "end_datetime"),
+            location_text=_required(record, "location_text"),
+            postcode=_text(record, "postcode"),
+            age_min=_number(record, "age_min", int),
+            age_max=_number(record, "age_max", int),
+            price=_number(record, "price", Decimal),
+            booking_required=_bool(record, "booking_required"),
+            booking_url=_text(record, "booking_url"),
+            latitude=_coordinate(record, "latitude", 90),
+            longitude=_coordinate(record, "longitude", 180),
+            created_by_user=self.created_by,
+            source=self.source,
+            external_id=_text(record, "external_id"),
+        )
+        if event.external_id:
+            event.source_hash = record_hash(record)
+        if event.end_datetime < event.start_datetime:
+            raise ImportRowError("end_datetime is before start_datetime.")
+        _check_columns(profile)
+        _check_columns(geo.geocode_event(event))
+        return profile, event
+
+    # Write one chunk of parsed rows in a single transaction
+    def write(self, pairs):
+        with transaction.atomic():
+            profiles = AccessibilityProfile.objects.bulk_create(
+                [profile for profile, _ in pairs], batch_size=self.batch_size
+            )
+            events = []
+            for profile, (_, event) in zip(profiles, pairs):
+                event.accessibility_profile = profile
+                events.append(event)
+            events = Event.objects.bulk_create(events, batch_size=self.batch_size)
+
+            # bulk_create skips model signals; refresh derived data explicitly
+            events_changed.send(sender=Event, event_ids=[event.pk for event in events], created=True, events=events)
+        return len(events)
+
+    # Import (line number, record) pairs; progress(result) is called after each chunk
+    def run(self, records, progress=None):
+        result = ImportResult()
+        started = time.perf_counter()
+        pending = []
+
+        for line_number, record in records:
+            result.rows += 1
+            try:
+                if isinstance(record, ImportRowError):
+                    raise record
+                pending.append(self.parse(record))
+            except ImportRowError as exc:
+                result.errors.append((line_number, str(exc)))
+                continue
+
+            if len(pending) >= self.chunk_size:
+                result.created += self.write(pending)
+                pending = []
+                result.elapsed = time.perf_counter() - started
+                if progress:
+                    progress(result)
+
+        if pending:
+            result.created += self.write(pending)
+        result.elapsed = time.perf_counter() - started
+        return result
+
+
+# Copy differing fields from incoming onto stored; returns the changed field names
+def _apply_changes(stored, incoming, names):
+    changed = []
+    for name in names:
+        attname = stored._meta.get_field(name).attname
+        value = getattr(incoming, attname)
+        if getattr(stored, attname) != value:
+            setattr(stored, attname, value)
+            changed.append(name)
+    return changed
+
+
+class EventSync(EventImporter):
+    """Apply a full feed from one source as inserts, delta updates and cancellations."""
+
+    def __init__(self, source, cancel_missing=True, **kwargs):
+        if not source:
+            raise ValueError("A feed source is required for sync.")
+        super().__init__(source=source, **kwargs)
+        self.cancel_missing = cancel_missing
+
+    # external_id -> (pk, source_hash, status) for this source's events
+    def existing(self):
+        rows = Event.objects.filter(source=self.source).exclude(external_id="").values_list(
+            "external_id", "pk", "source_hash", "status"
+        )
+        return {external_id: (pk, source_hash, status) for external_id, pk, source_hash, status in rows}
+
+    # Status a record leaves on its stored event: the feed's own when it
+    # carries one, otherwise the stored status, reactivating cancellations
+    def synced_status(self, record, stored_status):
+        if _text(record, "status"):
+            return self.record_status(record)
+        if stored_status == Event.Status.CANCELLED:
+            return self.status
+        return stored_status
+
+    # Apply parsed rows to stored events, writing only fields that differ.
+    # Returns the number of events whose data changed and the ids of events
+    # deleted since existing() was read.
+    def update(self, updates):
+        stored_events = Event.objects.select_related("accessibility_profile").in_bulk([pk for pk, _ in updates])
+        now = timezone.now()
+        events, profiles, changed = [], [], []
+        event_fields, profile_fields = {"source_hash"}, set()
+        vanished = [pk for pk, _ in updates if pk not in stored_events]
+
+        for pk, (profile, event) in updates:
+            stored = stored_events.get(pk)
+            if stored is None:
+                continue
+            stored_profile = stored.accessibility_profile
+            event_diff = _apply_changes(stored, event, EVENT_SYNC_FIELDS)
+            profile_diff = _apply_changes(stored_profile, profile, PROFILE_SYNC_FIELDS)
+
+            # A re-formatted but equivalent record only refreshes the stored hash
+            stored.source_hash = event.source_hash
+            events.append(stored)
+            if event_diff:
+                stored.updated_at = now
+                event_fields.update(event_diff)
+            if profile_diff:
+                stored_profile.updated_at = now
+                profile_fields.update(profile_diff)
+                profiles.append(stored_profile)
+            if event_diff or profile_diff:
+                changed.append(stored)
+
+        if len(event_fields) > 1:
+            event_fields.add("updated_at")
+        with transaction.atomic():
+            # bulk_update of a row deleted after in_bulk() updates nothing
+            Event.objects.bulk_update(events, sorted(event_fields), batch_size=self.batch_size)
+            if profiles:
+                AccessibilityProfile.objects.bulk_update(
+                    profiles, sorted(profile_fields | {"updated_at"}), batch_size=self.batch_size
+                )
+            if changed:
+                # bulk_update skips model signals; refresh derived data explicitly
+                events_changed.send(sender=Event, event_ids=[e.pk for e in changed], created=False, events=changed)
+        return len(changed), vanished
+
+    # Soft-cancel events of this source that were not in the feed
+    def cancel(self, event_ids):
+        now = timezone.now()
+        for start in range(0, len(event_ids), self.chunk_size):
+            chunk = event_ids[start:start + self.chunk_size]
+            with transaction.atomic():
+                Event.objects.filter(pk__in=chunk).update(status=Event.Status.CANCELLED, updated_at=now)
+                events_changed.send(sender=Event, event_ids=chunk, created=False)
+        return len(event_ids)
+
+    def run(self, records, progress=None):
+        result = ImportResult()
+        started = time.perf_counter()
+        existing = self.existing()
+        seen = set()
+        creates, updates = [], []
+        # pk -> line number of the pending updates, to report vanished events
+        update_lines = {}
+
+        def flush():
+            if creates:
+                result.created += self.write(creates)
+            if updates:
+                changed, vanished = self.update(updates)
+                result.updated += changed
+                result.errors.extend(
+                    (update_lines[pk], "Event was deleted during the sync; the next sync re-creates it.")
+                    for pk in vanished
+                )
+            creates.clear()
+            updates.clear()
+            update_lines.clear()
+            result.elapsed = time.perf_counter() - started
+            if progress:
+                progress(result)
+
+        for line_number, record in records:
+            result.rows += 1
+            try:
+                if isinstance(record, ImportRowError):
+                    raise record
+                external_id = _required(record, "external_id")
+                if external_id in seen:
+                    raise ImportRowError(f"external_id {external_id!r} appears more than once.")
+                seen.add(external_id)
+
+                current = existing.get(external_id)
+                status = self.synced_status(record, current[2]) if current else None
+                if current and current[1] == record_hash(record) and current[2] == status:
+                    result.unchanged += 1
+                    continue
+                parsed = self.parse(record)
+            except ImportRowError as exc:
+                result.errors.append((line_number, str(exc)))
+                continue
+
+            if current:
+                parsed[1].status = status
+                updates.append((current[0], parsed))
+                update_lines[current[0]] = line_number
+            else:
+                creates.append(parsed)
+            if len(creates) + len(updates) >= self.chunk_size:
+                flush()
+        flush()
+
+        # An empty feed is more likely a broken download than a cancelled programme
+        if self.cancel_missing and seen:
+            missing = [
+                pk for external_id, (pk, _, status) in existing.items()
+                if external_id not in seen and status != Event.Status.CANCELLED
+            ]
+            result.cancelled = self.cancel(missing)
+
+        result.elapsed = time.perf_counter() - started
+        return result
@@ -0,0 +1,204 @@
+"""
+============================================================
+File Name: lookup_cache.py
+Brief Description:
+Process-local, versioned cache of LookupOption and
+SensoryCategory reference data. Serializers and templates
+resolve lookup foreign keys against this cache instead of
+joining or re-reading the reference tables on every request.
+
+The cache is rebuilt when post_save / post_delete signals fire
+for the reference models (see signals.py). A version token held
+in the shared Django cache (settings.REFERENCE_DATA_CACHE) tells
+other processes to rebuild; set REFERENCE_DATA_CACHE_BACKEND to
+a shared backend when running more than one process. Tokens
+expire after settings.REFERENCE_DATA_VERSION_TIMEOUT, so a
+missed bump (or a process-local backend) leaves a process stale
+for at most that long. matching.py and snapshot.py keep their
+version tokens the same way (version_token / new_version_token).
+
+Cached LookupOption / SensoryCategory instances and their
+representations are shared between requests and must be
+treated as read-only.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.5
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Versioned reference-data cache              | user-003
+v1.1    | 2026-10-17 | Category / per-category option lookups      | user-005
+v1.2    | 2026-10-17 | Public current_version() for validators     | user-009
+v1.3    | 2026-10-17 | aget_reference_data() for async views       | user-021
+v1.4    | 2026-10-17 | Rebuild from the primary database           | user-023
+v1.5    | 2026-10-17 | Shared version tokens expire                | user-003
+============================================================
+"""
+
+import threading
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from .db_routers import primary_database
+from .models import Event, AccessibilityProfile, LookupOption, SensoryCategory
+
+VERSION_KEY = "main:reference-data:version"
+
+# Event / AccessibilityProfile foreign keys that point at LookupOption
+EVENT_LOOKUP_FIELDS = ("category",)
+PROFILE_LOOKUP_FIELDS = ("noise_level", "lighting_conditions", "crowd_level", "sensory_level")
+
+_lock = threading.Lock()
+_reference_data = None
+
+
+class ReferenceData:
+    """Snapshot of every LookupOption and SensoryCategory at one version."""
+
+    def __init__(self, version, categories, options):
+        # Imported here to avoid a circular import with serializers.py
+        from .serializers import LookupOptionSerializer
+
+        self.version = version
+        self.categories = {c.pk: c for c in categories}
+        self.categories_by_code = {c.code: c for c in categories}
+        self.options = {}
+        self.by_key = {}
+        self.by_category = {}
+        self.representations = {}
+
+        for option in sorted(options, key=lambda o: (o.display_order, o.label, o.pk)):
+            LookupOption.category.field.set_cached_value(
+                option, self.categories.get(option.category_id)
+            )
+            self.options[option.pk] = option
+            self.representations[option.pk] = LookupOptionSerializer(option).data
+            self.by_category.setdefault(option.category_id, []).append(option)
+            if option.is_active:
+                self.by_key[(option.option_type, option.category_id, option.code)] = option
+
+    # LookupOption by primary key (inactive options still resolve)
+    def get(self, option_id):
+        return self.options.get(option_id)
+
+    # Active LookupOption by natural key
+    def get_by_key(self, option_type, category_id, code):
+        return self.by_key.get((option_type, category_id, code))
+
+    # SensoryCategory by code
+    def get_category_by_code(self, code):
+        return self.categories_by_code.get(code)
+
+    # All options (active or not) in a sensory category, in display order
+    def options_in_category(self, category_id):
+        return self.by_category.get(category_id, [])
+
+    # Serialized {code, label, category} for an option id
+    def represent(self, option_id):
+        return self.representations.get(option_id)
+
+    # Active options of a type in display order, optionally within a sensory category
+    def active_options(self, option_type, category_id=None):
+        return [
+            option for (kind, cat, _), option in self.by_key.items()
+            if kind == option_type and (category_id is None or cat == category_id)
+        ]
+
+
+def _shared_cache():
+    return caches[getattr(settings, "REFERENCE_DATA_CACHE", "default")]
+
+
+def _token_timeout():
+    return getattr(settings, "REFERENCE_DATA_VERSION_TIMEOUT", None)
+
+
+# Version token stored under key in the shared cache, created if missing or
+# expired (which makes every process reload whatever the token guards)
+def version_token(key):
+    cache = _shared_cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=_token_timeout())
+        version = cache.get(key)
+    return version
+
+
+# Replace the version token stored under key
+def new_version_token(key):
+    _shared_cache().set(key, uuid.uuid4().hex, timeout=_token_timeout())
+
+
+def _shared_version():
+    return version_token(VERSION_KEY)
+
+
+# Shared version token; changes whenever any reference data changes
+def current_version():
+    return _shared_version()
+
+
+def _load(version):
+    categories = list(SensoryCategory.objects.all())
+    options = list(LookupOption.objects.order_by())
+    return ReferenceData(version, categories, options)
+
+
+# Return the current reference data, rebuilding it when the version moves
+def get_reference_data() -> ReferenceData:
+    global _reference_data
+    version = _shared_version()
+    data = _reference_data
+    if data is not None and data.version == version:
+        return data
+
+    # Never cache a lagging replica's rows under the new version
+    with _lock, primary_database():
+        if _reference_data is None or _reference_data.version != version:
+            _reference_data = _load(version)
+        return _reference_data
+
+
+# get_reference_data() for async code: a rebuild reads the database, so it
+# runs in a worker thread; the common, current case returns directly
+async def aget_reference_data() -> ReferenceData:
+    data = _reference_data
+    if data is not None and data.version == _shared_version():
+        return data
+    return await sync_to_async(get_reference_data)()
+
+
+def _bump_shared_version():
+    global _reference_data
+    new_version_token(VERSION_KEY)
+    _reference_data = None
+
+
+# Drop this process's snapshot now and tell other processes once committed
+def invalidate():
+    global _reference_data
+    _reference_data = None
+    transaction.on_commit(_bump_shared_version)
+
+
+# Populate lookup foreign keys on events (and their profiles) from the cache
+# so templates can follow them without further queries
+def attach_reference_data(events):
+    data = get_reference_data()
+    for event in events:
+        for name in EVENT_LOOKUP_FIELDS:
+            field = Event._meta.get_field(name)
+            field.set_cached_value(event, data.get(getattr(event, field.attname)))
+
+        profile = event.accessibility_profile
+        for name in PROFILE_LOOKUP_FIELDS:
+            field = AccessibilityProfile._meta.get_field(name)
+            field.set_cached_value(profile, data.get(getattr(profile, field.attname)))
+    return events
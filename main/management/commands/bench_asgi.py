@@ -0,0 +1,191 @@
+"""
+============================================================
+File Name: bench_asgi.py
+Brief Description:
+Benchmark comparing the WSGI stack (sync DRF views on a fixed
+pool of worker threads, like a threaded WSGI server) with the
+ASGI stack (async_views.py on one event loop) at increasing
+client concurrency. Requests are driven in-process through
+Django's WSGIHandler / ASGIHandler, so no server needs to be
+installed; N closed-loop clients each send their next request
+as soon as the previous one completes.
+
+--client-delay simulates slow clients: each response body
+takes that long to send. A WSGI worker thread is held for the
+whole send; an ASGI worker only awaits it, so concurrency is
+not capped by the thread count.
+
+Worker threads need committed data, so missing catalogue
+events are generated and committed, then deleted afterwards
+unless --keep is given.
+
+Usage:
+  python manage.py bench_asgi --events 5000 --concurrency 1 10 100 --client-delay 0 50
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | WSGI vs ASGI concurrency benchmark          | user-021
+v1.1    | 2026-10-17 | wsgi_environ moved to benchmarking.py       | user-022
+v1.2    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+============================================================
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.test import override_settings
+
+from main.benchmarking import grow_catalogue, percentile, wsgi_environ
+from main.models import AccessibilityProfile, Event
+
+# Endpoint name -> (WSGI path, ASGI path, query string)
+ENDPOINTS = {
+    "list": ("/api/events/", "/api/async/events/", "facets=false"),
+    "detail": ("/api/events/{pk}/", "/api/async/events/{pk}/", ""),
+    "search": ("/api/events/search/", "/api/async/events/search/", "q=quiet"),
+}
+
+
+def asgi_scope(path, query):
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 0),
+        "server": ("testserver", 80),
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare WSGI (sync views, worker threads) and ASGI (async views) throughput at high concurrency."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=5000)
+        parser.add_argument("--endpoints", nargs="+", choices=sorted(ENDPOINTS), default=list(ENDPOINTS))
+        parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+        parser.add_argument("--client-delay", type=float, nargs="+", default=[0, 50], help="Milliseconds per response send.")
+        parser.add_argument("--requests", type=int, default=300, help="Requests per run.")
+        parser.add_argument("--threads", type=int, default=8, help="WSGI worker threads.")
+        parser.add_argument("--keep", action="store_true", help="Keep generated events.")
+
+    @staticmethod
+    def wsgi_request(handler, path, query, delay):
+        status = []
+        body = handler(wsgi_environ(path, query), lambda code, headers, exc_info=None: status.append(code))
+        try:
+            for _ in body:
+                pass
+            # The worker thread is busy until the client has the body
+            time.sleep(delay)
+        finally:
+            body.close()
+        close_old_connections()
+        return status[0]
+
+    @staticmethod
+    async def asgi_request(handler, path, query, delay):
+        status = []
+        received = False
+
+        async def receive():
+            nonlocal received
+            if received:
+                # No disconnect until the response is done
+                await asyncio.Event().wait()
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                status.append(str(message["status"]))
+            elif not message.get("more_body"):
+                await asyncio.sleep(delay)
+
+        await handler(asgi_scope(path, query), receive, send)
+        return status[0]
+
+    # N closed-loop clients over requests; latencies in seconds
+    async def drive(self, call, requests, concurrency):
+        queue = list(reversed(requests))
+        latencies = []
+
+        async def client():
+            while queue:
+                request = queue.pop()
+                started = time.perf_counter()
+                status = await call(*request)
+                latencies.append(time.perf_counter() - started)
+                if not status.startswith("200"):
+                    raise CommandError(f"{request[0]}?{request[1]} returned {status}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return time.perf_counter() - started, sorted(latencies)
+
+    def run_wsgi(self, requests, concurrency, delay, threads):
+        handler = WSGIHandler()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            async def call(path, query):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(pool, self.wsgi_request, handler, path, query, delay)
+            return asyncio.run(self.drive(call, requests, concurrency))
+
+    def run_asgi(self, requests, concurrency, delay):
+        handler = ASGIHandler()
+
+        async def call(path, query):
+            return await self.asgi_request(handler, path, query, delay)
+        return asyncio.run(self.drive(call, requests, concurrency))
+
+    def requests_for(self, name, event_ids, count, stack):
+        sync_path, async_path, query = ENDPOINTS[name]
+        path = sync_path if stack == "wsgi" else async_path
+        return [(path.format(pk=event_ids[i % len(event_ids)]), query) for i in range(count)]
+
+    def handle(self, *args, **options):
+        existing = Event.objects.filter(status=Event.Status.PUBLISHED).count()
+        created = grow_catalogue(options["events"], start=existing)
+        event_ids = list(
+            Event.objects.filter(status=Event.Status.PUBLISHED).order_by("?").values_list("pk", flat=True)[:1000]
+        )
+        try:
+            with override_settings(ALLOWED_HOSTS=["testserver"]):
+                for name in options["endpoints"]:
+                    for delay in options["client_delay"]:
+                        for concurrency in options["concurrency"]:
+                            self.compare(name, event_ids, concurrency, delay, options)
+        finally:
+            if created and not options["keep"]:
+                AccessibilityProfile.objects.filter(event__pk__in=created).delete()
+
+    def compare(self, name, event_ids, concurrency, delay, options):
+        count = options["requests"]
+        for stack in ("wsgi", "asgi"):
+            requests = self.requests_for(name, event_ids, count, stack)
+            if stack == "wsgi":
+                elapsed, latencies = self.run_wsgi(requests, concurrency, delay / 1000, options["threads"])
+            else:
+                elapsed, latencies = self.run_asgi(requests, concurrency, delay / 1000)
+            self.stdout.write(
+                f"{name:>6} | delay {delay:>4g} ms | {concurrency:>4} clients | {stack} "
+                f"| {count / elapsed:>7.1f} req/s | p50 {percentile(latencies, 50) * 1000:>8.2f} ms "
+                f"| p99 {percentile(latencies, 99) * 1000:>8.2f} ms"
+            )
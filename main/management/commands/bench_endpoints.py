@@ -0,0 +1,170 @@
+"""
+============================================================
+File Name: bench_endpoints.py
+Brief Description:
+Load-test harness for the events API. Bulk-generates synthetic
+catalogues of increasing size (main/benchmarking.py:
+valid lookup references, varied text, geocoded postcodes),
+then drives the list, filtered list, detail and search
+endpoints through the Django test client, recording
+throughput and p50 / p99 latency for each.
+
+Results are written to a JSON file (commit, environment and
+settings included) so runs on different commits can be
+compared; --baseline compares against an earlier file and
+lists p50 / p99 regressions above --threshold.
+
+The catalogue is built inside a transaction that is rolled
+back afterwards; --keep commits it instead, and a later run
+only generates the events missing for each size.
+
+Usage:
+  python manage.py bench_endpoints --events 10000 100000 1000000
+  python manage.py bench_endpoints --baseline var/benchmarks/endpoints-<commit>.json
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Endpoint throughput / latency harness       | user-020
+v1.1    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+v1.2    | 2026-10-17 | Catalogue builders from main.benchmarking   | user-020
+============================================================
+"""
+
+import json
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client, override_settings
+
+from main.benchmarking import (
+    ACTIVITIES, ADJECTIVES, git_revision, grow_catalogue, latency_stats, regressions, result_document, write_results,
+)
+from main.models import Event
+
+
+# Endpoint name -> function(rng, event_ids) returning a request path
+def _list(rng, event_ids):
+    return "/api/events/"
+
+
+def _filtered(rng, event_ids):
+    return rng.choice((
+        "/api/events/?wheelchair_access=true&max_noise_level=MEDIUM",
+        "/api/events/?lighting_conditions=DIM,STANDARD&category=ARTS&facets=false",
+        "/api/events/?accessible_toilets=true&max_crowd_level=SMALL&age=8",
+    ))
+
+
+def _detail(rng, event_ids):
+    return f"/api/events/{rng.choice(event_ids)}/"
+
+
+def _search(rng, event_ids):
+    adjective, activity = rng.choice(ADJECTIVES), rng.choice(ACTIVITIES)
+    return f"/api/events/search/?q={adjective.lower()}+{activity.lower()}"
+
+
+ENDPOINTS = {"list": _list, "filter": _filtered, "detail": _detail, "search": _search}
+
+
+class Command(BaseCommand):
+    help = "Measure events API throughput and p50 / p99 latency on synthetic catalogues; results to JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, nargs="+", default=[10000, 100000])
+        parser.add_argument("--endpoints", nargs="+", choices=sorted(ENDPOINTS), default=list(ENDPOINTS))
+        parser.add_argument("--requests", type=int, default=200, help="Measured requests per endpoint.")
+        parser.add_argument("--warmup", type=int, default=20)
+        parser.add_argument("--chunk", type=int, default=20000)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--output", help="Result file (default var/benchmarks/endpoints-<commit>-<time>.json).")
+        parser.add_argument("--baseline", help="Earlier result file to compare against.")
+        parser.add_argument("--threshold", type=float, default=0.1, help="Regression threshold (0.1 = 10%% slower).")
+        parser.add_argument("--keep", action="store_true", help="Commit the generated catalogue.")
+
+    def default_output(self):
+        commit, _ = git_revision()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        return Path(settings.BASE_DIR) / "var" / "benchmarks" / f"endpoints-{(commit or 'nocommit')[:10]}-{stamp}.json"
+
+    # Build the published events missing for target
+    def grow_catalogue(self, target, chunk):
+        existing = Event.objects.filter(status=Event.Status.PUBLISHED).count()
+        if existing < target:
+            started = time.perf_counter()
+            grow_catalogue(target, chunk, start=existing)
+            self.stdout.write(f"Generated {target - existing:,} events in {time.perf_counter() - started:.1f} s")
+
+    def measure(self, client, name, event_ids, options):
+        rng = random.Random(options["seed"])
+        paths = [ENDPOINTS[name](rng, event_ids) for _ in range(options["warmup"] + options["requests"])]
+        position = iter(paths)
+
+        def request():
+            response = client.get(next(position))
+            if response.status_code != 200:
+                raise CommandError(f"{response.request['PATH_INFO']} returned {response.status_code}")
+
+        for _ in range(options["warmup"]):
+            request()
+        return latency_stats(request, options["requests"])
+
+    def handle(self, *args, **options):
+        baseline = json.loads(Path(options["baseline"]).read_text()) if options["baseline"] else None
+        results = []
+        client = Client()
+
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]), transaction.atomic():
+            for target in sorted(options["events"]):
+                self.grow_catalogue(target, options["chunk"])
+                event_ids = list(
+                    Event.objects.filter(status=Event.Status.PUBLISHED).order_by("pk").values_list("pk", flat=True)
+                )
+                for name in options["endpoints"]:
+                    stats = self.measure(client, name, event_ids, options)
+                    results.append({"events": target, "endpoint": name, **stats})
+                    self.stdout.write(
+                        f"{target:>9,} events | {name:>6} | {stats['throughput_rps']:>7.1f} req/s "
+                        f"| p50 {stats['p50_ms']:>7.2f} ms | p99 {stats['p99_ms']:>7.2f} ms"
+                    )
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+        document = result_document(
+            results,
+            database=settings.DATABASES["default"]["ENGINE"],
+            settings={
+                "EVENT_API_FAST_SERIALIZER": getattr(settings, "EVENT_API_FAST_SERIALIZER", False),
+                "EVENT_SNAPSHOT": getattr(settings, "EVENT_SNAPSHOT", False),
+            },
+            requests=options["requests"],
+            seed=options["seed"],
+        )
+        output = Path(options["output"]) if options["output"] else self.default_output()
+        write_results(output, document)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {output}"))
+
+        if baseline is not None:
+            self.report_regressions(baseline, document, options["threshold"])
+
+    def report_regressions(self, baseline, document, threshold):
+        found = regressions(baseline, document, lambda result: (result["events"], result["endpoint"]), threshold)
+        label = f"baseline {(baseline.get('commit') or 'unknown')[:10]}"
+        if not found:
+            self.stdout.write(self.style.SUCCESS(f"No p50 / p99 regressions over {threshold:.0%} against {label}"))
+            return
+        for (events, endpoint), metric, before, after, change in found:
+            self.stdout.write(self.style.WARNING(
+                f"{events:>9,} events | {endpoint:>6} | {metric} {before:.2f} -> {after:.2f} ms (+{change:.0%}) vs {label}"
+            ))
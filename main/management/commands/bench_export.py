@@ -0,0 +1,78 @@
+"""
+============================================================
+File Name: bench_export.py
+Brief Description:
+Benchmark for the streaming catalogue export: throughput and
+peak Python memory (tracemalloc) at growing catalogue sizes,
+against materialising the whole EventSerializer output as the
+paginated API mirror did. Everything is written inside a
+transaction that is rolled back afterwards.
+
+Usage: python manage.py bench_export --events 10000 100000
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Streaming export benchmark                  | user-013
+v1.1    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+============================================================
+"""
+
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main.benchmarking import grow_catalogue
+from main.exporters import published_events, stream_export
+from main.query_plans import with_query_plan
+from main.serializers import EventSerializer
+
+
+# (seconds, peak MiB) of fn(); timed and traced in separate runs because
+# tracemalloc slows allocation-heavy code several times over
+def measure(fn):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+class Command(BaseCommand):
+    help = "Measure streaming export throughput and peak memory as the catalogue grows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, nargs="+", default=[10000, 100000])
+        parser.add_argument("--chunk", type=int, default=20000)
+        parser.add_argument("--format", default="jsonl")
+        parser.add_argument("--skip-materialised", action="store_true",
+                            help="Only measure the streaming export.")
+
+    def handle(self, *args, **options):
+        fmt = options["format"]
+        with transaction.atomic():
+            built = 0
+            for target in sorted(options["events"]):
+                grow_catalogue(target, options["chunk"], start=built)
+                built = target
+
+                stream = lambda: sum(len(piece) for piece in stream_export(fmt))
+                elapsed, peak = measure(stream)
+                line = f"{target:>9,} events | stream {elapsed:>6.2f}s {target / elapsed:>9,.0f} rows/sec peak {peak:>7.1f} MiB"
+
+                if not options["skip_materialised"]:
+                    queryset = with_query_plan(published_events(), EventSerializer)
+                    elapsed, peak = measure(lambda: EventSerializer(queryset, many=True).data)
+                    line += f" | materialised {elapsed:>6.2f}s peak {peak:>7.1f} MiB"
+                self.stdout.write(line)
+            transaction.set_rollback(True)
@@ -0,0 +1,51 @@
+"""
+============================================================
+File Name: bench_import.py
+Brief Description:
+Benchmark for the bulk event importer over synthetic partner
+feed records. Everything is written inside a transaction that
+is rolled back afterwards.
+
+Usage: python manage.py bench_import --events 100000
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Import throughput benchmark                 | user-011
+v1.1    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+v1.2    | 2026-10-17 | Catalogue builders from main.benchmarking   | user-020
+============================================================
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main.benchmarking import build_reference_data, feed_records
+from main.importers import EventImporter
+
+
+class Command(BaseCommand):
+    help = "Measure bulk import throughput (rows/sec, events/min)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=100000)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--chunk-size", type=int, default=10000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            build_reference_data()
+            importer = EventImporter(batch_size=options["batch_size"], chunk_size=options["chunk_size"])
+            records = enumerate(feed_records(options["events"]), start=1)
+            result = importer.run(records)
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"{result.created:,} events in {result.elapsed:.1f}s | {result.rows_per_second:,.0f} rows/sec "
+            f"| {result.rows_per_second * 60:,.0f} events/min"
+        )
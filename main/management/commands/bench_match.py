@@ -0,0 +1,80 @@
+"""
+============================================================
+File Name: bench_match.py
+Brief Description:
+Benchmark for accessibility match ranking (main/matching.py):
+loads the ProfileMatrix for catalogues of increasing size and
+times ranking the whole catalogue for a first page of 20.
+Everything is written inside a transaction that is rolled back
+afterwards.
+
+Usage: python manage.py bench_match --events 100000 500000
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Match ranking benchmark                     | user-017
+v1.1    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+============================================================
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main import matching
+from main.benchmarking import best_of, grow_catalogue
+
+# (label, preferences, requirements)
+QUERIES = (
+    ("one field", [("noise_level", "LOW", 1)], {}),
+    ("four fields", [
+        ("noise_level", "LOW", 3), ("lighting_conditions", "DIM", 2),
+        ("crowd_level", "SMALL", 2), ("sensory_level", "LOW", 1),
+    ], {}),
+    ("four + access", [
+        ("noise_level", "LOW", 3), ("lighting_conditions", "DIM", 2),
+        ("crowd_level", "SMALL", 2), ("sensory_level", "LOW", 1),
+    ], {"wheelchair_access": True, "quiet_space_available": True}),
+)
+PAGE = 20
+
+
+class Command(BaseCommand):
+    help = "Measure vectorised match ranking over the published catalogue."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, nargs="+", default=[100000, 500000])
+        parser.add_argument("--chunk", type=int, default=20000)
+        parser.add_argument("--repeat", type=int, default=10)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            built = 0
+            for target in sorted(options["events"]):
+                grow_catalogue(target, options["chunk"], start=built)
+                built = target
+
+                started = time.perf_counter()
+                matrix = matching.load()
+                load_time = time.perf_counter() - started
+                self.stdout.write(
+                    f"{target:>9,} events | matrix load {load_time:.2f} s | "
+                    f"{matrix.nbytes / 2 ** 20:.1f} MiB ({matrix.nbytes / len(matrix):.0f} bytes/event)"
+                )
+                for label, preferences, requirements in QUERIES:
+                    count, _ = matching.rank(preferences, requirements, limit=PAGE, matrix=matrix)
+                    elapsed = best_of(
+                        lambda: matching.rank(preferences, requirements, limit=PAGE, matrix=matrix),
+                        options["repeat"],
+                    )
+                    self.stdout.write(
+                        f"{target:>9,} events | {label:>13} | {count:>7,} eligible | rank {elapsed * 1000:>6.2f} ms"
+                    )
+            transaction.set_rollback(True)
@@ -0,0 +1,81 @@
+"""
+============================================================
+File Name: bench_nearby.py
+Brief Description:
+Benchmark comparing grid-indexed proximity search (main/geo.py)
+with a full scan measuring the distance to every event. The
+catalogue is built in chunks inside a transaction that is
+rolled back afterwards.
+
+Usage: python manage.py bench_nearby --events 1000000
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Proximity search benchmark                  | user-008
+v1.1    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+============================================================
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main import geo
+from main.benchmarking import best_of, grow_catalogue
+from main.models import EventSearchDocument
+
+# (postcode, radius_km) searches; None radius is a nearest-N search
+SEARCHES = (("EH1 1YZ", 2), ("EH1 1YZ", 10), ("SW1A 1AA", 5), ("IV1 1AA", 25), ("M1 4BT", None))
+
+
+class Command(BaseCommand):
+    help = "Measure grid-indexed proximity search against a full distance scan."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=1000000)
+        parser.add_argument("--chunk", type=int, default=20000)
+        parser.add_argument("--limit", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def build(self, count, chunk):
+        started = time.perf_counter()
+        grow_catalogue(count, chunk)
+        self.stdout.write(f"Built {count:,} events in {time.perf_counter() - started:.1f}s")
+
+    # Distance to every located event, nearest first
+    @staticmethod
+    def full_scan(latitude, longitude, radius, limit):
+        hits = []
+        for pk, lat, lon in EventSearchDocument.objects.filter(latitude__isnull=False).values_list(
+            "pk", "latitude", "longitude"
+        ).iterator(chunk_size=10000):
+            distance = geo.distance_km(latitude, longitude, lat, lon)
+            if distance <= radius:
+                hits.append((distance, pk))
+        hits.sort()
+        return hits[:limit]
+
+    def handle(self, *args, **options):
+        limit, repeat = options["limit"], options["repeat"]
+        with transaction.atomic():
+            self.build(options["events"], options["chunk"])
+            queryset = EventSearchDocument.objects.all()
+
+            for postcode, radius in SEARCHES:
+                latitude, longitude = geo.locate(postcode)
+                radius = radius or 100.0
+                grid = best_of(lambda: geo.nearest(queryset, latitude, longitude, limit, radius), repeat)
+                scan = best_of(lambda: self.full_scan(latitude, longitude, radius, limit), 1)
+                found = len(geo.nearest(queryset, latitude, longitude, limit, radius))
+                self.stdout.write(
+                    f"{postcode:>9} {radius:>6.0f} km | {found:>3} found | grid {grid * 1000:>8.2f} ms "
+                    f"| full scan {scan * 1000:>9.2f} ms | speed-up x{scan / grid:.0f}"
+                )
+            transaction.set_rollback(True)
@@ -0,0 +1,74 @@
+"""
+============================================================
+File Name: bench_search.py
+Brief Description:
+Benchmark comparing ranked full-text search (main/search.py)
+with the previous icontains scan over a synthetic catalogue.
+The catalogue is built in chunks inside a transaction that is
+rolled back afterwards.
+
+Usage: python manage.py bench_search --events 500000
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Full-text search benchmark                  | user-007
+v1.1    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+============================================================
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from main.benchmarking import best_of, grow_catalogue
+from main.models import Event
+from main.search import search_events
+
+QUERIES = ("pottery", "quiet yoga", "hearing loop", "riverside", "sign language interpreter", "choi")
+
+
+class Command(BaseCommand):
+    help = "Measure full-text search latency against an icontains scan."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=500000)
+        parser.add_argument("--chunk", type=int, default=20000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def build(self, count, chunk):
+        started = time.perf_counter()
+        grow_catalogue(count, chunk)
+        self.stdout.write(f"Built {count:,} events in {time.perf_counter() - started:.1f}s")
+
+    # The previous admin search: icontains on every field, counted and ordered
+    @staticmethod
+    def icontains(text):
+        query = Q()
+        for word in text.split():
+            query &= (
+                Q(title__icontains=word) | Q(description__icontains=word) | Q(location_text__icontains=word)
+                | Q(postcode__icontains=word) | Q(accessibility_profile__additional_notes__icontains=word)
+            )
+        matches = Event.objects.filter(query, status=Event.Status.PUBLISHED)
+        return matches.count(), list(matches.order_by("start_datetime").values_list("pk", flat=True)[:20])
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.build(options["events"], options["chunk"])
+
+            for text in QUERIES:
+                fts = best_of(lambda: search_events(text, limit=20), options["repeat"])
+                scan = best_of(lambda: self.icontains(text), options["repeat"])
+                self.stdout.write(
+                    f"{text!r:>30} | FTS {fts * 1000:>8.2f} ms | icontains {scan * 1000:>8.2f} ms "
+                    f"| speed-up x{scan / fts:.1f}"
+                )
+            transaction.set_rollback(True)
@@ -0,0 +1,53 @@
+"""
+============================================================
+File Name: bench_serializers.py
+Brief Description:
+Benchmark comparing DRF EventSerializer with the compiled
+fast-path serializer over synthetic catalogues.
+
+Usage: python manage.py bench_serializers --events 1000 10000
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Serializer throughput benchmark             | user-004
+============================================================
+"""
+
+from django.core.management.base import BaseCommand
+
+from main.benchmarking import best_of, temporary_catalogue
+from main.fast_serializers import compile_serializer
+from main.lookup_cache import get_reference_data
+from main.models import Event
+from main.query_plans import with_query_plan
+from main.serializers import EventSerializer
+
+
+class Command(BaseCommand):
+    help = "Measure EventSerializer vs compiled serializer throughput (events/sec)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, nargs="+", default=[1000, 10000])
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        compiled = compile_serializer(EventSerializer)
+
+        for count in options["events"]:
+            with temporary_catalogue(count):
+                get_reference_data()
+                queryset = with_query_plan(Event.objects.order_by("start_datetime", "id"), EventSerializer)
+
+                drf = best_of(lambda: EventSerializer(list(queryset), many=True).data, options["repeat"])
+                fast = best_of(lambda: compiled.serialize_many(compiled.values(queryset)), options["repeat"])
+
+            self.stdout.write(
+                f"{count:>8} events | DRF {count / drf:>10,.0f}/s | compiled {count / fast:>10,.0f}/s "
+                f"| speed-up x{drf / fast:.1f}"
+            )
@@ -0,0 +1,101 @@
+"""
+============================================================
+File Name: bench_snapshot.py
+Brief Description:
+Benchmark for the in-memory event snapshot (main/snapshot.py):
+reports load time and memory per event, then times
+/api/events/ requests (first page with facets, filtered pages
+and a deep cursor page) served from the snapshot against the
+database path. Everything is written inside a transaction that
+is rolled back afterwards.
+
+Usage: python manage.py bench_snapshot --events 10000 100000
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | In-memory snapshot benchmark                | user-018
+v1.1    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+============================================================
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory, override_settings
+
+from main import snapshot
+from main.api_views import EventListAPIView
+from main.benchmarking import best_of, grow_catalogue
+
+# (label, query string)
+QUERIES = (
+    ("first page", ""),
+    ("no facets", "facets=false"),
+    ("filtered", "wheelchair_access=true&max_noise_level=MEDIUM&lighting_conditions=DIM"),
+    ("category", "category=ARTS&accessible_toilets=true&page_size=50"),
+)
+
+
+class Command(BaseCommand):
+    help = "Measure /api/events/ served from the in-memory snapshot against the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, nargs="+", default=[10000, 100000])
+        parser.add_argument("--chunk", type=int, default=20000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    @staticmethod
+    def request(view, query, use_snapshot):
+        with override_settings(EVENT_SNAPSHOT=use_snapshot):
+            response = view(RequestFactory().get(f"/api/events/?{query}"))
+            response.render()
+        assert response.status_code == 200, response.content
+        return response
+
+    # Query string of a page about halfway through the catalogue
+    def deep_query(self, view, target):
+        cursor = None
+        response = self.request(view, "facets=false&page_size=100", True)
+        for _ in range(target // 200):
+            cursor = response.data["next"].split("cursor=")[1].split("&")[0]
+            response = self.request(view, f"facets=false&page_size=100&cursor={cursor}", True)
+        return f"facets=false&cursor={cursor}"
+
+    def handle(self, *args, **options):
+        view = EventListAPIView.as_view()
+        with override_settings(ALLOWED_HOSTS=["testserver"]), transaction.atomic():
+            built = 0
+            for target in sorted(options["events"]):
+                grow_catalogue(target, options["chunk"], start=built)
+                built = target
+
+                snapshot.reset()
+                started = time.perf_counter()
+                with override_settings(EVENT_SNAPSHOT=True):
+                    usage = snapshot.get_snapshot().memory_usage()
+                load_time = time.perf_counter() - started
+                self.stdout.write(
+                    f"{target:>9,} events | load {load_time:.2f} s | {usage['total_bytes'] / 2 ** 20:.1f} MiB "
+                    f"| {usage['bytes_per_event']} bytes/event (arrays {usage['array_bytes'] // target}, "
+                    f"text {usage['text_bytes'] // target}, index {usage['index_bytes'] // target})"
+                )
+
+                for label, query in (*QUERIES, ("deep cursor", self.deep_query(view, target))):
+                    database = self.request(view, query, False)
+                    memory = self.request(view, query, True)
+                    assert database.content == memory.content
+                    database_time = best_of(lambda: self.request(view, query, False), options["repeat"])
+                    memory_time = best_of(lambda: self.request(view, query, True), options["repeat"])
+                    self.stdout.write(
+                        f"{target:>9,} events | {label:>11} | database {database_time * 1000:>7.2f} ms "
+                        f"| snapshot {memory_time * 1000:>6.2f} ms | speed-up x{database_time / memory_time:.1f}"
+                    )
+            snapshot.reset()
+            transaction.set_rollback(True)
@@ -0,0 +1,162 @@
+"""
+============================================================
+File Name: bench_sqlite.py
+Brief Description:
+Concurrency benchmark for the SQLite database mode
+(config/database.py). Reader threads request the public event
+list and detail pages through Django's WSGIHandler for a fixed
+time, first alone and then while a writer thread runs a bulk
+import (EventImporter, committed chunk by chunk). Reports read
+throughput, p50 / p99 latency and failed reads, plus import
+rows per second, under the mode in effect.
+
+Run it once per mode against separate database files, since
+journal_mode=WAL is stored in the file:
+
+  EVENT_DB_PATH=/tmp/simple.sqlite3 python manage.py migrate
+  EVENT_DB_PATH=/tmp/simple.sqlite3 python manage.py bench_sqlite
+  EVENT_DB_PATH=/tmp/wal.sqlite3 EVENT_DB_MODE=wal python manage.py migrate
+  EVENT_DB_PATH=/tmp/wal.sqlite3 EVENT_DB_MODE=wal python manage.py bench_sqlite
+
+Catalogue and imported events are committed (threads need
+them) and deleted afterwards unless --keep is given.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Read throughput during imports benchmark    | user-022
+v1.1    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+v1.2    | 2026-10-17 | Catalogue builders from main.benchmarking   | user-020
+============================================================
+"""
+
+import logging
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+from django.test import override_settings
+
+from main.benchmarking import feed_records, grow_catalogue, percentile, wsgi_environ
+from main.db_routers import read_alias
+from main.importers import EventImporter
+from main.models import AccessibilityProfile, Event
+
+BENCH_SOURCE = "bench-sqlite"
+
+
+class Command(BaseCommand):
+    help = "Measure public read throughput with and without a concurrent bulk import."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=20000)
+        parser.add_argument("--readers", type=int, default=8)
+        parser.add_argument("--duration", type=float, default=10, help="Seconds per phase.")
+        parser.add_argument("--chunk", type=int, default=2000, help="Rows per import transaction.")
+        parser.add_argument("--keep", action="store_true", help="Keep generated and imported events.")
+
+    def describe_mode(self):
+        with connection.cursor() as cursor:
+            values = {}
+            for pragma in ("journal_mode", "synchronous", "cache_size", "mmap_size"):
+                cursor.execute(f"PRAGMA {pragma}")
+                values[pragma] = cursor.fetchone()[0]
+        self.stdout.write(
+            f"Mode {settings.EVENT_DB_MODE} | read alias {read_alias() or '-'} "
+            f"| CONN_MAX_AGE {connection.settings_dict['CONN_MAX_AGE']} | "
+            + " ".join(f"{name}={value}" for name, value in values.items())
+        )
+
+    def reader(self, handler, event_ids, stop, latencies, failures, seed):
+        rng = random.Random(seed)
+        try:
+            while not stop.is_set():
+                if rng.random() < 0.5:
+                    environ = wsgi_environ("/api/events/", "facets=false")
+                else:
+                    environ = wsgi_environ(f"/api/events/{rng.choice(event_ids)}/")
+                status = []
+                started = time.perf_counter()
+                body = handler(environ, lambda code, headers, exc_info=None: status.append(code))
+                try:
+                    for _ in body:
+                        pass
+                finally:
+                    body.close()
+                latencies.append(time.perf_counter() - started)
+                if not status[0].startswith("200"):
+                    failures.append(status[0])
+        finally:
+            connections.close_all()
+
+    def writer(self, stop, imported):
+        importer = EventImporter(chunk_size=self.options["chunk"], status=Event.Status.PUBLISHED, source=BENCH_SOURCE)
+        offset = 0
+        try:
+            while not stop.is_set():
+                records = enumerate(feed_records(self.options["chunk"], offset=offset), start=1)
+                imported.append(importer.run(records).created)
+                offset += self.options["chunk"]
+        finally:
+            connections.close_all()
+
+    def phase(self, label, event_ids, importing):
+        handler = WSGIHandler()
+        stop = threading.Event()
+        latencies, failures, imported = [], [], []
+        threads = [
+            threading.Thread(target=self.reader, args=(handler, event_ids, stop, latencies, failures, seed))
+            for seed in range(self.options["readers"])
+        ]
+        if importing:
+            threads.append(threading.Thread(target=self.writer, args=(stop, imported)))
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(self.options["duration"])
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        line = (
+            f"{label:>9} | {len(latencies) / elapsed:>7.1f} reads/s | p50 {percentile(latencies, 50) * 1000:>7.2f} ms "
+            f"| p99 {percentile(latencies, 99) * 1000:>8.2f} ms | {len(failures)} failed"
+        )
+        if importing:
+            line += f" | import {sum(imported) / elapsed:,.0f} rows/s"
+        self.stdout.write(line)
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.describe_mode()
+        existing = Event.objects.filter(status=Event.Status.PUBLISHED).count()
+        created = grow_catalogue(options["events"], start=existing)
+        event_ids = list(
+            Event.objects.filter(status=Event.Status.PUBLISHED).order_by("?").values_list("pk", flat=True)[:1000]
+        )
+        # Locked reads become 500s; count them rather than logging each one
+        request_logger = logging.getLogger("django.request")
+        level = request_logger.level
+        request_logger.setLevel(logging.CRITICAL)
+        try:
+            with override_settings(ALLOWED_HOSTS=["testserver"]):
+                self.phase("idle", event_ids, importing=False)
+                self.phase("importing", event_ids, importing=True)
+        finally:
+            request_logger.setLevel(level)
+            if not options["keep"]:
+                AccessibilityProfile.objects.filter(event__source=BENCH_SOURCE).delete()
+                if created:
+                    AccessibilityProfile.objects.filter(event__pk__in=created).delete()
@@ -0,0 +1,67 @@
+"""
+============================================================
+File Name: bench_sync.py
+Brief Description:
+Benchmark for nightly feed sync (importers.EventSync): imports
+a synthetic feed, then re-syncs it unchanged and with a small
+delta. Everything is rolled back afterwards.
+
+Usage: python manage.py bench_sync --events 200000 --changed 0.01
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Feed sync benchmark                         | user-012
+v1.1    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+v1.2    | 2026-10-17 | Catalogue builders from main.benchmarking   | user-020
+============================================================
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main.benchmarking import build_reference_data, feed_records
+from main.importers import EventSync
+
+SOURCE = "bench-feed"
+
+
+class Command(BaseCommand):
+    help = "Measure full vs delta feed sync times."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=200000)
+        parser.add_argument("--changed", type=float, default=0.01, help="Fraction of rows changed.")
+        parser.add_argument("--missing", type=float, default=0.005, help="Fraction of rows dropped.")
+
+    def report(self, label, result):
+        self.stdout.write(
+            f"{label:<12} {result.elapsed:>7.1f}s | {result.created:>8,} created | {result.updated:>7,} updated "
+            f"| {result.unchanged:>8,} unchanged | {result.cancelled:>6,} cancelled | {result.rows_per_second:>9,.0f} rows/sec"
+        )
+
+    def handle(self, *args, **options):
+        count = options["events"]
+        change_every = max(1, round(1 / options["changed"])) if options["changed"] else None
+        drop_every = max(1, round(1 / options["missing"])) if options["missing"] else None
+
+        def delta_feed():
+            for i, record in enumerate(feed_records(count)):
+                if drop_every and i % drop_every == drop_every - 1:
+                    continue
+                if change_every and i % change_every == 0:
+                    record["title"] += " (rescheduled)"
+                yield record
+
+        with transaction.atomic():
+            build_reference_data()
+            sync = EventSync(SOURCE)
+            self.report("initial", sync.run(enumerate(feed_records(count), start=1)))
+            self.report("unchanged", sync.run(enumerate(feed_records(count), start=1)))
+            self.report("delta", sync.run(enumerate(delta_feed(), start=1)))
+            transaction.set_rollback(True)
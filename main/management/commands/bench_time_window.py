@@ -0,0 +1,83 @@
+"""
+============================================================
+File Name: bench_time_window.py
+Brief Description:
+Benchmark for time-window (overlap) queries on the event list:
+the day-bucket index (main/time_windows.py) against a plain
+start < window_end AND end > window_start query, as the
+archive grows. The synthetic catalogue has one event an hour,
+so 100,000 events span over eleven years; windows are placed
+in the middle of it. Everything is written inside a
+transaction that is rolled back afterwards.
+
+Usage: python manage.py bench_time_window --events 10000 100000
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Time-window query benchmark                 | user-016
+v1.1    | 2026-10-17 | Catalogue built via benchmarking helpers    | user-020
+============================================================
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from main.benchmarking import best_of, grow_catalogue
+from main.models import Event, EventSearchDocument
+from main.time_windows import overlapping
+
+# (label, window length); zero is an "on at this instant" query
+WINDOWS = (("instant", timedelta(0)), ("day", timedelta(days=1)), ("week", timedelta(days=7)))
+PAGE = 20
+
+
+class Command(BaseCommand):
+    help = "Measure bucketed time-window queries against a plain overlap query."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, nargs="+", default=[10000, 100000])
+        parser.add_argument("--chunk", type=int, default=20000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    # Count plus first page, as the event list does
+    @staticmethod
+    def run(query):
+        queryset = EventSearchDocument.objects.filter(query)
+        count = queryset.count()
+        list(queryset.order_by("start_datetime", "event_id").values_list("pk", flat=True)[:PAGE])
+        return count
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            built, first = 0, None
+            for target in sorted(options["events"]):
+                created = grow_catalogue(target, options["chunk"], start=built)
+                first = first or Event.objects.get(pk=created[0]).start_datetime
+                built = target
+
+                middle = first + timedelta(hours=target // 2)
+                for label, length in WINDOWS:
+                    start, end = middle, middle + length
+                    plain = (
+                        Q(start_datetime__lte=start, end_datetime__gt=start) if start == end
+                        else Q(start_datetime__lt=end, end_datetime__gt=start)
+                    )
+                    bucketed = overlapping(start, end)
+                    found = self.run(bucketed)
+                    assert found == self.run(plain)
+                    bucket_time = best_of(lambda: self.run(bucketed), options["repeat"])
+                    plain_time = best_of(lambda: self.run(plain), options["repeat"])
+                    self.stdout.write(
+                        f"{target:>9,} events | {label:>7} | {found:>4} found | buckets {bucket_time * 1000:>7.2f} ms "
+                        f"| plain {plain_time * 1000:>8.2f} ms | speed-up x{plain_time / bucket_time:.0f}"
+                    )
+            transaction.set_rollback(True)
@@ -0,0 +1,62 @@
+"""
+============================================================
+File Name: export_events.py
+Brief Description:
+Streams the published catalogue to a JSONL / NDJSON / CSV file
+(see main/exporters.py). Use "-" to write to stdout.
+
+Usage: python manage.py export_events events.jsonl
+           [--format jsonl|ndjson|csv] [--chunk-size 2000]
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Streaming catalogue export                  | user-013
+============================================================
+"""
+
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from main.exporters import FORMATS, stream_export
+
+
+class Command(BaseCommand):
+    help = "Export published events as JSONL, NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=sorted(FORMATS))
+        parser.add_argument("--chunk-size", type=int, help="Events read and written per chunk.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or path.rsplit(".", 1)[-1].lower()
+        if fmt not in FORMATS:
+            raise CommandError(f"Cannot tell the format of {path}; pass --format.")
+
+        started = time.perf_counter()
+        if path == "-":
+            written = self.write(sys.stdout, fmt, options["chunk_size"])
+        else:
+            try:
+                with open(path, "w", newline="", encoding="utf-8") as stream:
+                    written = self.write(stream, fmt, options["chunk_size"])
+            except OSError as exc:
+                raise CommandError(f"Cannot write {path}: {exc}")
+            self.stdout.write(f"{path}: {written:,} bytes in {time.perf_counter() - started:.1f}s")
+
+    # Write the export to stream; returns the characters written
+    @staticmethod
+    def write(stream, fmt, chunk_size):
+        written = 0
+        for piece in stream_export(fmt, chunk_size=chunk_size):
+            written += stream.write(piece)
+        return written
@@ -0,0 +1,65 @@
+"""
+============================================================
+File Name: geocode_events.py
+Brief Description:
+Re-geocodes every stored event from its postcode (geo.py),
+e.g. after EVENT_OUTCODE_CENTROIDS is pointed at a fuller
+outcode file. Only events whose coordinates change are written;
+their search documents follow through events_changed.
+
+Usage: python manage.py geocode_events [--batch-size N]
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Re-geocode stored events                    | user-008
+============================================================
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main import geo
+from main.models import Event
+from main.signals import events_changed
+
+GEO_FIELDS = ("latitude", "longitude", "geo_cell_x", "geo_cell_y")
+
+
+class Command(BaseCommand):
+    help = "Re-geocode stored events from their postcodes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        batch_size = options["batch_size"]
+        ids = list(Event.objects.order_by("pk").values_list("pk", flat=True))
+        updated = 0
+        for start in range(0, len(ids), batch_size):
+            changed = []
+            events = Event.objects.filter(pk__in=ids[start:start + batch_size]).only(
+                "pk", "postcode", "location_text", *GEO_FIELDS
+            )
+            for event in events:
+                before = [getattr(event, field) for field in GEO_FIELDS]
+                geo.geocode_event(event)
+                if [getattr(event, field) for field in GEO_FIELDS] != before:
+                    changed.append(event)
+            if changed:
+                with transaction.atomic():
+                    Event.objects.bulk_update(changed, GEO_FIELDS)
+                    events_changed.send(sender=Event, event_ids=[event.pk for event in changed], created=False)
+                updated += len(changed)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Geocoded {len(ids)} events ({updated} changed) in {elapsed:.2f}s"
+        ))
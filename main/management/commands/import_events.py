@@ -0,0 +1,102 @@
+"""
+============================================================
+File Name: import_events.py
+Brief Description:
+Imports events from partner CSV / JSONL feeds (see
+main/importers.py for the columns). Use "-" to read stdin.
+
+With --sync the feed is the complete current programme of
+--source: unchanged rows are skipped, changed rows updated,
+new rows created and the source's events missing from the
+feed cancelled (unless --no-cancel).
+
+Usage: python manage.py import_events feed.csv [feed2.jsonl ...]
+           [--format csv|jsonl] [--status DRAFT|PUBLISHED]
+           [--batch-size 1000] [--chunk-size 10000]
+           [--source NAME [--sync [--no-cancel]]]
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | CSV / JSONL event import                    | user-011
+v1.1    | 2026-10-17 | --sync upsert mode for recurring feeds      | user-012
+============================================================
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from main.importers import FORMATS, EventImporter, EventSync, detect_format, read_records
+from main.models import Event
+
+# Row errors echoed to stderr per file
+MAX_REPORTED_ERRORS = 20
+
+
+class Command(BaseCommand):
+    help = "Import events from CSV or JSONL partner feeds."
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+")
+        parser.add_argument("--format", choices=FORMATS)
+        parser.add_argument("--status", choices=Event.Status.values, default=Event.Status.DRAFT,
+                            help="Status for rows without a status column.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows per INSERT.")
+        parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per transaction.")
+        parser.add_argument("--source", default="", help="Feed name; rows are keyed on (source, external_id).")
+        parser.add_argument("--sync", action="store_true", help="Upsert the feed and cancel missing events.")
+        parser.add_argument("--no-cancel", action="store_true", help="With --sync, keep events missing from the feed.")
+
+    def handle(self, *args, **options):
+        common = dict(batch_size=options["batch_size"], chunk_size=options["chunk_size"], status=options["status"])
+        if options["sync"]:
+            if not options["source"]:
+                raise CommandError("--sync requires --source.")
+            importer = EventSync(options["source"], cancel_missing=not options["no_cancel"], **common)
+        else:
+            importer = EventImporter(source=options["source"], **common)
+        progress = self.report_progress if options["verbosity"] > 1 else None
+
+        for path in options["paths"]:
+            try:
+                fmt = options["format"] or detect_format(path)
+            except ValueError as exc:
+                raise CommandError(str(exc))
+
+            try:
+                if path == "-":
+                    result = importer.run(read_records(sys.stdin, fmt), progress)
+                else:
+                    with open(path, newline="", encoding="utf-8") as stream:
+                        result = importer.run(read_records(stream, fmt), progress)
+            except OSError as exc:
+                raise CommandError(f"Cannot read {path}: {exc}")
+            except IntegrityError as exc:
+                raise CommandError(f"{path}: {exc}. Use --sync to update events already imported.")
+
+            for line_number, message in result.errors[:MAX_REPORTED_ERRORS]:
+                self.stderr.write(f"{path}:{line_number}: {message}")
+            if result.skipped > MAX_REPORTED_ERRORS:
+                self.stderr.write(f"{path}: ... {result.skipped - MAX_REPORTED_ERRORS} more rows skipped")
+
+            if options["sync"]:
+                summary = (
+                    f"synced {result.rows:,} rows: {result.created:,} created, {result.updated:,} updated, "
+                    f"{result.unchanged:,} unchanged, {result.cancelled:,} cancelled"
+                )
+            else:
+                summary = f"imported {result.created:,} of {result.rows:,} rows"
+            self.stdout.write(self.style.SUCCESS(
+                f"{path}: {summary} ({result.skipped:,} skipped) in {result.elapsed:.1f}s, "
+                f"{result.rows_per_second:,.0f} rows/sec"
+            ))
+
+    def report_progress(self, result):
+        self.stdout.write(f"  {result.created:,} events, {result.rows_per_second:,.0f} rows/sec")
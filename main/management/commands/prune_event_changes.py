@@ -0,0 +1,40 @@
+"""
+============================================================
+File Name: prune_event_changes.py
+Brief Description:
+Deletes event change log rows older than the retention window
+(settings.EVENT_CHANGE_RETENTION_DAYS). Clients holding a token
+from before the window get 410 Gone and must re-export.
+
+Usage: python manage.py prune_event_changes [--days 30]
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Change log retention                        | user-014
+============================================================
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from main import changes
+
+
+class Command(BaseCommand):
+    help = "Delete event change log rows older than the retention window."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.EVENT_CHANGE_RETENTION_DAYS)
+
+    def handle(self, *args, **options):
+        removed = changes.prune(timezone.now() - timedelta(days=options["days"]))
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} changes older than {options['days']} days"))
@@ -0,0 +1,42 @@
+"""
+============================================================
+File Name: rebuild_search_documents.py
+Brief Description:
+Rebuilds the EventSearchDocument read model from the events
+table in bulk (e.g. after a restore or a bulk SQL import).
+
+Usage: python manage.py rebuild_search_documents [--batch-size N]
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Bulk search document rebuild                | user-006
+v1.1    | 2026-10-17 | Invalidate the match-scoring matrix         | user-017
+============================================================
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from main import matching, search_documents
+
+
+class Command(BaseCommand):
+    help = "Rebuild the flat EventSearchDocument table for all published events."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        total = search_documents.rebuild(batch_size=options["batch_size"])
+        # rebuild() writes the table directly, without events_changed
+        matching.invalidate()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} search documents in {elapsed:.2f}s"))
@@ -0,0 +1,42 @@
+"""
+============================================================
+File Name: rebuild_search_index.py
+Brief Description:
+Rebuilds the full-text event search index (SQLite FTS5 or
+PostgreSQL tsvector) from the events table.
+
+Usage: python manage.py rebuild_search_index [--batch-size N]
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Full-text index rebuild                     | user-007
+v1.1    | 2026-10-17 | Error on databases without search           | user-007
+============================================================
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from main import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text event search index."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        if not search.available():
+            raise CommandError(str(search.SearchUnavailable().detail))
+        started = time.perf_counter()
+        total = search.rebuild(batch_size=options["batch_size"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} events in {elapsed:.2f}s"))
@@ -0,0 +1,40 @@
+"""
+============================================================
+File Name: rebuild_time_windows.py
+Brief Description:
+Rebuilds the EventDay time-window bucket index from the events
+table in bulk (e.g. after a restore, a bulk SQL import or a
+TIME_ZONE change).
+
+Usage: python manage.py rebuild_time_windows [--batch-size N]
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Bulk time-window bucket rebuild             | user-016
+============================================================
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from main import time_windows
+
+
+class Command(BaseCommand):
+    help = "Rebuild the EventDay time-window buckets for all published events."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        total = time_windows.rebuild(batch_size=options["batch_size"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} day buckets in {elapsed:.2f}s"))
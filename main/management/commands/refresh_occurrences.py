@@ -0,0 +1,50 @@
+"""
+============================================================
+File Name: refresh_occurrences.py
+Brief Description:
+Rolls the occurrence calendar forward (see main/occurrences.py):
+removes occurrences that have ended and extends recurring
+events to the horizon, in the calendar and in the time-window
+day buckets (main/time_windows.py). Run daily, e.g. from cron.
+--rebuild recreates the whole calendar from the published
+events.
+
+Usage: python manage.py refresh_occurrences [--rebuild]
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Rolling occurrence horizon refresh          | user-015
+v1.1    | 2026-10-17 | Extend the time-window buckets too          | user-016
+============================================================
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from main import occurrences, time_windows
+
+
+class Command(BaseCommand):
+    help = "Drop ended occurrences and extend recurring events to the horizon."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rebuild", action="store_true", help="Recreate every occurrence.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        if options["rebuild"]:
+            total = occurrences.rebuild()
+            message = f"Materialised {total} occurrences"
+        else:
+            removed, added = occurrences.refresh()
+            bucketed = time_windows.refresh()
+            message = f"Removed {removed} ended and added {added} new occurrences ({bucketed} day buckets)"
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"{message} in {elapsed:.2f}s"))
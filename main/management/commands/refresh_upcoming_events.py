@@ -0,0 +1,42 @@
+"""
+============================================================
+File Name: refresh_upcoming_events.py
+Brief Description:
+Drops ended events from the UpcomingEvent working set behind
+the event list, and copies in the documents of any live events
+it lacks (search_documents.refresh_upcoming). Ended events stay
+in EventSearchDocument for date-range queries. Run it on a
+schedule, e.g. every 15 minutes from cron; the list hides
+events that ended since the last run either way.
+
+Usage: python manage.py refresh_upcoming_events
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Scheduled upcoming events refresh           | user-024
+============================================================
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from main import search_documents
+
+
+class Command(BaseCommand):
+    help = "Move ended events out of the upcoming events table."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        added, archived = search_documents.refresh_upcoming()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {archived} ended events, added {added} upcoming events in {elapsed:.2f}s"
+        ))
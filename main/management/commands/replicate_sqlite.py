@@ -0,0 +1,58 @@
+"""
+============================================================
+File Name: replicate_sqlite.py
+Brief Description:
+Replication stand-in for local replica testing: copies the
+primary SQLite database onto each replica file configured with
+EVENT_DB_REPLICAS (config/database.copy_database), once or
+every --every seconds. Replicas lag the primary by up to one
+interval, which the replica router's pin-after-write covers.
+
+Usage:
+  EVENT_DB_REPLICAS=/tmp/replica1.sqlite3,/tmp/replica2.sqlite3 \\
+      python manage.py replicate_sqlite --every 2
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | SQLite replication stand-in                 | user-023
+============================================================
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from config.database import copy_database, replica_path
+
+
+class Command(BaseCommand):
+    help = "Copy the primary SQLite database onto each configured replica file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--every", type=float, default=0, help="Repeat every N seconds (0: copy once).")
+
+    def replicate(self, source, replicas):
+        started = time.perf_counter()
+        for alias in replicas:
+            copy_database(source, replica_path(settings.DATABASES[alias]))
+        self.stdout.write(
+            f"Copied {source} to {len(replicas)} replicas in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+
+    def handle(self, *args, **options):
+        replicas = settings.EVENT_REPLICA_DATABASES
+        if not replicas:
+            raise CommandError("No replicas configured; set EVENT_DB_REPLICAS to their file paths.")
+        source = str(settings.DATABASES[DEFAULT_DB_ALIAS]["NAME"])
+        self.replicate(source, replicas)
+        while options["every"]:
+            time.sleep(options["every"])
+            self.replicate(source, replicas)
@@ -0,0 +1,249 @@
+"""
+============================================================
+File Name: matching.py
+Brief Description:
+Accessibility match scoring behind /api/events/match/: ranks
+published events by how well their sensory profile fits a
+user's preferences (e.g. low noise, dim lighting, small
+crowds).
+
+A preference names a sensory field, the preferred option code
+and a weight. For each field an event scores
+    1 - |position(event option) - position(preferred option)| / (options - 1)
+where positions follow the options' display_order within the
+field's sensory category, so the preferred level scores 1 and
+the furthest level 0. An event's match score is the weighted
+mean over the requested fields, between 0 and 1.
+
+Scores are computed with NumPy over a ProfileMatrix: the
+EventSearchDocument rows of all published events held as
+columns (ranks, access flags, start and live_until times),
+ordered by start time. An event is ranked until live_until, the
+end of its last occurrence (never, for recurring events without
+an end date), as on the event list. The matrix is loaded once per process and reused
+until events change; a version token in the shared Django
+cache (as in lookup_cache.py) tells other processes to reload.
+Ranking never touches the database, so the whole catalogue is
+scored on every request; `python manage.py bench_match` times
+it.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.3
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Vectorised accessibility match scoring      | user-017
+v1.1    | 2026-10-17 | Load from the primary database              | user-023
+v1.2    | 2026-10-17 | Expiring shared version token               | user-003
+v1.3    | 2026-10-17 | Live until the last occurrence ends         | user-017
+============================================================
+"""
+
+import threading
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .db_routers import primary_database
+from .filters import TRI_STATE_FIELDS, _parse_bool, sensory_options
+from .lookup_cache import new_version_token, version_token
+from .models import EventSearchDocument
+
+VERSION_KEY = "main:match-profiles:version"
+
+# Sensory fields a preference can name (EventSearchDocument has <field>_rank)
+SENSORY_FIELDS = ("noise_level", "lighting_conditions", "crowd_level", "sensory_level")
+# Access flags usable as hard requirements; stored 1 / 0, with -1 for unknown
+FLAG_FIELDS = ("wheelchair_access", "accessible_toilets", "quiet_space_available")
+MAX_WEIGHT = 10
+
+_lock = threading.Lock()
+_matrix = None
+
+
+class ProfileMatrix:
+    """
+    Column arrays over the published events, in (start_datetime, event)
+    order. Shared between requests; treat as read-only.
+    """
+
+    def __init__(self, version, event_ids, starts, live_until, ranks, flags):
+        self.version = version
+        self.event_ids = event_ids
+        self.starts = starts
+        self.live_until = live_until
+        self.ranks = ranks
+        self.flags = flags
+
+    def __len__(self):
+        return len(self.event_ids)
+
+    # Bytes held by the arrays
+    @property
+    def nbytes(self):
+        columns = [self.event_ids, self.starts, self.live_until, *self.ranks.values(), *self.flags.values()]
+        return sum(column.nbytes for column in columns)
+
+
+def _flag(value):
+    return -1 if value is None else int(value)
+
+
+# live_until as a timestamp; repeating without end is live forever
+def _live_until(moment):
+    return np.inf if moment is None else moment.timestamp()
+
+
+def load(version=None) -> ProfileMatrix:
+    rank_columns = [f"{field}_rank" for field in SENSORY_FIELDS]
+    rows = list(
+        EventSearchDocument.objects.order_by("start_datetime", "event_id")
+        .values_list("event_id", "start_datetime", "live_until", *rank_columns, *FLAG_FIELDS)
+    )
+    columns = list(zip(*rows)) or [()] * (3 + len(rank_columns) + len(FLAG_FIELDS))
+    count = len(rows)
+
+    ranks = {
+        field: np.fromiter(columns[3 + i], dtype=np.int32, count=count)
+        for i, field in enumerate(SENSORY_FIELDS)
+    }
+    first_flag = 3 + len(rank_columns)
+    flags = {
+        field: np.fromiter(map(_flag, columns[first_flag + i]), dtype=np.int8, count=count)
+        for i, field in enumerate(FLAG_FIELDS)
+    }
+    return ProfileMatrix(
+        version,
+        np.fromiter(columns[0], dtype=np.int64, count=count),
+        np.fromiter((moment.timestamp() for moment in columns[1]), dtype=np.float64, count=count),
+        np.fromiter(map(_live_until, columns[2]), dtype=np.float64, count=count),
+        ranks,
+        flags,
+    )
+
+
+def _shared_version():
+    return version_token(VERSION_KEY)
+
+
+# Return the current matrix, reloading it when the version moves
+def get_matrix() -> ProfileMatrix:
+    global _matrix
+    version = _shared_version()
+    matrix = _matrix
+    if matrix is not None and matrix.version == version:
+        return matrix
+
+    # Never cache a lagging replica's rows under the new version
+    with _lock, primary_database():
+        if _matrix is None or _matrix.version != version:
+            _matrix = load(version)
+        return _matrix
+
+
+def _bump_shared_version():
+    global _matrix
+    new_version_token(VERSION_KEY)
+    _matrix = None
+
+
+# Drop this process's matrix now and tell other processes once committed
+def invalidate():
+    global _matrix
+    _matrix = None
+    transaction.on_commit(_bump_shared_version)
+
+
+# [(field, code, weight)] from <field>=<code> and optional <field>_weight=<number>
+def parse_preferences(params):
+    preferences = []
+    for field in SENSORY_FIELDS:
+        if not params.get(field):
+            continue
+        code = params[field].strip().upper()
+        if code not in {option.code for option in sensory_options(field)}:
+            raise ValidationError({field: f"Unknown level {code!r}."})
+        weight_param = f"{field}_weight"
+        try:
+            weight = float(params.get(weight_param, 1))
+        except ValueError:
+            raise ValidationError({weight_param: "Expected a number."})
+        if not 0 <= weight <= MAX_WEIGHT:
+            raise ValidationError({weight_param: f"Expected a weight between 0 and {MAX_WEIGHT}."})
+        preferences.append((field, code, weight))
+    if not any(weight for _, _, weight in preferences):
+        raise ValidationError({"preferences": "At least one sensory preference with a weight is required."})
+    return preferences
+
+
+# {flag field: True / False / None} from the access requirement parameters
+def parse_requirements(params):
+    return {
+        field: _parse_bool(field, params[field], allow_unknown=field in TRI_STATE_FIELDS)
+        for field in FLAG_FIELDS
+        if params.get(field)
+    }
+
+
+# Per-rank closeness to the preferred code for field, indexed by display_order;
+# ranks of inactive options score 0. Raises KeyError for an unknown code.
+def closeness_table(field, code, size):
+    options = sorted(sensory_options(field), key=lambda option: option.display_order)
+    positions = {option.code: position for position, option in enumerate(options)}
+    target = positions[code]
+    span = max(len(options) - 1, 1)
+    table = np.zeros(max(size, max((option.display_order for option in options), default=0) + 1))
+    for option in options:
+        table[option.display_order] = 1 - abs(positions[option.code] - target) / span
+    return table
+
+
+# Match score of every row. preferences: [(field, code, weight)]
+def score(matrix, preferences):
+    total = np.zeros(len(matrix))
+    weights = 0.0
+    for field, code, weight in preferences:
+        ranks = matrix.ranks[field]
+        size = int(ranks.max()) + 1 if len(ranks) else 1
+        total += weight * closeness_table(field, code, size)[ranks]
+        weights += weight
+    return total / weights if weights else total
+
+
+# Rows of events that have not ended and meet every requirement
+# ({flag field: True / False / None})
+def eligible(matrix, requirements=None, now=None):
+    mask = matrix.live_until > (now or timezone.now()).timestamp()
+    for field, value in (requirements or {}).items():
+        mask &= matrix.flags[field] == _flag(value)
+    return mask
+
+
+# (count, [(event_id, score)]) of the eligible events ranked offset to
+# offset + limit by score, ties by start time then event id
+def rank(preferences, requirements=None, offset=0, limit=20, now=None, matrix=None):
+    matrix = matrix or get_matrix()
+    scores = score(matrix, preferences)
+    mask = eligible(matrix, requirements, now)
+    rows = np.flatnonzero(mask)
+    count = len(rows)
+    wanted = min(offset + limit, count)
+    if wanted <= offset:
+        return count, []
+
+    # Partition on score instead of sorting the catalogue: keep the rows above
+    # the wanted-th best score, plus the earliest rows tied with it (rows are
+    # in start order, so flatnonzero returns ties earliest first)
+    candidates = scores[rows]
+    if wanted < count:
+        threshold = np.partition(candidates, count - wanted)[count - wanted]
+        above = rows[candidates > threshold]
+        tied = rows[candidates == threshold][:wanted - len(above)]
+        rows = np.concatenate([above, tied])
+    rows = rows[np.lexsort((rows, -scores[rows]))][offset:wanted]
+    return count, [(int(matrix.event_ids[row]), float(scores[row])) for row in rows]
@@ -0,0 +1,267 @@
+"""
+============================================================
+File Name: metrics.py
+Brief Description:
+Per-request query-count and latency instrumentation.
+
+RequestMetricsMiddleware records for every request:
+  * queries: SQL statements run (all database aliases);
+  * db: time spent executing them;
+  * serializer: time in event serialization (views wrap it in
+    timer("serializer"));
+  * render: time rendering templates / DRF responses;
+  * total: wall time through the middleware.
+Section times exclude database time spent inside them, so a
+template that runs a lazy query counts it under db, not render.
+
+Values are aggregated per URL name (resolver view_name) into
+process-local histograms, served in Prometheus text format at
+/internal/metrics. Optionally each response carries a
+Server-Timing and X-Query-Count header
+(settings.EVENT_METRICS_HEADER), and each request logs one
+JSON line to the "main.metrics" logger
+(settings.EVENT_METRICS_LOG). Streaming responses are measured
+up to the start of the stream. The middleware is sync- and
+async-capable, so it does not push async views (async_views.py)
+back onto a thread under ASGI.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Request metrics middleware + histograms     | user-019
+v1.1    | 2026-10-17 | Async-capable middleware for ASGI views     | user-021
+============================================================
+"""
+
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("main.metrics")
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# (metric name, RequestMetrics attribute, buckets, help text)
+HISTOGRAMS = (
+    ("event_request_duration_seconds", "total", SECONDS_BUCKETS, "Request wall time."),
+    ("event_request_db_seconds", "db", SECONDS_BUCKETS, "Time executing SQL per request."),
+    ("event_request_serializer_seconds", "serializer", SECONDS_BUCKETS, "Serialization time per request."),
+    ("event_request_render_seconds", "render", SECONDS_BUCKETS, "Response rendering time per request."),
+    ("event_request_queries", "queries", QUERY_BUCKETS, "SQL queries per request."),
+)
+
+_current = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """Counters for one request; times in seconds."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.serializer = 0.0
+        self.render = 0.0
+        self.total = 0.0
+
+    # Server-Timing header value (durations in milliseconds)
+    def server_timing(self):
+        return ", ".join(
+            f"{name};dur={getattr(self, name) * 1000:.2f}" for name in ("db", "serializer", "render", "total")
+        )
+
+
+class Histogram:
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # counts[i]: observations in (buckets[i - 1], buckets[i]]; the last is +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    # (le, cumulative count) pairs, ending with +Inf
+    def cumulative(self):
+        total = 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            total += count
+            yield bound, total
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """Process-local histograms per (metric, view name)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def record(self, view, metrics):
+        with self._lock:
+            for name, attribute, buckets, _ in HISTOGRAMS:
+                histogram = self._histograms.get((name, view))
+                if histogram is None:
+                    histogram = self._histograms[(name, view)] = Histogram(buckets)
+                histogram.observe(getattr(metrics, attribute))
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    # Prometheus text exposition format (version 0.0.4)
+    def prometheus_text(self):
+        lines = []
+        with self._lock:
+            for name, _, _, help_text in HISTOGRAMS:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (metric, view), histogram in sorted(self._histograms.items()):
+                    if metric != name:
+                        continue
+                    label = f'view="{_label(view)}"'
+                    for bound, count in histogram.cumulative():
+                        lines.append(f'{name}_bucket{{{label},le="{bound}"}} {count}')
+                    lines.append(f"{name}_sum{{{label}}} {histogram.sum:.6f}")
+                    lines.append(f"{name}_count{{{label}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+# Add the time spent in the block, less database time, to the current
+# request's section (a no-op outside a request)
+@contextmanager
+def timer(section):
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    started, db_before = time.perf_counter(), metrics.db
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started - (metrics.db - db_before)
+        setattr(metrics, section, getattr(metrics, section) + elapsed)
+
+
+def _query_counter(metrics):
+    def wrapper(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics.queries += 1
+            metrics.db += time.perf_counter() - started
+    return wrapper
+
+
+def view_name(request):
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match else "unmatched"
+
+
+# Count queries on every connection of the calling thread until stack closes
+def _count_queries(stack, metrics):
+    counter = _query_counter(metrics)
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(counter))
+
+
+class RequestMetricsMiddleware:
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                _count_queries(stack, metrics)
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics, started)
+
+    # Under ASGI the ORM runs in the request's sync_to_async thread, whose
+    # connections are not the event loop thread's, so the query counter is
+    # installed and removed there
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        stack = ExitStack()
+        try:
+            await sync_to_async(_count_queries)(stack, metrics)
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(stack.close)()
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics, started)
+
+    def finish(self, request, response, metrics, started):
+        metrics.total = time.perf_counter() - started
+
+        view = view_name(request)
+        registry.record(view, metrics)
+        if getattr(settings, "EVENT_METRICS_HEADER", False):
+            response["Server-Timing"] = metrics.server_timing()
+            response["X-Query-Count"] = str(metrics.queries)
+        if getattr(settings, "EVENT_METRICS_LOG", False):
+            logger.info(json.dumps({
+                "view": view,
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "queries": metrics.queries,
+                "db_ms": round(metrics.db * 1000, 2),
+                "serializer_ms": round(metrics.serializer * 1000, 2),
+                "render_ms": round(metrics.render * 1000, 2),
+                "total_ms": round(metrics.total * 1000, 2),
+            }))
+        return response
+
+    # Template and DRF responses are rendered after the view returns
+    def process_template_response(self, request, response):
+        render = response.render
+
+        def timed_render():
+            with timer("render"):
+                return render()
+
+        response.render = timed_render
+        return response
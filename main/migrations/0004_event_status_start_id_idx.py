@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0003_alter_lookupoption_unique_together"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["status", "start_datetime", "id"], name="event_status_start_id_idx"),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0004_event_status_start_id_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="accessibilityprofile",
+            index=models.Index(fields=["wheelchair_access", "quiet_space_available", "accessible_toilets"], name="profile_access_flags_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["status", "category", "start_datetime", "id"], name="event_status_cat_start_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["status", "price"], name="event_status_price_idx"),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+SENSORY_FIELDS = ("noise_level", "lighting_conditions", "crowd_level", "sensory_level")
+
+
+# Backfill documents for existing published events
+def build_documents(apps, schema_editor):
+    Event = apps.get_model("main", "Event")
+    EventSearchDocument = apps.get_model("main", "EventSearchDocument")
+
+    related = ["category", "accessibility_profile"] + [f"accessibility_profile__{f}" for f in SENSORY_FIELDS]
+    documents = []
+    for event in Event.objects.filter(status="PUBLISHED").select_related(*related).iterator(chunk_size=2000):
+        profile = event.accessibility_profile
+        document = EventSearchDocument(
+            event_id=event.pk,
+            start_datetime=event.start_datetime,
+            end_datetime=event.end_datetime,
+            category_code=event.category.code,
+            wheelchair_access=profile.wheelchair_access,
+            accessible_toilets=profile.accessible_toilets,
+            quiet_space_available=profile.quiet_space_available,
+            age_min=event.age_min,
+            age_max=event.age_max,
+            price=event.price,
+            postcode=event.postcode,
+        )
+        for field in SENSORY_FIELDS:
+            option = getattr(profile, field)
+            setattr(document, f"{field}_code", option.code)
+            setattr(document, f"{field}_rank", option.display_order)
+        documents.append(document)
+    EventSearchDocument.objects.bulk_create(documents, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0005_event_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventSearchDocument",
+            fields=[
+                ("event", models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name="search_document", serialize=False, to="main.event")),
+                ("start_datetime", models.DateTimeField()),
+                ("end_datetime", models.DateTimeField()),
+                ("category_code", models.CharField(max_length=50)),
+                ("wheelchair_access", models.BooleanField()),
+                ("accessible_toilets", models.BooleanField(null=True)),
+                ("quiet_space_available", models.BooleanField(null=True)),
+                ("noise_level_code", models.CharField(max_length=50)),
+                ("noise_level_rank", models.PositiveIntegerField()),
+                ("lighting_conditions_code", models.CharField(max_length=50)),
+                ("lighting_conditions_rank", models.PositiveIntegerField()),
+                ("crowd_level_code", models.CharField(max_length=50)),
+                ("crowd_level_rank", models.PositiveIntegerField()),
+                ("sensory_level_code", models.CharField(max_length=50)),
+                ("sensory_level_rank", models.PositiveIntegerField()),
+                ("age_min", models.IntegerField(null=True)),
+                ("age_max", models.IntegerField(null=True)),
+                ("price", models.DecimalField(decimal_places=2, max_digits=8, null=True)),
+                ("postcode", models.CharField(blank=True, max_length=20)),
+            ],
+            options={
+                "indexes": [models.Index(fields=["start_datetime", "event"], name="searchdoc_start_idx"), models.Index(fields=["category_code", "start_datetime", "event"], name="searchdoc_cat_start_idx"), models.Index(fields=["noise_level_rank", "crowd_level_rank", "sensory_level_rank"], name="searchdoc_sensory_rank_idx"), models.Index(fields=["wheelchair_access", "quiet_space_available", "accessible_toilets"], name="searchdoc_access_flags_idx"), models.Index(fields=["price"], name="searchdoc_price_idx")],
+            },
+        ),
+        migrations.RunPython(build_documents, migrations.RunPython.noop),
+    ]
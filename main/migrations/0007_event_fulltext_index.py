@@ -0,0 +1,63 @@
+# Full-text search index tables (see main/search.py)
+
+from django.db import migrations
+
+SQLITE_CREATE = [
+    "CREATE VIRTUAL TABLE main_event_fts USING fts5("
+    "title, description, location_text, postcode, additional_notes, "
+    "tokenize = 'porter unicode61')",
+    "INSERT INTO main_event_fts (rowid, title, description, location_text, postcode, additional_notes) "
+    "SELECT e.id, e.title, e.description, e.location_text, e.postcode, p.additional_notes "
+    "FROM main_event e JOIN main_accessibilityprofile p ON p.id = e.accessibility_profile_id",
+]
+SQLITE_DROP = ["DROP TABLE IF EXISTS main_event_fts"]
+
+POSTGRES_DOCUMENT = (
+    "setweight(to_tsvector('english', e.title), 'A') || "
+    "setweight(to_tsvector('english', e.description), 'C') || "
+    "setweight(to_tsvector('english', e.location_text), 'B') || "
+    "setweight(to_tsvector('english', e.postcode), 'B') || "
+    "setweight(to_tsvector('english', p.additional_notes), 'B')"
+)
+POSTGRES_CREATE = [
+    "CREATE TABLE main_event_search_vector ("
+    "event_id bigint PRIMARY KEY REFERENCES main_event (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+    "document tsvector NOT NULL)",
+    "CREATE INDEX main_event_search_vector_gin ON main_event_search_vector USING GIN (document)",
+    "INSERT INTO main_event_search_vector (event_id, document) "
+    f"SELECT e.id, {POSTGRES_DOCUMENT} "
+    "FROM main_event e JOIN main_accessibilityprofile p ON p.id = e.accessibility_profile_id",
+]
+POSTGRES_DROP = ["DROP TABLE IF EXISTS main_event_search_vector"]
+
+STATEMENTS = {
+    "sqlite": (SQLITE_CREATE, SQLITE_DROP),
+    "postgresql": (POSTGRES_CREATE, POSTGRES_DROP),
+}
+
+
+def run(schema_editor, index):
+    statements = STATEMENTS.get(schema_editor.connection.vendor)
+    if statements is None:
+        return
+    for sql in statements[index]:
+        schema_editor.execute(sql)
+
+
+def create_index(apps, schema_editor):
+    run(schema_editor, 0)
+
+
+def drop_index(apps, schema_editor):
+    run(schema_editor, 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0006_eventsearchdocument"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
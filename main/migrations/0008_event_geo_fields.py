@@ -0,0 +1,129 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:51
+
+import csv
+import math
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.db import migrations, models
+
+GEO_FIELDS = ["latitude", "longitude", "geo_cell_x", "geo_cell_y"]
+
+# A frozen copy of main/geo.py's geocoding as of this migration, so later
+# changes to that module cannot change what this migration does
+GRID_CELL_DEGREES = 0.05
+POSTCODE = re.compile(r"^([A-Z]{1,2}[0-9][A-Z0-9]?)\s*([0-9][A-Z]{2})?$")
+POSTCODE_IN_TEXT = re.compile(r"\b([A-Z]{1,2}[0-9][A-Z0-9]?)\s*([0-9][A-Z]{2})\b")
+BUNDLED_CENTROIDS = Path(__file__).resolve().parent.parent / "data" / "outcode_centroids.csv"
+
+
+def load_centroids():
+    path = getattr(settings, "EVENT_OUTCODE_CENTROIDS", BUNDLED_CENTROIDS)
+    with open(path, newline="", encoding="utf-8") as handle:
+        return {
+            row["outcode"].strip().upper(): (float(row["latitude"]), float(row["longitude"]))
+            for row in csv.DictReader(handle)
+        }
+
+
+def outcode(text):
+    match = POSTCODE.match((text or "").strip().upper())
+    return match.group(1) if match else None
+
+
+def outcode_in_text(text):
+    match = POSTCODE_IN_TEXT.search((text or "").upper())
+    return match.group(1) if match else None
+
+
+def geocode_event(event, centroids):
+    point = centroids.get(outcode(event.postcode)) or centroids.get(outcode_in_text(event.location_text))
+    if point is not None:
+        event.latitude, event.longitude = point
+
+    if event.latitude is None or event.longitude is None:
+        event.geo_cell_x = event.geo_cell_y = None
+    else:
+        event.geo_cell_x = math.floor(event.longitude / GRID_CELL_DEGREES)
+        event.geo_cell_y = math.floor(event.latitude / GRID_CELL_DEGREES)
+    return event
+
+
+# Geocode existing events and copy the results onto their search documents
+def geocode_events(apps, schema_editor):
+    Event = apps.get_model("main", "Event")
+    EventSearchDocument = apps.get_model("main", "EventSearchDocument")
+    if not Event.objects.exists():
+        return
+    centroids = load_centroids()
+
+    batch = []
+    for event in Event.objects.order_by("pk").iterator(chunk_size=2000):
+        batch.append(geocode_event(event, centroids))
+        if len(batch) >= 2000:
+            Event.objects.bulk_update(batch, GEO_FIELDS)
+            batch = []
+    Event.objects.bulk_update(batch, GEO_FIELDS)
+
+    documents = []
+    for document in EventSearchDocument.objects.select_related("event").iterator(chunk_size=2000):
+        for field in GEO_FIELDS:
+            setattr(document, field, getattr(document.event, field))
+        documents.append(document)
+    EventSearchDocument.objects.bulk_update(documents, GEO_FIELDS, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0007_event_fulltext_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="geo_cell_x",
+            field=models.IntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="geo_cell_y",
+            field=models.IntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="latitude",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="longitude",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="eventsearchdocument",
+            name="geo_cell_x",
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name="eventsearchdocument",
+            name="geo_cell_y",
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name="eventsearchdocument",
+            name="latitude",
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddField(
+            model_name="eventsearchdocument",
+            name="longitude",
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name="eventsearchdocument",
+            index=models.Index(fields=["geo_cell_y", "geo_cell_x"], name="searchdoc_geo_cell_idx"),
+        ),
+        migrations.RunPython(geocode_events, migrations.RunPython.noop),
+    ]
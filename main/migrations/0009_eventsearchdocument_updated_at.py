@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0008_event_geo_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventsearchdocument",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="eventsearchdocument",
+            index=models.Index(fields=["updated_at"], name="searchdoc_updated_idx"),
+        ),
+    ]
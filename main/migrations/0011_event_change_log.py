@@ -0,0 +1,26 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0010_event_feed_identity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventChange",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("event_id", models.IntegerField()),
+                ("kind", models.CharField(choices=[("CREATED", "Created"), ("UPDATED", "Updated"), ("CANCELLED", "Cancelled"), ("DELETED", "Deleted")], max_length=10)),
+                ("changed_at", models.DateTimeField()),
+            ],
+            options={
+                "ordering": ["id"],
+                "indexes": [models.Index(fields=["changed_at"], name="eventchange_changed_at_idx")],
+            },
+        ),
+    ]
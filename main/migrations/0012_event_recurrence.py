@@ -0,0 +1,112 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:25
+
+import calendar
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+# A frozen copy of main/occurrences.py's expansion as of this migration, so
+# later changes to that module cannot change what this migration does
+DAY_STEPS = {"DAILY": 1, "WEEKLY": 7}
+
+
+def horizon(now):
+    return now + timedelta(days=getattr(settings, "EVENT_OCCURRENCE_HORIZON_DAYS", 180))
+
+
+def add_months(moment, months):
+    month_index = moment.month - 1 + months
+    year, month = moment.year + month_index // 12, month_index % 12 + 1
+    if moment.day > calendar.monthrange(year, month)[1]:
+        return None
+    return moment.replace(year=year, month=month)
+
+
+# (start, end) of event's occurrences ending after window_start and, for
+# repeats, starting before window_end
+def expand(event, window_start, window_end):
+    duration = event.end_datetime - event.start_datetime
+    if not event.recurrence:
+        if event.end_datetime > window_start:
+            yield event.start_datetime, event.end_datetime
+        return
+
+    zone = timezone.get_default_timezone()
+    local_start = timezone.make_naive(event.start_datetime, zone)
+    n = 0
+    while True:
+        if event.recurrence == "MONTHLY":
+            moment = add_months(local_start, n * event.recurrence_interval)
+        else:
+            moment = local_start + timedelta(days=n * DAY_STEPS[event.recurrence] * event.recurrence_interval)
+        n += 1
+        if moment is None:
+            continue
+        if event.recurrence_until and moment.date() > event.recurrence_until:
+            return
+        start = timezone.make_aware(moment, zone)
+        if start >= window_end:
+            return
+        if start + duration > window_start:
+            yield start, start + duration
+
+
+# Materialise occurrences of the existing published events
+def materialise_occurrences(apps, schema_editor):
+    Event = apps.get_model("main", "Event")
+    EventOccurrence = apps.get_model("main", "EventOccurrence")
+
+    now = timezone.now()
+    until = horizon(now)
+    batch = []
+    for event in Event.objects.filter(status="PUBLISHED").order_by("pk").iterator(chunk_size=2000):
+        batch.extend(
+            EventOccurrence(event_id=event.pk, start_datetime=start, end_datetime=end)
+            for start, end in expand(event, now, until)
+        )
+        if len(batch) >= 2000:
+            EventOccurrence.objects.bulk_create(batch)
+            batch = []
+    EventOccurrence.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0011_event_change_log"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="recurrence",
+            field=models.CharField(blank=True, choices=[("", "Does not repeat"), ("DAILY", "Daily"), ("WEEKLY", "Weekly"), ("MONTHLY", "Monthly")], default="", max_length=10),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="recurrence_interval",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="recurrence_until",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="EventOccurrence",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("start_datetime", models.DateTimeField()),
+                ("end_datetime", models.DateTimeField()),
+                ("event", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="occurrences", to="main.event")),
+            ],
+            options={
+                "indexes": [models.Index(fields=["start_datetime", "event"], name="occurrence_start_idx")],
+                "constraints": [models.UniqueConstraint(fields=("event", "start_datetime"), name="uniq_occurrence_event_start")],
+            },
+        ),
+        migrations.RunPython(materialise_occurrences, migrations.RunPython.noop),
+    ]
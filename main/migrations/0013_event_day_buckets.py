@@ -0,0 +1,58 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:32
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+# A frozen copy of main/time_windows.py's bucketing as of this migration, so
+# later changes to that module cannot change what this migration does
+LONG_EVENT_DAYS = 31
+
+
+# Local days covered by [start, end); [None] for long events
+def event_days(start, end):
+    zone = timezone.get_current_timezone()
+    first = start.astimezone(zone).date()
+    last = max(start, end - timedelta(microseconds=1)).astimezone(zone).date()
+    span = (last - first).days + 1
+    if span > LONG_EVENT_DAYS:
+        return [None]
+    return [first + timedelta(days=offset) for offset in range(span)]
+
+
+# Bucket the existing published events
+def bucket_events(apps, schema_editor):
+    Event = apps.get_model("main", "Event")
+    EventDay = apps.get_model("main", "EventDay")
+
+    batch = []
+    for event in Event.objects.filter(status="PUBLISHED").order_by("pk").iterator(chunk_size=2000):
+        batch.extend(EventDay(event_id=event.pk, day=day) for day in event_days(event.start_datetime, event.end_datetime))
+        if len(batch) >= 2000:
+            EventDay.objects.bulk_create(batch)
+            batch = []
+    EventDay.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0012_event_recurrence"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventDay",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("day", models.DateField(null=True)),
+                ("event", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="days", to="main.event")),
+            ],
+            options={
+                "indexes": [models.Index(fields=["day", "event"], name="eventday_day_event_idx")],
+            },
+        ),
+        migrations.RunPython(bucket_events, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.9 on 2026-10-17 19:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+# Copy the documents of events that have not ended, updated_at included
+def copy_upcoming(apps, schema_editor):
+    EventSearchDocument = apps.get_model("main", "EventSearchDocument")
+    UpcomingEvent = apps.get_model("main", "UpcomingEvent")
+    quote = schema_editor.quote_name
+    columns = ", ".join(quote(field.column) for field in EventSearchDocument._meta.concrete_fields)
+    schema_editor.execute(
+        f"INSERT INTO {quote(UpcomingEvent._meta.db_table)} ({columns}) "
+        f"SELECT {columns} FROM {quote(EventSearchDocument._meta.db_table)} WHERE {quote('end_datetime')} > %s",
+        [schema_editor.connection.ops.adapt_datetimefield_value(timezone.now())],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0013_event_day_buckets'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UpcomingEvent',
+            fields=[
+                ('start_datetime', models.DateTimeField()),
+                ('end_datetime', models.DateTimeField()),
+                ('category_code', models.CharField(max_length=50)),
+                ('wheelchair_access', models.BooleanField()),
+                ('accessible_toilets', models.BooleanField(null=True)),
+                ('quiet_space_available', models.BooleanField(null=True)),
+                ('noise_level_code', models.CharField(max_length=50)),
+                ('noise_level_rank', models.PositiveIntegerField()),
+                ('lighting_conditions_code', models.CharField(max_length=50)),
+                ('lighting_conditions_rank', models.PositiveIntegerField()),
+                ('crowd_level_code', models.CharField(max_length=50)),
+                ('crowd_level_rank', models.PositiveIntegerField()),
+                ('sensory_level_code', models.CharField(max_length=50)),
+                ('sensory_level_rank', models.PositiveIntegerField()),
+                ('age_min', models.IntegerField(null=True)),
+                ('age_max', models.IntegerField(null=True)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=8, null=True)),
+                ('postcode', models.CharField(blank=True, max_length=20)),
+                ('latitude', models.FloatField(null=True)),
+                ('longitude', models.FloatField(null=True)),
+                ('geo_cell_x', models.IntegerField(null=True)),
+                ('geo_cell_y', models.IntegerField(null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='upcoming', serialize=False, to='main.event')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='eventsearchdocument',
+            index=models.Index(fields=['end_datetime'], name='searchdoc_end_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='upcomingevent',
+            index=models.Index(fields=['start_datetime', 'event'], name='upcoming_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='upcomingevent',
+            index=models.Index(fields=['category_code', 'start_datetime', 'event'], name='upcoming_cat_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='upcomingevent',
+            index=models.Index(fields=['end_datetime'], name='upcoming_end_idx'),
+        ),
+        migrations.RunPython(copy_upcoming, migrations.RunPython.noop),
+    ]
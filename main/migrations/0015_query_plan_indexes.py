@@ -0,0 +1,59 @@
+# Generated by Django 5.2.9 on 2026-10-17 19:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0014_upcoming_event'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='event',
+            name='event_status_start_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='event',
+            name='event_status_cat_start_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='event',
+            name='event_status_price_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='eventsearchdocument',
+            name='searchdoc_updated_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='upcomingevent',
+            name='upcoming_end_idx',
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('status', 'PUBLISHED')), fields=['start_datetime', 'id'], name='event_published_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('status', 'PUBLISHED')), fields=['category', 'start_datetime', 'id'], name='event_published_cat_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('status', 'PUBLISHED')), fields=['id'], name='event_published_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventsearchdocument',
+            index=models.Index(fields=['updated_at', 'event'], name='searchdoc_updated_event_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lookupoption',
+            index=models.Index(fields=['option_type', 'display_order', 'label'], name='lookupoption_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='upcomingevent',
+            index=models.Index(fields=['end_datetime', 'updated_at', 'event'], name='upcoming_end_stamp_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-17 19:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0015_query_plan_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogueState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('removed_at', models.DateTimeField(null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-17 19:56
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+# Logs pruned before the watermark existed start below their oldest row
+def set_watermark(apps, schema_editor):
+    EventChange = apps.get_model("main", "EventChange")
+    CatalogueState = apps.get_model("main", "CatalogueState")
+    oldest = EventChange.objects.aggregate(oldest=Min("id"))["oldest"]
+    if oldest is not None and oldest > 1:
+        CatalogueState.objects.update_or_create(pk=1, defaults={"changes_pruned_through": oldest - 1})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0016_catalogue_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cataloguestate',
+            name='changes_pruned_through',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(set_watermark, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 5.2.9 on 2026-10-17 20:05
+
+import calendar
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils import timezone
+
+# A frozen copy of main/occurrences.py's last_end() as of this migration, so
+# later changes to that module cannot change what this migration does
+DAY_STEPS = {"DAILY": 1, "WEEKLY": 7}
+
+
+def add_months(moment, months):
+    month_index = moment.month - 1 + months
+    year, month = moment.year + month_index // 12, month_index % 12 + 1
+    if moment.day > calendar.monthrange(year, month)[1]:
+        return None
+    return moment.replace(year=year, month=month)
+
+
+# End of event's final occurrence; None while it repeats without end
+def last_end(event):
+    if not event.recurrence:
+        return event.end_datetime
+    if not event.recurrence_until:
+        return None
+    zone = timezone.get_default_timezone()
+    local_start = timezone.make_naive(event.start_datetime, zone)
+    duration = event.end_datetime - event.start_datetime
+    end, n = event.end_datetime, 0
+    while True:
+        if event.recurrence in DAY_STEPS:
+            moment = local_start + timedelta(days=n * DAY_STEPS[event.recurrence] * event.recurrence_interval)
+        else:
+            moment = add_months(local_start, n * event.recurrence_interval)
+        n += 1
+        if moment is None:
+            continue
+        if moment.date() > event.recurrence_until:
+            return end
+        end = timezone.make_aware(moment, zone) + duration
+
+
+# Fill live_until on the documents, then rebuild the upcoming working set so
+# recurring events whose first occurrence has ended come back, updated_at
+# included
+def fill_live_until(apps, schema_editor):
+    Event = apps.get_model("main", "Event")
+    EventSearchDocument = apps.get_model("main", "EventSearchDocument")
+    UpcomingEvent = apps.get_model("main", "UpcomingEvent")
+
+    EventSearchDocument.objects.filter(event__recurrence="").update(live_until=models.F("end_datetime"))
+    recurring = Event.objects.filter(search_document__isnull=False).exclude(recurrence="")
+    for event in recurring.iterator(chunk_size=2000):
+        EventSearchDocument.objects.filter(pk=event.pk).update(live_until=last_end(event))
+
+    quote = schema_editor.quote_name
+    columns = ", ".join(quote(field.column) for field in EventSearchDocument._meta.concrete_fields)
+    UpcomingEvent.objects.all().delete()
+    # INSERT ... SELECT copies updated_at unchanged
+    schema_editor.execute(
+        f"INSERT INTO {quote(UpcomingEvent._meta.db_table)} ({columns}) "
+        f"SELECT {columns} FROM {quote(EventSearchDocument._meta.db_table)} "
+        f"WHERE {quote('live_until')} > %s OR {quote('live_until')} IS NULL",
+        [schema_editor.connection.ops.adapt_datetimefield_value(timezone.now())],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0017_catalogue_state_pruned_through'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='upcomingevent',
+            name='upcoming_end_stamp_idx',
+        ),
+        migrations.AddField(
+            model_name='eventsearchdocument',
+            name='live_until',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='upcomingevent',
+            name='live_until',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name='eventsearchdocument',
+            index=models.Index(fields=['live_until'], name='searchdoc_live_until_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='upcomingevent',
+            index=models.Index(fields=['live_until', 'updated_at', 'event'], name='upcoming_live_stamp_idx'),
+        ),
+        migrations.RunPython(fill_live_until, migrations.RunPython.noop),
+    ]
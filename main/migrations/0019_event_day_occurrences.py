@@ -0,0 +1,108 @@
+# Generated by Django 5.2.9 on 2026-10-17 21:10
+
+import calendar
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+# A frozen copy of main/time_windows.py's bucketing and main/occurrences.py's
+# expansion as of this migration, so later changes to those modules cannot
+# change what this migration does
+LONG_EVENT_DAYS = 31
+DAY_STEPS = {"DAILY": 1, "WEEKLY": 7}
+
+
+def add_months(moment, months):
+    month_index = moment.month - 1 + months
+    year, month = moment.year + month_index // 12, month_index % 12 + 1
+    if moment.day > calendar.monthrange(year, month)[1]:
+        return None
+    return moment.replace(year=year, month=month)
+
+
+# (start, end) of event's occurrences from the first one up to until; the
+# first is returned even when it starts past until
+def occurrences(event, until):
+    yield event.start_datetime, event.end_datetime
+    if not event.recurrence:
+        return
+    zone = timezone.get_default_timezone()
+    local_start = timezone.make_naive(event.start_datetime, zone)
+    duration = event.end_datetime - event.start_datetime
+    until = max(until, event.end_datetime)
+    n = 1
+    while True:
+        if event.recurrence in DAY_STEPS:
+            moment = local_start + timedelta(days=n * DAY_STEPS[event.recurrence] * event.recurrence_interval)
+        else:
+            moment = add_months(local_start, n * event.recurrence_interval)
+        n += 1
+        if moment is None:
+            continue
+        if event.recurrence_until and moment.date() > event.recurrence_until:
+            return
+        start = timezone.make_aware(moment, zone)
+        if start >= until:
+            return
+        yield start, start + duration
+
+
+# Local days covered by [start, end); [None] for long occurrences
+def event_days(start, end):
+    zone = timezone.get_current_timezone()
+    first = start.astimezone(zone).date()
+    last = max(start, end - timedelta(microseconds=1)).astimezone(zone).date()
+    span = (last - first).days + 1
+    if span > LONG_EVENT_DAYS:
+        return [None]
+    return [first + timedelta(days=offset) for offset in range(span)]
+
+
+# Re-bucket the published events, one row per occurrence day
+def bucket_occurrences(apps, schema_editor):
+    Event = apps.get_model("main", "Event")
+    EventDay = apps.get_model("main", "EventDay")
+    until = timezone.now() + timedelta(days=getattr(settings, "EVENT_OCCURRENCE_HORIZON_DAYS", 180))
+
+    batch = []
+    for event in Event.objects.filter(status="PUBLISHED").order_by("pk").iterator(chunk_size=2000):
+        batch.extend(
+            EventDay(event_id=event.pk, day=day, start_datetime=start, end_datetime=end)
+            for start, end in occurrences(event, until)
+            for day in event_days(start, end)
+        )
+        if len(batch) >= 2000:
+            EventDay.objects.bulk_create(batch)
+            batch = []
+    EventDay.objects.bulk_create(batch)
+
+
+def clear_days(apps, schema_editor):
+    apps.get_model("main", "EventDay").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0018_search_document_live_until'),
+    ]
+
+    operations = [
+        # Existing rows have no occurrence times; they are rebuilt below
+        migrations.RunPython(clear_days, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='eventday',
+            name='start_datetime',
+            field=models.DateTimeField(default=timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='eventday',
+            name='end_datetime',
+            field=models.DateTimeField(default=timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(bucket_occurrences, migrations.RunPython.noop),
+    ]
@@ -9,13 +9,28 @@ system field.
 
 Author: Gavin Plucknett
 Created: 2026-01-05
-Current Version: v2.0
+Current Version: v2.15
 
 Change Log:
 ------------------------------------------------------------
 Version | Date       | Change Description                                  | Reference
 ------------------------------------------------------------
 v2.0    | 2026-01-05 | Normalised coded choices + added Venue + categories| DEV-ITER2
+v2.1    | 2026-10-17 | Event (status, start_datetime, id) keyset index    | user-002
+v2.2    | 2026-10-17 | Filter indexes + sensory field category codes      | user-005
+v2.3    | 2026-10-17 | EventSearchDocument flat discovery read model      | user-006
+v2.4    | 2026-10-17 | Event coordinates + grid cells for proximity search| user-008
+v2.5    | 2026-10-17 | EventSearchDocument.updated_at list validator      | user-009
+v2.6    | 2026-10-17 | Event source / external_id / source_hash for sync  | user-012
+v2.7    | 2026-10-17 | EventChange append-only change log                 | user-014
+v2.8    | 2026-10-17 | Event recurrence rules + EventOccurrence calendar  | user-015
+v2.9    | 2026-10-17 | EventDay bucket index for time-window queries      | user-016
+v2.10   | 2026-10-17 | UpcomingEvent live working set of the list         | user-024
+v2.11   | 2026-10-17 | Partial / covering indexes from query plans        | user-025
+v2.12   | 2026-10-17 | CatalogueState removal time for list validators    | user-009
+v2.13   | 2026-10-17 | CatalogueState change log pruning watermark        | user-014
+v2.14   | 2026-10-17 | Search document live_until for recurring events    | user-024
+v2.15   | 2026-10-17 | EventDay rows per occurrence, with its start / end | user-016
 ============================================================
 """
 
@@ -24,6 +39,8 @@ from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db.models import Q
 
+from . import geo
+
 
 class SensoryCategory(models.Model):
     """
@@ -98,6 +115,10 @@ class LookupOption(models.Model):
             ),
         ]
         ordering = ("option_type","display_order", "label")
+        indexes = [
+            # Reads in Meta.ordering without a sort, all options or one type
+            models.Index(fields=["option_type", "display_order", "label"], name="lookupoption_order_idx"),
+        ]
 
 
     def __str__(self):
@@ -105,6 +126,14 @@ class LookupOption(models.Model):
     
 class AccessibilityProfile(models.Model):
 
+    # SensoryCategory code grouping the options of each sensory field
+    SENSORY_CATEGORY_CODES = {
+        "noise_level": "NOISE",
+        "lighting_conditions": "LIGHTING",
+        "crowd_level": "CROWD",
+        "sensory_level": "SENSORY",
+    }
+
     wheelchair_access = models.BooleanField(default=False)
 
     # tri-state booleans
@@ -141,6 +170,15 @@ class AccessibilityProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Boolean accessibility filters
+            models.Index(
+                fields=["wheelchair_access", "quiet_space_available", "accessible_toilets"],
+                name="profile_access_flags_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         return f"AccessibilityProfile #{self.pk}"
 
@@ -151,6 +189,12 @@ class Event(models.Model):
         PUBLISHED = "PUBLISHED"
         CANCELLED = "CANCELLED"
 
+    class Recurrence(models.TextChoices):
+        NONE = "", "Does not repeat"
+        DAILY = "DAILY"
+        WEEKLY = "WEEKLY"
+        MONTHLY = "MONTHLY"
+
     title = models.CharField(max_length=255)
     description = models.TextField()
 
@@ -174,6 +218,11 @@ class Event(models.Model):
     age_min = models.IntegerField(null=True, blank=True)
     age_max = models.IntegerField(null=True, blank=True)
     price = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True)
+    # Set from the postcode on save (see geo.py); may be entered by hand otherwise
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    geo_cell_x = models.IntegerField(null=True, editable=False)
+    geo_cell_y = models.IntegerField(null=True, editable=False)
     booking_required = models.BooleanField(default=False)
     booking_url = models.URLField(blank=True)
     accessibility_profile = models.OneToOneField(AccessibilityProfile,on_delete=models.CASCADE,related_name="event",)
@@ -181,6 +230,242 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Partner feed identity (see importers.py); blank for events entered in the admin
+    source = models.CharField(max_length=100, blank=True)
+    external_id = models.CharField(max_length=255, blank=True)
+    source_hash = models.CharField(max_length=64, blank=True, editable=False)
+
+    # Repeat every recurrence_interval days / weeks / months from start_datetime
+    # (local time) up to and including recurrence_until; see occurrences.py
+    recurrence = models.CharField(max_length=10, choices=Recurrence.choices, blank=True, default=Recurrence.NONE)
+    recurrence_interval = models.PositiveSmallIntegerField(default=1)
+    recurrence_until = models.DateField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "external_id"],
+                condition=~Q(external_id=""),
+                name="uniq_event_source_external_id",
+            ),
+        ]
+        # Public reads only ever want published events, so these are partial
+        # indexes over them; drafts and cancelled events cost nothing to keep
+        indexes = [
+            # Published events in (start_datetime, id) order
+            models.Index(
+                fields=["start_datetime", "id"], condition=Q(status="PUBLISHED"), name="event_published_start_idx",
+            ),
+            models.Index(
+                fields=["category", "start_datetime", "id"], condition=Q(status="PUBLISHED"),
+                name="event_published_cat_start_idx",
+            ),
+            # Exports and rebuilds walk published events in id order
+            models.Index(fields=["id"], condition=Q(status="PUBLISHED"), name="event_published_id_idx"),
+        ]
+
+    def clean(self):
+        super().clean()
+        if self.recurrence_interval < 1:
+            raise ValidationError({"recurrence_interval": "Must be at least 1."})
+        if self.recurrence_until and self.start_datetime and self.recurrence_until < self.start_datetime.date():
+            raise ValidationError({"recurrence_until": "Must not be before the first occurrence."})
+
+    # Geocode from the postcode before saving; bulk paths call geo.geocode_event themselves
+    def save(self, *args, **kwargs):
+        geo.geocode_event(self)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"postcode", "location_text", "latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = set(update_fields) | {"latitude", "longitude", "geo_cell_x", "geo_cell_y"}
+        super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         return self.title
-    
\ No newline at end of file
+
+
+class SearchDocumentColumns(models.Model):
+    """
+    Columns shared by EventSearchDocument and UpcomingEvent: the event's
+    times, codes and display_order ranks of its lookup options, so
+    discovery filters and facets are single-table queries.
+    """
+    start_datetime = models.DateTimeField()
+    end_datetime = models.DateTimeField()
+    # End of the event's last occurrence (end_datetime unless it repeats);
+    # null while it repeats without end. Upcoming lists keep it until then.
+    live_until = models.DateTimeField(null=True)
+    category_code = models.CharField(max_length=50)
+
+    wheelchair_access = models.BooleanField()
+    accessible_toilets = models.BooleanField(null=True)
+    quiet_space_available = models.BooleanField(null=True)
+
+    noise_level_code = models.CharField(max_length=50)
+    noise_level_rank = models.PositiveIntegerField()
+    lighting_conditions_code = models.CharField(max_length=50)
+    lighting_conditions_rank = models.PositiveIntegerField()
+    crowd_level_code = models.CharField(max_length=50)
+    crowd_level_rank = models.PositiveIntegerField()
+    sensory_level_code = models.CharField(max_length=50)
+    sensory_level_rank = models.PositiveIntegerField()
+
+    age_min = models.IntegerField(null=True)
+    age_max = models.IntegerField(null=True)
+    price = models.DecimalField(max_digits=8, decimal_places=2, null=True)
+    postcode = models.CharField(max_length=20, blank=True)
+    latitude = models.FloatField(null=True)
+    longitude = models.FloatField(null=True)
+    geo_cell_x = models.IntegerField(null=True)
+    geo_cell_y = models.IntegerField(null=True)
+    # Rewritten on every upsert; drives list ETag / Last-Modified (conditional.py)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
+class EventSearchDocument(SearchDocumentColumns):
+    """
+    Flat, denormalised read model: one row per published event, past and
+    upcoming. Maintained by search_documents.py; never edit directly.
+    """
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, primary_key=True, related_name="search_document")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["start_datetime", "event"], name="searchdoc_start_idx"),
+            models.Index(fields=["category_code", "start_datetime", "event"], name="searchdoc_cat_start_idx"),
+            models.Index(
+                fields=["noise_level_rank", "crowd_level_rank", "sensory_level_rank"],
+                name="searchdoc_sensory_rank_idx",
+            ),
+            models.Index(
+                fields=["wheelchair_access", "quiet_space_available", "accessible_toilets"],
+                name="searchdoc_access_flags_idx",
+            ),
+            models.Index(fields=["price"], name="searchdoc_price_idx"),
+            # Proximity search reads the grid cells overlapping a radius
+            models.Index(fields=["geo_cell_y", "geo_cell_x"], name="searchdoc_geo_cell_idx"),
+            # Covers the catalogue stamp, Count(event) and Max(updated_at)
+            models.Index(fields=["updated_at", "event"], name="searchdoc_updated_event_idx"),
+            # Open-ended ?from= windows
+            models.Index(fields=["end_datetime"], name="searchdoc_end_idx"),
+            # Latest end before now, for the upcoming list's Last-Modified
+            models.Index(fields=["live_until"], name="searchdoc_live_until_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"EventSearchDocument #{self.pk}"
+
+
+class UpcomingEvent(SearchDocumentColumns):
+    """
+    The event list's working set: a copy of the search documents of
+    published events that had not ended (live_until) when last synced, so
+    the default list never reads the archive of past events. Rows follow
+    the documents (search_documents.py); ended rows are dropped by
+    `python manage.py refresh_upcoming_events`.
+    """
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, primary_key=True, related_name="upcoming")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["start_datetime", "event"], name="upcoming_start_idx"),
+            models.Index(fields=["category_code", "start_datetime", "event"], name="upcoming_cat_start_idx"),
+            # Covers the upcoming list stamp (conditional.py) and refresh deletes
+            models.Index(fields=["live_until", "updated_at", "event"], name="upcoming_live_stamp_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"UpcomingEvent #{self.pk}"
+
+
+class EventOccurrence(models.Model):
+    """
+    Materialised calendar: one row per occurrence of a published event,
+    from now to the rolling horizon for recurring events. Maintained by
+    occurrences.py; never edit directly.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="occurrences")
+    start_datetime = models.DateTimeField()
+    end_datetime = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["event", "start_datetime"], name="uniq_occurrence_event_start"),
+        ]
+        indexes = [
+            # Date-range queries are a range scan in start order
+            models.Index(fields=["start_datetime", "event"], name="occurrence_start_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.event_id} @ {self.start_datetime:%Y-%m-%d %H:%M}"
+
+
+class EventDay(models.Model):
+    """
+    Day-bucket index for time-window queries: one row per occurrence of a
+    published event per local day it spans, or a single row with day NULL
+    for occurrences longer than time_windows.LONG_EVENT_DAYS. Each row
+    carries its occurrence's start / end for the exact overlap test.
+    Maintained by time_windows.py; never edit directly.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="days")
+    day = models.DateField(null=True)
+    start_datetime = models.DateTimeField()
+    end_datetime = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["day", "event"], name="eventday_day_event_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.event_id} on {self.day or 'every day'}"
+
+
+class EventChange(models.Model):
+    """
+    Append-only log of event changes behind the /api/events/changes/ feed.
+    One row per event per change, written by changes.py from the
+    events_changed / events_deleted signals. event_id is a plain column
+    rather than a foreign key so deletions stay in the log.
+    """
+    class Kind(models.TextChoices):
+        CREATED = "CREATED"
+        UPDATED = "UPDATED"
+        CANCELLED = "CANCELLED"
+        DELETED = "DELETED"
+
+    # id doubles as the feed position (change token)
+    id = models.BigAutoField(primary_key=True)
+    event_id = models.IntegerField()
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    changed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["changed_at"], name="eventchange_changed_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"#{self.pk} {self.kind} event {self.event_id}"
+
+
+class CatalogueState(models.Model):
+    """
+    Catalogue-wide bookkeeping that no event row carries; a single row
+    with pk 1.
+    """
+    # Last time a published event left the catalogue (unpublished, ended
+    # early or deleted). Its document is gone, so list Last-Modified takes
+    # the max with this (conditional.py).
+    removed_at = models.DateTimeField(null=True)
+    # Highest change id removed by prune_event_changes; change tokens below
+    # it are stale even once the log is empty (changes.py)
+    changes_pruned_through = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return "Catalogue state"
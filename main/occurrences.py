@@ -0,0 +1,231 @@
+"""
+============================================================
+File Name: occurrences.py
+Brief Description:
+Expansion of recurring events into the EventOccurrence
+calendar table, so date-range queries ("what's on this
+weekend") are an indexed range scan instead of rule expansion
+at request time.
+
+Every published event has occurrences in the table:
+  * a one-off event has a single occurrence (its own dates);
+  * a recurring event repeats every recurrence_interval days,
+    weeks or months from its first start, up to and including
+    recurrence_until, and is materialised from now up to the
+    rolling horizon (settings.EVENT_OCCURRENCE_HORIZON_DAYS).
+Repeats keep the local wall-clock time of the first start
+(settings.TIME_ZONE), so a 7pm session stays at 7pm across
+daylight-saving changes. Monthly repeats skip months without
+the start day (e.g. the 31st).
+
+Occurrences of an event are rewritten from the events_changed
+signal (see signals.py). `python manage.py refresh_occurrences`
+(run daily) drops occurrences that have ended and extends each
+recurring event from its last materialised occurrence to the
+new horizon.
+
+last_end() gives the end of an event's final occurrence, which
+search_documents.py stores as live_until so the upcoming list
+keeps a recurring event until its last repeat is over.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Recurrence expansion + occurrence refresh   | user-015
+v1.1    | 2026-10-17 | last_end() of an event's final occurrence   | user-024
+============================================================
+"""
+
+import calendar
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import Event, EventOccurrence
+
+CHUNK_SIZE = 500
+
+# Days / weeks are a fixed number of local days apart
+DAY_STEPS = {Event.Recurrence.DAILY: 1, Event.Recurrence.WEEKLY: 7}
+
+
+def horizon(now=None):
+    return (now or timezone.now()) + timedelta(days=getattr(settings, "EVENT_OCCURRENCE_HORIZON_DAYS", 180))
+
+
+def _add_months(moment, months):
+    month_index = moment.month - 1 + months
+    year, month = moment.year + month_index // 12, month_index % 12 + 1
+    if moment.day > calendar.monthrange(year, month)[1]:
+        return None
+    return moment.replace(year=year, month=month)
+
+
+# Local (naive) starts of the nth repeats, n = first, first + 1, ...
+# without end; callers stop at their window
+def _local_starts(event, local_start, first):
+    n = first
+    while True:
+        if event.recurrence == Event.Recurrence.MONTHLY:
+            moment = _add_months(local_start, n * event.recurrence_interval)
+            if moment is not None:
+                yield moment
+        else:
+            yield local_start + timedelta(days=n * DAY_STEPS[event.recurrence] * event.recurrence_interval)
+        n += 1
+
+
+# (start, end) of event's occurrences that end after window_start; repeats
+# stop at window_end, a one-off event is returned wherever it falls. Works on
+# any object with the Event date and recurrence attributes.
+def expand(event, window_start, window_end):
+    duration = event.end_datetime - event.start_datetime
+    if not event.recurrence:
+        if event.end_datetime > window_start:
+            yield event.start_datetime, event.end_datetime
+        return
+
+    zone = timezone.get_default_timezone()
+    local_start = timezone.make_naive(event.start_datetime, zone)
+
+    # Skip repeats that end before the window without generating them
+    first = 0
+    if event.recurrence in DAY_STEPS and window_start > event.end_datetime:
+        step = timedelta(days=DAY_STEPS[event.recurrence] * event.recurrence_interval)
+        first = max(0, (window_start - event.end_datetime) // step - 1)
+
+    for moment in _local_starts(event, local_start, first):
+        if event.recurrence_until and moment.date() > event.recurrence_until:
+            return
+        start = timezone.make_aware(moment, zone)
+        if start >= window_end:
+            return
+        if start + duration > window_start:
+            yield start, start + duration
+
+
+# End of event's final occurrence: end_datetime for a one-off event, None
+# while it repeats without end
+def last_end(event):
+    if not event.recurrence:
+        return event.end_datetime
+    if not event.recurrence_until:
+        return None
+    zone = timezone.get_default_timezone()
+    window_end = timezone.make_aware(datetime.combine(event.recurrence_until + timedelta(days=1), time.min), zone)
+    # Daily / weekly repeats before the last step cannot be the final one
+    window_start = event.start_datetime
+    if event.recurrence in DAY_STEPS:
+        step = timedelta(days=DAY_STEPS[event.recurrence] * event.recurrence_interval)
+        window_start = max(window_start, window_end - step - timedelta(days=1))
+    ends = [end for _, end in expand(event, window_start, window_end)]
+    return ends[-1] if ends else event.end_datetime
+
+
+# (event_id, start, end) rows for events' occurrences in the window
+def _occurrences(events, window_start, window_end):
+    return [
+        (event.pk, start, end)
+        for event in events
+        for start, end in expand(event, window_start, window_end)
+    ]
+
+
+# Insert (event_id, start, end) rows with one executemany, as bulk imports
+# write an occurrence for every event
+def _insert(rows):
+    if not rows:
+        return 0
+    quote = connection.ops.quote_name
+    # Values are always aware datetimes, so skip the field's prep checks
+    adapt = connection.ops.adapt_datetimefield_value
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {quote(EventOccurrence._meta.db_table)} "
+            f"({quote('event_id')}, {quote('start_datetime')}, {quote('end_datetime')}) VALUES (%s, %s, %s)",
+            [
+                (pk, adapt(start), adapt(end))
+                for pk, start, end in rows
+            ],
+        )
+    return len(rows)
+
+
+# Rewrite the occurrences of event_ids. events, when given, are the saved
+# instances and are not re-read; created events have nothing to delete.
+def sync_events(event_ids, events=None, created=False):
+    event_ids = list(event_ids)
+    now = timezone.now()
+    until = horizon(now)
+    for start in range(0, len(event_ids), CHUNK_SIZE):
+        chunk = event_ids[start:start + CHUNK_SIZE]
+        if events is None:
+            published = Event.objects.filter(pk__in=chunk, status=Event.Status.PUBLISHED)
+        else:
+            published = [event for event in events[start:start + CHUNK_SIZE] if event.status == Event.Status.PUBLISHED]
+        if not created:
+            EventOccurrence.objects.filter(event_id__in=chunk).delete()
+        _insert(_occurrences(published, now, until))
+
+
+# Drop ended occurrences and extend recurring events to the horizon.
+# Returns (removed, added).
+def refresh(now=None):
+    now = now or timezone.now()
+    until = horizon(now)
+    added = 0
+    with transaction.atomic():
+        removed = EventOccurrence.objects.filter(end_datetime__lte=now).delete()[0]
+
+        recurring = Event.objects.filter(status=Event.Status.PUBLISHED).exclude(recurrence=Event.Recurrence.NONE)
+        last = dict(
+            EventOccurrence.objects.filter(event__in=recurring)
+            .values_list("event").annotate(last=Max("start_datetime"))
+        )
+        batch = []
+        for event in recurring.order_by("pk").iterator(chunk_size=CHUNK_SIZE):
+            after = last.get(event.pk)
+            batch.extend(
+                (event.pk, start, end)
+                for start, end in expand(event, now, until)
+                if after is None or start > after
+            )
+            if len(batch) >= CHUNK_SIZE:
+                added += _insert(batch)
+                batch = []
+        added += _insert(batch)
+    return removed, added
+
+
+# Rebuild the whole table from the published events
+def rebuild(batch_size=2000) -> int:
+    now = timezone.now()
+    until = horizon(now)
+    total = 0
+    with transaction.atomic():
+        EventOccurrence.objects.all().delete()
+        published = Event.objects.filter(status=Event.Status.PUBLISHED).order_by("pk")
+        batch = []
+        for event in published.iterator(chunk_size=batch_size):
+            batch.append(event)
+            if len(batch) >= batch_size:
+                total += _insert(_occurrences(batch, now, until))
+                batch = []
+        total += _insert(_occurrences(batch, now, until))
+    return total
+
+
+# Occurrences of published events starting in [start, end), in start order
+def between(start, end):
+    return (
+        EventOccurrence.objects.filter(start_datetime__gte=start, start_datetime__lt=end)
+        .order_by("start_datetime", "event_id")
+    )
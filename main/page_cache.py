@@ -0,0 +1,143 @@
+"""
+============================================================
+File Name: page_cache.py
+Brief Description:
+Rendered response cache for the public event list and detail
+pages (anonymous GET requests only).
+
+Cache keys carry the versions of everything a page shows, so
+edits invalidate exactly the pages they affect without any
+explicit purge:
+  * detail: the event's and its AccessibilityProfile's
+    updated_at, read from the row the view loads anyway;
+  * list: the published catalogue stamp (count + latest
+    EventSearchDocument.updated_at, see conditional.py);
+  * both: the reference-data version, which moves whenever a
+    LookupOption or SensoryCategory changes (lookup_cache.py),
+    plus the full path and query string.
+Superseded entries are never read again and age out after
+settings.EVENT_PAGE_CACHE_TIMEOUT.
+
+Pages are stored in the settings.EVENT_PAGE_CACHE alias
+(local-memory by default, file-based when configured). Pages
+shared between processes need the reference-data version shared
+too, or an edit in one process would leave pages cached by the
+others in use; check_shared_version() (run at startup) raises
+ImproperlyConfigured for that combination. Hit / miss counters
+are kept per process and per page kind.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Versioned page cache + hit / miss counters  | user-010
+v1.1    | 2026-10-17 | Render time for request metrics             | user-019
+v1.2    | 2026-10-17 | Require a shared version for shared pages   | user-010
+============================================================
+"""
+
+import hashlib
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+
+from .lookup_cache import current_version
+from .metrics import timer
+
+CACHE_HEADER = "X-Cache"
+LOCAL_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+
+
+class PageCacheStats:
+    """Process-local hit / miss counters per page kind."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = Counter()
+
+    def record(self, kind, hit):
+        with self._lock:
+            self._counts[(kind, "hits" if hit else "misses")] += 1
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+    # {"list": {"hits", "misses", "hit_rate"}, "detail": {...}, "total": {...}}
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self._counts)
+        totals = Counter()
+        for (_, outcome), value in counts.items():
+            totals[("total", outcome)] += value
+        counts.update(totals)
+
+        result = {}
+        for kind in sorted({kind for kind, _ in counts}):
+            hits, misses = counts.get((kind, "hits"), 0), counts.get((kind, "misses"), 0)
+            result[kind] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+            }
+        return result
+
+
+stats = PageCacheStats()
+
+
+def page_cache():
+    return caches[getattr(settings, "EVENT_PAGE_CACHE", "default")]
+
+
+# Page keys include the reference-data version, so a page cache shared by
+# processes needs that version in a shared cache as well
+def check_shared_version():
+    backends = {alias: config.get("BACKEND") for alias, config in settings.CACHES.items()}
+    pages = backends.get(getattr(settings, "EVENT_PAGE_CACHE", "default"))
+    reference = backends.get(getattr(settings, "REFERENCE_DATA_CACHE", "default"))
+    if pages != LOCAL_BACKEND and reference == LOCAL_BACKEND:
+        raise ImproperlyConfigured(
+            "The page cache is shared between processes but the reference-data version is not; "
+            "set REFERENCE_DATA_CACHE_BACKEND=file (or another shared backend) with EVENT_PAGE_CACHE_BACKEND=file."
+        )
+
+
+# Only anonymous GETs are cached
+def is_cacheable(request):
+    return request.method == "GET" and not request.user.is_authenticated
+
+
+def page_key(kind, request, *versions):
+    key = "|".join(str(part) for part in (*versions, current_version(), request.get_full_path()))
+    return f"page:{kind}:{hashlib.sha1(key.encode()).hexdigest()}"
+
+
+# Serve key from the page cache, or call render() and store a 200 result
+def serve_cached(kind, key, render):
+    cache = page_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        stats.record(kind, hit=True)
+        content, content_type = cached
+        response = HttpResponse(content, content_type=content_type)
+        response[CACHE_HEADER] = "HIT"
+        return response
+
+    stats.record(kind, hit=False)
+    response = render()
+    if hasattr(response, "render"):
+        with timer("render"):
+            response.render()
+    if response.status_code == 200:
+        cache.set(key, (response.content, response["Content-Type"]), settings.EVENT_PAGE_CACHE_TIMEOUT)
+    response[CACHE_HEADER] = "MISS"
+    return response
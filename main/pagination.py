@@ -0,0 +1,230 @@
+"""
+============================================================
+File Name: pagination.py
+Brief Description:
+Keyset (cursor) pagination for published events ordered on
+(start_datetime, id). Each page is a bounded index range scan
+from the cursor position, so the cost of a page does not grow
+with its depth and pages stay stable while events are added.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.6
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Keyset paginator + DRF pagination class     | user-002
+v1.1    | 2026-10-17 | Paginate values() rows as well as models    | user-004
+v1.2    | 2026-10-17 | Order on pk so any (start_datetime, pk) model pages | user-006
+v1.3    | 2026-10-17 | Page in-memory snapshot selections          | user-018
+v1.4    | 2026-10-17 | Async keyset pages (aiterator)              | user-021
+v1.5    | 2026-10-17 | Out-of-range cursor ids are invalid         | user-002
+v1.6    | 2026-10-17 | Shared, bounded offset parsing              | user-007
+============================================================
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+CURSOR_QUERY_PARAM = "cursor"
+PAGE_SIZE_QUERY_PARAM = "page_size"
+# Largest id a 64-bit integer column can hold
+MAX_PK = 2 ** 63 - 1
+# Offset pages stop well short of MAX_PK so offset + limit stays in range
+MAX_OFFSET = 2 ** 31 - 1
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def get_page_size(requested=None) -> int:
+    default = getattr(settings, "EVENT_PAGE_SIZE", 20)
+    maximum = getattr(settings, "EVENT_MAX_PAGE_SIZE", 100)
+    try:
+        size = int(requested) if requested else default
+    except (TypeError, ValueError):
+        size = default
+    return max(1, min(size, maximum))
+
+
+# ?offset= for the offset-paged search, match and occurrence lists
+def get_offset(requested=None) -> int:
+    try:
+        offset = max(0, int(requested or 0))
+    except ValueError:
+        raise ValidationError({"offset": "Expected a whole number."})
+    if offset > MAX_OFFSET:
+        raise ValidationError({"offset": f"Must be at most {MAX_OFFSET}."})
+    return offset
+
+
+# Cursors are an opaque encoding of direction + (start_datetime, id)
+def encode_cursor(position, reverse=False) -> str:
+    start, pk = position
+    raw = f"{'p' if reverse else 'n'}|{start.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        direction, start, pk = raw.split("|")
+        if direction not in ("n", "p"):
+            raise ValueError(direction)
+        pk = int(pk)
+        if not 0 < pk <= MAX_PK:
+            raise ValueError(pk)
+        return (datetime.fromisoformat(start), pk), direction == "p"
+    except (ValueError, UnicodeDecodeError, binascii.Error) as exc:
+        raise InvalidCursor(cursor) from exc
+
+
+@dataclass
+class KeysetPage:
+    items: list
+    next_cursor: str = None
+    previous_cursor: str = None
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+# Cursor position of a model instance or values() row
+def _position(item):
+    if isinstance(item, dict):
+        return (item["start_datetime"], item["id"])
+    return (item.start_datetime, item.pk)
+
+
+# Queryset of the limit rows after (or before, when reversed) position.
+# The >= bound keeps the scan on the (start_datetime, id) index; the OR only
+# resolves ties on start_datetime.
+def _keyset_queryset(queryset, position, reverse, limit):
+    if position is not None:
+        start, pk = position
+        if reverse:
+            queryset = queryset.filter(start_datetime__lte=start).filter(
+                Q(start_datetime__lt=start) | Q(pk__lt=pk)
+            )
+        else:
+            queryset = queryset.filter(start_datetime__gte=start).filter(
+                Q(start_datetime__gt=start) | Q(pk__gt=pk)
+            )
+
+    ordering = ("-start_datetime", "-pk") if reverse else ("start_datetime", "pk")
+    return queryset.order_by(*ordering)[:limit]
+
+
+# Build the page from up to page_size + 1 rows read in cursor order
+def _keyset_page(rows, position, reverse, page_size) -> KeysetPage:
+    has_more = len(rows) > page_size
+    items = rows[:page_size]
+
+    if reverse:
+        items.reverse()
+        has_next, has_previous = True, has_more
+    else:
+        has_next, has_previous = has_more, position is not None
+
+    if not items:
+        return KeysetPage(items=[])
+
+    return KeysetPage(
+        items=items,
+        next_cursor=encode_cursor(_position(items[-1])) if has_next else None,
+        previous_cursor=encode_cursor(_position(items[0]), reverse=True) if has_previous else None,
+    )
+
+
+# Return one page of queryset after (or before, when reversed) the cursor
+def paginate_keyset(queryset, cursor=None, page_size=None) -> KeysetPage:
+    page_size = get_page_size(page_size)
+    position, reverse = decode_cursor(cursor) if cursor else (None, False)
+
+    # In-memory selections (snapshot.py) slice themselves
+    if hasattr(queryset, "keyset_slice"):
+        rows = queryset.keyset_slice(position, reverse, page_size + 1)
+    else:
+        rows = list(_keyset_queryset(queryset, position, reverse, page_size + 1))
+    return _keyset_page(rows, position, reverse, page_size)
+
+
+# paginate_keyset() for async views: rows are read with aiterator()
+async def apaginate_keyset(queryset, cursor=None, page_size=None) -> KeysetPage:
+    page_size = get_page_size(page_size)
+    position, reverse = decode_cursor(cursor) if cursor else (None, False)
+
+    if hasattr(queryset, "keyset_slice"):
+        rows = queryset.keyset_slice(position, reverse, page_size + 1)
+    else:
+        rows = [row async for row in _keyset_queryset(queryset, position, reverse, page_size + 1).aiterator()]
+    return _keyset_page(rows, position, reverse, page_size)
+
+
+# DRF pagination class for the events API
+class EventCursorPagination(BasePagination):
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        try:
+            self.page = paginate_keyset(
+                queryset,
+                cursor=request.query_params.get(CURSOR_QUERY_PARAM),
+                page_size=request.query_params.get(PAGE_SIZE_QUERY_PARAM),
+            )
+        except InvalidCursor:
+            raise NotFound("Invalid cursor")
+        return self.page.items
+
+    def get_link(self, cursor):
+        return cursor_link(self.request, cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_link(self.page.next_cursor),
+            "previous": self.get_link(self.page.previous_cursor),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+# Absolute link to another page for the API (keeps other query params)
+def cursor_link(request, cursor):
+    if cursor is None:
+        return None
+    return replace_query_param(request.build_absolute_uri(), CURSOR_QUERY_PARAM, cursor)
+
+
+# Link to another page for the HTML views (keeps other query params)
+def page_url(request, cursor):
+    if cursor is None:
+        return None
+    return replace_query_param(request.get_full_path(), CURSOR_QUERY_PARAM, cursor)
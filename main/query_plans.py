@@ -0,0 +1,75 @@
+"""
+============================================================
+File Name: query_plans.py
+Brief Description:
+Derives eager-loading plans (select_related / prefetch_related)
+from nested serializer declarations so list and detail views
+fetch a page of events in a constant number of queries.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Query plan derived from serializer tree     | user-001
+============================================================
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from rest_framework import serializers
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    select_related: tuple
+    prefetch_related: tuple
+
+    # Apply the plan to a queryset
+    def apply(self, queryset):
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        return queryset
+
+
+# Walk nested serializers and collect the relation paths they read.
+# Forward FK / OneToOne relations are joined; reverse and many-to-many
+# relations (and anything beneath them) are prefetched.
+def _collect_paths(serializer, model, prefix, select, prefetch, prefetching):
+    for field in serializer.fields.values():
+        if isinstance(field, serializers.ListSerializer):
+            child, many = field.child, True
+        elif isinstance(field, serializers.BaseSerializer):
+            child, many = field, False
+        else:
+            continue
+
+        # Only plain attribute sources map onto a model relation
+        if field.source == "*" or "." in field.source:
+            continue
+
+        model_field = model._meta.get_field(field.source)
+        path = f"{prefix}{field.source}"
+        nested_prefetch = prefetching or many or not (model_field.many_to_one or model_field.one_to_one)
+
+        (prefetch if nested_prefetch else select).append(path)
+        _collect_paths(child, model_field.related_model, f"{path}__", select, prefetch, nested_prefetch)
+
+
+@lru_cache(maxsize=None)
+def build_query_plan(serializer_class) -> QueryPlan:
+    select, prefetch = [], []
+    serializer = serializer_class()
+    _collect_paths(serializer, serializer_class.Meta.model, "", select, prefetch, False)
+    return QueryPlan(select_related=tuple(select), prefetch_related=tuple(prefetch))
+
+
+# Return queryset eager-loading everything serializer_class will read
+def with_query_plan(queryset, serializer_class):
+    return build_query_plan(serializer_class).apply(queryset)
@@ -0,0 +1,276 @@
+"""
+============================================================
+File Name: search.py
+Brief Description:
+Ranked full-text search over event title, description,
+location, postcode and accessibility notes.
+
+Two backends share one interface, chosen from the database
+vendor:
+  * SQLite: an FTS5 virtual table (main_event_fts) ranked
+    with bm25().
+  * PostgreSQL: a tsvector table (main_event_search_vector)
+    with a GIN index, ranked with ts_rank_cd().
+
+Both tables are created by migration 0007 and kept in step
+with events from the events_changed / events_deleted signals
+(see signals.py). Every event is indexed whatever its status so
+the admin can search drafts; public search only returns
+published events that have not ended (live_at, as on the event
+list: search documents' live_until).
+
+On any other database there is no index: maintenance is a
+no-op, searching raises SearchUnavailable (HTTP 501) and the
+admin falls back to its default search.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.4
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | FTS5 / tsvector event search                | user-007
+v1.1    | 2026-10-17 | Index in-memory events from bulk senders    | user-011
+v1.2    | 2026-10-17 | Search on the routed read database          | user-022
+v1.3    | 2026-10-17 | No-op index / 501 on other databases        | user-007
+v1.4    | 2026-10-17 | Public search skips ended events            | user-024
+============================================================
+"""
+
+import re
+
+from django.db import connection, connections, router, transaction
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from .models import Event, EventSearchDocument
+
+# Indexed text, in index column order
+INDEXED_FIELDS = (
+    "title",
+    "description",
+    "location_text",
+    "postcode",
+    "accessibility_profile__additional_notes",
+)
+CHUNK_SIZE = 500
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+# (join, where, params) limiting a search to events not ended at live_at (an
+# adapted datetime), read from the search documents as search_documents.live_q
+def _live_clauses(live_at):
+    if live_at is None:
+        return "", "", []
+    table = EventSearchDocument._meta.db_table
+    return (
+        f"JOIN {table} d ON d.event_id = e.id",
+        "AND (d.live_until > %s OR d.live_until IS NULL)",
+        [live_at],
+    )
+
+
+class SQLiteFTSBackend:
+    table = "main_event_fts"
+
+    # bm25 column weights: title, description, location, postcode, notes
+    weights = (10.0, 1.0, 2.0, 2.0, 3.0)
+
+    # Quote every word so user input can never be read as FTS5 syntax;
+    # the last word is a prefix match to support search-as-you-type
+    @staticmethod
+    def build_query(text):
+        tokens = _TOKEN.findall(text)
+        if not tokens:
+            return None
+        quoted = [f'"{token}"' for token in tokens]
+        quoted[-1] += "*"
+        return " ".join(quoted)
+
+    def delete(self, cursor, event_ids):
+        placeholders = ", ".join(["%s"] * len(event_ids))
+        cursor.execute(f"DELETE FROM {self.table} WHERE rowid IN ({placeholders})", list(event_ids))
+
+    # Rows must not already be indexed (callers delete first)
+    def index(self, cursor, rows):
+        cursor.executemany(
+            f"INSERT INTO {self.table} (rowid, title, description, location_text, postcode, additional_notes) "
+            "VALUES (%s, %s, %s, %s, %s, %s)",
+            rows,
+        )
+
+    def clear(self, cursor):
+        cursor.execute(f"DELETE FROM {self.table}")
+
+    def search(self, cursor, text, limit, offset, published_only, live_at):
+        query = self.build_query(text)
+        if query is None:
+            return []
+        weights = ", ".join(str(w) for w in self.weights)
+        status = "AND e.status = %s" if published_only else ""
+        join, live, live_params = _live_clauses(live_at)
+        params = [query] + ([Event.Status.PUBLISHED] if published_only else []) + live_params + [limit, offset]
+        cursor.execute(
+            f"SELECT f.rowid, -bm25({self.table}, {weights}) AS score "
+            f"FROM {self.table} f JOIN main_event e ON e.id = f.rowid {join} "
+            f"WHERE {self.table} MATCH %s {status} {live} "
+            "ORDER BY score DESC, f.rowid LIMIT %s OFFSET %s",
+            params,
+        )
+        return cursor.fetchall()
+
+
+class PostgresSearchBackend:
+    table = "main_event_search_vector"
+    config = "english"
+
+    # Title weighted highest, then notes / location, then description
+    document_sql = (
+        "setweight(to_tsvector(%(config)s, %%s), 'A') || "
+        "setweight(to_tsvector(%(config)s, %%s), 'C') || "
+        "setweight(to_tsvector(%(config)s, %%s), 'B') || "
+        "setweight(to_tsvector(%(config)s, %%s), 'B') || "
+        "setweight(to_tsvector(%(config)s, %%s), 'B')"
+    )
+
+    def delete(self, cursor, event_ids):
+        cursor.execute(f"DELETE FROM {self.table} WHERE event_id = ANY(%s)", [list(event_ids)])
+
+    def index(self, cursor, rows):
+        document = self.document_sql % {"config": f"'{self.config}'"}
+        cursor.executemany(
+            f"INSERT INTO {self.table} (event_id, document) VALUES (%s, {document}) "
+            "ON CONFLICT (event_id) DO UPDATE SET document = EXCLUDED.document",
+            rows,
+        )
+
+    def clear(self, cursor):
+        cursor.execute(f"TRUNCATE {self.table}")
+
+    def search(self, cursor, text, limit, offset, published_only, live_at):
+        if not _TOKEN.search(text):
+            return []
+        status = "AND e.status = %s" if published_only else ""
+        join, live, live_params = _live_clauses(live_at)
+        params = (
+            [self.config, text] + ([Event.Status.PUBLISHED] if published_only else []) + live_params + [limit, offset]
+        )
+        cursor.execute(
+            f"SELECT v.event_id, ts_rank_cd(v.document, q) AS score "
+            f"FROM {self.table} v JOIN main_event e ON e.id = v.event_id {join}, "
+            "websearch_to_tsquery(%s, %s) q "
+            f"WHERE v.document @@ q {status} {live} "
+            "ORDER BY score DESC, v.event_id LIMIT %s OFFSET %s",
+            params,
+        )
+        return cursor.fetchall()
+
+
+BACKENDS = {
+    "sqlite": SQLiteFTSBackend,
+    "postgresql": PostgresSearchBackend,
+}
+
+
+class SearchUnavailable(APIException):
+    status_code = status.HTTP_501_NOT_IMPLEMENTED
+    default_detail = "Full-text search is not available on this database."
+    default_code = "search_unavailable"
+
+
+# True when the database has a full-text backend (and so an index to maintain)
+def available():
+    return connection.vendor in BACKENDS
+
+
+def get_backend():
+    backend = BACKENDS.get(connection.vendor)
+    if backend is None:
+        raise SearchUnavailable(f"Full-text search is not available on {connection.vendor}.")
+    return backend()
+
+
+def _chunks(ids, size=CHUNK_SIZE):
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def _rows(event_ids):
+    return [
+        tuple("" if value is None else value for value in row)
+        for row in Event.objects.filter(pk__in=event_ids).values_list("pk", *INDEXED_FIELDS)
+    ]
+
+
+# Index rows from saved Event instances with accessibility_profile set
+def _instance_rows(events):
+    return [
+        (
+            event.pk, event.title, event.description or "", event.location_text,
+            event.postcode or "", event.accessibility_profile.additional_notes or "",
+        )
+        for event in events
+    ]
+
+
+# (Re)index the given events, dropping any that no longer exist. events,
+# when given, are the saved instances for event_ids and are not re-read.
+def index_events(event_ids, events=None):
+    if not available():
+        return
+    backend = get_backend()
+    event_ids = list(event_ids)
+    with connection.cursor() as cursor:
+        for start in range(0, len(event_ids), CHUNK_SIZE):
+            chunk = event_ids[start:start + CHUNK_SIZE]
+            backend.delete(cursor, chunk)
+            if events is None:
+                rows = _rows(chunk)
+            else:
+                rows = _instance_rows(events[start:start + CHUNK_SIZE])
+            if rows:
+                backend.index(cursor, rows)
+
+
+def remove_events(event_ids):
+    if not available():
+        return
+    backend = get_backend()
+    with connection.cursor() as cursor:
+        for chunk in _chunks(event_ids):
+            backend.delete(cursor, chunk)
+
+
+# Rebuild the whole index from the events table
+def rebuild(batch_size=2000) -> int:
+    backend = get_backend()
+    total = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        backend.clear(cursor)
+        ids = Event.objects.order_by("pk").values_list("pk", flat=True)
+        batch = []
+        for pk in ids.iterator(chunk_size=batch_size):
+            batch.append(pk)
+            if len(batch) >= batch_size:
+                backend.index(cursor, _rows(batch))
+                total += len(batch)
+                batch = []
+        if batch:
+            backend.index(cursor, _rows(batch))
+            total += len(batch)
+    return total
+
+
+# Ranked [(event_id, score)] for text, best match first; read from the
+# database the router picks for Event reads (db_routers.py). With live_at,
+# only events that have not ended by then are returned.
+def search_events(text, limit=20, offset=0, published_only=True, live_at=None):
+    database = connections[router.db_for_read(Event)]
+    if live_at is not None:
+        live_at = database.ops.adapt_datetimefield_value(live_at)
+    with database.cursor() as cursor:
+        return get_backend().search(cursor, text, limit, offset, published_only, live_at)
@@ -0,0 +1,232 @@
+"""
+============================================================
+File Name: search_documents.py
+Brief Description:
+Builds and maintains EventSearchDocument rows, the flat read
+model behind discovery filters and facets. Rows are upserted
+or removed incrementally from the events_changed signal (see
+signals.py) and can be rebuilt in bulk with
+`python manage.py rebuild_search_documents`.
+
+Removing a document (an event unpublished, deleted or ended by
+an edit) records CatalogueState.removed_at, since the list's
+Last-Modified cannot see a row that is gone.
+
+The documents of events that have not ended are copied into
+UpcomingEvent, the event list's working set, in the same
+writes. An event ends with its last occurrence (live_until, see
+occurrences.last_end()), so a recurring event stays listed until
+its final repeat is over, or for good when it has no end date.
+Events end by the clock rather than by a change, so
+refresh_upcoming() (`python manage.py refresh_upcoming_events`,
+run on a schedule) drops the ended rows.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.5
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Incremental + bulk search document builds   | user-006
+v1.1    | 2026-10-17 | Copy coordinates / grid cells               | user-008
+v1.2    | 2026-10-17 | Chunked sync + raw executemany upserts      | user-011
+v1.3    | 2026-10-17 | UpcomingEvent working set + refresh         | user-024
+v1.4    | 2026-10-17 | Record removals for list Last-Modified      | user-009
+v1.5    | 2026-10-17 | Recurring events live until their last end  | user-024
+============================================================
+"""
+
+from django.db import connection, models, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .lookup_cache import get_reference_data
+from .models import CatalogueState, Event, AccessibilityProfile, EventSearchDocument, UpcomingEvent
+from .occurrences import last_end
+
+SENSORY_FIELDS = tuple(AccessibilityProfile.SENSORY_CATEGORY_CODES)
+CHUNK_SIZE = 500
+
+# Vendors with INSERT ... ON CONFLICT; others fall back to bulk_create
+UPSERT_VENDORS = ("sqlite", "postgresql")
+# Fields whose values need the backend's adaptation before binding
+ADAPTED_FIELD_TYPES = (models.DateTimeField, models.DecimalField)
+
+
+# Document field values (by attname) for a published event with its profile loaded
+def document_values(event, reference) -> dict:
+    profile = event.accessibility_profile
+    values = {
+        "event_id": event.pk,
+        "start_datetime": event.start_datetime,
+        "end_datetime": event.end_datetime,
+        "live_until": last_end(event),
+        "category_code": reference.get(event.category_id).code,
+        "wheelchair_access": profile.wheelchair_access,
+        "accessible_toilets": profile.accessible_toilets,
+        "quiet_space_available": profile.quiet_space_available,
+        "age_min": event.age_min,
+        "age_max": event.age_max,
+        "price": event.price,
+        "postcode": event.postcode,
+        "latitude": event.latitude,
+        "longitude": event.longitude,
+        "geo_cell_x": event.geo_cell_x,
+        "geo_cell_y": event.geo_cell_y,
+    }
+    for field in SENSORY_FIELDS:
+        option = reference.get(getattr(profile, f"{field}_id"))
+        values[f"{field}_code"] = option.code
+        values[f"{field}_rank"] = option.display_order
+    return values
+
+
+# Documents (or upcoming rows) of events not ended at now
+def live_q(now) -> Q:
+    return Q(live_until__gt=now) | Q(live_until__isnull=True)
+
+
+def _is_live(values, now):
+    return values["live_until"] is None or values["live_until"] > now
+
+
+# Build (unsaved) document for a published event with its profile loaded
+def build_document(event, reference=None) -> EventSearchDocument:
+    return EventSearchDocument(**document_values(event, reference or get_reference_data()))
+
+
+def _upsert_sql(model):
+    quote = connection.ops.quote_name
+    fields = model._meta.concrete_fields
+    columns = ", ".join(quote(field.column) for field in fields)
+    updates = ", ".join(
+        f"{quote(field.column)} = EXCLUDED.{quote(field.column)}" for field in fields if not field.primary_key
+    )
+    return (
+        f"INSERT INTO {quote(model._meta.db_table)} ({columns}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))}) "
+        f"ON CONFLICT ({quote(model._meta.pk.column)}) DO UPDATE SET {updates}"
+    )
+
+
+# Insert or replace model rows (EventSearchDocument or UpcomingEvent) from
+# document_values() dicts. A single executemany avoids the per-value overhead
+# of bulk_create(update_conflicts=True), which dominated bulk imports. Rows
+# are stamped with updated_at now, so a document and its upcoming copy match.
+def _upsert(rows, model=EventSearchDocument, now=None):
+    if not rows:
+        return
+    if connection.vendor not in UPSERT_VENDORS:
+        model.objects.bulk_create(
+            [model(**values) for values in rows],
+            update_conflicts=True, unique_fields=["event"],
+            update_fields=[field.name for field in model._meta.concrete_fields if not field.primary_key],
+        )
+        return
+
+    now = now or timezone.now()
+    fields = [
+        (field.attname, field if isinstance(field, ADAPTED_FIELD_TYPES) else None)
+        for field in model._meta.concrete_fields
+    ]
+    params = []
+    for values in rows:
+        values["updated_at"] = now
+        params.append([
+            adapt.get_db_prep_save(values[attname], connection) if adapt else values[attname]
+            for attname, adapt in fields
+        ])
+    with connection.cursor() as cursor:
+        cursor.executemany(_upsert_sql(model), params)
+
+
+# Bring the documents for event_ids in line with the events table. events,
+# when given, are the saved instances (profiles loaded) and are not re-read.
+def sync_events(event_ids, events=None):
+    event_ids = list(event_ids)
+    if not event_ids:
+        return
+
+    reference = get_reference_data()
+    now = timezone.now()
+    for start in range(0, len(event_ids), CHUNK_SIZE):
+        chunk = event_ids[start:start + CHUNK_SIZE]
+        if events is None:
+            published = list(
+                Event.objects.filter(pk__in=chunk, status=Event.Status.PUBLISHED)
+                .select_related("accessibility_profile")
+            )
+        else:
+            published = [event for event in events[start:start + CHUNK_SIZE] if event.status == Event.Status.PUBLISHED]
+        rows = [document_values(event, reference) for event in published]
+        _upsert(rows, now=now)
+        upcoming = [values for values in rows if _is_live(values, now)]
+        _upsert(upcoming, UpcomingEvent, now=now)
+
+        removed = 0
+        stale = set(chunk) - {event.pk for event in published}
+        if stale:
+            removed += EventSearchDocument.objects.filter(pk__in=stale).delete()[0]
+        ended = set(chunk) - {values["event_id"] for values in upcoming}
+        if ended:
+            removed += UpcomingEvent.objects.filter(pk__in=ended).delete()[0]
+        if removed:
+            record_removal(now)
+
+
+# Note that published events left the list at now (see CatalogueState)
+def record_removal(now=None):
+    CatalogueState.objects.update_or_create(pk=1, defaults={"removed_at": now or timezone.now()})
+
+
+# Rebuild every document from scratch, batch_size events at a time
+def rebuild(batch_size=2000) -> int:
+    reference = get_reference_data()
+    queryset = (
+        Event.objects.filter(status=Event.Status.PUBLISHED)
+        .select_related("accessibility_profile")
+        .order_by("pk")
+    )
+    total = 0
+    with transaction.atomic():
+        EventSearchDocument.objects.all().delete()
+        batch = []
+        for event in queryset.iterator(chunk_size=batch_size):
+            batch.append(document_values(event, reference))
+            if len(batch) >= batch_size:
+                _upsert(batch)
+                total += len(batch)
+                batch = []
+        _upsert(batch)
+        total += len(batch)
+        UpcomingEvent.objects.all().delete()
+        refresh_upcoming()
+    return total
+
+
+# Drop upcoming rows whose events have ended and copy in the documents of
+# live events the table lacks (e.g. after rebuild); returns (added, archived).
+# Ended events stay in EventSearchDocument, which serves date-range queries.
+def refresh_upcoming(now=None) -> tuple:
+    now = now or timezone.now()
+    with transaction.atomic():
+        archived, _ = UpcomingEvent.objects.filter(live_until__lte=now).delete()
+        missing = (
+            EventSearchDocument.objects.filter(live_q(now))
+            .exclude(pk__in=UpcomingEvent.objects.values("pk"))
+            .order_by()
+        )
+        fields = EventSearchDocument._meta.concrete_fields
+        select, params = missing.values_list(*(field.attname for field in fields)).query.sql_with_params()
+        quote = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            # INSERT ... SELECT copies updated_at unchanged
+            cursor.execute(
+                f"INSERT INTO {quote(UpcomingEvent._meta.db_table)} "
+                f"({', '.join(quote(field.column) for field in fields)}) {select}",
+                params,
+            )
+            added = cursor.rowcount
+    return added, archived
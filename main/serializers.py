@@ -7,18 +7,21 @@ serialization for Event and linked AccessibilityProfile.
 
 Author: Gavin Plucknett
 Updated: 2026-01-05
-Current Version: v2.0
+Current Version: v2.2
 
 Change Log:
 ------------------------------------------------------------
 Version | Date       | Change Description                          | Reference
 ------------------------------------------------------------
 v2.0    | 2026-01-05 | Nested LookupOption output (code/label)     | DEV-142
+v2.1    | 2026-10-17 | Resolve LookupOptions from reference cache  | user-003
+v2.2    | 2026-10-17 | Event recurrence rule fields                | user-015
 ============================================================
 """
 
 from rest_framework import serializers
 from .models import Event, AccessibilityProfile, LookupOption, SensoryCategory
+from .lookup_cache import get_reference_data
 
 
 class SensoryCategorySerializer(serializers.ModelSerializer):
@@ -37,11 +40,24 @@ class LookupOptionSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+# Read-only LookupOption foreign key rendered as LookupOptionSerializer output,
+# taken from the reference-data cache rather than a join or extra query.
+# Pass the FK column as the source, e.g. source="noise_level_id".
+class CachedLookupOptionField(serializers.Field):
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return get_reference_data().represent(value)
+
+
 class AccessibilityProfileSerializer(serializers.ModelSerializer):
-    noise_level = LookupOptionSerializer(read_only=True)
-    lighting_conditions = LookupOptionSerializer(read_only=True)
-    crowd_level = LookupOptionSerializer(read_only=True)
-    sensory_level = LookupOptionSerializer(read_only=True)
+    noise_level = CachedLookupOptionField(source="noise_level_id")
+    lighting_conditions = CachedLookupOptionField(source="lighting_conditions_id")
+    crowd_level = CachedLookupOptionField(source="crowd_level_id")
+    sensory_level = CachedLookupOptionField(source="sensory_level_id")
 
     class Meta:
         model = AccessibilityProfile
@@ -62,7 +78,7 @@ class AccessibilityProfileSerializer(serializers.ModelSerializer):
 
 
 class EventSerializer(serializers.ModelSerializer):
-    category = LookupOptionSerializer(read_only=True)
+    category = CachedLookupOptionField(source="category_id")
     accessibility_profile = AccessibilityProfileSerializer(read_only=True)
 
     class Meta:
@@ -76,6 +92,9 @@ class EventSerializer(serializers.ModelSerializer):
             "age_max",
             "start_datetime",
             "end_datetime",
+            "recurrence",
+            "recurrence_interval",
+            "recurrence_until",
             "location_text",
             "postcode",
             "price",
@@ -0,0 +1,162 @@
+"""
+============================================================
+File Name: signals.py
+Brief Description:
+Model signal receivers keeping derived / cached data in step
+with admin edits. Connected in MainConfig.ready().
+
+Model saves and deletes are translated into two app-level
+signals, which derived data (search documents, caches, ...)
+listens to. Bulk code paths that bypass model signals (e.g.
+bulk_create) must send these signals themselves:
+
+  events_changed(sender, event_ids, created[, events])
+  events_deleted(sender, event_ids)
+
+Bulk senders may pass `events`, the saved Event instances for
+event_ids with accessibility_profile set, so receivers can skip
+re-reading rows that are already in memory.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.10
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Reference-data cache invalidation           | user-003
+v1.1    | 2026-10-17 | events_changed / events_deleted + documents | user-006
+v1.2    | 2026-10-17 | Full-text index maintenance                 | user-007
+v1.3    | 2026-10-17 | Optional in-memory events for bulk senders  | user-011
+v1.4    | 2026-10-17 | Append to the event change log              | user-014
+v1.5    | 2026-10-17 | Occurrence calendar maintenance             | user-015
+v1.6    | 2026-10-17 | Day-bucket time-window index maintenance    | user-016
+v1.7    | 2026-10-17 | Invalidate the match-scoring matrix         | user-017
+v1.8    | 2026-10-17 | Catch up the in-memory snapshot             | user-018
+v1.9    | 2026-10-17 | Index-friendly option fan-out query         | user-025
+v1.10   | 2026-10-17 | Record event deletions for list validators  | user-009
+============================================================
+"""
+
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from . import changes, lookup_cache, matching, occurrences, search, search_documents, snapshot, time_windows
+from .models import Event, AccessibilityProfile, LookupOption, SensoryCategory
+
+events_changed = Signal()
+events_deleted = Signal()
+
+
+# Ids of events whose output depends on any of the given LookupOption ids.
+# The profile match is a subquery rather than a join, so each OR term reads
+# its own foreign key index instead of scanning every event.
+def events_using_options(option_ids):
+    option_ids = list(option_ids)
+    profiles = Q()
+    for field in AccessibilityProfile.SENSORY_CATEGORY_CODES:
+        profiles |= Q(**{f"{field}_id__in": option_ids})
+    query = Q(category_id__in=option_ids) | Q(
+        accessibility_profile_id__in=AccessibilityProfile.objects.filter(profiles).values("pk")
+    )
+    return list(Event.objects.filter(query).values_list("pk", flat=True))
+
+
+# ---------------------------
+# Model signals -> app signals
+# ---------------------------
+@receiver(post_save, sender=Event)
+def event_saved(sender, instance, created, **kwargs):
+    events_changed.send(sender=Event, event_ids=[instance.pk], created=created)
+
+
+@receiver(post_delete, sender=Event)
+def event_deleted(sender, instance, **kwargs):
+    events_deleted.send(sender=Event, event_ids=[instance.pk])
+
+
+@receiver(post_save, sender=AccessibilityProfile)
+def profile_saved(sender, instance, created, **kwargs):
+    # A new profile has no event yet; the event's own save follows
+    if created:
+        return
+    event_ids = list(Event.objects.filter(accessibility_profile=instance).values_list("pk", flat=True))
+    if event_ids:
+        events_changed.send(sender=AccessibilityProfile, event_ids=event_ids, created=False)
+
+
+# Any change to reference data invalidates the lookup cache and
+# refreshes the events that display the changed options
+@receiver(post_save, sender=LookupOption)
+@receiver(post_delete, sender=LookupOption)
+@receiver(post_save, sender=SensoryCategory)
+@receiver(post_delete, sender=SensoryCategory)
+def reference_data_changed(sender, instance, **kwargs):
+    lookup_cache.invalidate()
+
+    if sender is LookupOption:
+        option_ids = [instance.pk]
+    else:
+        option_ids = list(LookupOption.objects.filter(category=instance).values_list("pk", flat=True))
+
+    event_ids = events_using_options(option_ids) if option_ids else []
+    if event_ids:
+        events_changed.send(sender=sender, event_ids=event_ids, created=False)
+
+
+# ---------------------------
+# Derived data
+# ---------------------------
+@receiver(events_changed)
+def update_search_documents(sender, event_ids, events=None, **kwargs):
+    search_documents.sync_events(event_ids, events=events)
+
+
+@receiver(events_changed)
+def update_search_index(sender, event_ids, events=None, **kwargs):
+    search.index_events(event_ids, events=events)
+
+
+@receiver(events_changed)
+def update_occurrences(sender, event_ids, created, events=None, **kwargs):
+    occurrences.sync_events(event_ids, events=events, created=created)
+
+
+@receiver(events_changed)
+def update_time_windows(sender, event_ids, created, events=None, **kwargs):
+    time_windows.sync_events(event_ids, events=events, created=created)
+
+
+# Documents go with their events (on delete cascade)
+@receiver(events_deleted)
+def record_document_removal(sender, event_ids, **kwargs):
+    search_documents.record_removal()
+
+
+@receiver(events_deleted)
+def remove_from_search_index(sender, event_ids, **kwargs):
+    search.remove_events(event_ids)
+
+
+@receiver(events_changed)
+def log_event_changes(sender, event_ids, created, events=None, **kwargs):
+    changes.record_changes(event_ids, created, events=events)
+
+
+@receiver(events_deleted)
+def log_event_deletions(sender, event_ids, **kwargs):
+    changes.record_deletions(event_ids)
+
+
+@receiver(events_changed)
+@receiver(events_deleted)
+def invalidate_match_profiles(sender, **kwargs):
+    matching.invalidate()
+
+
+@receiver(events_changed)
+@receiver(events_deleted)
+def mark_snapshot_stale(sender, **kwargs):
+    snapshot.mark_stale()
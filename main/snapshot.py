@@ -0,0 +1,580 @@
+"""
+============================================================
+File Name: snapshot.py
+Brief Description:
+Optional process-wide, in-memory snapshot of the published
+catalogue, so /api/events/ (filters, facets, cursor pages and
+ETags) is answered without touching the database or building
+Event / AccessibilityProfile / LookupOption instances. Enabled
+with settings.EVENT_SNAPSHOT.
+
+Each published event is a slot across array-backed columns:
+  * ids and LookupOption foreign keys as integers (sensory
+    "max level" filters compare option display_order through
+    the reference-data cache, so relabelling or reordering
+    options needs no reload);
+  * datetimes as int64 microseconds since the epoch, dates as
+    ordinals, prices in pence;
+  * wheelchair_access, booking_required and the tri-state
+    accessible_toilets / quiet_space_available packed into one
+    byte (2 bits per tri-state: 0 unknown, 1 false, 2 true);
+  * free text in plain lists.
+Pages are rebuilt as values() rows and serialized through the
+compiled EventSerializer (fast_serializers.py), so output is
+identical to the database path. Time windows expand recurring
+events' occurrences in memory (occurrences.expand()) for the
+few slots the one-off comparison cannot settle.
+
+The snapshot is loaded once per process, then kept current
+incrementally: events_changed / events_deleted mark it stale
+and bump a version token in the shared Django cache (as in
+lookup_cache.py); the next request reads the change log
+(changes.py) since the snapshot's token and re-reads only the
+changed events. Updates build a new snapshot (copy-on-write),
+so requests in flight keep a consistent view. A stale token,
+or a database without an ordered change feed, forces a full
+reload.
+
+memory_usage() reports bytes per event (also at
+/internal/snapshot/); `python manage.py bench_snapshot`
+compares list latency with the database path.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.7
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Columnar in-memory catalogue snapshot       | user-018
+v1.1    | 2026-10-17 | Load from the primary database              | user-023
+v1.2    | 2026-10-17 | Upcoming list selection and stamp           | user-024
+v1.3    | 2026-10-17 | Expiring shared version token               | user-003
+v1.4    | 2026-10-17 | Stamp covers removed events                 | user-009
+v1.5    | 2026-10-17 | Reload where the change feed is unavailable | user-014
+v1.6    | 2026-10-17 | Upcoming selection follows live_until       | user-024
+v1.7    | 2026-10-17 | Time windows match any occurrence           | user-016
+============================================================
+"""
+
+import sys
+import threading
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import ROUND_FLOOR, Decimal
+from functools import cached_property
+from types import SimpleNamespace
+
+import numpy as np
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils import timezone
+
+from . import changes
+from .db_routers import primary_database
+from .fast_serializers import compile_serializer
+from .filters import BOOLEAN_FIELDS, TRI_STATE_FIELDS, sensory_options
+from .conditional import _latest, removed_at
+from .lookup_cache import get_reference_data, new_version_token, version_token
+from .models import AccessibilityProfile, Event, LookupOption
+from .occurrences import expand, horizon
+from .serializers import EventSerializer
+
+VERSION_KEY = "main:event-snapshot:version"
+CHUNK_SIZE = 500
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+NULL = np.iinfo(np.int64).min
+NULL_32 = np.iinfo(np.int32).min
+
+# Packed flags: values() key -> (bit shift, tri-state)
+FLAGS = {
+    "accessibility_profile__wheelchair_access": (0, False),
+    "booking_required": (1, False),
+    "accessibility_profile__accessible_toilets": (2, True),
+    "accessibility_profile__quiet_space_available": (4, True),
+}
+PROFILE_FLAG_KEYS = {key.split("__")[-1]: key for key in FLAGS if key.startswith("accessibility_profile__")}
+SENSORY_KEYS = {field: f"accessibility_profile__{field}_id" for field in AccessibilityProfile.SENSORY_CATEGORY_CODES}
+
+
+def _micros(moment):
+    if moment is None:
+        return NULL
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return (moment - EPOCH) // timedelta(microseconds=1)
+
+
+def _moment(micros):
+    return None if micros == NULL else EPOCH + timedelta(microseconds=micros)
+
+
+# Slots whose live_until (NULL while repeating without end) is after now
+def _upcoming(live_until, now):
+    return (live_until > now) | (live_until == NULL)
+
+
+# Column kinds: (dtype, encode, decode); dtype None keeps values in a list
+KINDS = {
+    "id": (np.int64, int, int),
+    "option": (np.int32, int, int),
+    "int": (np.int32, lambda value: NULL_32 if value is None else value, lambda value: None if value == NULL_32 else value),
+    "datetime": (np.int64, _micros, _moment),
+    "date": (np.int32, lambda value: 0 if value is None else value.toordinal(), lambda value: date.fromordinal(value) if value else None),
+    "price": (
+        np.int64,
+        lambda value: NULL if value is None else int(value * 100),
+        lambda value: None if value == NULL else Decimal(value).scaleb(-2),
+    ),
+    "text": (None, None, None),
+    # Few distinct values: interned so every slot shares one string
+    "code": (None, sys.intern, None),
+}
+
+# values() key -> kind, for every field the compiled EventSerializer reads,
+# plus the search document's updated_at for the list ETag and live_until for
+# the upcoming list
+COLUMNS = {
+    "id": "id",
+    "title": "text",
+    "description": "text",
+    "category_id": "option",
+    "age_min": "int",
+    "age_max": "int",
+    "start_datetime": "datetime",
+    "end_datetime": "datetime",
+    "recurrence": "code",
+    "recurrence_interval": "int",
+    "recurrence_until": "date",
+    "location_text": "text",
+    "postcode": "text",
+    "price": "price",
+    "booking_url": "text",
+    "status": "code",
+    "created_at": "datetime",
+    "updated_at": "datetime",
+    "accessibility_profile__id": "id",
+    "accessibility_profile__noise_level_id": "option",
+    "accessibility_profile__lighting_conditions_id": "option",
+    "accessibility_profile__crowd_level_id": "option",
+    "accessibility_profile__sensory_level_id": "option",
+    "accessibility_profile__additional_notes": "text",
+    "accessibility_profile__created_at": "datetime",
+    "accessibility_profile__updated_at": "datetime",
+    "search_document__updated_at": "datetime",
+    "search_document__live_until": "datetime",
+}
+
+_lock = threading.Lock()
+_snapshot = None
+_stale = False
+
+
+def enabled():
+    return getattr(settings, "EVENT_SNAPSHOT", False)
+
+
+def _pack(row):
+    packed = 0
+    for key, (shift, tri_state) in FLAGS.items():
+        value = row[key]
+        if tri_state:
+            packed |= (0 if value is None else 1 + value) << shift
+        else:
+            packed |= int(value) << shift
+    return packed
+
+
+def _unpack(packed, key):
+    shift, tri_state = FLAGS[key]
+    if tri_state:
+        return (None, False, True)[(packed >> shift) & 3]
+    return bool((packed >> shift) & 1)
+
+
+class EventSnapshot:
+    """
+    Columns over the published events at one change-log token. Immutable
+    once built; changes produce a new snapshot through updated().
+    """
+    # CatalogueState.removed_at as read by load() / catch_up(), for stamp()
+    removed_at = None
+
+    def __init__(self, version, token, arrays, texts, live, slots, free):
+        self.version = version
+        self.token = token
+        self.arrays = arrays
+        self.texts = texts
+        self.live = live
+        self.slots = slots
+        self.free = free
+
+    @classmethod
+    def from_rows(cls, rows, version=None, token=0):
+        count = len(rows)
+        arrays, texts = {}, {}
+        for key, kind in COLUMNS.items():
+            dtype, encode, _ = KINDS[kind]
+            if dtype is None:
+                texts[key] = [encode(row[key]) if encode else row[key] for row in rows]
+            else:
+                arrays[key] = np.fromiter((encode(row[key]) for row in rows), dtype=dtype, count=count)
+        arrays["flags"] = np.fromiter((_pack(row) for row in rows), dtype=np.uint8, count=count)
+        slots = {row["id"]: slot for slot, row in enumerate(rows)}
+        return cls(version, token, arrays, texts, np.ones(count, dtype=bool), slots, [])
+
+    def __len__(self):
+        return len(self.slots)
+
+    # New snapshot with rows upserted and removed_ids dropped
+    def updated(self, rows, removed_ids, version, token):
+        arrays = {key: column.copy() for key, column in self.arrays.items()}
+        texts = {key: list(column) for key, column in self.texts.items()}
+        live, slots, free = self.live.copy(), dict(self.slots), list(self.free)
+
+        for pk in removed_ids:
+            slot = slots.pop(pk, None)
+            if slot is not None:
+                live[slot] = False
+                free.append(slot)
+                for column in texts.values():
+                    column[slot] = None
+
+        grow = sum(1 for row in rows if row["id"] not in slots) - len(free)
+        if grow > 0:
+            capacity = len(live)
+            free.extend(range(capacity + grow - 1, capacity - 1, -1))
+            live = np.concatenate([live, np.zeros(grow, dtype=bool)])
+            arrays = {key: np.concatenate([column, np.zeros(grow, dtype=column.dtype)]) for key, column in arrays.items()}
+            for column in texts.values():
+                column.extend([None] * grow)
+
+        for row in rows:
+            slot = slots.get(row["id"])
+            if slot is None:
+                slot = slots[row["id"]] = free.pop()
+            live[slot] = True
+            for key, kind in COLUMNS.items():
+                dtype, encode, _ = KINDS[kind]
+                if dtype is None:
+                    texts[key][slot] = encode(row[key]) if encode else row[key]
+                else:
+                    arrays[key][slot] = encode(row[key])
+            arrays["flags"][slot] = _pack(row)
+        return EventSnapshot(version, token, arrays, texts, live, slots, free)
+
+    # Same snapshot contents at a new version / token
+    def advanced(self, version, token):
+        snapshot = EventSnapshot(version, token, self.arrays, self.texts, self.live, self.slots, self.free)
+        for name in ("order", "recurring"):
+            if name in self.__dict__:
+                setattr(snapshot, name, self.__dict__[name])
+        return snapshot
+
+    # Live slots in (start_datetime, id) order
+    @cached_property
+    def order(self):
+        live = np.flatnonzero(self.live)
+        keys = (self.arrays["id"][live], self.arrays["start_datetime"][live])
+        return live[np.lexsort(keys)]
+
+    # Slots of recurring events
+    @cached_property
+    def recurring(self):
+        return np.fromiter((bool(code) for code in self.texts["recurrence"]), dtype=bool, count=len(self.live))
+
+    # Slots with an occurrence overlapping [start, end), or on at start when
+    # start == end. Repeats are expanded up to the horizon, as
+    # time_windows.py buckets them.
+    def _occurring(self, start, end, now):
+        arrays, texts = self.arrays, self.texts
+        starts, ends = arrays["start_datetime"], arrays["end_datetime"]
+        if start == end:
+            end = start + timedelta(microseconds=1)
+        low, high = _micros(start), _micros(end)
+        hits = (starts < high) & (ends > low)
+
+        window_end = min(end, horizon(now))
+        candidates = self.live & self.recurring & ~hits & (starts < high)
+        candidates &= _upcoming(arrays["search_document__live_until"], low)
+        for slot in np.flatnonzero(candidates).tolist():
+            event = SimpleNamespace(
+                start_datetime=_moment(int(starts[slot])),
+                end_datetime=_moment(int(ends[slot])),
+                recurrence=texts["recurrence"][slot],
+                recurrence_interval=int(arrays["recurrence_interval"][slot]),
+                recurrence_until=KINDS["date"][2](int(arrays["recurrence_until"][slot])),
+            )
+            hits[slot] = next(expand(event, start, window_end), None) is not None
+        return hits
+
+    # The list stamp for filters, as conditional.list_stamp() computes it;
+    # without filters, the catalogue_stamp()
+    def stamp(self, filters=None):
+        updated = self.arrays["search_document__updated_at"]
+        if filters is None or not filters.upcoming:
+            if not self.slots:
+                return 0, self.removed_at
+            return len(self.slots), _latest(_moment(int(updated[self.live].max())), self.removed_at)
+
+        now, ends = _micros(filters.now), self.arrays["search_document__live_until"]
+        current = self.live & _upcoming(ends, now)
+        if not current.any():
+            return 0, None, None
+        # NULL (open-ended) sorts below every time
+        ended = self.live & (ends != NULL) & (ends <= now)
+        last_modified = int(updated[current].max())
+        if ended.any():
+            last_modified = max(last_modified, int(ends[ended].max()))
+        ending = current & (ends != NULL)
+        next_end = _moment(int(ends[ending].min())) if ending.any() else None
+        return int(current.sum()), _latest(_moment(last_modified), self.removed_at), next_end
+
+    # values() rows for slots, in order
+    def rows(self, slots):
+        slots = [int(slot) for slot in slots]
+        rows = [{} for _ in slots]
+        for key, kind in COLUMNS.items():
+            dtype, _, decode = KINDS[kind]
+            if dtype is None:
+                column = self.texts[key]
+                values = [column[slot] for slot in slots]
+            else:
+                values = map(decode, self.arrays[key][slots].tolist())
+            for row, value in zip(rows, values):
+                row[key] = value
+        for packed, row in zip(self.arrays["flags"][slots].tolist(), rows):
+            for key in FLAGS:
+                row[key] = _unpack(packed, key)
+        return rows
+
+    # Events matching an EventFilters (filters.py)
+    def select(self, filters):
+        return Selection(self, self.order[self._mask(filters)[self.order]])
+
+    def _mask(self, filters):
+        arrays, data = self.arrays, get_reference_data()
+        mask = self.live.copy()
+
+        for name, value in filters.flags.items():
+            shift, tri_state = FLAGS[PROFILE_FLAG_KEYS[name]]
+            if tri_state:
+                mask &= (arrays["flags"] >> shift) & 3 == (0 if value is None else 1 + value)
+            else:
+                mask &= (arrays["flags"] >> shift) & 1 == int(value)
+
+        for name, limit in filters.max_levels.items():
+            allowed = [
+                option.pk for option in data.options_in_category(limit.category_id)
+                if option.display_order <= limit.display_order
+            ]
+            mask &= np.isin(arrays[SENSORY_KEYS[name]], allowed)
+
+        if filters.lighting_codes is not None:
+            category = data.get_category_by_code(AccessibilityProfile.SENSORY_CATEGORY_CODES["lighting_conditions"])
+            allowed = [option.pk for option in data.options_in_category(category.pk) if option.code in filters.lighting_codes]
+            mask &= np.isin(arrays[SENSORY_KEYS["lighting_conditions"]], allowed)
+
+        if filters.category_codes is not None:
+            allowed = [
+                option.pk for option in data.options.values()
+                if option.option_type == LookupOption.OptionType.EVENT_CATEGORY and option.code in filters.category_codes
+            ]
+            mask &= np.isin(arrays["category_id"], allowed)
+
+        starts = arrays["start_datetime"]
+        if filters.upcoming:
+            mask &= _upcoming(arrays["search_document__live_until"], _micros(filters.now))
+        if filters.starts_after:
+            mask &= starts >= _micros(filters.starts_after)
+        if filters.starts_before:
+            mask &= starts <= _micros(filters.starts_before)
+        for start, end in filters.windows:
+            if start is not None and end is not None:
+                mask &= self._occurring(start, end, filters.now)
+            elif start is not None:
+                mask &= _upcoming(arrays["search_document__live_until"], _micros(start))
+            else:
+                mask &= starts < _micros(end)
+
+        if filters.age is not None:
+            age_min, age_max = arrays["age_min"], arrays["age_max"]
+            mask &= ((age_min == NULL_32) | (age_min <= filters.age)) & ((age_max == NULL_32) | (age_max >= filters.age))
+        if filters.max_price is not None:
+            prices = arrays["price"]
+            mask &= (prices != NULL) & (prices <= int((filters.max_price * 100).to_integral_value(rounding=ROUND_FLOOR)))
+        return mask
+
+    # Approximate bytes held: columns, text (counting shared strings once)
+    # and the id -> slot index
+    def memory_usage(self):
+        arrays = sum(column.nbytes for column in self.arrays.values()) + self.live.nbytes
+        seen, text = set(), 0
+        for column in self.texts.values():
+            text += sys.getsizeof(column)
+            for value in column:
+                if value is not None and id(value) not in seen:
+                    seen.add(id(value))
+                    text += sys.getsizeof(value)
+        index = sys.getsizeof(self.slots) + sum(sys.getsizeof(pk) for pk in self.slots)
+        total = arrays + text + index
+        return {
+            "events": len(self),
+            "slots": len(self.live),
+            "array_bytes": arrays,
+            "text_bytes": text,
+            "index_bytes": index,
+            "total_bytes": total,
+            "bytes_per_event": round(total / len(self)) if len(self) else 0,
+        }
+
+
+class Selection:
+    """Filtered snapshot slots in (start_datetime, id) order, paged by pagination.py."""
+
+    def __init__(self, snapshot, slots):
+        self.snapshot = snapshot
+        self.slots = slots
+
+    def __len__(self):
+        return len(self.slots)
+
+    # Up to limit rows after (or, reversed, before) a (start_datetime, id)
+    # cursor position, in paging order
+    def keyset_slice(self, position, reverse, limit):
+        slots = self.slots
+        if position is None:
+            chosen = slots[:limit]
+        else:
+            arrays = self.snapshot.arrays
+            start, pk = _micros(position[0]), position[1]
+            starts = arrays["start_datetime"][slots]
+            low, high = np.searchsorted(starts, start, "left"), np.searchsorted(starts, start, "right")
+            ties = arrays["id"][slots[low:high]]
+            if reverse:
+                index = low + np.searchsorted(ties, pk, "left")
+                chosen = slots[max(0, index - limit):index][::-1]
+            else:
+                index = low + np.searchsorted(ties, pk, "right")
+                chosen = slots[index:index + limit]
+        return self.snapshot.rows(chosen)
+
+    # Same result as filters.facet_counts() over the matching documents
+    def facet_counts(self):
+        arrays, data = self.snapshot.arrays, get_reference_data()
+
+        def option_counts(key, options):
+            counts = np.bincount(arrays[key][self.slots], minlength=max((o.pk for o in options), default=0) + 1)
+            return [{"code": option.code, "label": option.label, "count": int(counts[option.pk])} for option in options]
+
+        result = {"category": option_counts(
+            "category_id", data.active_options(LookupOption.OptionType.EVENT_CATEGORY)
+        )}
+        for field, key in SENSORY_KEYS.items():
+            result[field] = option_counts(key, sensory_options(field))
+
+        flags = arrays["flags"][self.slots]
+        for field in BOOLEAN_FIELDS + TRI_STATE_FIELDS:
+            shift, tri_state = FLAGS[PROFILE_FLAG_KEYS[field]]
+            if tri_state:
+                counts = np.bincount((flags >> shift) & 3, minlength=3)
+                result[field] = {"true": int(counts[2]), "false": int(counts[1]), "unknown": int(counts[0])}
+            else:
+                true = int(np.count_nonzero((flags >> shift) & 1))
+                result[field] = {"true": true, "false": len(flags) - true}
+        return result
+
+
+def _check_serializer():
+    missing = set(compile_serializer(EventSerializer).value_fields) - set(COLUMNS) - set(FLAGS)
+    if missing:
+        raise ImproperlyConfigured(f"EventSerializer reads fields the snapshot does not hold: {', '.join(sorted(missing))}.")
+
+
+def _published(queryset):
+    return queryset.filter(status=Event.Status.PUBLISHED).values(*COLUMNS, *FLAGS)
+
+
+# Full load; the token is read first so changes made during the load are
+# applied again by the next catch-up
+def load(version=None) -> EventSnapshot:
+    _check_serializer()
+    removed = removed_at()
+    token = changes.head()
+    snapshot = EventSnapshot.from_rows(list(_published(Event.objects.order_by()).iterator(chunk_size=2000)), version, token)
+    snapshot.removed_at = removed
+    return snapshot
+
+
+# Apply the change log since snapshot.token
+def catch_up(snapshot, version) -> EventSnapshot:
+    token, changed = snapshot.token, set()
+    try:
+        while True:
+            page, token, has_more = changes.changes_since(token, CHUNK_SIZE)
+            changed.update(change.event_id for change in page)
+            if not has_more:
+                break
+    except (changes.StaleToken, changes.ChangeFeedUnavailable):
+        return load(version)
+    if not changed:
+        caught_up = snapshot.advanced(version, token)
+        caught_up.removed_at = snapshot.removed_at
+        return caught_up
+
+    # A removal is always logged, and committed with its removed_at
+    removed = removed_at()
+    changed = list(changed)
+    rows = []
+    for start in range(0, len(changed), CHUNK_SIZE):
+        rows.extend(_published(Event.objects.filter(pk__in=changed[start:start + CHUNK_SIZE]).order_by()))
+    published = {row["id"] for row in rows}
+    caught_up = snapshot.updated(rows, [pk for pk in changed if pk not in published], version, token)
+    caught_up.removed_at = removed
+    return caught_up
+
+
+def _shared_version():
+    return version_token(VERSION_KEY)
+
+
+# Return the current snapshot, loading or catching it up as needed
+def get_snapshot() -> EventSnapshot:
+    global _snapshot, _stale
+    version = _shared_version()
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.version == version and not _stale:
+        return snapshot
+
+    # Never cache a lagging replica's rows under the new version
+    with _lock, primary_database():
+        if _snapshot is None:
+            _stale = False
+            _snapshot = load(version)
+        elif _snapshot.version != version or _stale:
+            _stale = False
+            _snapshot = catch_up(_snapshot, version)
+        return _snapshot
+
+
+def _bump_shared_version():
+    new_version_token(VERSION_KEY)
+
+
+# Catch this process up on its next request and tell other processes once
+# committed
+def mark_stale():
+    global _stale
+    if not enabled():
+        return
+    _stale = True
+    transaction.on_commit(_bump_shared_version)
+
+
+# Forget this process's snapshot (the next request reloads it)
+def reset():
+    global _snapshot, _stale
+    with _lock:
+        _snapshot, _stale = None, False
@@ -14,6 +14,7 @@ Change Log:
 Version | Date       | Change Description                   | Reference
 ------------------------------------------------------------
 v1.0    | 2026-01-01 | Initial factories                    | DEV-125
+v1.1    | 2026-10-17 | LookupOption factories for FK fields | user-001
 ============================================================
 """
 
@@ -22,7 +23,7 @@ from faker import Faker
 from django.contrib.auth.models import User
 from django.utils import timezone
 
-from main.models import Event, AccessibilityProfile
+from main.models import Event, AccessibilityProfile, LookupOption, SensoryCategory
 
 # Set faker country
 fake = Faker("en_GB")
@@ -35,6 +36,40 @@ class UserFactory(factory.django.DjangoModelFactory):
     username = factory.LazyAttribute(lambda _: fake.user_name())
     email = factory.LazyAttribute(lambda o: f"{o.username}@example.com")
 
+#Create (or reuse) a SensoryCategory by code
+class SensoryCategoryFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = SensoryCategory
+        django_get_or_create = ("code",)
+
+    code = "NOISE"
+    label = factory.LazyAttribute(lambda o: o.code.title())
+
+#Create (or reuse) a LookupOption by option type, category and code
+class LookupOptionFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = LookupOption
+        django_get_or_create = ("option_type", "category", "code")
+
+    option_type = LookupOption.OptionType.ACCESSIBILITY_LEVEL
+    category = factory.SubFactory(SensoryCategoryFactory)
+    code = "LOW"
+    label = factory.LazyAttribute(lambda o: o.code.title())
+
+#Create an event category LookupOption (no sensory category)
+class EventCategoryFactory(LookupOptionFactory):
+    option_type = LookupOption.OptionType.EVENT_CATEGORY
+    category = None
+    code = "SOCIAL"
+
+#Create a sensory LookupOption within the named SensoryCategory
+def sensory_option(category_code, code):
+    return factory.SubFactory(
+        LookupOptionFactory,
+        code=code,
+        category=factory.SubFactory(SensoryCategoryFactory, code=category_code),
+    )
+
 #Create an AccessibilityProfile for an Event
 class AccessibilityProfileFactory(factory.django.DjangoModelFactory):
     class Meta:
@@ -46,9 +81,10 @@ class AccessibilityProfileFactory(factory.django.DjangoModelFactory):
     quiet_space_available = factory.Faker("boolean")
 
     # These default to LOW impact, but can be overridden in tests
-    noise_level = "LOW"
-    lighting_conditions = "NATURAL"
-    crowd_level = "SMALL"
+    noise_level = sensory_option("NOISE", "LOW")
+    lighting_conditions = sensory_option("LIGHTING", "DIM")
+    crowd_level = sensory_option("CROWD", "SMALL")
+    sensory_level = sensory_option("SENSORY", "LOW")
     
     #Create 2 sentences of notes
     additional_notes = factory.Faker("paragraph", nb_sentences=2)
@@ -63,8 +99,9 @@ class EventFactory(factory.django.DjangoModelFactory):
     description = factory.Faker("paragraph", nb_sentences=4)
 
     #Choose random category
-    category = factory.Iterator(
-        ["SPORTS", "ARTS", "EDUCATION", "SOCIAL"]
+    category = factory.SubFactory(
+        EventCategoryFactory,
+        code=factory.Iterator(["SPORTS", "ARTS", "EDUCATION", "SOCIAL"]),
     )
 
     # Random min age 0-12 and max age min_age + 0-6
@@ -8,13 +8,14 @@ Unit tests for the prototype REST API endpoints:
 
 Author: Gavin Plucknett
 Created: 2026-01-04
-Current Version: v1.0
+Current Version: v1.1
 
 Change Log:
 ------------------------------------------------------------
 Version | Date       | Change Description                                  | Reference
 ------------------------------------------------------------
 v1.0    | 2026-01-04 | Added tests for event list and event detail API     | DEV-123
+v1.1    | 2026-10-17 | List results nested under paginated "results"       | user-002
 ============================================================
 """
 
@@ -53,7 +54,7 @@ class EventAPITests(TestCase):
         # Assert
         self.assertEqual(response.status_code, 200)
 
-        data = response.json()
+        data = response.json()["results"]
         self.assertIsInstance(data, list)
         self.assertGreaterEqual(len(data), 1)
 
@@ -102,10 +103,10 @@ class EventAPITests(TestCase):
 
         # Confirm a couple of values match the actual linked profile
         self.assertEqual(ap["wheelchair_access"], event.accessibility_profile.wheelchair_access)
-        self.assertEqual(ap["noise_level"], event.accessibility_profile.noise_level)
+        self.assertEqual(ap["noise_level"]["code"], event.accessibility_profile.noise_level.code)
 
         if self._sensory_level_field_exists():
-            self.assertEqual(ap["sensory_level"], event.accessibility_profile.sensory_level)
+            self.assertEqual(ap["sensory_level"]["code"], event.accessibility_profile.sensory_level.code)
 
     def test_api_event_detail_404_when_missing(self):
         response = self.client.get("/api/events/999999/")
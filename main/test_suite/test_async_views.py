@@ -0,0 +1,118 @@
+"""
+============================================================
+File Name: test_async_views.py
+Brief Description:
+Tests for the async list, detail and search endpoints
+(async_views.py): same bodies as the DRF endpoints, DRF-shaped
+errors, and query metrics when served through the ASGI
+handler.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Async endpoint tests                                | user-021
+============================================================
+"""
+
+from urllib.parse import parse_qs, urlsplit
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from main import snapshot
+from main.benchmarking import build_catalogue
+
+
+def cursor(url):
+    return url and parse_qs(urlsplit(url).query)["cursor"][0]
+
+
+class AsyncEventViewTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.events = build_catalogue(12)
+
+    def get_both(self, sync_url, async_url):
+        expected, actual = self.client.get(sync_url), self.client.get(async_url)
+        self.assertEqual(actual.status_code, expected.status_code, actual.content)
+        self.assertEqual(actual["Content-Type"], "application/json")
+        return expected.json(), actual.json()
+
+    def test_list_matches_drf_endpoint(self):
+        for query in (
+            "",
+            "page_size=5&facets=false",
+            "wheelchair_access=true&max_noise_level=MEDIUM&lighting_conditions=DIM,STANDARD",
+            "category=ARTS&accessible_toilets=unknown&page_size=3",
+        ):
+            with self.subTest(query=query):
+                expected, actual = self.get_both(f"/api/events/?{query}", f"/api/async/events/?{query}")
+                self.assertEqual(actual["results"], expected["results"])
+                self.assertEqual(actual.get("facets"), expected.get("facets"))
+                self.assertEqual(cursor(actual["next"]), cursor(expected["next"]))
+
+    def test_cursor_pages_match(self):
+        expected, actual = self.get_both("/api/events/?page_size=5", "/api/async/events/?page_size=5")
+        query = f"page_size=5&cursor={cursor(expected['next'])}"
+
+        expected, actual = self.get_both(f"/api/events/?{query}", f"/api/async/events/?{query}")
+
+        self.assertEqual(actual["results"], expected["results"])
+        self.assertEqual(cursor(actual["previous"]), cursor(expected["previous"]))
+
+    @override_settings(EVENT_SNAPSHOT=True)
+    def test_list_from_snapshot(self):
+        snapshot.reset()
+        self.addCleanup(snapshot.reset)
+
+        expected, actual = self.get_both("/api/events/?wheelchair_access=true", "/api/async/events/?wheelchair_access=true")
+
+        self.assertEqual(actual["results"], expected["results"])
+        self.assertEqual(actual["facets"], expected["facets"])
+
+    def test_detail_and_conditional_get(self):
+        pk = self.events[3].pk
+        expected, actual = self.get_both(f"/api/events/{pk}/", f"/api/async/events/{pk}/")
+        self.assertEqual(actual, expected)
+
+        response = self.client.get(f"/api/async/events/{pk}/")
+        self.assertEqual(self.client.get(f"/api/async/events/{pk}/", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+        self.assertEqual(self.client.get("/api/async/events/999999/").json(), {"detail": "Not found."})
+
+    def test_search_matches_drf_endpoint(self):
+        title = self.events[0].title.split()[0]
+        expected, actual = self.get_both(f"/api/events/search/?q={title}", f"/api/async/events/search/?q={title}")
+
+        self.assertTrue(actual["results"])
+        self.assertEqual(actual["results"], expected["results"])
+
+    def test_errors_use_drf_shapes(self):
+        for sync_url, async_url in (
+            ("/api/events/?max_noise_level=DEAFENING", "/api/async/events/?max_noise_level=DEAFENING"),
+            ("/api/events/?cursor=bogus", "/api/async/events/?cursor=bogus"),
+            ("/api/events/search/", "/api/async/events/search/"),
+        ):
+            with self.subTest(url=async_url):
+                expected, actual = self.get_both(sync_url, async_url)
+                self.assertEqual(actual, expected)
+
+
+class AsyncHandlerTests(TestCase):
+
+    def setUp(self):
+        build_catalogue(3)
+
+    @override_settings(EVENT_METRICS_HEADER=True)
+    async def test_served_async_with_query_metrics(self):
+        response = await self.async_client.get("/api/async/events/?facets=false")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 3)
+        # Events page and catalogue stamp at least, counted in the ORM's worker thread
+        self.assertGreaterEqual(int(response["X-Query-Count"]), 3)
@@ -0,0 +1,77 @@
+"""
+============================================================
+File Name: test_benchmarking.py
+Brief Description:
+Tests for the benchmark helpers (benchmarking.py): latency
+percentiles, result files and regression detection, plus a
+small bench_endpoints run.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Benchmark helper tests                              | user-020
+============================================================
+"""
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from main.benchmarking import latency_stats, percentile, regressions
+
+
+class BenchmarkHelperTests(SimpleTestCase):
+
+    def test_nearest_rank_percentile(self):
+        samples = list(range(1, 101))
+
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertEqual(percentile([7], 99), 7)
+
+    def test_latency_stats(self):
+        stats = latency_stats(lambda: None, 10)
+
+        self.assertEqual(stats["requests"], 10)
+        self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+        self.assertLessEqual(stats["p99_ms"], stats["max_ms"])
+
+    def test_regressions_over_threshold(self):
+        def document(p50, p99):
+            return {"results": [{"endpoint": "list", "p50_ms": p50, "p99_ms": p99}]}
+
+        found = regressions(document(10, 20), document(10.5, 30), lambda result: result["endpoint"])
+
+        self.assertEqual(found, [("list", "p99_ms", 20, 30, 0.5)])
+
+
+class BenchEndpointsCommandTests(TestCase):
+
+    def test_writes_results_and_compares_baseline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "run.json"
+            call_command(
+                "bench_endpoints", events=[20], requests=3, warmup=1, output=str(output), stdout=StringIO()
+            )
+            document = json.loads(output.read_text())
+            stdout = StringIO()
+            call_command(
+                "bench_endpoints", events=[20], requests=3, warmup=1, output=str(output),
+                baseline=str(output), threshold=100.0, stdout=stdout,
+            )
+
+        self.assertEqual(
+            [(result["events"], result["endpoint"]) for result in document["results"]],
+            [(20, "list"), (20, "filter"), (20, "detail"), (20, "search")],
+        )
+        self.assertIn("p99_ms", document["results"][0])
+        self.assertIn("No p50 / p99 regressions", stdout.getvalue())
@@ -0,0 +1,167 @@
+"""
+============================================================
+File Name: test_changes.py
+Brief Description:
+Tests for the event change log and the /api/events/changes/
+feed.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Change log + change feed tests                      | user-014
+v1.1    | 2026-10-17 | Pruning watermark, future tokens, other databases   | user-014
+v1.2    | 2026-10-17 | Feed on PostgreSQL behind the commit-order lock     | user-014
+============================================================
+"""
+
+import io
+from datetime import timedelta
+from unittest import mock, skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from main import changes
+from main.importers import EventSync
+from main.models import Event, EventChange
+from main.benchmarking import build_catalogue, build_reference_data, feed_records
+from main.test_suite.model_factories import EventFactory
+
+
+class EventChangeLogTests(TestCase):
+
+    def kinds(self):
+        return list(EventChange.objects.values_list("event_id", "kind"))
+
+    def test_saves_profile_edits_and_deletes_are_logged(self):
+        event = EventFactory(status=Event.Status.PUBLISHED)
+        event.title = "Renamed"
+        event.save()
+        event.accessibility_profile.additional_notes = "Hearing loop."
+        event.accessibility_profile.save()
+        event.status = Event.Status.CANCELLED
+        event.save()
+        pk = event.pk
+        # Deleting the profile cascades to the event
+        event.accessibility_profile.delete()
+
+        self.assertEqual(self.kinds(), [
+            (pk, "CREATED"), (pk, "UPDATED"), (pk, "UPDATED"), (pk, "CANCELLED"), (pk, "DELETED"),
+        ])
+
+    def test_bulk_paths_are_logged(self):
+        build_reference_data()
+        EventSync("partner").run(enumerate(feed_records(3), start=1))
+        EventChange.objects.all().delete()
+
+        records = list(feed_records(3))
+        records[0]["title"] = "Changed"
+        EventSync("partner").run(enumerate(records[:2], start=1))
+
+        ids = dict(Event.objects.values_list("external_id", "pk"))
+        self.assertEqual(sorted(self.kinds()), sorted([(ids["EXT-0"], "UPDATED"), (ids["EXT-2"], "CANCELLED")]))
+
+
+class EventChangesAPITests(TestCase):
+
+    url = reverse("main_api:events_changes")
+
+    def setUp(self):
+        self.events = build_catalogue(3)
+
+    def test_without_since_returns_head_token(self):
+        body = self.client.get(self.url).json()
+
+        self.assertEqual(body["next"], str(EventChange.objects.latest("id").id))
+        self.assertEqual(body["results"], [])
+
+    def test_returns_only_changes_after_token(self):
+        token = self.client.get(self.url).json()["next"]
+        first, second, third = self.events
+        first.title = "Moved indoors"
+        first.save()
+        second.status = Event.Status.DRAFT
+        second.save()
+        first.save()
+        deleted_pk = third.pk
+        third.delete()
+
+        body = self.client.get(self.url, {"since": token}).json()
+
+        self.assertFalse(body["has_more"])
+        self.assertEqual(
+            [(change["event_id"], change["kind"]) for change in body["results"]],
+            [(second.pk, "UPDATED"), (first.pk, "UPDATED"), (deleted_pk, "DELETED")],
+        )
+        self.assertEqual(body["results"][1]["event"]["title"], "Moved indoors")
+        self.assertIsNone(body["results"][0]["event"])
+        self.assertIsNone(body["results"][2]["event"])
+
+        again = self.client.get(self.url, {"since": body["next"]}).json()
+        self.assertEqual((again["results"], again["next"]), ([], body["next"]))
+
+    def test_pages_through_changes(self):
+        body = self.client.get(self.url, {"since": 0, "page_size": 2}).json()
+
+        self.assertTrue(body["has_more"])
+        self.assertEqual(len(body["results"]), 2)
+        rest = self.client.get(self.url, {"since": body["next"], "page_size": 2}).json()
+        self.assertFalse(rest["has_more"])
+        self.assertEqual([change["event_id"] for change in rest["results"]], [self.events[2].pk])
+
+    def test_pruned_token_is_gone(self):
+        token = self.client.get(self.url).json()["next"]
+        EventChange.objects.update(changed_at=timezone.now() - timedelta(days=60))
+        self.events[0].save()
+        call_command("prune_event_changes", stdout=io.StringIO())
+
+        self.assertEqual(self.client.get(self.url, {"since": 0}).status_code, 410)
+        self.assertEqual(len(self.client.get(self.url, {"since": token}).json()["results"]), 1)
+
+    def test_invalid_token_is_rejected(self):
+        self.assertEqual(self.client.get(self.url, {"since": "abc"}).status_code, 400)
+
+    def test_token_below_watermark_is_gone_after_log_empties(self):
+        token = int(self.client.get(self.url).json()["next"])
+        EventChange.objects.update(changed_at=timezone.now() - timedelta(days=60))
+        call_command("prune_event_changes", stdout=io.StringIO())
+
+        self.assertFalse(EventChange.objects.exists())
+        self.assertEqual(self.client.get(self.url).json()["next"], str(token))
+        self.assertEqual(self.client.get(self.url, {"since": token - 1}).status_code, 410)
+        self.assertEqual(self.client.get(self.url, {"since": token}).json()["results"], [])
+
+    def test_token_ahead_of_log_is_gone(self):
+        head = int(self.client.get(self.url).json()["next"])
+
+        self.assertEqual(self.client.get(self.url, {"since": head + 1}).status_code, 410)
+
+    def test_feed_refused_where_commits_can_reorder(self):
+        with mock.patch.object(changes, "ORDERED_VENDORS", ()):
+            self.assertEqual(self.client.get(self.url).status_code, 501)
+            with self.assertRaises(changes.ChangeFeedUnavailable):
+                changes.changes_since(0, 10)
+
+    def test_feed_served_where_writers_commit_in_order(self):
+        for vendor, served in (("sqlite", True), ("postgresql", True), ("mysql", False)):
+            with self.subTest(vendor=vendor), mock.patch.object(changes, "connection", mock.Mock(vendor=vendor)):
+                self.assertEqual(changes.available(), served)
+
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL only")
+    def test_writers_hold_commit_order_lock_until_commit(self):
+        EventFactory(status=Event.Status.PUBLISHED)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*) FROM pg_locks WHERE locktype = 'advisory' AND objid = %s AND pid = pg_backend_pid()",
+                [changes.COMMIT_ORDER_LOCK],
+            )
+            self.assertEqual(cursor.fetchone()[0], 1)
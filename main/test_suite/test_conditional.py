@@ -0,0 +1,135 @@
+"""
+============================================================
+File Name: test_conditional.py
+Brief Description:
+Tests for ETag / Last-Modified conditional GETs on the event
+list and detail API endpoints.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Conditional request tests                           | user-009
+v1.1    | 2026-10-17 | Last-Modified after an event is removed             | user-009
+============================================================
+"""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from main import snapshot
+from main.lookup_cache import get_reference_data
+from main.models import Event, EventSearchDocument, UpcomingEvent
+from main.benchmarking import build_catalogue
+
+
+class ConditionalRequestTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.events = build_catalogue(3)
+        self.event = self.events[0]
+        self.detail_url = f"/api/events/{self.event.pk}/"
+
+    def etag(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response["ETag"]
+
+    def test_detail_not_modified_costs_one_query(self):
+        response = self.client.get(self.detail_url)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+
+        get_reference_data()
+        with CaptureQueriesContext(connection) as ctx:
+            repeat = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.content, b"")
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        repeat = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(repeat.status_code, 304)
+
+    def test_detail_etag_changes_with_event_and_profile(self):
+        first = self.etag(self.detail_url)
+
+        self.event.title = "Renamed"
+        self.event.save()
+        second = self.etag(self.detail_url)
+        self.assertNotEqual(first, second)
+
+        profile = self.event.accessibility_profile
+        profile.additional_notes = "Ramp at the back door"
+        profile.save()
+        self.assertNotEqual(second, self.etag(self.detail_url))
+
+    def test_compiled_serializer_shares_validators(self):
+        etag = self.etag(self.detail_url)
+        with override_settings(EVENT_API_FAST_SERIALIZER=True):
+            self.assertEqual(self.etag(self.detail_url), etag)
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_not_modified_costs_one_query(self):
+        etag = self.etag("/api/events/")
+
+        get_reference_data()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/events/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_list_etag_varies_with_query_and_catalogue(self):
+        etag = self.etag("/api/events/")
+        self.assertNotEqual(etag, self.etag("/api/events/?wheelchair_access=true"))
+
+        self.events[1].delete()
+        after_delete = self.etag("/api/events/")
+        self.assertNotEqual(etag, after_delete)
+
+        profile = self.events[2].accessibility_profile
+        profile.wheelchair_access = not profile.wheelchair_access
+        profile.save()
+        self.assertNotEqual(after_delete, self.etag("/api/events/"))
+
+    def test_lookup_label_change_invalidates_etags(self):
+        list_etag, detail_etag = self.etag("/api/events/"), self.etag(self.detail_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            category = self.event.category
+            category.label = "Relabelled"
+            category.save()
+
+        self.assertNotEqual(list_etag, self.etag("/api/events/"))
+        self.assertNotEqual(detail_etag, self.etag(self.detail_url))
+
+    def test_last_modified_moves_when_an_event_is_removed(self):
+        snapshot.reset()
+        self.addCleanup(snapshot.reset)
+        an_hour_ago = self.event.updated_at - timedelta(hours=1)
+        for model in (EventSearchDocument, UpcomingEvent):
+            model.objects.update(updated_at=an_hour_ago)
+        since = f"/api/events/?starts_after={(self.event.start_datetime - timedelta(days=1)).date()}"
+        urls = ("/api/events/", since)
+        first = {url: self.client.get(url)["Last-Modified"] for url in urls}
+
+        self.events[1].status = Event.Status.DRAFT
+        self.events[1].save()
+        self.events[2].delete()
+
+        for snapshot_on in (False, True):
+            with override_settings(EVENT_SNAPSHOT=snapshot_on):
+                for url in urls:
+                    with self.subTest(url=url, snapshot=snapshot_on):
+                        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first[url])
+                        self.assertEqual(response.status_code, 200)
+                        self.assertEqual(len(response.json()["results"]), 1)
@@ -0,0 +1,247 @@
+"""
+============================================================
+File Name: test_database.py
+Brief Description:
+Tests for the SQLite database modes (config/database.py) and
+the read-database router (db_routers.py).
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Database mode + router tests                        | user-022
+v1.1    | 2026-10-17 | Replica routing, pinning and copy tests             | user-023
+v1.2    | 2026-10-17 | Failed replica reads retried on the primary         | user-023
+============================================================
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError
+from django.db.utils import ConnectionHandler
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.views import View
+
+from config.database import copy_database, parse_pragmas, replica_databases, replica_path, sqlite_databases
+from asgiref.sync import async_to_sync
+
+from main import db_routers
+from main.async_views import AsyncAPIView
+from main.db_routers import (
+    PIN_COOKIE,
+    ReadDatabaseMixin,
+    ReadDatabaseRouter,
+    ReplicaHealth,
+    ReplicaPinMiddleware,
+    primary_database,
+    read_database,
+    replica_health,
+)
+from main.models import Event
+
+
+# unittest.TestCase: the connections under test are outside django.db.connections,
+# which SimpleTestCase blocks
+class DatabaseModeTests(unittest.TestCase):
+
+    def test_simple_mode_is_stock_sqlite(self):
+        self.assertEqual(
+            sqlite_databases("/tmp/x.sqlite3"),
+            {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": "/tmp/x.sqlite3"}},
+        )
+        with self.assertRaises(ImproperlyConfigured):
+            sqlite_databases("/tmp/x.sqlite3", mode="turbo")
+
+    def test_pragma_overrides(self):
+        self.assertEqual(parse_pragmas(" synchronous=FULL, cache_size=-16000 "), {"synchronous": "FULL", "cache_size": "-16000"})
+        with self.assertRaises(ImproperlyConfigured):
+            parse_pragmas("synchronous")
+
+    def test_wal_mode_connections(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        handler = ConnectionHandler(
+            sqlite_databases(os.path.join(directory.name, "db.sqlite3"), mode="wal", pragmas={"synchronous": "OFF"})
+        )
+        self.addCleanup(handler.close_all)
+
+        def pragma(alias, name):
+            with handler[alias].cursor() as cursor:
+                cursor.execute(f"PRAGMA {name}")
+                return cursor.fetchone()[0]
+
+        with handler["default"].cursor() as cursor:
+            cursor.execute("CREATE TABLE example (value INTEGER)")
+        self.assertEqual(pragma("default", "journal_mode"), "wal")
+        self.assertEqual(pragma("default", "synchronous"), 0)
+        self.assertEqual(pragma("default", "mmap_size"), 268435456)
+        self.assertEqual(handler["default"].settings_dict["CONN_MAX_AGE"], 60)
+        self.assertEqual(pragma("read", "query_only"), 1)
+        with self.assertRaises(OperationalError), handler["read"].cursor() as cursor:
+            cursor.execute("INSERT INTO example VALUES (1)")
+
+    def test_replicas_are_read_only_copies(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        primary, replica = (os.path.join(directory.name, name) for name in ("primary.sqlite3", "replica.sqlite3"))
+        databases = {**sqlite_databases(primary, mode="wal"), **replica_databases([replica])}
+        self.assertEqual(replica_path(databases["replica_1"]), replica)
+        handler = ConnectionHandler(databases)
+        self.addCleanup(handler.close_all)
+
+        with handler["default"].cursor() as cursor:
+            cursor.execute("CREATE TABLE example (value INTEGER)")
+            cursor.execute("INSERT INTO example VALUES (1)")
+        copy_database(primary, replica)
+        with handler["replica_1"].cursor() as cursor:
+            cursor.execute("SELECT value FROM example")
+            self.assertEqual(cursor.fetchall(), [(1,)])
+            with self.assertRaises(OperationalError):
+                cursor.execute("INSERT INTO example VALUES (2)")
+
+        # Later copies replace the replica's contents under its open connection
+        with handler["default"].cursor() as cursor:
+            cursor.execute("INSERT INTO example VALUES (2)")
+        copy_database(primary, replica)
+        with handler["replica_1"].cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM example")
+            self.assertEqual(cursor.fetchone()[0], 2)
+        with sqlite3.connect(replica) as check:
+            self.assertEqual(check.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+
+
+class ReadDatabaseRouterTests(SimpleTestCase):
+
+    def test_reads_routed_only_inside_block(self):
+        router = ReadDatabaseRouter()
+        with override_settings(EVENT_READ_DATABASE="default"):
+            self.assertIsNone(router.db_for_read(Event))
+            with read_database():
+                self.assertEqual(router.db_for_read(Event), "default")
+                self.assertIsNone(router.db_for_write(Event))
+            self.assertIsNone(router.db_for_read(Event))
+
+    def test_unconfigured_alias_is_ignored(self):
+        with override_settings(EVENT_READ_DATABASE="missing"), read_database():
+            self.assertIsNone(ReadDatabaseRouter().db_for_read(Event))
+
+    @override_settings(EVENT_READ_DATABASE="default")
+    def test_read_alias_never_migrated(self):
+        self.assertFalse(ReadDatabaseRouter().allow_migrate("default", "main"))
+        self.assertIsNone(ReadDatabaseRouter().allow_migrate("other", "main"))
+
+
+@override_settings(EVENT_READ_DATABASE="missing", EVENT_REPLICA_DATABASES=["default"])
+class ReplicaRoutingTests(SimpleTestCase):
+
+    def setUp(self):
+        replica_health.reset()
+        self.addCleanup(replica_health.reset)
+        available = mock.patch.object(replica_health, "available", return_value=True)
+        self.available = available.start()
+        self.addCleanup(available.stop)
+
+    def test_reads_use_replica_until_a_write(self):
+        router = ReadDatabaseRouter()
+        with read_database():
+            self.assertEqual(router.db_for_read(Event), "default")
+            self.assertEqual(self.available.call_count, 1)
+            with primary_database():
+                self.assertIsNone(router.db_for_read(Event))
+            self.assertEqual(router.db_for_read(Event), "default")
+            # One choice per request
+            self.assertEqual(self.available.call_count, 1)
+            router.db_for_write(Event)
+            self.assertIsNone(router.db_for_read(Event))
+
+    def test_unavailable_replica_falls_back(self):
+        self.available.return_value = False
+        with read_database():
+            self.assertIsNone(ReadDatabaseRouter().db_for_read(Event))
+
+    def test_failed_replica_skipped_until_retry(self):
+        health = ReplicaHealth()
+        broken = mock.MagicMock(connection=None)
+        broken.cursor.side_effect = OperationalError("unable to open database file")
+        with mock.patch.object(db_routers, "connections", {"replica_1": broken}):
+            self.assertFalse(health.available("replica_1"))
+            broken.close.assert_called_once()
+            self.assertFalse(health.available("replica_1"))
+            self.assertEqual(broken.cursor.call_count, 1)
+            health.reset()
+            broken.cursor.side_effect = None
+            self.assertTrue(health.available("replica_1"))
+
+    def test_failed_replica_read_is_retried_on_the_primary(self):
+        aliases = []
+
+        # Fails while reads go to the replica ("default" here)
+        def read(request):
+            alias = ReadDatabaseRouter().db_for_read(Event)
+            aliases.append(alias)
+            if alias == "default":
+                raise OperationalError("disk I/O error")
+            return HttpResponse("ok")
+
+        class SyncView(ReadDatabaseMixin, View):
+            def get(self, request):
+                return read(request)
+
+        class AsyncView(AsyncAPIView):
+            async def get(self, request):
+                return read(request)
+
+        for view in (SyncView.as_view(), async_to_sync(AsyncView.as_view())):
+            aliases.clear()
+            replica = mock.MagicMock()
+            with mock.patch.object(db_routers, "connections", {"default": replica}), \
+                    mock.patch.object(replica_health, "mark_down") as mark_down:
+                response = view(RequestFactory().get("/"))
+
+            self.assertEqual(response.content, b"ok")
+            self.assertEqual(aliases, ["default", None])
+            mark_down.assert_called_once_with("default")
+            replica.close.assert_called_once()
+            self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_failed_primary_read_is_not_retried(self):
+        class FailingView(ReadDatabaseMixin, View):
+            calls = 0
+
+            def get(self, request):
+                FailingView.calls += 1
+                raise OperationalError("disk I/O error")
+
+        with self.settings(EVENT_REPLICA_DATABASES=[]), self.assertRaises(OperationalError):
+            FailingView.as_view()(RequestFactory().get("/"))
+        self.assertEqual(FailingView.calls, 1)
+
+    def test_pin_cookie(self):
+        factory = RequestFactory()
+
+        def write(request):
+            ReadDatabaseRouter().db_for_write(Event)
+            return HttpResponse()
+
+        response = ReplicaPinMiddleware(write)(factory.post("/"))
+        self.assertEqual(response.cookies[PIN_COOKIE]["max-age"], 10)
+
+        def read(request):
+            with read_database():
+                self.assertIsNone(ReadDatabaseRouter().db_for_read(Event))
+            return HttpResponse()
+
+        request = factory.get("/")
+        request.COOKIES[PIN_COOKIE] = "1"
+        response = ReplicaPinMiddleware(read)(request)
+        self.assertNotIn(PIN_COOKIE, response.cookies)
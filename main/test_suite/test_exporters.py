@@ -0,0 +1,96 @@
+"""
+============================================================
+File Name: test_exporters.py
+Brief Description:
+Tests for the streaming catalogue export endpoint and the
+export_events management command.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Streaming export tests                              | user-013
+============================================================
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from django.urls import reverse
+
+from main.exporters import CSV_COLUMNS, stream_export
+from main.importers import EventImporter, read_records
+from main.models import Event
+from main.benchmarking import build_catalogue
+
+
+class EventExportTests(TestCase):
+
+    def setUp(self):
+        self.events = build_catalogue(7)
+        build_catalogue(2, status=Event.Status.DRAFT, offset=7)
+
+    def export(self, fmt):
+        response = self.client.get(reverse("main_api:events_export", args=[fmt]))
+        self.assertIsInstance(response, StreamingHttpResponse)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_jsonl_matches_detail_api(self):
+        response, body = self.export("jsonl")
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertIn("attachment;", response["Content-Disposition"])
+        items = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([item["id"] for item in items], [event.pk for event in self.events])
+        self.assertEqual(items[3], self.client.get(f"/api/events/{self.events[3].pk}/").json())
+
+    def test_csv_export_can_be_reimported(self):
+        response, body = self.export("csv")
+
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(tuple(rows[0]), CSV_COLUMNS)
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(rows[0]["noise_level"], self.events[0].accessibility_profile.noise_level.code)
+
+        result = EventImporter().run(read_records(io.StringIO(body), "csv"))
+        self.assertEqual((result.created, result.skipped), (7, 0))
+
+    def test_rows_are_read_in_chunks(self):
+        pieces = list(stream_export("jsonl", chunk_size=3))
+
+        self.assertEqual([piece.count("\n") for piece in pieces], [3, 3, 1])
+
+    def test_empty_catalogue_exports_csv_header(self):
+        Event.objects.update(status=Event.Status.DRAFT)
+
+        self.assertEqual(self.export("csv")[1].strip(), ",".join(CSV_COLUMNS))
+        self.assertEqual(self.export("ndjson")[1], "")
+
+    def test_unknown_format_is_not_found(self):
+        self.assertEqual(self.client.get("/api/events/export.xml").status_code, 404)
+
+
+class ExportEventsCommandTests(TestCase):
+
+    def test_writes_file_in_format_from_suffix(self):
+        build_catalogue(3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.ndjson")
+            call_command("export_events", path, stdout=io.StringIO())
+            with open(path, encoding="utf-8") as handle:
+                self.assertEqual(len(handle.readlines()), 3)
+
+        with self.assertRaises(CommandError):
+            call_command("export_events", "events.txt", stdout=io.StringIO())
@@ -0,0 +1,74 @@
+"""
+============================================================
+File Name: test_fast_serializers.py
+Brief Description:
+Tests that the compiled fast-path serializer renders exactly
+the same JSON as the DRF EventSerializer.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Byte-for-byte parity with EventSerializer           | user-004
+============================================================
+"""
+
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from main.fast_serializers import compile_serializer
+from main.models import Event
+from main.serializers import EventSerializer
+from main.benchmarking import build_catalogue
+
+
+class CompiledSerializerTests(TestCase):
+    def setUp(self):
+        self.events = build_catalogue(6)
+
+        # Mix of null and non-null optional values
+        Event.objects.filter(pk=self.events[0].pk).update(price=Decimal("12.5"), age_min=3, age_max=11)
+        Event.objects.filter(pk=self.events[1].pk).update(price=Decimal("0"), booking_url="https://example.com")
+
+    def render_both(self, queryset):
+        compiled = compile_serializer(EventSerializer)
+        drf = JSONRenderer().render(EventSerializer(queryset, many=True).data)
+        fast = JSONRenderer().render(compiled.serialize_many(compiled.values(queryset)))
+        return drf, fast
+
+    def test_output_is_byte_for_byte_identical(self):
+        drf, fast = self.render_both(Event.objects.order_by("id"))
+        self.assertEqual(drf, fast)
+
+    def test_output_matches_in_non_utc_timezone(self):
+        with timezone.override("Europe/London"):
+            drf, fast = self.render_both(Event.objects.order_by("id"))
+        self.assertEqual(drf, fast)
+
+    @override_settings(EVENT_API_FAST_SERIALIZER=True)
+    def test_api_responses_match_standard_serializer(self):
+        client = APIClient()
+        event = self.events[0]
+        fast_list = client.get("/api/events/?page_size=4")
+        fast_detail = client.get(f"/api/events/{event.pk}/")
+
+        with self.settings(EVENT_API_FAST_SERIALIZER=False):
+            drf_list = client.get("/api/events/?page_size=4")
+            drf_detail = client.get(f"/api/events/{event.pk}/")
+
+        self.assertEqual(fast_list.content, drf_list.content)
+        self.assertEqual(fast_detail.content, drf_detail.content)
+
+    @override_settings(EVENT_API_FAST_SERIALIZER=True)
+    def test_fast_detail_404_when_missing(self):
+        response = APIClient().get("/api/events/999999/")
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,131 @@
+"""
+============================================================
+File Name: test_filters.py
+Brief Description:
+Tests for accessibility filtering and facet counts on
+GET /api/events/.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.3
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Filter + facet tests                                | user-005
+v1.1    | 2026-10-17 | Save events so search documents follow              | user-006
+v1.2    | 2026-10-17 | Impossible dates are rejected                       | user-005
+v1.3    | 2026-10-17 | Non-finite prices are rejected                      | user-005
+============================================================
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+
+from rest_framework.test import APIClient
+
+from main.models import Event
+from main.benchmarking import build_catalogue
+
+
+class EventFilterTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.events = build_catalogue(12)
+
+    # Ids returned for a query string (one page is enough for 12 events)
+    def ids(self, query):
+        response = self.client.get(f"/api/events/?page_size=100&{query}")
+        self.assertEqual(response.status_code, 200, response.content)
+        return [e["id"] for e in response.json()["results"]]
+
+    def expected(self, predicate):
+        return [e.pk for e in Event.objects.order_by("start_datetime", "id").select_related(
+            "accessibility_profile__noise_level", "category"
+        ) if predicate(e)]
+
+    def test_boolean_filters(self):
+        self.assertEqual(
+            self.ids("wheelchair_access=true"),
+            self.expected(lambda e: e.accessibility_profile.wheelchair_access),
+        )
+        self.assertEqual(
+            self.ids("accessible_toilets=unknown"),
+            self.expected(lambda e: e.accessibility_profile.accessible_toilets is None),
+        )
+
+    def test_max_level_filter_uses_display_order_rank(self):
+        self.assertEqual(
+            self.ids("max_noise_level=medium"),
+            self.expected(lambda e: e.accessibility_profile.noise_level.code in ("LOW", "MEDIUM")),
+        )
+        self.assertEqual(
+            self.ids("max_noise_level=LOW"),
+            self.expected(lambda e: e.accessibility_profile.noise_level.code == "LOW"),
+        )
+
+    def test_category_filter(self):
+        self.assertEqual(
+            self.ids("category=SPORTS,ARTS"),
+            self.expected(lambda e: e.category.code in ("SPORTS", "ARTS")),
+        )
+
+    def test_date_age_and_price_filters(self):
+        first = self.events[0]
+        for event in Event.objects.all():
+            if event.pk == first.pk:
+                event.age_min, event.age_max, event.price = 5, 10, Decimal("4.00")
+            else:
+                event.price = Decimal("20.00")
+            event.save()
+
+        self.assertEqual(self.ids("max_price=5"), [first.pk])
+        self.assertNotIn(first.pk, self.ids("age=12"))
+        self.assertIn(first.pk, self.ids("age=7"))
+
+        cutoff = (first.start_datetime + timedelta(hours=5)).isoformat()
+        self.assertEqual(self.ids(f"starts_before={cutoff.replace('+', '%2B')}"), [e.pk for e in self.events[:6]])
+
+    def test_filters_combine(self):
+        self.assertEqual(
+            self.ids("wheelchair_access=true&max_noise_level=LOW"),
+            self.expected(lambda e: e.accessibility_profile.wheelchair_access
+                          and e.accessibility_profile.noise_level.code == "LOW"),
+        )
+
+    def test_unknown_code_is_rejected(self):
+        response = self.client.get("/api/events/?max_noise_level=DEAFENING")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("max_noise_level", response.json())
+
+    def test_impossible_dates_are_rejected(self):
+        for query in ("starts_after=2026-02-30", "starts_before=2026-02-30T10:00", "from=2026-13-01", "to=2026-04-31"):
+            with self.subTest(query=query):
+                response = self.client.get(f"/api/events/?{query}")
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(query.split("=")[0], response.json())
+
+    def test_non_finite_prices_are_rejected(self):
+        for url in ("/api/events/?max_price=NaN", "/api/events/?max_price=Infinity", "/api/async/events/?max_price=NaN"):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("max_price", response.json())
+
+    def test_facet_counts_follow_filters(self):
+        response = self.client.get("/api/events/?wheelchair_access=true")
+        facets = response.json()["facets"]
+
+        noise = {f["code"]: f["count"] for f in facets["noise_level"]}
+        self.assertEqual(list(noise), ["LOW", "MEDIUM", "HIGH"])
+        self.assertEqual(sum(noise.values()), 6)
+        self.assertEqual(facets["wheelchair_access"], {"true": 6, "false": 0})
+        self.assertEqual(sum(facets["accessible_toilets"].values()), 6)
+        self.assertEqual(sum(f["count"] for f in facets["category"]), 6)
+
+    def test_facets_can_be_skipped(self):
+        response = self.client.get("/api/events/?facets=false")
+        self.assertNotIn("facets", response.json())
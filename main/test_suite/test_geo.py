@@ -0,0 +1,192 @@
+"""
+============================================================
+File Name: test_geo.py
+Brief Description:
+Tests for postcode geocoding, the grid-indexed proximity
+search and the /api/events/nearby/ endpoint.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Geocoding + proximity search tests                  | user-008
+v1.1    | 2026-10-17 | Configurable outcode file, geocode_events           | user-008
+v1.2    | 2026-10-17 | Unresolved postcode change clears the centroid      | user-008
+============================================================
+"""
+
+import os
+import tempfile
+from io import StringIO
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from main import geo
+from main.models import Event, EventSearchDocument
+from main.benchmarking import build_catalogue
+from main.test_suite.model_factories import EventFactory
+
+
+class GeocodingTests(TestCase):
+
+    def test_normalise_postcode(self):
+        self.assertEqual(geo.normalise_postcode(" eh11yz "), "EH1 1YZ")
+        self.assertEqual(geo.normalise_postcode("sw1a 1aa"), "SW1A 1AA")
+        self.assertEqual(geo.normalise_postcode("g12"), "G12")
+        self.assertIsNone(geo.normalise_postcode("90210"))
+        self.assertIsNone(geo.normalise_postcode(""))
+
+    def test_locate_uses_outcode_centroid(self):
+        self.assertEqual(geo.locate("EH1 1YZ"), geo.locate("EH1 3AB"))
+        self.assertIsNone(geo.locate("ZZ9 9ZZ"))
+
+    def test_event_save_geocodes_postcode(self):
+        event = EventFactory(postcode="eh1 1yz")
+        latitude, longitude = geo.locate("EH1")
+        self.assertEqual((event.latitude, event.longitude), (latitude, longitude))
+        self.assertEqual((event.geo_cell_x, event.geo_cell_y), geo.grid_cell(latitude, longitude))
+
+        event.postcode = "G2 3AB"
+        event.save(update_fields=["postcode"])
+        event.refresh_from_db()
+        self.assertEqual((event.latitude, event.longitude), geo.locate("G2"))
+
+    def test_postcode_in_location_text_is_used(self):
+        event = EventFactory(postcode="", location_text="Central Library, LS1 5QS")
+        self.assertEqual((event.latitude, event.longitude), geo.locate("LS1"))
+
+    def test_unresolved_postcode_keeps_manual_coordinates(self):
+        event = EventFactory(postcode="not a postcode", latitude=51.0, longitude=-1.0)
+        self.assertEqual((event.latitude, event.longitude), (51.0, -1.0))
+        self.assertEqual((event.geo_cell_x, event.geo_cell_y), geo.grid_cell(51.0, -1.0))
+
+
+class OutcodeDataTests(TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "outcodes.csv")
+
+    def write(self, text):
+        with open(self.path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+
+    def test_missing_file_fails_loudly(self):
+        with override_settings(EVENT_OUTCODE_CENTROIDS=self.path):
+            with self.assertRaises(ImproperlyConfigured):
+                geo.locate("EH1 1YZ")
+            self.assertEqual([error.id for error in geo.check_outcode_data()], ["main.E001"])
+
+    def test_bundled_sample_is_a_deploy_warning(self):
+        self.assertEqual(geo.check_outcode_data(), [])
+        self.assertEqual([warning.id for warning in geo.check_outcode_data_deploy()], ["main.W001"])
+
+    def test_configured_file_and_geocode_events(self):
+        event = EventFactory(status="PUBLISHED", postcode="ZZ1 1AA")
+        self.assertIsNone(event.latitude)
+
+        self.write("outcode,latitude,longitude\nzz1,50.5,-3.5\n")
+        with override_settings(EVENT_OUTCODE_CENTROIDS=self.path):
+            self.assertEqual(geo.check_outcode_data_deploy(), [])
+            out = StringIO()
+            call_command("geocode_events", stdout=out)
+
+        self.assertIn("Geocoded 1 events (1 changed)", out.getvalue())
+        event.refresh_from_db()
+        self.assertEqual((event.latitude, event.longitude), (50.5, -3.5))
+        self.assertEqual(EventSearchDocument.objects.get(pk=event.pk).latitude, 50.5)
+
+
+class ProximitySearchTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        build_catalogue(400)
+
+    def brute_force(self, latitude, longitude, radius):
+        hits = [
+            (pk, geo.distance_km(latitude, longitude, lat, lon))
+            for pk, lat, lon in EventSearchDocument.objects.values_list("pk", "latitude", "longitude")
+        ]
+        return sorted((hit for hit in hits if hit[1] <= radius), key=lambda hit: (hit[1], hit[0]))
+
+    def test_within_radius_matches_brute_force(self):
+        queryset = EventSearchDocument.objects.all()
+        for postcode, radius in (("EH1", 3), ("M1", 40), ("SW1A", 15)):
+            latitude, longitude = geo.locate(postcode)
+            self.assertEqual(
+                geo.within_radius(queryset, latitude, longitude, radius),
+                self.brute_force(latitude, longitude, radius),
+            )
+
+    def test_nearest_returns_closest_first(self):
+        latitude, longitude = geo.locate("LS1")
+        hits = geo.nearest(EventSearchDocument.objects.all(), latitude, longitude, 10, 500)
+
+        self.assertEqual(hits, self.brute_force(latitude, longitude, 500)[:10])
+
+
+class NearbyAPITests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("main_api:events_nearby")
+        self.edinburgh = EventFactory(status="PUBLISHED", postcode="EH1 1YZ")
+        self.leith = EventFactory(status="PUBLISHED", postcode="EH6 6AA")
+        self.glasgow = EventFactory(status="PUBLISHED", postcode="G1 1AA")
+
+    def test_nearest_events_with_distances(self):
+        response = self.client.get(self.url, {"postcode": "eh3 9aa"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["origin"]["postcode"], "EH3 9AA")
+        results = response.data["results"]
+        self.assertEqual([item["id"] for item in results], [self.edinburgh.pk, self.leith.pk, self.glasgow.pk])
+        self.assertLess(results[0]["distance_km"], results[1]["distance_km"])
+
+    def test_radius_and_limit(self):
+        response = self.client.get(self.url, {"postcode": "EH1", "radius_km": 10})
+        self.assertEqual([item["id"] for item in response.data["results"]], [self.edinburgh.pk, self.leith.pk])
+
+        response = self.client.get(self.url, {"lat": 55.86, "lon": -4.25, "limit": 1})
+        self.assertEqual([item["id"] for item in response.data["results"]], [self.glasgow.pk])
+
+    def test_drafts_excluded_and_filters_applied(self):
+        self.leith.status = Event.Status.DRAFT
+        self.leith.save()
+        profile = self.glasgow.accessibility_profile
+        profile.wheelchair_access = not self.edinburgh.accessibility_profile.wheelchair_access
+        profile.save()
+
+        response = self.client.get(self.url, {
+            "postcode": "EH1",
+            "wheelchair_access": str(self.edinburgh.accessibility_profile.wheelchair_access).lower(),
+        })
+        self.assertEqual([item["id"] for item in response.data["results"]], [self.edinburgh.pk])
+
+    def test_unresolved_postcode_change_leaves_nearby_results(self):
+        self.leith.postcode = "ZZ9 9ZZ"
+        self.leith.save(update_fields=["postcode"])
+        self.leith.refresh_from_db()
+
+        self.assertEqual(
+            (self.leith.latitude, self.leith.longitude, self.leith.geo_cell_x, self.leith.geo_cell_y),
+            (None, None, None, None),
+        )
+        response = self.client.get(self.url, {"postcode": "EH1"})
+        self.assertEqual([item["id"] for item in response.data["results"]], [self.edinburgh.pk, self.glasgow.pk])
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"postcode": "ZZ9 9ZZ"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"postcode": "EH1", "radius_km": "-1"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"lat": "north", "lon": "1"}).status_code, 400)
@@ -0,0 +1,268 @@
+"""
+============================================================
+File Name: test_importers.py
+Brief Description:
+Tests for the streaming CSV / JSONL event importer and the
+import_events management command.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.4
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Event importer tests                                | user-011
+v1.1    | 2026-10-17 | Upsert sync tests                                   | user-012
+v1.2    | 2026-10-17 | Values the database would reject                    | user-011
+v1.3    | 2026-10-17 | Status-less feeds keep the stored status            | user-012
+v1.4    | 2026-10-17 | Events deleted mid-sync are reported                | user-012
+============================================================
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from main.importers import EventImporter, EventSync, read_records
+from main.models import Event, EventSearchDocument
+from main.search import search_events
+from main.benchmarking import build_reference_data, feed_records
+
+
+def csv_feed(records):
+    records = list(records)
+    stream = io.StringIO()
+    writer = csv.DictWriter(stream, fieldnames=list(records[0]))
+    writer.writeheader()
+    writer.writerows(records)
+    stream.seek(0)
+    return stream
+
+
+class EventImporterTests(TestCase):
+
+    def setUp(self):
+        build_reference_data()
+
+    def test_csv_rows_become_events_with_profiles(self):
+        records = list(feed_records(5))
+        result = EventImporter(chunk_size=2).run(read_records(csv_feed(records), "csv"))
+
+        self.assertEqual((result.rows, result.created, result.skipped), (5, 5, 0))
+        event = Event.objects.select_related("accessibility_profile").get(title=records[0]["title"])
+        self.assertEqual(event.category.code, records[0]["category"])
+        self.assertEqual(event.accessibility_profile.noise_level.code, records[0]["noise_level"])
+        self.assertTrue(event.accessibility_profile.wheelchair_access)
+        self.assertIsNotNone(event.latitude)
+
+    def test_imported_events_reach_derived_stores(self):
+        records = list(feed_records(3))
+        EventImporter().run(read_records(csv_feed(records), "csv"))
+
+        self.assertEqual(EventSearchDocument.objects.count(), 3)
+        event = Event.objects.get(title=records[1]["title"])
+        self.assertIn(event.pk, [pk for pk, _ in search_events(records[1]["title"])])
+
+    def test_jsonl_with_typed_values_and_default_status(self):
+        record = dict(next(feed_records(1)), wheelchair_access=True, accessible_toilets=None, age_min=8)
+        del record["status"]
+        stream = io.StringIO(json.dumps(record) + "\n\n")
+
+        result = EventImporter(status=Event.Status.DRAFT).run(read_records(stream, "jsonl"))
+
+        self.assertEqual(result.created, 1)
+        event = Event.objects.get()
+        self.assertEqual(event.status, Event.Status.DRAFT)
+        self.assertEqual(event.age_min, 8)
+        self.assertIsNone(event.accessibility_profile.accessible_toilets)
+
+    def test_invalid_rows_are_skipped_with_line_numbers(self):
+        good, bad_code, bad_date, reversed_dates = feed_records(4)
+        bad_code["noise_level"] = "DEAFENING"
+        bad_date["start_datetime"] = "next tuesday"
+        reversed_dates["end_datetime"] = "2000-01-01T00:00:00"
+        lines = [json.dumps(r) for r in (good, bad_code, bad_date, reversed_dates)] + ["{not json", "[1, 2]"]
+
+        result = EventImporter().run(read_records(io.StringIO("\n".join(lines)), "jsonl"))
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual([line for line, _ in result.errors], [2, 3, 4, 5, 6])
+        self.assertIn("DEAFENING", result.errors[0][1])
+
+    def test_values_the_database_would_reject_are_row_errors(self):
+        cases = {
+            "start_datetime": "2026-02-30T10:00",
+            "latitude": "nan",
+            "longitude": "inf",
+            "price": "NaN",
+        }
+        rows = []
+        for name, value in cases.items():
+            rows.append(dict(next(feed_records(1)), **{name: value}))
+        base = next(feed_records(1))
+        rows += [
+            dict(base, latitude="91", longitude="0"),
+            dict(base, longitude="-180.5"),
+            dict(base, location_text="x" * 256),
+            dict(base, postcode="P" * 21),
+            dict(base, price="1000000"),
+            dict(base, age_min=str(2 ** 63)),
+            dict(base, latitude="-90", longitude="180"),
+        ]
+
+        result = EventImporter(chunk_size=100).run(enumerate(rows, start=1))
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual([line for line, _ in result.errors], list(range(1, 11)))
+        messages = dict(result.errors)
+        self.assertIn("not a valid datetime", messages[1])
+        self.assertIn("outside -90 to 90", messages[5])
+        self.assertIn("location_text is too long", messages[7])
+        self.assertIn("postcode is too long", messages[8])
+        self.assertIn("whole digits", messages[9])
+
+
+class EventSyncTests(TestCase):
+
+    def setUp(self):
+        build_reference_data()
+        self.records = list(feed_records(6))
+        EventSync("partner").run(enumerate(self.records, start=1))
+        self.events = {event.external_id: event for event in Event.objects.select_related("accessibility_profile")}
+
+    def sync(self, records, **kwargs):
+        return EventSync("partner", **kwargs).run(enumerate(records, start=1))
+
+    def test_unchanged_feed_touches_nothing(self):
+        reordered = [dict(reversed(list(record.items()))) for record in self.records]
+        result = self.sync(reordered)
+
+        self.assertEqual((result.created, result.updated, result.unchanged, result.cancelled), (0, 0, 6, 0))
+        for event in Event.objects.all():
+            self.assertEqual(event.updated_at, self.events[event.external_id].updated_at)
+
+    def test_changed_rows_update_only_differing_fields(self):
+        changed = [dict(record) for record in self.records]
+        changed[0]["title"] = "Rescheduled pottery"
+        changed[1]["noise_level"] = "HIGH" if changed[1]["noise_level"] != "HIGH" else "LOW"
+
+        result = self.sync(changed)
+
+        self.assertEqual((result.updated, result.unchanged), (2, 4))
+        first = Event.objects.get(external_id="EXT-0")
+        self.assertEqual(first.title, "Rescheduled pottery")
+        self.assertGreater(first.updated_at, self.events["EXT-0"].updated_at)
+        self.assertEqual(first.accessibility_profile.updated_at, self.events["EXT-0"].accessibility_profile.updated_at)
+
+        second = Event.objects.get(external_id="EXT-1")
+        self.assertEqual(second.accessibility_profile.noise_level.code, changed[1]["noise_level"])
+        self.assertEqual(second.updated_at, self.events["EXT-1"].updated_at)
+        self.assertEqual(EventSearchDocument.objects.get(pk=second.pk).noise_level_code, changed[1]["noise_level"])
+
+    def test_missing_events_are_cancelled_and_return(self):
+        result = self.sync(self.records[:4] + list(feed_records(1, offset=10)))
+
+        self.assertEqual((result.created, result.cancelled), (1, 2))
+        cancelled = Event.objects.filter(status=Event.Status.CANCELLED)
+        self.assertEqual(sorted(cancelled.values_list("external_id", flat=True)), ["EXT-4", "EXT-5"])
+        self.assertFalse(EventSearchDocument.objects.filter(pk__in=cancelled.values("pk")).exists())
+
+        result = self.sync(self.records)
+        self.assertEqual(result.updated, 2)
+        self.assertEqual(Event.objects.get(external_id="EXT-5").status, Event.Status.PUBLISHED)
+
+    def test_feed_without_status_keeps_stored_status(self):
+        self.sync(self.records[:4])
+        Event.objects.filter(external_id="EXT-1").update(status=Event.Status.DRAFT)
+        without_status = [{k: v for k, v in record.items() if k != "status"} for record in self.records]
+
+        result = self.sync(without_status)
+
+        # Dropping the column changes every hash; only the cancelled pair changes data
+        self.assertEqual((result.updated, result.unchanged), (2, 0))
+        statuses = dict(Event.objects.values_list("external_id", "status"))
+        self.assertEqual(statuses["EXT-0"], Event.Status.PUBLISHED)
+        self.assertEqual(statuses["EXT-1"], Event.Status.DRAFT)
+        self.assertEqual(statuses["EXT-4"], Event.Status.DRAFT)
+        self.assertEqual(statuses["EXT-5"], Event.Status.DRAFT)
+
+    def test_event_deleted_during_sync_is_reported(self):
+        changed = [dict(record, title=f"Renamed {i}") for i, record in enumerate(self.records)]
+        read_existing = EventSync.existing
+
+        # Delete EXT-0 after the sync has read the stored events
+        def existing(sync):
+            stored = read_existing(sync)
+            Event.objects.filter(external_id="EXT-0").delete()
+            return stored
+
+        with mock.patch.object(EventSync, "existing", existing):
+            result = self.sync(changed)
+
+        self.assertEqual((result.updated, result.cancelled), (5, 0))
+        self.assertEqual([line for line, _ in result.errors], [1])
+        self.assertFalse(Event.objects.filter(external_id="EXT-0").exists())
+        self.assertEqual(Event.objects.filter(title__startswith="Renamed").count(), 5)
+
+        self.assertEqual(self.sync(changed).created, 1)
+
+    def test_no_cancel_and_other_sources_untouched(self):
+        EventSync("other").run(enumerate(feed_records(2, offset=20), start=1))
+
+        self.assertEqual(self.sync(self.records[:1], cancel_missing=False).cancelled, 0)
+        self.assertEqual(self.sync(self.records[:1]).cancelled, 5)
+        self.assertFalse(Event.objects.filter(source="other", status=Event.Status.CANCELLED).exists())
+
+    def test_duplicate_and_missing_external_ids_are_errors(self):
+        duplicate = dict(self.records[0])
+        anonymous = dict(self.records[1], external_id="")
+        result = self.sync(self.records + [duplicate, anonymous])
+
+        self.assertEqual([line for line, _ in result.errors], [7, 8])
+        self.assertEqual(result.cancelled, 0)
+
+
+class ImportEventsCommandTests(TestCase):
+
+    def setUp(self):
+        build_reference_data()
+
+    def test_command_imports_files_and_reports_rate(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "feed.csv")
+            with open(path, "w", newline="", encoding="utf-8") as handle:
+                handle.write(csv_feed(feed_records(4)).getvalue())
+
+            out, err = io.StringIO(), io.StringIO()
+            call_command("import_events", path, "--chunk-size", "3", stdout=out, stderr=err)
+
+        self.assertEqual(Event.objects.count(), 4)
+        self.assertIn("imported 4 of 4 rows", out.getvalue())
+        self.assertIn("rows/sec", out.getvalue())
+
+    def test_sync_mode_reports_delta(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "feed.jsonl")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.writelines(json.dumps(record) + "\n" for record in feed_records(3))
+
+            call_command("import_events", path, "--source", "partner", "--sync", stdout=io.StringIO())
+            out = io.StringIO()
+            call_command("import_events", path, "--source", "partner", "--sync", stdout=out)
+
+        self.assertIn("0 created, 0 updated, 3 unchanged, 0 cancelled", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("import_events", path, "--sync", stdout=io.StringIO())
+
+    def test_unknown_format_is_an_error(self):
+        with self.assertRaises(CommandError):
+            call_command("import_events", "feed.xml", stdout=io.StringIO())
@@ -0,0 +1,125 @@
+"""
+============================================================
+File Name: test_index_usage.py
+Brief Description:
+EXPLAIN QUERY PLAN regression tests: every query issued by the
+hot public endpoints (and the reference-data fan-out) must read
+through an index. A plain "SCAN <table>" is a table scan and
+fails the test, as does a temporary B-tree sort on a paged
+query. Runs on SQLite only.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | EXPLAIN QUERY PLAN index regression tests           | user-025
+============================================================
+"""
+
+import re
+import unittest
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from main import exporters
+from main.lookup_cache import get_reference_data
+from main.models import LookupOption
+from main.signals import events_using_options
+from main.benchmarking import build_catalogue
+
+# "SCAN main_event", but not "SCAN main_event USING [COVERING] INDEX ..."
+TABLE_SCAN = re.compile(r"^SCAN (\S+)$")
+SORT = "USE TEMP B-TREE FOR ORDER BY"
+
+
+# EXPLAIN QUERY PLAN detail lines for each query run by call
+def query_plans(call):
+    with CaptureQueriesContext(connection) as ctx:
+        call()
+    plans = []
+    with connection.cursor() as cursor:
+        for query in ctx.captured_queries:
+            if not query["sql"].lstrip().upper().startswith("SELECT"):
+                continue
+            cursor.execute(f"EXPLAIN QUERY PLAN {query['sql']}")
+            plans.append((query["sql"], [row[-1] for row in cursor.fetchall()]))
+    return plans
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN output is SQLite's")
+class IndexUsageTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.events = build_catalogue(60)
+
+    def setUp(self):
+        self.client = APIClient()
+        get_reference_data()
+
+    def assert_indexed(self, call, sorts=False):
+        plans = query_plans(call)
+        self.assertTrue(plans)
+        for sql, plan in plans:
+            for line in plan:
+                self.assertIsNone(TABLE_SCAN.match(line), f"Table scan in {sql}\n{plan}")
+                if not sorts:
+                    self.assertNotIn(SORT, line, f"Sort in {sql}\n{plan}")
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+
+    def test_event_list(self):
+        for query in (
+            "",
+            "wheelchair_access=true&quiet_space_available=true",
+            "category=ARTS",
+            "max_noise_level=LOW&max_crowd_level=SMALL",
+            "age=7&max_price=5",
+            f"starts_after={self.events[10].start_datetime.date()}",
+            f"starts_after={self.events[10].start_datetime.date()}&category=ARTS",
+        ):
+            with self.subTest(query=query):
+                self.assert_indexed(lambda: self.get(f"/api/events/?{query}"))
+        self.assert_indexed(lambda: self.get("/events/"))
+
+    def test_time_windows(self):
+        start, end = self.events[5].start_datetime, self.events[20].start_datetime
+        # Day-bucket candidates are sorted; there are only the window's events
+        self.assert_indexed(
+            lambda: self.get(f"/api/events/?from={start.date()}&to={end.date()}&facets=false"), sorts=True
+        )
+        self.assert_indexed(lambda: self.get("/api/events/?happening=now&facets=false"), sorts=True)
+
+    def test_event_detail(self):
+        pk = self.events[0].pk
+        self.assert_indexed(lambda: self.get(f"/api/events/{pk}/"))
+        self.assert_indexed(lambda: self.get(f"/events/{pk}/"))
+
+    def test_other_public_endpoints(self):
+        for url in (
+            "/api/events/nearby/?postcode=SW1A 1AA&radius_km=5",
+            "/api/events/occurrences/",
+            "/api/events/changes/",
+        ):
+            with self.subTest(url=url):
+                self.assert_indexed(lambda: self.get(url))
+
+    def test_export_reads_published_events_in_order(self):
+        self.assert_indexed(lambda: list(exporters.serialized_chunks(chunk_size=25)))
+
+    def test_lookup_options_in_display_order(self):
+        self.assert_indexed(lambda: list(LookupOption.objects.all()))
+        self.assert_indexed(lambda: list(LookupOption.objects.filter(option_type=LookupOption.OptionType.EVENT_CATEGORY)))
+
+    def test_reference_data_fan_out(self):
+        option = self.events[0].accessibility_profile.noise_level
+        self.assert_indexed(lambda: events_using_options([option.pk]))
@@ -0,0 +1,105 @@
+"""
+============================================================
+File Name: test_lookup_cache.py
+Brief Description:
+Tests for the process-local LookupOption / SensoryCategory
+reference-data cache and its signal-based invalidation.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Reference-data cache tests                          | user-003
+v1.1    | 2026-10-17 | Version token expiry                                | user-003
+============================================================
+"""
+
+import time
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIClient
+
+from main import lookup_cache
+from main.lookup_cache import get_reference_data
+from main.models import LookupOption
+from main.benchmarking import build_catalogue
+
+
+class ReferenceDataCacheTests(TestCase):
+    def setUp(self):
+        self.event = build_catalogue(1)[0]
+        self.noise = self.event.accessibility_profile.noise_level
+
+    def test_warm_cache_issues_no_queries(self):
+        get_reference_data()
+        with self.assertNumQueries(0):
+            data = get_reference_data()
+        self.assertEqual(data.get(self.noise.pk).code, self.noise.code)
+        self.assertEqual(data.get(self.noise.pk).category.code, "NOISE")
+
+    def test_lookup_by_natural_key(self):
+        data = get_reference_data()
+        option = data.get_by_key(self.noise.option_type, self.noise.category_id, self.noise.code)
+        self.assertEqual(option.pk, self.noise.pk)
+
+    def test_inactive_options_resolve_by_id_only(self):
+        self.noise.is_active = False
+        self.noise.save()
+
+        data = get_reference_data()
+        self.assertIsNotNone(data.get(self.noise.pk))
+        self.assertIsNone(data.get_by_key(self.noise.option_type, self.noise.category_id, self.noise.code))
+
+    def test_save_invalidates_cache(self):
+        get_reference_data()
+        self.noise.label = "Very quiet"
+        self.noise.save()
+        self.assertEqual(get_reference_data().represent(self.noise.pk)["label"], "Very quiet")
+
+    def test_delete_invalidates_cache(self):
+        unused = LookupOption.objects.create(
+            option_type=LookupOption.OptionType.EVENT_CATEGORY, code="UNUSED", label="Unused",
+        )
+        self.assertIsNotNone(get_reference_data().get(unused.pk))
+        unused.delete()
+        self.assertIsNone(get_reference_data().get(unused.pk))
+
+    def test_shared_version_change_triggers_rebuild(self):
+        data = get_reference_data()
+
+        # Another process committed a change and bumped the shared version
+        lookup_cache._bump_shared_version()
+
+        self.assertIsNot(get_reference_data(), data)
+
+    @override_settings(REFERENCE_DATA_VERSION_TIMEOUT=60)
+    def test_version_token_expires(self):
+        # A bump this process never saw (e.g. another process's local cache)
+        lookup_cache._bump_shared_version()
+        data = get_reference_data()
+
+        later = time.time() + 61
+        with mock.patch("django.core.cache.backends.locmem.time.time", return_value=later):
+            self.assertIsNot(get_reference_data(), data)
+
+    def test_api_does_not_query_lookup_tables(self):
+        client = APIClient()
+        get_reference_data()
+        with self.assertNumQueries(1):
+            response = client.get(f"/api/events/{self.event.pk}/")
+        self.assertEqual(
+            response.json()["accessibility_profile"]["noise_level"],
+            {"code": self.noise.code, "label": self.noise.label, "category": {"code": "NOISE", "label": "Noise"}},
+        )
+
+    def test_templates_resolve_lookup_labels_from_cache(self):
+        get_reference_data()
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/events/{self.event.pk}/")
+        self.assertContains(response, f"<strong>Noise:</strong> {self.noise.label}")
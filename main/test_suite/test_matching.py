@@ -0,0 +1,139 @@
+"""
+============================================================
+File Name: test_matching.py
+Brief Description:
+Tests for accessibility match scoring (matching.py) and the
+/api/events/match/ ranking endpoint.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Match scoring + ranking endpoint tests              | user-017
+v1.1    | 2026-10-17 | Live recurring events are ranked                    | user-017
+============================================================
+"""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from main import matching
+from main.models import Event
+from main.benchmarking import build_catalogue
+
+
+class MatchScoringTests(TestCase):
+
+    # Catalogue event i has noise LOW / MEDIUM / HIGH for i % 3 and crowd
+    # SMALL / MEDIUM / LARGE for (i // 5) % 3, starting i hours from now
+    def setUp(self):
+        self.events = build_catalogue(12)
+
+    def test_closer_levels_score_higher(self):
+        count, hits = matching.rank([("noise_level", "LOW", 1)], limit=12)
+
+        self.assertEqual(count, 12)
+        scores = {pk: score for pk, score in hits}
+        self.assertEqual(scores[self.events[0].pk], 1)
+        self.assertEqual(scores[self.events[1].pk], 0.5)
+        self.assertEqual(scores[self.events[2].pk], 0)
+        # Best first, ties in start order
+        self.assertEqual([pk for pk, _ in hits[:4]], [self.events[i].pk for i in (0, 3, 6, 9)])
+
+    def test_weighted_mean_over_fields(self):
+        _, hits = matching.rank([("noise_level", "LOW", 3), ("crowd_level", "LARGE", 1)], limit=12)
+
+        scores = dict(hits)
+        # Event 1: noise MEDIUM (0.5), crowd SMALL (0)
+        self.assertAlmostEqual(scores[self.events[1].pk], 3 * 0.5 / 4)
+        # Events 6 and 9: noise LOW (1), crowd MEDIUM (0.5); 6 starts first
+        self.assertEqual(hits[:2], [(self.events[6].pk, 0.875), (self.events[9].pk, 0.875)])
+
+    def test_pages_follow_full_ranking(self):
+        preferences = [("noise_level", "MEDIUM", 1), ("crowd_level", "SMALL", 2)]
+        _, everything = matching.rank(preferences, limit=12)
+        pages = [matching.rank(preferences, offset=offset, limit=5)[1] for offset in (0, 5, 10)]
+
+        self.assertEqual(sum(pages, []), everything)
+
+    def test_requirements_and_ended_events_excluded(self):
+        past = self.events[0]
+        past.start_datetime = timezone.now() - timedelta(days=2)
+        past.end_datetime = past.start_datetime + timedelta(hours=2)
+        past.save()
+
+        count, hits = matching.rank([("noise_level", "LOW", 1)], {"wheelchair_access": True}, limit=12)
+
+        expected = {event.pk for i, event in enumerate(self.events) if i % 2 == 0 and i}
+        self.assertEqual(count, len(expected))
+        self.assertEqual({pk for pk, _ in hits}, expected)
+
+    def test_matrix_follows_event_changes(self):
+        matching.rank([("noise_level", "LOW", 1)])
+        self.events[5].status = Event.Status.DRAFT
+        self.events[5].save()
+
+        count, hits = matching.rank([("noise_level", "LOW", 1)], limit=12)
+
+        self.assertEqual(count, 11)
+        self.assertNotIn(self.events[5].pk, dict(hits))
+
+
+class MatchAPITests(TestCase):
+
+    def setUp(self):
+        self.events = build_catalogue(6)
+
+    def test_ranked_page_with_scores(self):
+        response = self.client.get("/api/events/match/", {
+            "noise_level": "low", "crowd_level": "SMALL", "crowd_level_weight": "2", "page_size": 2,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["count"], 6)
+        self.assertIn("offset=2", body["next"])
+        self.assertEqual([item["id"] for item in body["results"]], [self.events[0].pk, self.events[3].pk])
+        self.assertEqual([item["match_score"] for item in body["results"]], [1, 1])
+        self.assertEqual(body["results"][0]["accessibility_profile"]["noise_level"]["code"], "LOW")
+
+    def test_live_recurring_event_is_ranked(self):
+        weekly = self.events[0]
+        start = timezone.now() - timedelta(days=3)
+        weekly.start_datetime, weekly.end_datetime = start, start + timedelta(hours=2)
+        weekly.recurrence = Event.Recurrence.WEEKLY
+        weekly.recurrence_until = (start + timedelta(days=60)).date()
+        weekly.save()
+        listed = [item["id"] for item in self.client.get("/api/events/").json()["results"]]
+
+        body = self.client.get("/api/events/match/", {"noise_level": "LOW"}).json()
+
+        self.assertIn(weekly.pk, listed)
+        self.assertEqual(body["count"], 6)
+        self.assertEqual(body["results"][0]["id"], weekly.pk)
+
+        weekly.recurrence_until = None
+        weekly.save()
+        self.assertEqual(matching.rank([("noise_level", "LOW", 1)], limit=1)[1][0][0], weekly.pk)
+
+    def test_access_requirements(self):
+        response = self.client.get("/api/events/match/", {"noise_level": "LOW", "wheelchair_access": "false"})
+
+        self.assertEqual(response.json()["count"], 3)
+
+    def test_invalid_preferences_rejected(self):
+        for params in (
+            {},
+            {"noise_level": "DEAFENING"},
+            {"noise_level": "LOW", "noise_level_weight": "11"},
+            {"noise_level": "LOW", "noise_level_weight": "0"},
+            {"noise_level": "LOW", "accessible_toilets": "maybe"},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get("/api/events/match/", params).status_code, 400)
@@ -0,0 +1,106 @@
+"""
+============================================================
+File Name: test_metrics.py
+Brief Description:
+Tests for the request metrics middleware, histograms and the
+/internal/metrics Prometheus endpoint.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Request metrics tests                               | user-019
+v1.1    | 2026-10-17 | Metrics allowlist is explicit, empty by default     | user-019
+============================================================
+"""
+
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from main import metrics
+from main.benchmarking import build_catalogue
+
+
+class HistogramTests(TestCase):
+
+    def test_cumulative_buckets(self):
+        histogram = metrics.Histogram((1, 5))
+        for value in (0, 1, 3, 9):
+            histogram.observe(value)
+
+        self.assertEqual(list(histogram.cumulative()), [(1, 2), (5, 3), ("+Inf", 4)])
+        self.assertEqual((histogram.count, histogram.sum), (4, 13))
+
+    def test_timer_excludes_database_time(self):
+        request = metrics.RequestMetrics()
+        token = metrics._current.set(request)
+        try:
+            with metrics.timer("render"):
+                request.db += 10
+        finally:
+            metrics._current.reset(token)
+
+        self.assertLess(request.render, 0.1)
+
+
+class RequestMetricsTests(TestCase):
+
+    def setUp(self):
+        build_catalogue(3)
+        metrics.registry.reset()
+        self.addCleanup(metrics.registry.reset)
+
+    @override_settings(EVENT_METRICS_HEADER=True)
+    def test_debug_headers(self):
+        response = self.client.get("/api/events/")
+
+        self.assertGreater(int(response["X-Query-Count"]), 0)
+        self.assertRegex(response["Server-Timing"], r"^db;dur=[\d.]+, serializer;dur=[\d.]+, render;dur=[\d.]+, total;dur=[\d.]+$")
+
+    def test_headers_off_by_default(self):
+        self.assertNotIn("Server-Timing", self.client.get("/api/events/"))
+
+    @override_settings(EVENT_METRICS_LOG=True)
+    def test_structured_log_line(self):
+        with self.assertLogs("main.metrics", "INFO") as logs:
+            self.client.get("/events/")
+
+        line = json.loads(logs.records[0].getMessage())
+        self.assertEqual(line["view"], "main:event_list")
+        self.assertEqual(line["status"], 200)
+        self.assertGreater(line["queries"], 0)
+        self.assertGreater(line["render_ms"], 0)
+
+    @override_settings(EVENT_METRICS_ALLOWED_IPS=["127.0.0.1"])
+    def test_prometheus_histograms_per_view(self):
+        for _ in range(2):
+            self.client.get("/api/events/")
+        self.client.get(f"/api/events/{build_catalogue(1, offset=10)[0].pk}/")
+
+        response = self.client.get("/internal/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        text = response.content.decode()
+        self.assertIn("# TYPE event_request_duration_seconds histogram", text)
+        self.assertIn('event_request_duration_seconds_count{view="main_api:events_list"} 2', text)
+        self.assertIn('event_request_queries_bucket{view="main_api:events_detail",le="+Inf"} 1', text)
+        self.assertIn('event_request_serializer_seconds_count{view="main_api:events_list"} 2', text)
+
+    def test_endpoint_restricted_to_allowed_ips_and_staff(self):
+        # Nothing is allowed by default, not even a local reverse proxy
+        self.assertEqual(self.client.get("/internal/metrics", REMOTE_ADDR="127.0.0.1").status_code, 403)
+        self.assertEqual(self.client.get("/internal/metrics", REMOTE_ADDR="203.0.113.9").status_code, 403)
+        with self.settings(EVENT_METRICS_ALLOWED_IPS=["10.0.0.5"]):
+            self.assertEqual(self.client.get("/internal/metrics", REMOTE_ADDR="10.0.0.5").status_code, 200)
+            self.assertEqual(self.client.get("/internal/metrics", REMOTE_ADDR="127.0.0.1").status_code, 403)
+
+        staff = get_user_model().objects.create_user("staff", password="pw", is_staff=True)
+        self.client.force_login(staff)
+        self.assertEqual(self.client.get("/internal/metrics", REMOTE_ADDR="203.0.113.9").status_code, 200)
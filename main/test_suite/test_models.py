@@ -71,10 +71,10 @@ class ModelFieldTests(TestCase):
         self.assert_field_is_instance(AccessibilityProfile, "wheelchair_access", models.BooleanField)
         self.assert_field_is_instance(AccessibilityProfile, "accessible_toilets", models.BooleanField)
         self.assert_field_is_instance(AccessibilityProfile, "quiet_space_available", models.BooleanField)
-        self.assert_field_is_instance(AccessibilityProfile, "noise_level", models.CharField)
-        self.assert_field_is_instance(AccessibilityProfile, "lighting_conditions", models.CharField)
-        self.assert_field_is_instance(AccessibilityProfile, "crowd_level", models.CharField)
-        self.assert_field_is_instance(AccessibilityProfile, "sensory_level", models.CharField)
+        self.assert_field_is_instance(AccessibilityProfile, "noise_level", models.ForeignKey)
+        self.assert_field_is_instance(AccessibilityProfile, "lighting_conditions", models.ForeignKey)
+        self.assert_field_is_instance(AccessibilityProfile, "crowd_level", models.ForeignKey)
+        self.assert_field_is_instance(AccessibilityProfile, "sensory_level", models.ForeignKey)
         self.assert_field_is_instance(AccessibilityProfile, "additional_notes", models.TextField)
 
     # ---- Event fields ----
@@ -112,7 +112,7 @@ class ModelFieldTests(TestCase):
     def test_event_field_types_basic(self):
         self.assert_field_is_instance(Event, "title", models.CharField)
         self.assert_field_is_instance(Event, "description", models.TextField)
-        self.assert_field_is_instance(Event, "category", models.CharField)
+        self.assert_field_is_instance(Event, "category", models.ForeignKey)
         self.assert_field_is_instance(Event, "start_datetime", models.DateTimeField)
         self.assert_field_is_instance(Event, "end_datetime", models.DateTimeField)
         self.assert_field_is_instance(Event, "location_text", models.CharField)
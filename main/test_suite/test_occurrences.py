@@ -0,0 +1,146 @@
+"""
+============================================================
+File Name: test_occurrences.py
+Brief Description:
+Tests for recurrence expansion, the EventOccurrence calendar
+table and the /api/events/occurrences/ endpoint.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Occurrence calendar tests                           | user-015
+v1.1    | 2026-10-17 | Inclusive to date, impossible dates                 | user-015
+v1.2    | 2026-10-17 | Out-of-range offsets are rejected                   | user-007
+============================================================
+"""
+
+import io
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from main import occurrences
+from main.models import Event, EventOccurrence
+from main.test_suite.model_factories import EventFactory
+
+LONDON = ZoneInfo("Europe/London")
+
+
+def rule(start, hours=2, recurrence="WEEKLY", interval=1, until=None):
+    return SimpleNamespace(
+        start_datetime=start, end_datetime=start + timedelta(hours=hours),
+        recurrence=recurrence, recurrence_interval=interval, recurrence_until=until,
+    )
+
+
+class ExpandTests(TestCase):
+
+    def test_interval_and_until(self):
+        start = datetime(2026, 1, 5, 10, tzinfo=LONDON)
+        starts = [s for s, _ in occurrences.expand(rule(start, interval=2, until=date(2026, 2, 16)), start, start + timedelta(days=365))]
+
+        self.assertEqual([s.date() for s in starts], [date(2026, 1, 5), date(2026, 1, 19), date(2026, 2, 2), date(2026, 2, 16)])
+
+    @override_settings(TIME_ZONE="Europe/London")
+    def test_local_time_kept_across_clock_change(self):
+        start = datetime(2026, 10, 15, 19, tzinfo=LONDON)
+        starts = [s for s, _ in occurrences.expand(rule(start), start, start + timedelta(days=21))]
+
+        self.assertEqual([s.astimezone(LONDON).hour for s in starts], [19, 19, 19])
+        utc = [s.astimezone(ZoneInfo("UTC")) for s in starts]
+        self.assertEqual(utc[2] - utc[1], timedelta(days=7, hours=1))
+
+    def test_monthly_skips_short_months(self):
+        start = datetime(2026, 1, 31, 12, tzinfo=LONDON)
+        starts = [s for s, _ in occurrences.expand(rule(start, recurrence="MONTHLY"), start, datetime(2026, 6, 1, tzinfo=LONDON))]
+
+        self.assertEqual([s.month for s in starts], [1, 3, 5])
+
+    def test_window_starts_part_way_through_series(self):
+        start = datetime(2020, 1, 1, 9, tzinfo=LONDON)
+        window = datetime(2026, 3, 10, tzinfo=LONDON)
+        found = list(occurrences.expand(rule(start, recurrence="DAILY"), window, window + timedelta(days=3)))
+
+        self.assertEqual([s.day for s, _ in found], [10, 11, 12])
+
+
+@override_settings(EVENT_OCCURRENCE_HORIZON_DAYS=28)
+class OccurrenceTableTests(TestCase):
+
+    def setUp(self):
+        self.start = timezone.now() + timedelta(hours=1)
+
+    def test_saving_events_materialises_occurrences(self):
+        weekly = EventFactory(status=Event.Status.PUBLISHED, recurrence=Event.Recurrence.WEEKLY, start_datetime=self.start)
+        one_off = EventFactory(status=Event.Status.PUBLISHED, start_datetime=timezone.now() + timedelta(days=90))
+        EventFactory(status=Event.Status.DRAFT, recurrence=Event.Recurrence.DAILY)
+
+        self.assertEqual(weekly.occurrences.count(), 4)
+        self.assertEqual(list(one_off.occurrences.values_list("start_datetime", flat=True)), [one_off.start_datetime])
+        self.assertEqual(EventOccurrence.objects.count(), 5)
+
+        weekly.status = Event.Status.CANCELLED
+        weekly.save()
+        self.assertFalse(weekly.occurrences.exists())
+
+    def test_refresh_drops_ended_and_extends_horizon(self):
+        weekly = EventFactory(status=Event.Status.PUBLISHED, recurrence=Event.Recurrence.WEEKLY, start_datetime=self.start)
+        before = list(weekly.occurrences.values_list("start_datetime", flat=True))
+
+        removed, added = occurrences.refresh(now=timezone.now() + timedelta(days=10))
+
+        after = list(weekly.occurrences.order_by("start_datetime").values_list("start_datetime", flat=True))
+        self.assertEqual((removed, added), (2, 2))
+        self.assertEqual(after[:2], before[2:])
+        self.assertEqual(after[-1], before[-1] + timedelta(days=14))
+
+    def test_rebuild_command(self):
+        EventFactory(status=Event.Status.PUBLISHED, recurrence=Event.Recurrence.DAILY, recurrence_interval=7,
+                     start_datetime=self.start)
+        EventOccurrence.objects.all().delete()
+        call_command("refresh_occurrences", "--rebuild", stdout=io.StringIO())
+
+        self.assertEqual(EventOccurrence.objects.count(), 4)
+
+
+class EventOccurrencesAPITests(TestCase):
+
+    url = reverse("main_api:events_occurrences")
+
+    def test_weekend_window_lists_occurrences_in_order(self):
+        monday = timezone.make_aware(datetime.combine(timezone.localdate() + timedelta(days=7 - timezone.localdate().weekday()), datetime.min.time()))
+        saturday = monday + timedelta(days=5)
+        daily = EventFactory(status=Event.Status.PUBLISHED, recurrence=Event.Recurrence.DAILY,
+                             start_datetime=monday + timedelta(hours=10), end_datetime=monday + timedelta(hours=11))
+        one_off = EventFactory(status=Event.Status.PUBLISHED, start_datetime=saturday + timedelta(hours=12),
+                               end_datetime=saturday + timedelta(hours=14))
+
+        # A to date covers its whole day: Saturday through Sunday
+        body = self.client.get(self.url, {"from": saturday.date().isoformat(), "to": (saturday + timedelta(days=1)).date().isoformat()}).json()
+
+        self.assertEqual(
+            [(item["event"]["id"], item["start_datetime"][:13]) for item in body["results"]],
+            [
+                (daily.pk, (saturday + timedelta(hours=10)).isoformat()[:13]),
+                (one_off.pk, (saturday + timedelta(hours=12)).isoformat()[:13]),
+                (daily.pk, (saturday + timedelta(days=1, hours=10)).isoformat()[:13]),
+            ],
+        )
+        self.assertEqual(body["results"][0]["event"]["recurrence"], "DAILY")
+
+    def test_invalid_window_is_rejected(self):
+        self.assertEqual(self.client.get(self.url, {"from": "2026-05-02", "to": "2026-05-01"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"from": "soon"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"from": "2026-02-30"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"to": "2026-13-01T10:00"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"offset": "99999999999999999999999"}).status_code, 400)
@@ -0,0 +1,132 @@
+"""
+============================================================
+File Name: test_page_cache.py
+Brief Description:
+Tests for the versioned HTML page cache on the event list and
+detail pages, its invalidation and hit / miss counters.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Page cache tests                                    | user-010
+v1.1    | 2026-10-17 | Keep the reference cache alias                      | user-003
+v1.2    | 2026-10-17 | Shared pages need a shared version                  | user-010
+============================================================
+"""
+
+import tempfile
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from main import page_cache
+from main.lookup_cache import get_reference_data
+from main.benchmarking import build_catalogue
+
+
+class PageCacheTests(TestCase):
+
+    def setUp(self):
+        page_cache.page_cache().clear()
+        page_cache.stats.reset()
+        self.first, self.second = build_catalogue(2)
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_detail_hit_skips_rendering(self):
+        url = f"/events/{self.first.pk}/"
+        miss = self.get(url)
+        self.assertEqual(miss["X-Cache"], "MISS")
+
+        get_reference_data()
+        with CaptureQueriesContext(connection) as ctx:
+            hit = self.get(url)
+        self.assertEqual(hit["X-Cache"], "HIT")
+        self.assertEqual(hit.content, miss.content)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_event_edit_invalidates_only_its_page(self):
+        self.get(f"/events/{self.first.pk}/")
+        self.get(f"/events/{self.second.pk}/")
+
+        self.first.title = "Renamed pottery session"
+        self.first.save()
+
+        response = self.get(f"/events/{self.first.pk}/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertContains(response, "Renamed pottery session")
+        self.assertEqual(self.get(f"/events/{self.second.pk}/")["X-Cache"], "HIT")
+
+    def test_profile_edit_invalidates_detail_and_list(self):
+        self.get(f"/events/{self.first.pk}/")
+        self.get("/events/")
+
+        profile = self.first.accessibility_profile
+        profile.additional_notes = "Portable ramp available"
+        profile.save()
+
+        self.assertContains(self.get(f"/events/{self.first.pk}/"), "Portable ramp available")
+        self.assertEqual(self.get("/events/")["X-Cache"], "MISS")
+
+    def test_new_event_invalidates_list(self):
+        self.get("/events/")
+        self.assertEqual(self.get("/events/")["X-Cache"], "HIT")
+
+        build_catalogue(1, offset=50)
+        self.assertEqual(self.get("/events/")["X-Cache"], "MISS")
+
+    def test_lookup_change_invalidates_pages(self):
+        url = f"/events/{self.first.pk}/"
+        self.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            category = self.first.category
+            category.label = "Relabelled category"
+            category.save()
+
+        response = self.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertContains(response, "Relabelled category")
+
+    def test_authenticated_requests_bypass_cache(self):
+        self.client.force_login(User.objects.create_user("member", password="x"))
+        self.assertNotIn("X-Cache", self.get("/events/"))
+
+    def test_counters_and_stats_endpoint(self):
+        self.get("/events/")
+        self.get("/events/")
+        self.get(f"/events/{self.first.pk}/")
+
+        self.assertEqual(self.client.get("/internal/page-cache/").status_code, 302)
+
+        self.client.force_login(User.objects.create_user("staff", password="x", is_staff=True))
+        stats = self.client.get("/internal/page-cache/").json()
+        self.assertEqual(stats["list"], {"hits": 1, "misses": 1, "hit_rate": 0.5})
+        self.assertEqual(stats["detail"]["misses"], 1)
+        self.assertEqual(stats["total"]["hits"], 1)
+
+    def test_file_based_backend(self):
+        with tempfile.TemporaryDirectory() as location:
+            backend = "django.core.cache.backends.filebased.FileBasedCache"
+            pages = {"BACKEND": backend, "LOCATION": f"{location}/pages"}
+            with override_settings(CACHES={**settings.CACHES, "pages": pages}):
+                with self.assertRaises(ImproperlyConfigured):
+                    page_cache.check_shared_version()
+
+            shared = {**settings.CACHES, "pages": pages, "reference": {"BACKEND": backend, "LOCATION": f"{location}/reference"}}
+            with override_settings(CACHES=shared):
+                page_cache.check_shared_version()
+                self.assertEqual(self.get("/events/")["X-Cache"], "MISS")
+                self.assertEqual(self.get("/events/")["X-Cache"], "HIT")
@@ -0,0 +1,107 @@
+"""
+============================================================
+File Name: test_pagination.py
+Brief Description:
+Tests for keyset (cursor) pagination of the event list API
+and HTML event list.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Cursor pagination tests                             | user-002
+v1.1    | 2026-10-17 | Out-of-range cursor ids                             | user-002
+============================================================
+"""
+
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIClient
+
+from main.models import Event
+from main.pagination import encode_cursor
+from main.benchmarking import build_catalogue
+from main.test_suite.model_factories import EventFactory
+
+
+@override_settings(EVENT_PAGE_SIZE=5, EVENT_MAX_PAGE_SIZE=8)
+class EventCursorPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.events = build_catalogue(12)
+
+    def get_page(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_first_page_uses_default_page_size(self):
+        data = self.get_page("/api/events/")
+        self.assertEqual(len(data["results"]), 5)
+        self.assertIsNone(data["previous"])
+        self.assertIsNotNone(data["next"])
+
+    def test_following_next_links_visits_every_event_once(self):
+        seen, url = [], "/api/events/"
+        while url:
+            data = self.get_page(url)
+            seen.extend(e["id"] for e in data["results"])
+            url = data["next"]
+        self.assertEqual(seen, [e.pk for e in self.events])
+
+    def test_previous_link_returns_prior_page(self):
+        first = self.get_page("/api/events/")
+        second = self.get_page(first["next"])
+        back = self.get_page(second["previous"])
+        self.assertEqual(back["results"], first["results"])
+        self.assertIsNone(back["previous"])
+
+    def test_page_size_is_capped(self):
+        data = self.get_page("/api/events/?page_size=500")
+        self.assertEqual(len(data["results"]), 8)
+
+    def test_ties_on_start_datetime_are_ordered_by_id(self):
+        Event.objects.update(start_datetime=self.events[0].start_datetime)
+        data = self.get_page("/api/events/?page_size=5")
+        data = self.get_page(data["next"])
+        self.assertEqual([e["id"] for e in data["results"]], [e.pk for e in self.events[5:10]])
+
+    def test_cursor_is_stable_under_concurrent_inserts(self):
+        first = self.get_page("/api/events/")
+
+        # An event inserted before the cursor must not shift the next page
+        EventFactory(status="PUBLISHED", start_datetime=self.events[0].start_datetime - timedelta(days=1))
+
+        second = self.get_page(first["next"])
+        self.assertEqual([e["id"] for e in second["results"]], [e.pk for e in self.events[5:10]])
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get("/api/events/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 404)
+
+    def test_out_of_range_cursor_id_returns_404(self):
+        start = self.events[0].start_datetime
+        for pk in (99999999999999999999999, 0, -1):
+            cursor = encode_cursor((start, pk))
+            for url in ("/api/events/", "/api/async/events/", "/events/"):
+                with self.subTest(pk=pk, url=url):
+                    self.assertEqual(self.client.get(f"{url}?cursor={cursor}").status_code, 404)
+
+    def test_html_list_is_paginated(self):
+        response = self.client.get("/events/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["events"]), 5)
+        self.assertContains(response, 'rel="next"')
+
+        next_url = response.context["page_obj"].next_url
+        response = self.client.get(next_url)
+        self.assertEqual(
+            [e.pk for e in response.context["events"]],
+            [e.pk for e in self.events[5:10]],
+        )
@@ -0,0 +1,74 @@
+"""
+============================================================
+File Name: test_query_counts.py
+Brief Description:
+Regression tests ensuring event list and detail views run a
+constant number of SQL queries regardless of catalogue size.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Flat query count for list/detail views              | user-001
+v1.1    | 2026-10-17 | Lookup options come from the reference cache        | user-003
+============================================================
+"""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+
+from main.lookup_cache import get_reference_data
+from main.query_plans import build_query_plan
+from main.serializers import EventSerializer
+from main.benchmarking import build_catalogue
+
+
+class QueryPlanTests(TestCase):
+    def test_plan_joins_every_nested_relation(self):
+        # Lookup options are resolved from the reference cache, not joined
+        plan = build_query_plan(EventSerializer)
+        self.assertEqual(plan.select_related, ("accessibility_profile",))
+        self.assertEqual(plan.prefetch_related, ())
+
+
+class QueryCountTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    # Count the queries issued by a GET request (reference-data cache warm)
+    def count_queries(self, url):
+        get_reference_data()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_api_list_query_count_is_flat(self):
+        build_catalogue(10)
+        small = self.count_queries("/api/events/")
+
+        build_catalogue(9990)
+        large = self.count_queries("/api/events/")
+
+        self.assertEqual(small, large)
+
+    def test_html_list_query_count_is_flat(self):
+        build_catalogue(10)
+        small = self.count_queries("/events/")
+
+        build_catalogue(990)
+        large = self.count_queries("/events/")
+
+        self.assertEqual(small, large)
+
+    def test_detail_views_use_single_query(self):
+        event = build_catalogue(1)[0]
+        self.assertEqual(self.count_queries(f"/api/events/{event.pk}/"), 1)
+        self.assertEqual(self.count_queries(f"/events/{event.pk}/"), 1)
@@ -0,0 +1,166 @@
+"""
+============================================================
+File Name: test_search.py
+Brief Description:
+Tests for ranked full-text event search, index maintenance
+and the /api/events/search/ endpoint.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Full-text search tests                              | user-007
+v1.1    | 2026-10-17 | Unsupported databases, admin search cap             | user-007
+v1.2    | 2026-10-17 | Out-of-range offsets are rejected                   | user-007
+============================================================
+"""
+
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from main import admin as main_admin, search
+from main.search import search_events
+from main.test_suite.model_factories import EventFactory
+
+
+def ids(hits):
+    return [event_id for event_id, _ in hits]
+
+
+class SearchIndexTests(TestCase):
+
+    def test_title_match_ranks_above_description_match(self):
+        in_description = EventFactory(status="PUBLISHED", title="Afternoon meetup", description="Bring pottery tools")
+        in_title = EventFactory(status="PUBLISHED", title="Pottery taster", description="Clay and wheels")
+        EventFactory(status="PUBLISHED", title="Chess club", description="Bring a board")
+
+        self.assertEqual(ids(search_events("pottery")), [in_title.pk, in_description.pk])
+
+    def test_accessibility_notes_and_prefix_match(self):
+        event = EventFactory(status="PUBLISHED", title="Film night")
+        event.accessibility_profile.additional_notes = "Hearing loop installed"
+        event.accessibility_profile.save()
+
+        self.assertEqual(ids(search_events("hearing lo")), [event.pk])
+
+    def test_drafts_only_returned_when_requested(self):
+        draft = EventFactory(status="DRAFT", title="Secret rehearsal")
+        self.assertEqual(search_events("rehearsal"), [])
+        self.assertEqual(ids(search_events("rehearsal", published_only=False)), [draft.pk])
+
+    def test_updates_and_deletes_are_reflected(self):
+        event = EventFactory(status="PUBLISHED", title="Yoga morning")
+        event.title = "Pilates morning"
+        event.save()
+        self.assertEqual(search_events("yoga"), [])
+        self.assertEqual(ids(search_events("pilates")), [event.pk])
+
+        event.delete()
+        self.assertEqual(search_events("pilates", published_only=False), [])
+
+    def test_query_syntax_is_treated_as_text(self):
+        event = EventFactory(status="PUBLISHED", title="Choir practice")
+        for text in ('choir"', '"choir', "(choir)", "choir:", "choir*", "-choir", "^choir"):
+            self.assertEqual(ids(search_events(text)), [event.pk], text)
+        self.assertEqual(search_events("!!!"), [])
+
+    def test_rebuild_command(self):
+        event = EventFactory(status="PUBLISHED", title="Gardening club")
+        out = StringIO()
+        call_command("rebuild_search_index", stdout=out)
+        self.assertIn("Indexed 1 events", out.getvalue())
+        self.assertEqual(ids(search_events("gardening")), [event.pk])
+
+
+class SearchAPITests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("main_api:events_search")
+
+    def test_returns_ranked_serialized_events(self):
+        first = EventFactory(status="PUBLISHED", title="Dance workshop", description="Relaxed dance")
+        second = EventFactory(status="PUBLISHED", title="Open day", description="Includes a dance taster")
+
+        response = self.client.get(self.url, {"q": "dance"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["id"] for item in response.data["results"]], [first.pk, second.pk])
+        self.assertEqual(response.data["results"][0]["title"], "Dance workshop")
+
+    def test_page_size_and_next_link(self):
+        for i in range(3):
+            EventFactory(status="PUBLISHED", title=f"Baking class {i}")
+
+        response = self.client.get(self.url, {"q": "baking", "page_size": 2})
+
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIn("offset=2", response.data["next"])
+
+    def test_missing_query_is_rejected(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+
+    def test_out_of_range_offset_is_rejected(self):
+        for url in (self.url, "/api/async/events/search/"):
+            with self.subTest(url=url):
+                response = self.client.get(url, {"q": "a", "offset": "99999999999999999999999"})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("offset", response.json())
+
+
+# A database vendor with no full-text backend
+class UnsupportedDatabaseTests(TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.dict(search.BACKENDS, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_events_save_without_an_index(self):
+        event = EventFactory(status="PUBLISHED", title="Knitting circle")
+        event.title = "Crochet circle"
+        event.save()
+        event.delete()
+
+    def test_search_endpoint_is_not_implemented(self):
+        for url in (reverse("main_api:events_search"), "/api/async/events/search/"):
+            with self.subTest(url=url):
+                self.assertEqual(APIClient().get(url, {"q": "knitting"}).status_code, 501)
+
+    def test_rebuild_command_fails(self):
+        with self.assertRaises(CommandError):
+            call_command("rebuild_search_index", stdout=StringIO())
+
+    def test_admin_falls_back_to_default_search(self):
+        event = EventFactory(status="DRAFT", title="Knitting circle")
+        self.client.force_login(User.objects.create_superuser("admin", password="x"))
+        response = self.client.get("/admin/main/event/", {"q": "knitting"})
+        self.assertEqual([e.pk for e in response.context["cl"].result_list], [event.pk])
+
+
+class AdminSearchTests(TestCase):
+
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser("admin", password="x"))
+
+    @mock.patch.object(main_admin, "ADMIN_SEARCH_LIMIT", 2)
+    def test_capped_results_show_a_warning(self):
+        for i in range(3):
+            EventFactory(status="DRAFT", title=f"Quiz night {i}")
+
+        response = self.client.get("/admin/main/event/", {"q": "quiz"})
+
+        self.assertEqual(len(response.context["cl"].result_list), 2)
+        self.assertIn("Showing the best 2 matches", [str(m) for m in response.context["messages"]][0])
+        response = self.client.get("/admin/main/event/", {"q": "quiz 1"})
+        self.assertEqual(list(response.context["messages"]), [])
@@ -0,0 +1,81 @@
+"""
+============================================================
+File Name: test_search_documents.py
+Brief Description:
+Tests for incremental and bulk maintenance of the flat
+EventSearchDocument read model.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.0
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Search document maintenance tests                   | user-006
+============================================================
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from main.models import Event, EventSearchDocument
+from main.benchmarking import build_catalogue
+from main.test_suite.model_factories import EventFactory
+
+
+class SearchDocumentTests(TestCase):
+
+    def test_published_event_save_creates_document(self):
+        event = EventFactory(status="PUBLISHED")
+        document = EventSearchDocument.objects.get(pk=event.pk)
+
+        profile = event.accessibility_profile
+        self.assertEqual(document.category_code, event.category.code)
+        self.assertEqual(document.noise_level_code, profile.noise_level.code)
+        self.assertEqual(document.noise_level_rank, profile.noise_level.display_order)
+        self.assertEqual(document.wheelchair_access, profile.wheelchair_access)
+
+    def test_draft_event_has_no_document(self):
+        event = EventFactory(status="DRAFT")
+        self.assertFalse(EventSearchDocument.objects.filter(pk=event.pk).exists())
+
+    def test_unpublishing_removes_document(self):
+        event = EventFactory(status="PUBLISHED")
+        event.status = Event.Status.CANCELLED
+        event.save()
+        self.assertFalse(EventSearchDocument.objects.filter(pk=event.pk).exists())
+
+    def test_profile_save_updates_document(self):
+        event = EventFactory(status="PUBLISHED")
+        profile = event.accessibility_profile
+        profile.quiet_space_available = None
+        profile.save()
+        self.assertIsNone(EventSearchDocument.objects.get(pk=event.pk).quiet_space_available)
+
+    def test_lookup_option_change_updates_documents(self):
+        event = build_catalogue(1)[0]
+        option = event.accessibility_profile.noise_level
+        option.display_order = 9
+        option.save()
+        self.assertEqual(EventSearchDocument.objects.get(pk=event.pk).noise_level_rank, 9)
+
+    def test_event_delete_removes_document(self):
+        event = EventFactory(status="PUBLISHED")
+        event.accessibility_profile.delete()
+        self.assertFalse(EventSearchDocument.objects.filter(pk=event.pk).exists())
+
+    def test_rebuild_command(self):
+        events = build_catalogue(5)
+        Event.objects.filter(pk=events[0].pk).update(status="DRAFT")
+        EventSearchDocument.objects.filter(pk=events[1].pk).delete()
+
+        call_command("rebuild_search_documents", batch_size=2, stdout=StringIO())
+
+        self.assertEqual(
+            sorted(EventSearchDocument.objects.values_list("pk", flat=True)),
+            [e.pk for e in events[1:]],
+        )
@@ -0,0 +1,126 @@
+"""
+============================================================
+File Name: test_snapshot.py
+Brief Description:
+Tests for the in-memory event snapshot (snapshot.py): the
+event list served from it matches the database path, needs no
+queries once loaded and follows event changes incrementally.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | In-memory snapshot tests                            | user-018
+v1.1    | 2026-10-17 | Catch-up also reads the catalogue removal time      | user-009
+v1.2    | 2026-10-17 | happening=now parity without validators             | user-016
+============================================================
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from main import snapshot
+from main.filters import parse_event_filters
+from main.models import Event
+from main.benchmarking import build_catalogue
+
+
+@override_settings(EVENT_SNAPSHOT=True)
+class SnapshotListTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.events = build_catalogue(20)
+        for i, event in enumerate(self.events[:6]):
+            event.age_min, event.age_max = (None, 5 + i) if i % 2 else (i, None)
+            event.price = Decimal(f"{i * 2}.50") if i % 3 else None
+            event.booking_required = i % 2 == 0
+            event.save()
+        snapshot.reset()
+        self.addCleanup(snapshot.reset)
+
+    def get(self, url, use_snapshot):
+        with self.settings(EVENT_SNAPSHOT=use_snapshot):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response
+
+    def test_matches_database_path(self):
+        window_start = (self.events[4].start_datetime + timedelta(minutes=30)).isoformat()
+        window_end = (self.events[9].start_datetime).isoformat()
+        for query in (
+            "",
+            "page_size=100&wheelchair_access=true",
+            "page_size=100&accessible_toilets=unknown&max_noise_level=MEDIUM",
+            "page_size=100&lighting_conditions=DIM,STANDARD&category=ARTS,SPORTS",
+            "page_size=100&age=7&max_price=5",
+            f"page_size=100&starts_after={self.events[3].start_datetime.date()}",
+            f"page_size=100&from={window_start}&to={window_end}",
+            "page_size=100&happening=now&facets=false",
+        ):
+            with self.subTest(query=query):
+                url = f"/api/events/?{query}".replace("+", "%2B")
+                database, memory = self.get(url, False), self.get(url, True)
+                self.assertEqual(memory.json(), database.json())
+                self.assertEqual(memory.get("ETag"), database.get("ETag"))
+                self.assertEqual(memory.get("Cache-Control"), database.get("Cache-Control"))
+
+    def test_cursor_pages_match(self):
+        pages = {}
+        for use_snapshot in (False, True):
+            url, seen = "/api/events/?page_size=6&facets=false", []
+            while url:
+                body = self.get(url, use_snapshot).json()
+                seen.append([item["id"] for item in body["results"]])
+                url = body["next"]
+            seen.append([item["id"] for item in self.get(body["previous"], use_snapshot).json()["results"]])
+            pages[use_snapshot] = seen
+
+        self.assertEqual(pages[True], pages[False])
+        self.assertEqual(pages[True][-1], [event.pk for event in self.events[12:18]])
+
+    def test_served_without_queries_once_loaded(self):
+        self.client.get("/api/events/")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/events/?wheelchair_access=true&cursor=")
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_follows_changes_incrementally(self):
+        before = snapshot.get_snapshot()
+        renamed, unpublished, deleted = self.events[0], self.events[1], self.events[2]
+        renamed.title = "Renamed"
+        renamed.save()
+        unpublished.status = Event.Status.DRAFT
+        unpublished.save()
+        deleted_pk = deleted.pk
+        deleted.delete()
+        added = build_catalogue(1, offset=100)[0]
+
+        # Change log (oldest, page), removal time, changed events
+        with self.assertNumQueries(4):
+            current = snapshot.get_snapshot()
+
+        self.assertEqual(len(current), 19)
+        # Freed slots are reused rather than growing the columns
+        self.assertEqual(len(current.live), len(before.live))
+        self.assertEqual(len(before), 20)
+        ids = {row["id"]: row for row in current.select(parse_event_filters({})).keyset_slice(None, False, 100)}
+        self.assertEqual(ids[renamed.pk]["title"], "Renamed")
+        self.assertNotIn(unpublished.pk, ids)
+        self.assertNotIn(deleted_pk, ids)
+        self.assertIn(added.pk, ids)
+
+    def test_memory_usage(self):
+        usage = snapshot.get_snapshot().memory_usage()
+
+        self.assertEqual(usage["events"], 20)
+        self.assertGreater(usage["bytes_per_event"], usage["array_bytes"] // 20)
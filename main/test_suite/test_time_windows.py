@@ -0,0 +1,185 @@
+"""
+============================================================
+File Name: test_time_windows.py
+Brief Description:
+Tests for the EventDay time-window bucket index and the
+from / to / happening=now event list filters.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Time-window index + filter tests                    | user-016
+v1.1    | 2026-10-17 | happening=now is never answered 304                 | user-016
+v1.2    | 2026-10-17 | Recurring events match any occurrence               | user-016
+============================================================
+"""
+
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from main import snapshot, time_windows
+from main.models import Event, EventDay
+from main.time_windows import event_days
+from main.test_suite.model_factories import EventFactory
+
+
+def at(day, hour=0):
+    return timezone.make_aware(datetime(2030, 6, day, hour))
+
+
+class EventDaysTests(TestCase):
+
+    def test_days_spanned(self):
+        self.assertEqual(event_days(at(1, 22), at(3, 1)), [date(2030, 6, 1), date(2030, 6, 2), date(2030, 6, 3)])
+        # Ending at midnight does not touch the next day
+        self.assertEqual(event_days(at(1, 10), at(2)), [date(2030, 6, 1)])
+        self.assertEqual(event_days(at(1), at(1) + timedelta(days=60)), [None])
+
+    def test_rows_follow_event_changes(self):
+        event = EventFactory(status=Event.Status.PUBLISHED, start_datetime=at(1, 10), end_datetime=at(2, 12))
+        self.assertEqual(sorted(event.days.values_list("day", flat=True)), [date(2030, 6, 1), date(2030, 6, 2)])
+
+        event.start_datetime, event.end_datetime = at(5, 10), at(5, 12)
+        event.save()
+        self.assertEqual(list(event.days.values_list("day", flat=True)), [date(2030, 6, 5)])
+
+        event.status = Event.Status.DRAFT
+        event.save()
+        self.assertFalse(EventDay.objects.exists())
+
+
+class TimeWindowFilterTests(TestCase):
+
+    def setUp(self):
+        published = dict(status=Event.Status.PUBLISHED)
+        self.before = EventFactory(start_datetime=at(1, 9), end_datetime=at(1, 11), **published)
+        self.overnight = EventFactory(start_datetime=at(9, 20), end_datetime=at(10, 2), **published)
+        self.inside = EventFactory(start_datetime=at(10, 14), end_datetime=at(10, 16), **published)
+        self.season = EventFactory(start_datetime=at(1), end_datetime=at(1) + timedelta(days=90), **published)
+        self.after = EventFactory(start_datetime=at(12, 9), end_datetime=at(12, 11), **published)
+
+    def ids(self, **params):
+        response = self.client.get("/api/events/", {"facets": "false", **params})
+        self.assertEqual(response.status_code, 200)
+        return {item["id"] for item in response.json()["results"]}
+
+    def test_window_returns_overlapping_events(self):
+        found = self.ids(**{"from": at(10).isoformat(), "to": at(11).isoformat()})
+
+        self.assertEqual(found, {self.overnight.pk, self.inside.pk, self.season.pk})
+
+    def test_date_window_includes_whole_last_day(self):
+        self.assertEqual(
+            self.ids(**{"from": "2030-06-11", "to": "2030-06-12"}),
+            {self.after.pk, self.season.pk},
+        )
+
+    def test_open_ended_windows(self):
+        self.assertEqual(self.ids(**{"from": at(11).isoformat()}), {self.after.pk, self.season.pk})
+        self.assertEqual(self.ids(to=at(2).isoformat()), {self.before.pk, self.season.pk})
+
+    def test_happening_now(self):
+        current = EventFactory(
+            status=Event.Status.PUBLISHED,
+            start_datetime=timezone.now() - timedelta(hours=1),
+            end_datetime=timezone.now() + timedelta(hours=1),
+        )
+
+        self.assertEqual(self.ids(happening="now"), {current.pk})
+
+    def test_happening_now_is_revalidated_as_time_passes(self):
+        now = timezone.now()
+        current = EventFactory(
+            status=Event.Status.PUBLISHED,
+            start_datetime=now - timedelta(hours=1),
+            end_datetime=now + timedelta(hours=1),
+        )
+        upcoming = EventFactory(
+            status=Event.Status.PUBLISHED,
+            start_datetime=now + timedelta(hours=2),
+            end_datetime=now + timedelta(hours=4),
+        )
+        for url in ("/api/events/", "/api/async/events/"):
+            with self.subTest(url=url):
+                first = self.client.get(url, {"happening": "now"})
+                self.assertEqual([item["id"] for item in first.json()["results"]], [current.pk])
+                self.assertNotIn("ETag", first)
+                self.assertIn("no-cache", first["Cache-Control"])
+
+                # Nothing was saved, but one event has ended and the other started
+                with mock.patch("django.utils.timezone.now", return_value=now + timedelta(hours=3)):
+                    response = self.client.get(
+                        url, {"happening": "now"}, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT"
+                    )
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual([item["id"] for item in response.json()["results"]], [upcoming.pk])
+
+    def test_invalid_windows_are_rejected(self):
+        self.assertEqual(self.client.get("/api/events/", {"from": "2030-06-05", "to": "2030-06-01"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/events/", {"happening": "later"}).status_code, 400)
+
+
+class RecurringWindowTests(TestCase):
+
+    def setUp(self):
+        self.now = timezone.now()
+        # First occurrence yesterday, repeating every day
+        first = self.now - timedelta(days=1, hours=1)
+        self.daily = EventFactory(
+            status=Event.Status.PUBLISHED, start_datetime=first, end_datetime=first + timedelta(hours=2),
+            recurrence=Event.Recurrence.DAILY,
+        )
+        self.ending = EventFactory(
+            status=Event.Status.PUBLISHED, start_datetime=first, end_datetime=first + timedelta(hours=2),
+            recurrence=Event.Recurrence.DAILY, recurrence_until=timezone.localdate(self.now),
+        )
+        self.past = EventFactory(status=Event.Status.PUBLISHED, start_datetime=first, end_datetime=first + timedelta(hours=2))
+        snapshot.reset()
+        self.addCleanup(snapshot.reset)
+
+    # Repeats keep their local time across clock changes
+    def days_later(self, days):
+        return timezone.make_aware(timezone.make_naive(self.now) + timedelta(days=days))
+
+    def ids(self, use_snapshot, **params):
+        with self.settings(EVENT_SNAPSHOT=use_snapshot):
+            response = self.client.get("/api/events/", {"facets": "false", **params})
+        self.assertEqual(response.status_code, 200)
+        return {item["id"] for item in response.json()["results"]}
+
+    def test_windows_match_later_occurrences(self):
+        later = self.days_later(2)
+        cases = (
+            ({"happening": "now"}, {self.daily.pk, self.ending.pk}),
+            ({"from": (later - timedelta(minutes=30)).isoformat(), "to": later.isoformat()}, {self.daily.pk}),
+            # Between two occurrences
+            ({"from": (later + timedelta(hours=2)).isoformat(), "to": (later + timedelta(hours=3)).isoformat()}, set()),
+            ({"from": later.isoformat()}, {self.daily.pk}),
+        )
+        for use_snapshot in (False, True):
+            for params, expected in cases:
+                with self.subTest(snapshot=use_snapshot, **params):
+                    self.assertEqual(self.ids(use_snapshot, **params), expected)
+
+    @override_settings(EVENT_OCCURRENCE_HORIZON_DAYS=3)
+    def test_refresh_extends_buckets_to_the_horizon(self):
+        event = EventFactory(
+            status=Event.Status.PUBLISHED, start_datetime=self.now, end_datetime=self.now + timedelta(hours=2),
+            recurrence=Event.Recurrence.DAILY,
+        )
+        starts = lambda: set(event.days.values_list("start_datetime", flat=True))
+        self.assertEqual(starts(), {self.days_later(n) for n in range(4)})
+
+        later = self.now + timedelta(days=2, hours=12)
+        self.assertGreater(time_windows.refresh(later), 0)
+        self.assertEqual(starts(), {self.days_later(n) for n in range(6)})
+        self.assertEqual(time_windows.refresh(later), 0)
@@ -0,0 +1,215 @@
+"""
+============================================================
+File Name: test_upcoming_events.py
+Brief Description:
+Tests for the UpcomingEvent working set: maintenance alongside
+the search documents, the scheduled refresh, and the upcoming
+event list with its validators.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.2
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                                  | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Upcoming events table + list tests                  | user-024
+v1.1    | 2026-10-17 | Recurring events listed until their last occurrence | user-024
+v1.2    | 2026-10-17 | Nearby and search skip ended events                 | user-024
+============================================================
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from main import occurrences, snapshot
+from main.models import Event, EventOccurrence, EventSearchDocument, UpcomingEvent
+from main.search import search_events
+from main.search_documents import refresh_upcoming
+from main.benchmarking import build_catalogue
+
+
+# Move an event's end into the past in every table, as time passing would
+def end_event(event, ago=timedelta(hours=1)):
+    end = timezone.now() - ago
+    Event.objects.filter(pk=event.pk).update(start_datetime=end - timedelta(hours=2), end_datetime=end)
+    for model in (EventSearchDocument, UpcomingEvent):
+        model.objects.filter(pk=event.pk).update(start_datetime=end - timedelta(hours=2), end_datetime=end, live_until=end)
+
+
+class UpcomingEventTests(TestCase):
+
+    def setUp(self):
+        self.events = build_catalogue(4)
+
+    def test_follows_search_documents(self):
+        event = self.events[0]
+        upcoming = UpcomingEvent.objects.get(pk=event.pk)
+        self.assertEqual(upcoming.updated_at, EventSearchDocument.objects.get(pk=event.pk).updated_at)
+
+        event.end_datetime = timezone.now() - timedelta(minutes=1)
+        event.start_datetime = event.end_datetime - timedelta(hours=1)
+        event.save()
+        self.assertFalse(UpcomingEvent.objects.filter(pk=event.pk).exists())
+        self.assertTrue(EventSearchDocument.objects.filter(pk=event.pk).exists())
+
+        self.events[1].status = Event.Status.DRAFT
+        self.events[1].save()
+        self.assertEqual(UpcomingEvent.objects.count(), 2)
+
+    def test_refresh_archives_ended_and_restores_missing(self):
+        UpcomingEvent.objects.filter(pk=self.events[3].pk).delete()
+
+        added, archived = refresh_upcoming(now=self.events[1].end_datetime)
+
+        self.assertEqual((added, archived), (1, 2))
+        self.assertEqual(
+            sorted(UpcomingEvent.objects.values_list("pk", flat=True)), [e.pk for e in self.events[2:]]
+        )
+        self.assertEqual(EventSearchDocument.objects.count(), 4)
+        restored = UpcomingEvent.objects.get(pk=self.events[3].pk)
+        self.assertEqual(restored.updated_at, EventSearchDocument.objects.get(pk=self.events[3].pk).updated_at)
+
+    def test_refresh_command(self):
+        end_event(self.events[0])
+        out = StringIO()
+        call_command("refresh_upcoming_events", stdout=out)
+        self.assertIn("Archived 1 ended events, added 0", out.getvalue())
+
+    def test_rebuild_refills_upcoming(self):
+        end_event(self.events[0])
+        UpcomingEvent.objects.all().delete()
+        call_command("rebuild_search_documents", stdout=StringIO())
+        self.assertEqual(
+            sorted(UpcomingEvent.objects.values_list("pk", flat=True)), [e.pk for e in self.events[1:]]
+        )
+
+    def test_recurring_events_live_until_their_last_occurrence(self):
+        event = self.events[0]
+        start = timezone.now() - timedelta(days=20)
+        event.start_datetime, event.end_datetime = start, start + timedelta(hours=2)
+        event.recurrence = Event.Recurrence.WEEKLY
+        event.recurrence_until = (start + timedelta(days=28)).date()
+        event.save()
+        last = start + timedelta(days=28, hours=2)
+
+        self.assertEqual(occurrences.last_end(event), last)
+        self.assertEqual(UpcomingEvent.objects.get(pk=event.pk).live_until, last)
+        refresh_upcoming(now=last - timedelta(minutes=1))
+        self.assertEqual(list(UpcomingEvent.objects.values_list("pk", flat=True)), [event.pk])
+        self.assertEqual(refresh_upcoming(now=last), (0, 1))
+        self.assertFalse(UpcomingEvent.objects.exists())
+
+        event.recurrence_until = None
+        event.save()
+        self.assertIsNone(UpcomingEvent.objects.get(pk=event.pk).live_until)
+
+
+class UpcomingListTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.events = build_catalogue(5)
+        snapshot.reset()
+        self.addCleanup(snapshot.reset)
+
+    def ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [item["id"] for item in response.json()["results"]]
+
+    def test_ended_events_listed_only_for_time_ranges(self):
+        # Ended but not yet refreshed out of the table
+        end_event(self.events[0])
+        everything = [e.pk for e in self.events]
+
+        self.assertEqual(self.ids("/api/events/"), everything[1:])
+        self.assertEqual(self.ids("/api/async/events/"), everything[1:])
+        response = self.client.get("/events/")
+        self.assertEqual([e.pk for e in response.context["events"]], everything[1:])
+        since = (timezone.now() - timedelta(days=1)).date()
+        self.assertEqual(self.ids(f"/api/events/?starts_after={since}"), everything)
+
+    def test_weekly_event_listed_after_its_first_occurrence(self):
+        weekly = self.events[0]
+        start = timezone.now() - timedelta(days=8)
+        weekly.start_datetime, weekly.end_datetime = start, start + timedelta(hours=2)
+        weekly.recurrence = Event.Recurrence.WEEKLY
+        weekly.save()
+        self.assertTrue(EventOccurrence.objects.filter(event=weekly, start_datetime__gt=timezone.now()).exists())
+
+        self.assertIn(weekly.pk, self.ids("/api/events/"))
+        self.assertIn(weekly.pk, self.ids("/api/async/events/"))
+        database = self.client.get("/api/events/")
+        with override_settings(EVENT_SNAPSHOT=True):
+            memory = self.client.get("/api/events/")
+        self.assertEqual(memory.json(), database.json())
+        self.assertEqual(memory["ETag"], database["ETag"])
+
+    def test_validators_change_when_an_event_ends(self):
+        an_hour_ago = timezone.now() - timedelta(hours=1)
+        for model in (EventSearchDocument, UpcomingEvent):
+            model.objects.update(updated_at=an_hour_ago)
+        first = self.client.get("/api/events/")
+        end_event(self.events[0], ago=timedelta(seconds=1))
+
+        response = self.client.get("/api/events/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get("/api/events/", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get("/api/events/", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+
+    def test_snapshot_matches_database_path(self):
+        end_event(self.events[0])
+        for url in ("/api/events/", f"/api/events/?starts_after={(timezone.now() - timedelta(days=1)).date()}"):
+            with self.subTest(url=url):
+                database = self.client.get(url)
+                with override_settings(EVENT_SNAPSHOT=True):
+                    memory = self.client.get(url)
+                self.assertEqual(memory.json(), database.json())
+                self.assertEqual(memory["ETag"], database["ETag"])
+
+
+class DiscoveryAgreesWithListTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.events = build_catalogue(3)
+        end_event(self.events[0])
+
+    def ids(self, url, params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return [item["id"] for item in response.json()["results"]]
+
+    def test_nearby_skips_ended_events_unless_a_time_range_is_given(self):
+        postcode = self.events[0].postcode
+        self.assertNotIn(self.events[0].pk, self.ids("/api/events/nearby/", {"postcode": postcode}))
+        self.assertIn(self.events[1].pk, self.ids("/api/events/nearby/", {"postcode": postcode}))
+        since = (timezone.now() - timedelta(days=1)).date()
+        self.assertIn(self.events[0].pk, self.ids("/api/events/nearby/", {"postcode": postcode, "starts_after": since}))
+
+    def test_public_search_skips_ended_events_admin_search_does_not(self):
+        title = self.events[0].title
+        for url in ("/api/events/search/", "/api/async/events/search/"):
+            with self.subTest(url=url):
+                self.assertNotIn(self.events[0].pk, self.ids(url, {"q": title}))
+                self.assertIn(self.events[1].pk, self.ids(url, {"q": self.events[1].title}))
+        self.assertIn(self.events[0].pk, [pk for pk, _ in search_events(title, published_only=False)])
+        self.assertIn(self.events[0].pk, [pk for pk, _ in search_events(title)])
+
+    def test_live_recurring_event_is_found(self):
+        weekly = self.events[0]
+        start = timezone.now() - timedelta(days=8)
+        weekly.start_datetime, weekly.end_datetime = start, start + timedelta(hours=2)
+        weekly.recurrence = Event.Recurrence.WEEKLY
+        weekly.save()
+
+        self.assertIn(weekly.pk, self.ids("/api/events/search/", {"q": weekly.title}))
+        self.assertIn(weekly.pk, self.ids("/api/events/nearby/", {"postcode": weekly.postcode}))
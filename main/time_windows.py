@@ -0,0 +1,185 @@
+"""
+============================================================
+File Name: time_windows.py
+Brief Description:
+Day-bucket index for "what overlaps this time window" queries
+(/api/events/?from=&to= and ?happening=now).
+
+An overlap test (start < window_end AND end > window_start)
+has two range conditions on different columns, so a B-tree on
+either only halves the work: over a multi-year archive every
+past event starts before "now". Instead each occurrence of a
+published event has an EventDay row for every local day
+(settings.TIME_ZONE) it spans, carrying the occurrence's own
+start and end. A window query reads the rows for the window's
+days through the (day, event) index and applies the exact
+overlap test to those rows only, so its cost follows the number
+of occurrences around the window rather than the archive size,
+and a recurring event matches whichever of its occurrences
+falls in the window.
+
+Recurring events are bucketed from their first occurrence to
+the rolling horizon (occurrences.horizon()); refresh(), run
+with `python manage.py refresh_occurrences`, extends them as
+the horizon moves. Occurrences longer than LONG_EVENT_DAYS
+(e.g. season-long exhibitions) get a single row with day NULL
+instead, which every window query includes as a candidate.
+
+Rows are rewritten from the events_changed signal (see
+signals.py); `python manage.py bench_time_window` compares the
+bucketed and plain overlap queries.
+
+Author: Gavin Plucknett
+Created: 2026-10-17
+Current Version: v1.1
+
+Change Log:
+------------------------------------------------------------
+Version | Date       | Change Description                          | Reference
+------------------------------------------------------------
+v1.0    | 2026-10-17 | Day-bucket time-window index                | user-016
+v1.1    | 2026-10-17 | Bucket and match every occurrence           | user-016
+============================================================
+"""
+
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from .models import Event, EventDay
+from .occurrences import expand, horizon
+
+CHUNK_SIZE = 500
+
+# Longer occurrences are stored once with day NULL
+LONG_EVENT_DAYS = 31
+
+# Event fields read to expand occurrences
+EVENT_FIELDS = ("pk", "start_datetime", "end_datetime", "recurrence", "recurrence_interval", "recurrence_until")
+
+
+# Local days covered by [start, end); [None] for long events
+def event_days(start, end, zone=None):
+    zone = zone or timezone.get_current_timezone()
+    first = start.astimezone(zone).date()
+    last = max(start, end - timedelta(microseconds=1)).astimezone(zone).date()
+    span = (last - first).days + 1
+    if span > LONG_EVENT_DAYS:
+        return [None]
+    return [first + timedelta(days=offset) for offset in range(span)]
+
+
+# Insert (event_id, day, start, end) rows with one executemany, as bulk
+# imports write rows for every event
+def _insert(rows):
+    if not rows:
+        return 0
+    quote = connection.ops.quote_name
+    adapt_day, adapt_moment = connection.ops.adapt_datefield_value, connection.ops.adapt_datetimefield_value
+    columns = ", ".join(quote(column) for column in ("event_id", "day", "start_datetime", "end_datetime"))
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {quote(EventDay._meta.db_table)} ({columns}) VALUES (%s, %s, %s, %s)",
+            [(pk, adapt_day(day), adapt_moment(start), adapt_moment(end)) for pk, day, start, end in rows],
+        )
+    return len(rows)
+
+
+# Rows for (event_id, start, end) occurrences
+def _occurrence_rows(occurrences, zone):
+    return [
+        (pk, day, start, end)
+        for pk, start, end in occurrences
+        for day in event_days(start, end, zone)
+    ]
+
+
+# Rows for events' occurrences from the first up to until; the first
+# occurrence is bucketed even when it starts past until
+def _rows(events, until):
+    return _occurrence_rows(
+        (
+            (event.pk, start, end)
+            for event in events
+            for start, end in expand(event, event.start_datetime, max(until, event.end_datetime))
+        ),
+        timezone.get_current_timezone(),
+    )
+
+
+# Rewrite the day rows of event_ids. events, when given, are the saved
+# instances and are not re-read; created events have nothing to delete.
+def sync_events(event_ids, events=None, created=False):
+    event_ids = list(event_ids)
+    until = horizon()
+    for start in range(0, len(event_ids), CHUNK_SIZE):
+        chunk = event_ids[start:start + CHUNK_SIZE]
+        if events is None:
+            published = Event.objects.filter(pk__in=chunk, status=Event.Status.PUBLISHED).only(*EVENT_FIELDS)
+        else:
+            published = [event for event in events[start:start + CHUNK_SIZE] if event.status == Event.Status.PUBLISHED]
+        if not created:
+            EventDay.objects.filter(event_id__in=chunk).delete()
+        _insert(_rows(published, until))
+
+
+# Extend recurring events' rows to the horizon. Past rows stay, so windows
+# over the archive still find earlier occurrences. Returns the rows added.
+def refresh(now=None) -> int:
+    until = horizon(now)
+    added = 0
+    zone = timezone.get_current_timezone()
+    with transaction.atomic():
+        recurring = (
+            Event.objects.filter(status=Event.Status.PUBLISHED)
+            .exclude(recurrence=Event.Recurrence.NONE).only(*EVENT_FIELDS)
+        )
+        last = dict(
+            EventDay.objects.filter(event__in=recurring)
+            .values_list("event").annotate(last=Max("start_datetime"))
+        )
+        batch = []
+        for event in recurring.order_by("pk").iterator(chunk_size=CHUNK_SIZE):
+            after = last.get(event.pk, event.start_datetime - timedelta(microseconds=1))
+            batch.extend(_occurrence_rows(
+                ((event.pk, start, end) for start, end in expand(event, after, until) if start > after), zone
+            ))
+            if len(batch) >= CHUNK_SIZE:
+                added += _insert(batch)
+                batch = []
+        added += _insert(batch)
+    return added
+
+
+# Rebuild every row from the published events
+def rebuild(batch_size=2000) -> int:
+    until = horizon()
+    total = 0
+    with transaction.atomic():
+        EventDay.objects.all().delete()
+        published = (
+            Event.objects.filter(status=Event.Status.PUBLISHED)
+            .only(*EVENT_FIELDS).order_by("pk")
+        )
+        batch = []
+        for event in published.iterator(chunk_size=batch_size):
+            batch.append(event)
+            if len(batch) >= batch_size:
+                total += _insert(_rows(batch, until))
+                batch = []
+        total += _insert(_rows(batch, until))
+    return total
+
+
+# Q over EventSearchDocument (or Event) for events with an occurrence
+# overlapping [start, end); start == end asks what is on at that instant
+def overlapping(start, end):
+    first, last = timezone.localdate(start), timezone.localdate(end)
+    if start == end:
+        exact = Q(start_datetime__lte=start, end_datetime__gt=start)
+    else:
+        exact = Q(start_datetime__lt=end, end_datetime__gt=start)
+    candidates = EventDay.objects.filter(Q(day__range=(first, last)) | Q(day__isnull=True), exact).values("event_id")
+    return Q(pk__in=candidates)
@@ -7,13 +7,16 @@ events and viewing event detail pages.
 
 Author: Gavin Plucknett
 Created: 2026-01-04
-Current Version: v1.0
+Current Version: v1.3
 
 Change Log:
 ------------------------------------------------------------
 Version | Date       | Change Description                   | Reference
 ------------------------------------------------------------
 v1.0    | 2026-01-04 | Added event list and detail routes   | DEV-119
+v1.1    | 2026-10-17 | Added page cache stats route         | user-010
+v1.2    | 2026-10-17 | Added snapshot stats route           | user-018
+v1.3    | 2026-10-17 | Added Prometheus metrics route       | user-019
 ============================================================
 """
 
@@ -25,4 +28,7 @@ app_name = "main"
 urlpatterns = [
     path("events/", views.EventListView.as_view(), name="event_list"),
     path("events/<int:pk>/", views.EventDetailView.as_view(), name="event_detail"),
+    path("internal/page-cache/", views.PageCacheStatsView.as_view(), name="page_cache_stats"),
+    path("internal/snapshot/", views.SnapshotStatsView.as_view(), name="snapshot_stats"),
+    path("internal/metrics", views.MetricsView.as_view(), name="metrics"),
 ]
\ No newline at end of file
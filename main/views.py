@@ -7,7 +7,7 @@ used during early development and URL testing.
 
 Author: Gavin Plucknett
 Created: 2026-01-04
-Current Version: v1.1
+Current Version: v1.10
 
 Change Log:
 ------------------------------------------------------------
@@ -15,12 +15,37 @@ Version | Date       | Change Description                      | Reference
 ------------------------------------------------------------
 v1.0    | 2026-01-04 | Added holding page view for URL testing | DEV-119          
 v1.1    | 2026-01-04 | Added events and event detail views.    | DEV-120          
+v1.2    | 2026-10-17 | Eager-load event relations              | user-001
+v1.3    | 2026-10-17 | Cursor pagination on event list         | user-002
+v1.4    | 2026-10-17 | Lookup labels from reference-data cache | user-003
+v1.5    | 2026-10-17 | Versioned page cache + stats endpoint   | user-010
+v1.6    | 2026-10-17 | In-memory snapshot stats endpoint       | user-018
+v1.7    | 2026-10-17 | Prometheus request metrics endpoint     | user-019
+v1.8    | 2026-10-17 | Public pages read via the read database | user-022
+v1.9    | 2026-10-17 | Upcoming list via UpcomingEvent         | user-024
+v1.10   | 2026-10-17 | Explicit metrics IP allowlist           | user-019
 ============================================================
 """
 
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import render
-from django.views.generic import ListView, DetailView, TemplateView
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.generic import ListView, DetailView, TemplateView, View
+from . import metrics, page_cache, snapshot
+from .conditional import upcoming_stamp
+from .db_routers import ReadDatabaseMixin
+from .filters import EventFilters, list_documents
 from .models import Event
+from .query_plans import with_query_plan
+from .lookup_cache import attach_reference_data
+from .serializers import EventSerializer
+from .pagination import (
+    CURSOR_QUERY_PARAM, PAGE_SIZE_QUERY_PARAM, InvalidCursor, paginate_keyset, page_url,
+)
 
 # Temporary holding page view for new urls with no view
 class HoldingPageView(TemplateView):
@@ -28,25 +53,102 @@ class HoldingPageView(TemplateView):
     template_name = "main/holding.html"
 
 # Event list view
-class EventListView(ListView):
+class EventListView(ReadDatabaseMixin, ListView):
     
     # Displays a list of published events for browsing/discovery.
     model = Event
     template_name = "main/event_list.html"
     context_object_name = "events"
-    paginate_by = None 
 
-    # Get Published Events Query
+    # Upcoming published events are paged through UpcomingEvent; only the
+    # page of events is then loaded
     def get_queryset(self):
-        # Prototype scope: show published events first; if you don't use status yet,
-        # change this to: return Event.objects.all().order_by("-start_datetime")
-        return Event.objects.filter(status="PUBLISHED").order_by("start_datetime")
+        return list_documents(EventFilters())
 
+    def get_paginate_by(self, queryset):
+        return settings.EVENT_PAGE_SIZE
 
-class EventDetailView(DetailView):
+    # Anonymous pages are cached against the upcoming list's stamp
+    def get(self, request, *args, **kwargs):
+        if not page_cache.is_cacheable(request):
+            return super().get(request, *args, **kwargs)
+        key = page_cache.page_key("list", request, *upcoming_stamp(timezone.now()))
+        render_page = super().get
+        return page_cache.serve_cached("list", key, lambda: render_page(request, *args, **kwargs))
+
+    # Keyset pagination replaces ListView's offset paginator
+    def paginate_queryset(self, queryset, page_size):
+        try:
+            page = paginate_keyset(
+                queryset,
+                cursor=self.request.GET.get(CURSOR_QUERY_PARAM),
+                page_size=self.request.GET.get(PAGE_SIZE_QUERY_PARAM, page_size),
+            )
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        # Templates read the same relations as the API serializer
+        event_ids = [document.pk for document in page.items]
+        events = Event.objects.filter(pk__in=event_ids)
+        events = {event.pk: event for event in with_query_plan(events, EventSerializer)}
+        page.items = [events[pk] for pk in event_ids if pk in events]
+        attach_reference_data(page.items)
+        page.next_url = page_url(self.request, page.next_cursor)
+        page.previous_url = page_url(self.request, page.previous_cursor)
+        return (None, page, page.items, page.has_other_pages())
+
+
+class EventDetailView(ReadDatabaseMixin, DetailView):
 
     #Displays a single event including event detail and accessibility information.
 
     model = Event
     template_name = "main/event_detail.html"
     context_object_name = "event"
+
+    def get_queryset(self):
+        return with_query_plan(Event.objects.all(), EventSerializer)
+
+    def get_object(self, queryset=None):
+        event = super().get_object(queryset)
+        attach_reference_data([event])
+        return event
+
+    # The event is loaded first: its (and its profile's) updated_at key the cached page
+    def get(self, request, *args, **kwargs):
+        if not page_cache.is_cacheable(request):
+            return super().get(request, *args, **kwargs)
+        self.object = self.get_object()
+        key = page_cache.page_key(
+            "detail", request, self.object.pk, self.object.updated_at, self.object.accessibility_profile.updated_at
+        )
+        return page_cache.serve_cached(
+            "detail", key, lambda: self.render_to_response(self.get_context_data(object=self.object))
+        )
+
+
+# Staff-only JSON hit / miss counters for the page cache (this process)
+@method_decorator(staff_member_required, name="dispatch")
+class PageCacheStatsView(View):
+
+    def get(self, request):
+        return JsonResponse(page_cache.stats.snapshot())
+
+
+# Staff-only JSON memory usage of the in-memory event snapshot (this process)
+@method_decorator(staff_member_required, name="dispatch")
+class SnapshotStatsView(View):
+
+    def get(self, request):
+        if not snapshot.enabled():
+            return JsonResponse({"enabled": False})
+        return JsonResponse({"enabled": True, **snapshot.get_snapshot().memory_usage()})
+
+
+# Request metrics histograms (this process) in Prometheus text format, for
+# scrapers on EVENT_METRICS_ALLOWED_IPS and for staff
+class MetricsView(View):
+
+    def get(self, request):
+        if request.META.get("REMOTE_ADDR") not in settings.EVENT_METRICS_ALLOWED_IPS and not request.user.is_staff:
+            raise PermissionDenied
+        return HttpResponse(metrics.registry.prometheus_text(), content_type="text/plain; version=0.0.4; charset=utf-8")